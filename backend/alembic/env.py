@@ -11,6 +11,7 @@ from alembic import context
 from app.core.database import Base
 from app.core.config import settings
 from app import models  # Import all model modules here
+from app.services.log_partition_service import is_partition_table
 
 # this is the Alembic Config object
 config = context.config
@@ -26,6 +27,13 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to):
+    """Keep autogenerate from dropping the monthly log partitions"""
+    if type_ == "table" and reflected and compare_to is None and is_partition_table(name):
+        return False
+    return True
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -45,6 +53,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -58,6 +67,7 @@ def do_run_migrations(connection: Connection) -> None:
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,162 @@
+"""Partition activity, CRM activity and AI task logs by month
+
+Revision ID: d9dc59310731
+Revises: 629040c87304
+Create Date: 2026-10-19 09:00:12.418337
+
+Rebuilds activity_logs, crm_activity_logs and ai_task_logs as tables range
+partitioned on created_at, with one partition per UTC month (<table>_pYYYY_MM)
+covering existing data through three months ahead, plus a DEFAULT partition.
+Later months are created by LogPartitionService.ensure_partitions.
+
+Postgres requires the partition key in every unique constraint, so the primary
+keys become (id, created_at) and public_id is indexed without UNIQUE (it is a
+random uuid4). ai_chat_messages.task_log_id loses its foreign key for the same
+reason: a partitioned table can only be referenced through its full key.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9dc59310731'
+down_revision: Union[str, None] = '629040c87304'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MONTHS_AHEAD = 3
+
+FOREIGN_KEYS = {
+    'activity_logs': [
+        ('user_id', 'users', 'SET NULL'),
+    ],
+    'crm_activity_logs': [
+        ('performed_by', 'users', 'SET NULL'),
+    ],
+    'ai_task_logs': [
+        ('triggered_by_user_id', 'users', 'SET NULL'),
+        ('approved_by_user_id', 'users', 'SET NULL'),
+        ('chat_session_id', 'ai_chat_sessions', 'SET NULL'),
+    ],
+}
+
+# (index name, columns) — the original single-column indexes plus composites
+# led by the filter columns and ending in created_at, so per-partition index
+# scans can return rows already ordered by created_at.
+INDEXES = {
+    'activity_logs': [
+        ('ix_activity_logs_id', 'id'),
+        ('ix_activity_logs_user_id', 'user_id'),
+        ('ix_activity_logs_action_type', 'action_type'),
+        ('ix_activity_logs_resource_type', 'resource_type'),
+        ('ix_activity_logs_is_deleted', 'is_deleted'),
+        ('ix_activity_logs_created_at', 'created_at'),
+        ('ix_activity_logs_user_created', 'user_id, created_at'),
+        ('ix_activity_logs_resource_created', 'resource_type, resource_id, created_at'),
+    ],
+    'crm_activity_logs': [
+        ('ix_crm_activity_logs_id', 'id'),
+        ('ix_crm_activity_logs_public_id', 'public_id'),
+        ('ix_crm_activity_logs_activity_type', 'activity_type'),
+        ('ix_crm_activity_logs_entity_id', 'entity_id'),
+        ('ix_crm_activity_logs_entity_type', 'entity_type'),
+        ('ix_crm_activity_logs_is_deleted', 'is_deleted'),
+        ('ix_crm_activity_logs_performed_by', 'performed_by'),
+        ('ix_crm_activity_logs_created_at', 'created_at'),
+        ('ix_crm_activity_logs_entity_created', 'entity_type, entity_id, created_at'),
+    ],
+    'ai_task_logs': [
+        ('ix_ai_task_logs_id', 'id'),
+        ('ix_ai_task_logs_public_id', 'public_id'),
+        ('ix_ai_task_logs_is_deleted', 'is_deleted'),
+        ('ix_ai_task_logs_status', 'status'),
+        ('ix_ai_task_logs_task_name', 'task_name'),
+        ('ix_ai_task_logs_trigger', 'trigger'),
+        ('ix_ai_task_logs_triggered_by_user_id', 'triggered_by_user_id'),
+        ('ix_ai_task_logs_chat_session_id', 'chat_session_id'),
+        ('ix_ai_task_logs_created_at', 'created_at'),
+        ('ix_ai_task_logs_status_created', 'status, created_at'),
+    ],
+}
+
+UNIQUE_PUBLIC_ID = {'crm_activity_logs', 'ai_task_logs'}
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    """Copy ``table`` into a new (un)partitioned table of the same shape and swap it in"""
+    new = f'{table}_rebuild'
+    if partitioned:
+        op.execute(f"""
+            CREATE TABLE {new} (
+                LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS,
+                PRIMARY KEY (id, created_at)
+            ) PARTITION BY RANGE (created_at)
+        """)
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {new} DEFAULT")
+        op.execute(f"""
+            DO $$
+            DECLARE
+                month timestamptz;
+                last_month timestamptz := date_trunc('month', now()) + interval '{MONTHS_AHEAD} months';
+            BEGIN
+                SELECT date_trunc('month', coalesce(min(created_at), now())) INTO month FROM {table};
+                WHILE month <= last_month LOOP
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF {new} FOR VALUES FROM (%L) TO (%L)',
+                        '{table}_p' || to_char(month, 'YYYY_MM'),
+                        month,
+                        month + interval '1 month'
+                    );
+                    month := month + interval '1 month';
+                END LOOP;
+            END $$
+        """)
+    else:
+        op.execute(f"""
+            CREATE TABLE {new} (
+                LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS INCLUDING COMMENTS,
+                PRIMARY KEY (id)
+            )
+        """)
+
+    op.execute(f"INSERT INTO {new} SELECT * FROM {table}")
+
+    # The id sequence is owned by the old column; keep it alive across the drop
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY NONE")
+    op.execute(f"DROP TABLE {table}")
+    op.execute(f"ALTER TABLE {new} RENAME TO {table}")
+    op.execute(f"ALTER TABLE {table} RENAME CONSTRAINT {new}_pkey TO {table}_pkey")
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+
+    for column, target, on_delete in FOREIGN_KEYS[table]:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {target} (id) ON DELETE {on_delete}"
+        )
+
+    for name, columns in INDEXES[table]:
+        if not partitioned and name.endswith('_public_id') and table in UNIQUE_PUBLIC_ID:
+            op.execute(f"CREATE UNIQUE INDEX {name} ON {table} ({columns})")
+        else:
+            op.execute(f"CREATE INDEX {name} ON {table} ({columns})")
+
+    op.execute(f"ANALYZE {table}")
+
+
+def upgrade() -> None:
+    # Month boundaries are UTC regardless of the server's timezone setting
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+    op.execute("ALTER TABLE ai_chat_messages DROP CONSTRAINT IF EXISTS ai_chat_messages_task_log_id_fkey")
+    for table in INDEXES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    for table in INDEXES:
+        _rebuild(table, partitioned=False)
+    op.execute("UPDATE ai_chat_messages SET task_log_id = NULL WHERE task_log_id NOT IN (SELECT id FROM ai_task_logs)")
+    op.execute(
+        "ALTER TABLE ai_chat_messages ADD CONSTRAINT ai_chat_messages_task_log_id_fkey "
+        "FOREIGN KEY (task_log_id) REFERENCES ai_task_logs (id) ON DELETE SET NULL"
+    )
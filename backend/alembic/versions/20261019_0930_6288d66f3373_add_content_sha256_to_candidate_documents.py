@@ -0,0 +1,27 @@
+"""Add content_sha256 to candidate_documents
+
+Revision ID: 6288d66f3373
+Revises: d9dc59310731
+Create Date: 2026-10-19 09:30:41.207815
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6288d66f3373'
+down_revision: Union[str, None] = 'd9dc59310731'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('candidate_documents', sa.Column('content_sha256', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_candidate_documents_content_sha256'), 'candidate_documents', ['content_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_candidate_documents_content_sha256'), table_name='candidate_documents')
+    op.drop_column('candidate_documents', 'content_sha256')
@@ -0,0 +1,44 @@
+"""Add document_texts extraction cache
+
+Revision ID: fe5b03ff4753
+Revises: 6288d66f3373
+Create Date: 2026-10-19 10:00:27.551903
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fe5b03ff4753'
+down_revision: Union[str, None] = '6288d66f3373'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('document_texts',
+    sa.Column('content_sha256', sa.String(length=64), nullable=False),
+    sa.Column('kind', sa.String(length=10), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('page_count', sa.Integer(), nullable=False),
+    sa.Column('truncated', sa.Boolean(), nullable=False),
+    sa.Column('extractor_version', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_document_texts_content_sha256'), 'document_texts', ['content_sha256'], unique=True)
+    op.create_index(op.f('ix_document_texts_id'), 'document_texts', ['id'], unique=False)
+    op.create_index(op.f('ix_document_texts_is_deleted'), 'document_texts', ['is_deleted'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_document_texts_is_deleted'), table_name='document_texts')
+    op.drop_index(op.f('ix_document_texts_id'), table_name='document_texts')
+    op.drop_index(op.f('ix_document_texts_content_sha256'), table_name='document_texts')
+    op.drop_table('document_texts')
@@ -0,0 +1,58 @@
+"""Add email_outbox delivery queue
+
+Revision ID: 3b7e2a91c4d8
+Revises: fe5b03ff4753
+Create Date: 2026-10-19 11:00:41.207316
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2a91c4d8'
+down_revision: Union[str, None] = 'fe5b03ff4753'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('email_outbox',
+    sa.Column('category', sa.String(length=50), nullable=False),
+    sa.Column('transport', sa.Enum('system', 'user', name='emailtransport'), nullable=False),
+    sa.Column('sender_config_id', sa.Integer(), nullable=True),
+    sa.Column('to_email', sa.String(length=255), nullable=False),
+    sa.Column('cc', sa.JSON(), nullable=True),
+    sa.Column('subject', sa.String(length=500), nullable=False),
+    sa.Column('html_body', sa.Text(), nullable=True),
+    sa.Column('text_body', sa.Text(), nullable=True),
+    sa.Column('attachments', sa.JSON(), nullable=True),
+    sa.Column('status', sa.Enum('pending', 'sending', 'sent', 'failed', name='emailoutboxstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['sender_config_id'], ['user_email_configurations.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_email_outbox_category'), 'email_outbox', ['category'], unique=False)
+    op.create_index(op.f('ix_email_outbox_id'), 'email_outbox', ['id'], unique=False)
+    op.create_index(op.f('ix_email_outbox_is_deleted'), 'email_outbox', ['is_deleted'], unique=False)
+    op.create_index('ix_email_outbox_status_next_attempt', 'email_outbox', ['status', 'next_attempt_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_email_outbox_status_next_attempt', table_name='email_outbox')
+    op.drop_index(op.f('ix_email_outbox_is_deleted'), table_name='email_outbox')
+    op.drop_index(op.f('ix_email_outbox_id'), table_name='email_outbox')
+    op.drop_index(op.f('ix_email_outbox_category'), table_name='email_outbox')
+    op.drop_table('email_outbox')
+    sa.Enum(name='emailoutboxstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='emailtransport').drop(op.get_bind(), checkfirst=True)
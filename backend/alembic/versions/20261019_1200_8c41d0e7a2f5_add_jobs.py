@@ -0,0 +1,69 @@
+"""Add jobs table for the durable background job queue
+
+Revision ID: 8c41d0e7a2f5
+Revises: 3b7e2a91c4d8
+Create Date: 2026-10-19 12:00:12.604118
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41d0e7a2f5'
+down_revision: Union[str, None] = '3b7e2a91c4d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('jobs',
+    sa.Column('public_id', sa.Uuid(), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('queue', sa.String(length=50), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=True),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('queued', 'running', 'succeeded', 'failed', 'cancelled', name='jobstatus'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('run_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('locked_by', sa.String(length=100), nullable=True),
+    sa.Column('progress', sa.Integer(), nullable=False),
+    sa.Column('progress_message', sa.String(length=255), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_by_user_id', sa.Integer(), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['created_by_user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_jobs_created_by_user_id'), 'jobs', ['created_by_user_id'], unique=False)
+    op.create_index(op.f('ix_jobs_id'), 'jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_jobs_is_deleted'), 'jobs', ['is_deleted'], unique=False)
+    op.create_index(op.f('ix_jobs_name'), 'jobs', ['name'], unique=False)
+    op.create_index(op.f('ix_jobs_public_id'), 'jobs', ['public_id'], unique=True)
+    op.create_index(
+        'ix_jobs_claim', 'jobs', ['queue', sa.text('priority DESC'), 'run_at'],
+        unique=False, postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index('ix_jobs_status_heartbeat', 'jobs', ['status', 'heartbeat_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_status_heartbeat', table_name='jobs')
+    op.drop_index('ix_jobs_claim', table_name='jobs', postgresql_where=sa.text("status = 'queued'"))
+    op.drop_index(op.f('ix_jobs_public_id'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_name'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_is_deleted'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_id'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_created_by_user_id'), table_name='jobs')
+    op.drop_table('jobs')
+    sa.Enum(name='jobstatus').drop(op.get_bind(), checkfirst=True)
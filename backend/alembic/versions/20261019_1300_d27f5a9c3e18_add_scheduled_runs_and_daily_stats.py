@@ -0,0 +1,65 @@
+"""Add scheduled_runs history and daily_stats rollups
+
+Revision ID: d27f5a9c3e18
+Revises: 8c41d0e7a2f5
+Create Date: 2026-10-19 13:00:27.951204
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd27f5a9c3e18'
+down_revision: Union[str, None] = '8c41d0e7a2f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scheduled_runs',
+    sa.Column('schedule', sa.String(length=100), nullable=False),
+    sa.Column('scheduled_for', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('schedule', 'scheduled_for', name='uq_scheduled_runs_schedule_slot')
+    )
+    op.create_index(op.f('ix_scheduled_runs_id'), 'scheduled_runs', ['id'], unique=False)
+    op.create_index(op.f('ix_scheduled_runs_is_deleted'), 'scheduled_runs', ['is_deleted'], unique=False)
+    op.create_index(op.f('ix_scheduled_runs_job_id'), 'scheduled_runs', ['job_id'], unique=False)
+    op.create_index(op.f('ix_scheduled_runs_schedule'), 'scheduled_runs', ['schedule'], unique=False)
+
+    op.create_table('daily_stats',
+    sa.Column('metric', sa.String(length=100), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('is_deleted', sa.Boolean(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('metric', 'day', name='uq_daily_stats_metric_day')
+    )
+    op.create_index(op.f('ix_daily_stats_day'), 'daily_stats', ['day'], unique=False)
+    op.create_index(op.f('ix_daily_stats_id'), 'daily_stats', ['id'], unique=False)
+    op.create_index(op.f('ix_daily_stats_is_deleted'), 'daily_stats', ['is_deleted'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_daily_stats_is_deleted'), table_name='daily_stats')
+    op.drop_index(op.f('ix_daily_stats_id'), table_name='daily_stats')
+    op.drop_index(op.f('ix_daily_stats_day'), table_name='daily_stats')
+    op.drop_table('daily_stats')
+    op.drop_index(op.f('ix_scheduled_runs_schedule'), table_name='scheduled_runs')
+    op.drop_index(op.f('ix_scheduled_runs_job_id'), table_name='scheduled_runs')
+    op.drop_index(op.f('ix_scheduled_runs_is_deleted'), table_name='scheduled_runs')
+    op.drop_index(op.f('ix_scheduled_runs_id'), table_name='scheduled_runs')
+    op.drop_table('scheduled_runs')
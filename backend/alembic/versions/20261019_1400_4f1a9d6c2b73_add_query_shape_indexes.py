@@ -0,0 +1,79 @@
+"""Add composite and partial indexes for the hot repository queries
+
+Each index matches a query shape in the repositories:
+
+* notifications: the per-user feed (newest first) and, partial on unread
+  rows, the badge count / unread feed / mark-all-read;
+* dsr_entries: DSREntryRepository.get_by_user_and_date and the reminder EXISTS;
+* dsr_leave_applications: approved-leave checks for a user and day;
+* training_attendance: a batch's register for a day (with the per-period
+  existence check on save) and the attendance-percentage subqueries;
+* placement_mappings: active mappings by candidate and by job role;
+* candidate_counseling: a counselor's records, newest first;
+* candidates / training_candidate_allocations: live-row (is_deleted = false)
+  list ordering and filters.
+
+Indexes are built CONCURRENTLY so the tables stay writable during the upgrade.
+
+Revision ID: 4f1a9d6c2b73
+Revises: d27f5a9c3e18
+Create Date: 2026-10-19 14:00:12.408311
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1a9d6c2b73'
+down_revision: Union[str, None] = 'd27f5a9c3e18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, partial-index predicate)
+INDEXES = [
+    ('ix_notifications_user_created', 'notifications', ['user_id', 'created_at DESC'], None),
+    ('ix_notifications_user_unread', 'notifications', ['user_id', 'created_at DESC'], 'is_read = false'),
+    ('ix_dsr_entries_user_report_date', 'dsr_entries', ['user_id', 'report_date'], 'is_deleted = false'),
+    (
+        'ix_dsr_leave_applications_user_approved', 'dsr_leave_applications',
+        ['user_id', 'start_date', 'end_date'], "status = 'approved' AND is_deleted = false",
+    ),
+    (
+        'ix_training_attendance_batch_date', 'training_attendance',
+        ['batch_id', 'date', 'candidate_id', 'period_id'], 'is_deleted = false',
+    ),
+    ('ix_training_attendance_candidate_batch', 'training_attendance', ['candidate_id', 'batch_id', 'status'], None),
+    ('ix_placement_mappings_candidate_active', 'placement_mappings', ['candidate_id'], 'is_active = true'),
+    ('ix_placement_mappings_job_role_active', 'placement_mappings', ['job_role_id'], 'is_active = true'),
+    ('ix_candidate_counseling_counselor_date', 'candidate_counseling', ['counselor_id', 'counseling_date DESC'], None),
+    ('ix_candidates_live_created', 'candidates', ['created_at DESC'], 'is_deleted = false'),
+    (
+        'ix_training_candidate_allocations_live_batch_status', 'training_candidate_allocations',
+        ['batch_id', 'status'], 'is_deleted = false',
+    ),
+]
+
+
+def _columns(columns):
+    return [sa.text(column) if ' ' in column else column for column in columns]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, _columns(columns), unique=False,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
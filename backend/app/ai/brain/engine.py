@@ -28,7 +28,6 @@ from app.ai.brain.schemas import ToolCallPlan, ToolCallRequest, ToolResult
 from app.ai.schemas import AITaskRunRequest, AITaskRunResponse
 from app.ai.brain.journal import TaskJournal
 from app.ai.mcp.registry import registry as global_registry
-import app.ai.mcp.tools  # Trigger tool discovery and registration
 from app.core.config import settings
 from app.models.ai_task_log import AITaskStatus, AITaskTrigger
 
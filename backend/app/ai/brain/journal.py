@@ -287,16 +287,33 @@ async def list_task_logs(
     page: int = 1,
     page_size: int = 20,
     status_filter: str | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
 ) -> tuple[list[AITaskLog], int]:
-    """Paginated task log list with optional status filter."""
+    """
+    Paginated task log list with optional status and date filters.
+
+    ai_task_logs is partitioned by month on created_at; the lower bound
+    defaults to the AI_LOG_RETENTION_DAYS window so expired partitions are
+    pruned from both queries.
+    """
     from sqlalchemy import func
+    from app.services.log_partition_service import retention_floor
 
-    query = select(AITaskLog)
-    count_query = select(func.count(AITaskLog.id))
+    floor = retention_floor(AITaskLog.__tablename__)
+    if floor is not None and (created_after is None or created_after < floor):
+        created_after = floor
 
+    conditions = []
     if status_filter:
-        query = query.where(AITaskLog.status == status_filter)
-        count_query = count_query.where(AITaskLog.status == status_filter)
+        conditions.append(AITaskLog.status == status_filter)
+    if created_after is not None:
+        conditions.append(AITaskLog.created_at >= created_after)
+    if created_before is not None:
+        conditions.append(AITaskLog.created_at < created_before)
+
+    query = select(AITaskLog).where(*conditions)
+    count_query = select(func.count(AITaskLog.id)).where(*conditions)
 
     query = (
         query
@@ -4,17 +4,24 @@ AI Engine — Tool Registry
 
 Central registry for MCP-compatible AI tools.
 Handles tool discovery, filtering, and prompt generation.
+
+Tool modules register themselves when ``app.ai.mcp.tools`` is imported. The
+registry imports that package the first time tools are looked up rather than
+at app start-up, since the tool modules pull in most of the CRM layer.
 """
 
 from __future__ import annotations
 
 import logging
+from importlib import import_module
 from typing import List, Optional
 from app.ai.brain.schemas import ToolDefinition
 from app.ai.mcp.base_tool import BaseTool
 
 logger = logging.getLogger(__name__)
 
+TOOLS_PACKAGE = "app.ai.mcp.tools"
+
 
 class ToolRegistry:
     """
@@ -23,8 +30,18 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, BaseTool] = {}
+        self._discovered = False
         logger.info("ToolRegistry initialized.")
 
+    def discover(self) -> None:
+        """Import the tools package once so every tool module registers itself."""
+        if self._discovered:
+            return
+        # Set first: the tool modules call register() while being imported
+        self._discovered = True
+        import_module(TOOLS_PACKAGE)
+        logger.debug(f"Discovered {len(self._tools)} tools.")
+
     def register(self, tool: BaseTool) -> None:
         """Register a tool instance."""
         name = tool.definition.name
@@ -33,6 +50,7 @@ class ToolRegistry:
 
     def get(self, name: str) -> BaseTool:
         """Retrieve a tool by name."""
+        self.discover()
         if name not in self._tools:
             from app.ai.brain.exceptions import ToolNotFoundError
             raise ToolNotFoundError(name)
@@ -40,16 +58,19 @@ class ToolRegistry:
 
     def all(self) -> List[BaseTool]:
         """Return all registered tools."""
+        self.discover()
         return list(self._tools.values())
 
     def by_category(self, category: str) -> List[BaseTool]:
         """Return registered tools belonging to a category."""
+        self.discover()
         return [t for t in self._tools.values() if t.definition.category == category]
 
     def to_prompt_block(self, categories: List[str] | None = None) -> str:
         """
         Generates the formatted tool block for LLM system prompts.
         """
+        self.discover()
         tools = self.all() if not categories else [
             t for t in self._tools.values() if t.definition.category in categories
         ]
@@ -80,6 +101,7 @@ class ToolRegistry:
         return "\n---\n".join(blocks)
 
     def count(self) -> int:
+        self.discover()
         return len(self._tools)
 
 
@@ -10,7 +10,8 @@ Phase 4: candidate_tools, hr_tools
 Phase 5: notification_tools
 """
 
-# Tools are loaded on-demand by importing this package.
+# Tools are loaded on-demand: registry.discover() imports this package on the
+# first tool lookup.
 # Each tool module self-registers via: from app.ai.tool_registry import registry
 from . import crm_tools
 from . import placement_tools
@@ -1,2 +1,2 @@
-from app.ai.providers.factory import get_llm_provider, SUPPORTED_PROVIDERS, get_provider_info, PROVIDER_REGISTRY
+from app.ai.providers.factory import get_llm_provider, SUPPORTED_PROVIDERS, get_provider_info, load_provider_class
 from app.ai.providers.base import LLMProvider, LLMResponse
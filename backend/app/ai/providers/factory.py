@@ -1,28 +1,34 @@
 import logging
+from importlib import import_module
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
 from app.ai.brain.exceptions import LLMProviderError
 from app.repositories.system_setting_repository import SystemSettingRepository
 from app.ai.providers.base import LLMProvider
+from app.ai.providers.instrumented import InstrumentedProvider
 
 logger = logging.getLogger(__name__)
 
-def get_provider_registry():
-    from app.ai.providers.gemini import GeminiProvider
-    from app.ai.providers.openai import OpenAIProvider
-    from app.ai.providers.anthropic import AnthropicProvider
-    from app.ai.providers.groq import GroqProvider
-    from app.ai.providers.mistral import MistralProvider
-    
-    return {
-        "gemini": GeminiProvider,
-        "openai": OpenAIProvider,
-        "anthropic": AnthropicProvider,
-        "groq": GroqProvider,
-        "mistral": MistralProvider,
-    }
+# Provider classes by name, as "module:ClassName". Each provider module is
+# imported the first time it is asked for, so app start-up never pays for
+# providers (and HTTP clients) that are not in use.
+PROVIDER_PATHS = {
+    "gemini": "app.ai.providers.gemini:GeminiProvider",
+    "openai": "app.ai.providers.openai:OpenAIProvider",
+    "anthropic": "app.ai.providers.anthropic:AnthropicProvider",
+    "groq": "app.ai.providers.groq:GroqProvider",
+    "mistral": "app.ai.providers.mistral:MistralProvider",
+}
 
-PROVIDER_REGISTRY = get_provider_registry()
+def load_provider_class(provider_name: str) -> type[LLMProvider]:
+    """Import and return the provider class registered under ``provider_name``"""
+    if provider_name not in PROVIDER_PATHS:
+        raise LLMProviderError(
+            f"Unknown AI provider '{provider_name}'.",
+            provider=provider_name,
+        )
+    module_name, class_name = PROVIDER_PATHS[provider_name].split(":")
+    return getattr(import_module(module_name), class_name)
 
 async def get_llm_provider(db: AsyncSession, override: str | None = None) -> LLMProvider:
     repo = SystemSettingRepository(db)
@@ -33,15 +39,7 @@ async def get_llm_provider(db: AsyncSession, override: str | None = None) -> LLM
         provider_name = stored_provider.value if stored_provider and stored_provider.value else settings.AI_PROVIDER
     
     provider_name = provider_name.lower().strip()
-    registry = get_provider_registry()
-
-    if provider_name not in registry:
-        raise LLMProviderError(
-            f"Unknown AI provider '{provider_name}'.",
-            provider=provider_name,
-        )
-
-    provider_class = registry[provider_name]
+    provider_class = load_provider_class(provider_name)
     
     # Fetch API key from DB if it exists
     key_field = f"{provider_name.upper()}_API_KEY"
@@ -60,16 +58,13 @@ async def get_llm_provider(db: AsyncSession, override: str | None = None) -> LLM
         stored_global_model = await repo.get_by_key("AI_MODEL_OVERRIDE")
         model_override = stored_global_model.value if stored_global_model and stored_global_model.value else None
     
-    return provider_class(api_key=api_key, model=model_override)
+    return InstrumentedProvider(provider_class(api_key=api_key, model=model_override))
 
 def get_provider_info() -> list[dict]:
     """
     Returns metadata about all supported providers.
     Used by the /ai/health endpoint.
     """
-    registry = get_provider_registry()
-    supported = list(registry.keys())
-    
     # Map of provider names to their settings (for health check)
     provider_key_map = {
         "gemini":    ("GEMINI_API_KEY", settings.GEMINI_API_KEY),
@@ -0,0 +1,91 @@
+import time
+from typing import AsyncGenerator
+
+from app.ai.providers.base import LLMProvider, LLMResponse
+from app.core.metrics import AI_REQUEST_DURATION, AI_REQUESTS_TOTAL, AI_TOKENS_TOTAL
+
+
+def _tokens_from_raw(raw: object) -> int | None:
+    """Fall back to the OpenAI-style ``usage.total_tokens`` block when the adapter didn't set tokens_used."""
+    if isinstance(raw, dict):
+        usage = raw.get("usage") or {}
+        total = usage.get("total_tokens")
+        if total is None and ("input_tokens" in usage or "output_tokens" in usage):
+            total = (usage.get("input_tokens") or 0) + (usage.get("output_tokens") or 0)
+        if isinstance(total, int):
+            return total
+    return None
+
+
+class InstrumentedProvider(LLMProvider):
+    """Wraps any provider adapter to record latency, token usage and error rate."""
+
+    def __init__(self, inner: LLMProvider) -> None:
+        self._inner = inner
+
+    @property
+    def provider_name(self) -> str:
+        return self._inner.provider_name
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    async def complete(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 0.2,
+        max_tokens: int = 4096,
+    ) -> LLMResponse:
+        provider = self.provider_name
+        outcome = "success"
+        start = time.perf_counter()
+        try:
+            response = await self._inner.complete(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except Exception as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            AI_REQUEST_DURATION.labels(provider=provider, operation="complete").observe(
+                time.perf_counter() - start
+            )
+            AI_REQUESTS_TOTAL.labels(provider=provider, operation="complete", outcome=outcome).inc()
+
+        if response.tokens_used is None:
+            response.tokens_used = _tokens_from_raw(response.raw_response)
+        if response.tokens_used:
+            AI_TOKENS_TOTAL.labels(provider=provider, model=self.model_name).inc(response.tokens_used)
+        return response
+
+    async def stream_complete(
+        self,
+        system_prompt: str,
+        user_message: str,
+        temperature: float = 0.2,
+        max_tokens: int = 4096,
+    ) -> AsyncGenerator[str, None]:
+        provider = self.provider_name
+        outcome = "success"
+        start = time.perf_counter()
+        try:
+            async for token in self._inner.stream_complete(
+                system_prompt=system_prompt,
+                user_message=user_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            ):
+                yield token
+        except Exception as exc:
+            outcome = type(exc).__name__
+            raise
+        finally:
+            AI_REQUEST_DURATION.labels(provider=provider, operation="stream").observe(
+                time.perf_counter() - start
+            )
+            AI_REQUESTS_TOTAL.labels(provider=provider, operation="stream", outcome=outcome).inc()
@@ -9,9 +9,6 @@ Uses the Jinja2 PromptLoader and the AI Provider system.
 import json
 import logging
 import re
-import io
-import PyPDF2
-import os
 from typing import Any, Dict, Optional
 
 from app.ai.providers import get_llm_provider
@@ -19,6 +16,7 @@ from app.ai.prompts.loader import loader
 from app.core.constants import DISABILITY_TYPES, QUALIFICATIONS, COMMON_SKILLS
 from app.repositories.skill_repository import SkillRepository
 from app.repositories.candidate_document_repository import CandidateDocumentRepository
+from app.services.document_text_service import DocumentTextService
 
 logger = logging.getLogger(__name__)
 
@@ -44,30 +42,29 @@ class CandidateExtractionService:
         # 1. Prepare source text
         source_text = resume_text or ""
         
-        # If document_id is provided, fetch it from DB
+        # Text is parsed off the event loop and cached by content hash
+        text_service = DocumentTextService(self._db)
+        document_text = None
+        
+        # If document_id is provided, fetch it from DB (takes precedence over an upload)
         if document_id:
             repo = CandidateDocumentRepository(self._db)
             doc = await repo.get(document_id)
             if not doc:
                 raise ValueError(f"Document {document_id} not found.")
-            
-            # Read file from filesystem
-            if os.path.exists(doc.file_path):
-                with open(doc.file_path, "rb") as f:
-                    pdf_file = f.read()
-            else:
-                logger.error(f"File not found at path: {doc.file_path}")
-
-        if pdf_file:
             try:
-                reader = PyPDF2.PdfReader(io.BytesIO(pdf_file))
-                pdf_text = ""
-                for page in reader.pages:
-                    pdf_text += page.extract_text() + "\n"
-                source_text = (resume_text + "\n" + pdf_text) if resume_text else pdf_text
+                document_text = await text_service.extract_document(doc)
+            except Exception as e:
+                logger.error(f"Failed to extract text from document {document_id}: {str(e)}")
+        elif pdf_file:
+            try:
+                document_text = await text_service.extract_bytes(pdf_file)
             except Exception as e:
                 logger.error(f"Failed to extract text from PDF: {str(e)}")
 
+        if document_text:
+            source_text = (resume_text + "\n" + document_text) if resume_text else document_text
+
         if not source_text.strip():
             raise ValueError("No text provided for extraction.")
 
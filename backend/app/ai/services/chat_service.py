@@ -8,7 +8,6 @@ Handles session persistence, message history retrieval, and agentic response gen
 
 from __future__ import annotations
 
-import json
 import logging
 import asyncio
 from typing import AsyncGenerator, TYPE_CHECKING
@@ -25,6 +24,7 @@ from app.ai.brain.exceptions import LLMAuthError, LLMRateLimitError
 from app.models.ai_chat import AIChatSession, AIChatMessage
 from app.models.ai_task_log import AITaskStatus, AITaskTrigger
 from app.repositories.system_setting_repository import SystemSettingRepository
+from app.utils.sse import format_data
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -87,14 +87,14 @@ class AIChatService:
 
     # ── Streaming Execution ──────────────────────────────────────────────────
 
-    async def stream_message(self, session_id: int, schema: "AIChatMessageCreate") -> AsyncGenerator[str, None]:
+    async def stream_message(self, session_id: int, schema: "AIChatMessageCreate") -> AsyncGenerator[bytes, None]:
         """
         Stream the assistant response via SSE and persist everything to the DB.
         """
         # 1. Load context
         session = await self.get_session_details(session_id)
         if not session:
-            yield f"data: {json.dumps({'error': 'Session not found', 'status': 'failed'})}\n\n"
+            yield format_data({'error': 'Session not found', 'status': 'failed'})
             return
 
         # 2. Persist User Message
@@ -124,7 +124,7 @@ class AIChatService:
         try:
             provider = await get_llm_provider(self._db)
         except Exception as e:
-            yield f"data: {json.dumps({'error': str(e), 'status': 'failed'})}\n\n"
+            yield format_data({'error': str(e), 'status': 'failed'})
             return
 
         journal = await TaskJournal.create(
@@ -141,7 +141,7 @@ class AIChatService:
         full_content = ""
         try:
             # Planning
-            yield f"data: {json.dumps({'status': 'planning', 'message': 'Planning response...'})}\n\n"
+            yield format_data({'status': 'planning', 'message': 'Planning response...'})
             await journal.mark_planning()
             from app.ai.brain.planner import Planner
             planner = Planner(provider=provider, registry=registry, db=self._db)
@@ -157,12 +157,12 @@ class AIChatService:
             # Executing Tools
             if plan.steps:
                 for step in plan.steps:
-                    yield f"data: {json.dumps({'status': 'executing', 'message': f'Running {step.tool_name}...'})}\n\n"
+                    yield format_data({'status': 'executing', 'message': f'Running {step.tool_name}...'})
             
             _, results = await self._engine._execute_task_with_plan(plan, journal)
             
             # Synthesis & Token Streaming
-            yield f"data: {json.dumps({'status': 'typing'})}\n\n"
+            yield format_data({'status': 'typing'})
             full_content = self._synthesizer.synthesize_tool_results(
                 results=results,
                 planned_response=plan.response_to_user
@@ -171,18 +171,18 @@ class AIChatService:
             words = full_content.split(" ")
             for i, word in enumerate(words):
                 token = word + (" " if i < len(words) - 1 else "")
-                yield f"data: {json.dumps({'token': token})}\n\n"
+                yield format_data({'token': token})
                 await asyncio.sleep(0.01) # Low latency streaming
 
             # Finalize
             await journal.finalize(status=AITaskStatus.COMPLETED, summary=full_content)
-            yield f"data: {json.dumps({'status': 'completed', 'summary': full_content, 'task_db_id': journal.task_id})}\n\n"
+            yield format_data({'status': 'completed', 'summary': full_content, 'task_db_id': journal.task_id})
 
         except Exception as e:
             logger.exception("Chat failed")
             msg = f"⚠️ **Error:** {str(e)}"
             await journal.finalize(status=AITaskStatus.FAILED, summary=msg, error_message=str(e))
-            yield f"data: {json.dumps({'error': msg, 'status': 'failed'})}\n\n"
+            yield format_data({'error': msg, 'status': 'failed'})
             full_content = msg
 
         # 5. Persist Assistant Message
@@ -195,7 +195,7 @@ class AIChatService:
             )
             self._db.add(assistant_msg)
             await self._db.commit()
-            yield f"data: {json.dumps({'session_title_update': session.title, 'session_id': session_id})}\n\n"
+            yield format_data({'session_title_update': session.title, 'session_id': session_id})
 
     async def delete_session(self, session_id: int) -> bool:
         """Permanently remove a chat thread."""
@@ -9,8 +9,6 @@ Uses the Jinja2 PromptLoader and the AI Provider system.
 import json
 import logging
 import re
-import io
-import PyPDF2
 from typing import Any, Dict, Optional
 
 from app.ai.providers import get_llm_provider
@@ -19,6 +17,7 @@ from app.core.constants import DISABILITY_TYPES, QUALIFICATIONS, COMMON_SKILLS
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.contact_repository import ContactRepository
 from app.repositories.skill_repository import SkillRepository
+from app.services.document_text_service import DocumentTextService
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +39,8 @@ class JobRoleExtractionService:
         source_text = jd_text or ""
         if pdf_file:
             try:
-                reader = PyPDF2.PdfReader(io.BytesIO(pdf_file))
-                pdf_text = ""
-                for page in reader.pages:
-                    pdf_text += page.extract_text() + "\n"
+                # Parsed off the event loop and cached by content hash
+                pdf_text = await DocumentTextService(self._db).extract_bytes(pdf_file)
                 source_text = (jd_text + "\n" + pdf_text) if jd_text else pdf_text
             except Exception as e:
                 logger.error(f"Failed to extract text from PDF: {str(e)}")
@@ -1,10 +1,11 @@
 """Shared API dependencies"""
 
+import secrets
 from typing import Generator, Optional
 from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.security import decode_token, verify_token_type
 from app.core.config import settings
 from app.models.user import User
@@ -32,6 +33,22 @@ async def verify_api_key(
     return api_key
 
 
+async def verify_metrics_token(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> None:
+    """
+    Verify the bearer token on the Prometheus scrape endpoint.
+    Rejects every request while METRICS_SCRAPE_TOKEN is unset.
+    """
+    expected = settings.METRICS_SCRAPE_TOKEN
+    if not expected or credentials is None or not secrets.compare_digest(credentials.credentials, expected):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or missing metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     token_query: Optional[str] = Query(None, alias="token"),
@@ -44,6 +61,28 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    return await _authenticate(credentials, token_query, db)
+
+
+async def get_current_reader(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    token_query: Optional[str] = Query(None, alias="token"),
+    db: AsyncSession = Depends(get_read_db)
+) -> User:
+    """
+    get_current_user for endpoints on get_read_db: the user is looked up
+    through the request's read session, so the request holds one connection
+    instead of a second one on the primary. A user deactivated on the
+    primary may keep this read access for up to READ_REPLICA_MAX_LAG_SECONDS.
+    """
+    return await _authenticate(credentials, token_query, db)
+
+
+async def _authenticate(
+    credentials: Optional[HTTPAuthorizationCredentials],
+    token_query: Optional[str],
+    db: AsyncSession
+) -> User:
     token = None
     if credentials:
         token = credentials.credentials
@@ -123,12 +162,13 @@ async def get_current_superuser(
     return current_user
 
 
-def require_roles(allowed_roles: list):
+def require_roles(allowed_roles: list, read_only: bool = False):
     """
     Create a dependency that checks if user has one of the allowed roles
     
     Args:
         allowed_roles: List of UserRole enums that are allowed to access the endpoint
+        read_only: Authenticate with get_current_reader (endpoints on get_read_db)
         
     Returns:
         Dependency function that returns the current user if they have an allowed role
@@ -143,7 +183,9 @@ def require_roles(allowed_roles: list):
         ):
             pass
     """
-    async def role_checker(current_user: User = Depends(get_current_user)) -> User:
+    async def role_checker(
+        current_user: User = Depends(get_current_reader if read_only else get_current_user)
+    ) -> User:
         from app.models.user import UserRole
         
         # Convert allowed_roles to list of strings for comparison
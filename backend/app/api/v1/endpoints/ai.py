@@ -19,6 +19,7 @@ from __future__ import annotations
 
 from typing import Annotated, Optional
 import logging
+from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, File, UploadFile, Form
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -98,11 +99,18 @@ async def list_tasks(
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
     status_filter: Annotated[str | None, Query(description="Filter by status")] = None,
+    created_after: Annotated[datetime | None, Query(description="Only tasks created at or after this time")] = None,
+    created_before: Annotated[datetime | None, Query(description="Only tasks created before this time")] = None,
     db: AsyncSession = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> dict:
     items, total = await list_task_logs(
-        db=db, page=page, page_size=page_size, status_filter=status_filter
+        db=db,
+        page=page,
+        page_size=page_size,
+        status_filter=status_filter,
+        created_after=created_after,
+        created_before=created_before,
     )
     return {
         "items": [
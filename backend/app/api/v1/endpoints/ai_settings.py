@@ -192,8 +192,6 @@ async def test_connection(
     to verify the API key and connectivity.
     """
     import time
-    import time
-    from app.ai.providers import PROVIDER_REGISTRY
 
     provider_name = body.provider.lower()
 
@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, Request
-from datetime import datetime, time
+from typing import Optional
+from fastapi import APIRouter, Depends, Request, Query
+from datetime import date, datetime, time, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, case, String
 from sqlalchemy.orm import selectinload
-from fastapi.encoders import jsonable_encoder
 
 from app.api import deps
+from app.core.serialization import FastJSONResponse
 from app.models.user import User, UserRole
 from app.models.candidate import Candidate
 from app.models.candidate_screening import CandidateScreening
@@ -48,6 +49,8 @@ from app.models.placement_interview import PlacementInterview
 from app.models.placement_offer import PlacementOffer
 from app.models.placement_note import PlacementNote
 from app.models.ticket import TicketMessage
+from app.models.daily_stat import DailyStat
+from app.services.daily_stats_service import DailyStatsService
 from app.utils.activity_tracker import log_read
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
@@ -55,12 +58,15 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 @router.get("/export/{table_name}")
 async def export_table_for_power_bi(
     table_name: str,
-    db: AsyncSession = Depends(deps.get_db),
+    since: Optional[datetime] = Query(None, description="Only rows created at or after this time"),
+    until: Optional[datetime] = Query(None, description="Only rows created before this time"),
+    db: AsyncSession = Depends(deps.get_read_db),
     api_key: str = Depends(deps.verify_api_key),
 ):
     """
     Get a specific table dump for Power BI.
-    Returns a plain list of records.
+    Returns a plain list of records, optionally limited to a created_at window
+    (use it for incremental refreshes of the partitioned log tables).
     Supported tables: users, candidates, screenings, counselings, documents,
     activity_logs, allocations, batches, attendance, assignments, 
     mock_interviews, batch_events, batch_plans, batch_extensions, 
@@ -70,7 +76,8 @@ async def export_table_for_power_bi(
     crm_tasks, crm_activity_logs, candidate_assignments, job_roles,
     system_settings, company_holidays, notifications,
     skills, placement_mappings, placement_pipeline_history,
-    placement_interviews, placement_offers, placement_notes, candidate_analyses
+    placement_interviews, placement_offers, placement_notes, candidate_analyses,
+    daily_stats
     """
     from fastapi import HTTPException
     
@@ -117,6 +124,7 @@ async def export_table_for_power_bi(
         "placement_offers": PlacementOffer,
         "placement_notes": PlacementNote,
         "ticket_messages": TicketMessage,
+        "daily_stats": DailyStat,
     }
     
     if table_name not in model_map:
@@ -126,9 +134,31 @@ async def export_table_for_power_bi(
         )
         
     model = model_map[table_name]
-    result = await db.execute(select(model))
+    query = select(model)
+    if since is not None:
+        query = query.where(model.created_at >= since)
+    if until is not None:
+        query = query.where(model.created_at < until)
+    result = await db.execute(query)
     data = result.scalars().all()
-    
-    return jsonable_encoder(data)
+
+    # Encoded straight from the ORM rows, without a jsonable_encoder pass
+    return FastJSONResponse(data)
 
 
+@router.get("/daily-stats")
+async def get_daily_stats(
+    start: Optional[date] = Query(None, description="First day (defaults to 30 days ago)"),
+    end: Optional[date] = Query(None, description="Last day, inclusive (defaults to yesterday)"),
+    metrics: Optional[str] = Query(None, description="Comma-separated metric names"),
+    current_user: User = Depends(deps.require_roles([UserRole.ADMIN, UserRole.MANAGER], read_only=True)),
+    db: AsyncSession = Depends(deps.get_read_db),
+):
+    """
+    Per-day counters precomputed by the nightly rollup schedule.
+    Returns one series per metric.
+    """
+    end = end or date.today() - timedelta(days=1)
+    start = start or end - timedelta(days=29)
+    metric_list = [m.strip() for m in metrics.split(",") if m.strip()] if metrics else None
+    return await DailyStatsService(db).get_stats(start, end, metric_list)
@@ -17,6 +17,7 @@ from app.schemas.candidate_document import (
 from app.services.candidate_document_service import CandidateDocumentService
 from app.services.file_storage_service import FileStorageService
 from app.utils.activity_tracker import log_create, log_update, log_delete
+from app.utils.file_delivery import deliver_file
 
 
 router = APIRouter(tags=["Candidate Documents"])
@@ -82,6 +83,8 @@ async def download_candidate_document(
     """
     Download or preview a candidate document file.
     - disposition: 'attachment' (default, download) or 'inline' (preview)
+    - Supports If-None-Match / If-Modified-Since (304) and Range requests;
+      behind nginx (FILE_DELIVERY_MODE=x-accel) the file body is sent by nginx
     """
     service = CandidateDocumentService(db)
     document = await service.get_document(document_id)
@@ -92,12 +95,12 @@ async def download_candidate_document(
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="File not found on server")
     
-    # Return file
-    return FileResponse(
-        path=str(file_path),
+    return await deliver_file(
+        request,
+        file_path,
         filename=document.document_name,
         media_type=document.mime_type or "application/octet-stream",
-        content_disposition_type=disposition
+        disposition=disposition,
     )
 
 
@@ -2,11 +2,11 @@
 
 from typing import List, Optional, Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, Request, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.rate_limiter import rate_limit_medium
-from app.api.deps import require_roles, get_current_active_user
+from app.api.deps import require_roles, get_current_active_user, get_current_reader
 from app.models.user import User, UserRole
 from app.schemas.candidate import (
     CandidateCreate,
@@ -14,6 +14,8 @@ from app.schemas.candidate import (
     CandidateResponse,
     CandidateListResponse,
     CandidatePaginatedResponse,
+    CandidateListItem,
+    CANDIDATE_LIST_VIEWS,
     CandidateStats,
     ScreeningStats,
     CandidateCheck
@@ -21,18 +23,21 @@ from app.schemas.candidate import (
 from app.schemas.candidate_assignment import CandidateAssignmentResponse, CandidateAssignmentCreate
 from app.services.candidate_service import CandidateService
 from app.utils.activity_tracker import log_create, log_update, log_delete
-from app.utils.email import send_registration_emails
+from app.utils.fieldsets import FieldSelection, field_selection
+from app.services.job_service import JobService
+from app.jobs import handlers as job_handlers
 
 
 router = APIRouter(prefix="/candidates", tags=["Candidates"])
 
+candidate_list_fields = field_selection(CandidateListItem, CANDIDATE_LIST_VIEWS)
+
 
 @router.post("/", response_model=CandidateResponse, status_code=status.HTTP_201_CREATED)
 @rate_limit_medium()
 async def register_candidate(
     request: Request,
     candidate_in: CandidateCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -42,8 +47,8 @@ async def register_candidate(
     service = CandidateService(db)
     candidate = await service.create_candidate(candidate_in)
     
-    # Send registration emails in background
-    background_tasks.add_task(send_registration_emails, candidate)
+    # Send registration emails from a job worker
+    await JobService(db).enqueue(job_handlers.send_registration_email, {"candidate_id": candidate.id})
     
     # Log the registration
     await log_create(
@@ -104,6 +109,7 @@ async def get_candidates(
     registration_type: str = None,
     is_global: bool = False,
     status_of_beneficiary: str = None,
+    selection: Optional[FieldSelection] = Depends(candidate_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER, UserRole.PLACEMENT, UserRole.COUNSELOR])),
     db: AsyncSession = Depends(get_db)
 ):
@@ -128,7 +134,7 @@ async def get_candidates(
             extra_filters[key] = value
 
     service = CandidateService(db)
-    return await service.get_candidates(
+    result = await service.get_candidates(
         skip=skip, 
         limit=limit, 
         search=search, 
@@ -150,53 +156,18 @@ async def get_candidates(
         registration_type=registration_type,
         current_user=current_user,
         is_global=is_global,
-        status_of_beneficiary=status_of_beneficiary_list
+        status_of_beneficiary=status_of_beneficiary_list,
+        fields=selection
     )
-
-
-from app.core.database import get_db, AsyncSessionLocal
-
-
-async def _run_export_candidates(
-    user_id: int,
-    user_email: str,
-    user_name: str,
-    columns: Optional[str] = None,
-    **kwargs
-):
-    """Wrapper to run export in background with its own DB session"""
-    from loguru import logger
-    import sys
-    print(f"DEBUG: Background task STARTING for candidate export (User: {user_email})")
-    sys.stdout.flush()
-    logger.info(f"Background task STARTED for candidate export (User: {user_email})")
-    try:
-        async with AsyncSessionLocal() as db:
-            from app.models.user import User
-            # Create a mock user for the service with correct attributes
-            current_user = User(
-                id=user_id, 
-                email=user_email, 
-                full_name=user_name,
-                username=user_email # Fallback for username
-            )
-            
-            service = CandidateService(db)
-            await service.export_candidates(current_user=current_user, columns=columns, **kwargs)
-        logger.info(f"Background task COMPLETED for candidate export (User: {user_email})")
-        print(f"DEBUG: Background task COMPLETED for candidate export (User: {user_email})")
-        sys.stdout.flush()
-    except Exception as e:
-        logger.error(f"Background task FAILED for candidate export: {str(e)}", exc_info=True)
-        print(f"DEBUG: Background task FAILED for candidate export: {str(e)}")
-        sys.stdout.flush()
+    if selection:
+        return selection.page(result["items"], total=result["total"])
+    return result
 
 
 @router.post("/export")
 @rate_limit_medium()
 async def export_candidates(
     request: Request,
-    background_tasks: BackgroundTasks,
     search: str = None,
     sort_by: str = None,
     sort_order: str = "desc",
@@ -235,13 +206,11 @@ async def export_candidates(
         if key.startswith(('screening_others.', 'counseling_others.')):
             extra_filters[key] = value
 
-    service = CandidateService(db)
     from loguru import logger
     logger.info(f"API: Export candidates requested by {current_user.email}")
     
-    # Trigger export in background
-    background_tasks.add_task(
-        _run_export_candidates,
+    # Run the export in a job worker
+    job = await JobService(db).enqueue(job_handlers.export_candidates, dict(
         user_id=current_user.id,
         user_email=current_user.email,
         user_name=current_user.full_name or current_user.username,
@@ -265,9 +234,12 @@ async def export_candidates(
         extra_filters=extra_filters,
         is_global=is_global,
         status_of_beneficiary=status_of_beneficiary_list
-    )
+    ), user_id=current_user.id)
     
-    return {"message": f"Export started. The report will be sent to {current_user.email} shortly."}
+    return {
+        "message": f"Export started. The report will be sent to {current_user.email} shortly.",
+        "job_id": job.public_id,
+    }
 
 
 
@@ -283,18 +255,74 @@ async def get_filter_options(
     """
     Get all unique values for filterable fields (Restricted)
     Returns disability types, education levels, cities, and counseling statuses
-    from ALL candidates in the database (not just current page)
+    from ALL candidates in the database (not just current page).
+    Served from an in-memory index; send If-None-Match to get a 304 when unchanged.
+    """
+    service = CandidateService(db)
+    snapshot = await service.get_filter_options()
+    return snapshot.response(request)
+
+
+@router.get("/facets")
+@rate_limit_medium()
+async def get_candidate_facets(
+    request: Request,
+    search: str = None,
+    disability_types: str = None,  # Comma-separated list
+    education_levels: str = None,  # Comma-separated list
+    cities: str = None,  # Comma-separated list
+    counseling_status: str = None,
+    is_experienced: bool = None,
+    screening_status: str = None,
+    disability_percentages: str = None,  # Comma-separated list (or single range string)
+    gender: str = None,
+    year_of_passing: str = None,  # Comma-separated list
+    year_of_experience: str = None,
+    currently_employed: bool = None,
+    registration_type: str = None,
+    is_global: bool = False,
+    status_of_beneficiary: str = None,
+    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER, UserRole.PLACEMENT, UserRole.COUNSELOR], read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
+):
     """
+    Candidate counts per filter value within the current selection (Restricted)
+    Takes the same filters as the candidate list and returns, for each facet of
+    /filter-options, the matching candidates per value: {facet: [{value, count}]}
+    """
+    extra_filters = {}
+    for key, value in request.query_params.items():
+        if key.startswith(('screening_others.', 'counseling_others.')):
+            extra_filters[key] = value
+
     service = CandidateService(db)
-    return await service.get_filter_options()
+    return await service.get_facets(
+        current_user=current_user,
+        is_global=is_global,
+        search=search,
+        disability_types=disability_types.split(',') if disability_types else None,
+        education_levels=education_levels.split(',') if education_levels else None,
+        cities=cities.split(',') if cities else None,
+        counseling_status=counseling_status,
+        is_experienced=is_experienced,
+        screening_status=screening_status,
+        disability_percentages=disability_percentages.split(',') if disability_percentages else None,
+        gender=gender,
+        year_of_passing=year_of_passing.split(',') if year_of_passing else None,
+        year_of_experience=year_of_experience,
+        currently_employed=currently_employed,
+        extra_filters=extra_filters,
+        registration_type=registration_type,
+        status_of_beneficiary=status_of_beneficiary.split(',') if status_of_beneficiary else None,
+    )
 
 
 @router.get("/stats", response_model=CandidateStats)
 @rate_limit_medium()
 async def get_candidate_stats(
     request: Request,
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER, UserRole.PLACEMENT, UserRole.COUNSELOR])),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER, UserRole.PLACEMENT, UserRole.COUNSELOR], read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get candidate statistics (Restricted)
@@ -308,8 +336,8 @@ async def get_candidate_stats(
 async def get_candidate_screening_stats(
     request: Request,
     is_global: bool = False,
-    current_user: User = Depends(get_current_active_user),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(get_current_reader),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get candidate screening statistics for tabs (Role-filtered)
@@ -334,6 +362,7 @@ async def get_unscreened_candidates(
     is_experienced: bool = None,
     counseling_status: str = None,
     is_global: bool = False,
+    selection: Optional[FieldSelection] = Depends(candidate_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER, UserRole.PLACEMENT, UserRole.COUNSELOR])),
     db: AsyncSession = Depends(get_db)
 ):
@@ -345,7 +374,7 @@ async def get_unscreened_candidates(
     cities_list = cities.split(',') if cities else None
 
     service = CandidateService(db)
-    return await service.get_unscreened_candidates(
+    result = await service.get_unscreened_candidates(
         skip=skip, 
         limit=limit, 
         search=search, 
@@ -358,8 +387,12 @@ async def get_unscreened_candidates(
         is_experienced=is_experienced,
         counseling_status=counseling_status,
         current_user=current_user,
-        is_global=is_global
+        is_global=is_global,
+        fields=selection
     )
+    if selection:
+        return selection.page(result["items"], total=result["total"])
+    return result
 
 
 @router.get("/screened", response_model=CandidatePaginatedResponse)
@@ -379,6 +412,7 @@ async def get_screened_candidates(
     screening_status: str = None,
     is_experienced: bool = None,
     is_global: bool = False,
+    selection: Optional[FieldSelection] = Depends(candidate_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER, UserRole.PLACEMENT, UserRole.COUNSELOR])),
     db: AsyncSession = Depends(get_db)
 ):
@@ -391,7 +425,7 @@ async def get_screened_candidates(
     cities_list = cities.split(',') if cities else None
 
     service = CandidateService(db)
-    return await service.get_screened_candidates(
+    result = await service.get_screened_candidates(
         skip=skip, 
         limit=limit, 
         counseling_status=counseling_status, 
@@ -405,8 +439,12 @@ async def get_screened_candidates(
         screening_status=screening_status,
         is_experienced=is_experienced,
         current_user=current_user,
-        is_global=is_global
+        is_global=is_global,
+        fields=selection
     )
+    if selection:
+        return selection.page(result["items"], total=result["total"])
+    return result
 
 
 @router.post("/{public_id}/assign", response_model=CandidateAssignmentResponse)
@@ -52,8 +52,8 @@ async def create_company(
 
 @router.get("/stats", response_model=CompanyStats)
 async def get_company_stats(
-    db: AsyncSession = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user)
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_reader)
 ) -> Any:
     """Get company statistics"""
     service = CompanyService(db)
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, Query, status
+
+from app.api.deps import require_roles
+from app.core import query_profiler
+from app.core.config import settings
+from app.models.user import User, UserRole
+
+router = APIRouter()
+
+SORT_FIELDS = {
+    "avg_duration_ms",
+    "max_duration_ms",
+    "avg_db_time_ms",
+    "avg_statements",
+    "max_statements",
+    "n_plus_one_requests",
+    "requests",
+}
+
+
+@router.get("/slow-endpoints", response_model=dict)
+async def get_slow_endpoints(
+    limit: int = Query(default=20, ge=1, le=200),
+    order_by: str = Query(default="avg_duration_ms"),
+    current_user: User = Depends(require_roles([UserRole.ADMIN])),
+):
+    """
+    Per-endpoint latency and SQL statement aggregates collected by the query profiler.
+    Figures are per worker process. ADMIN ONLY.
+    """
+    if order_by not in SORT_FIELDS:
+        order_by = "avg_duration_ms"
+    return {
+        "enabled": settings.QUERY_PROFILER_ENABLED,
+        "n_plus_one_threshold": settings.QUERY_PROFILER_N_PLUS_ONE_THRESHOLD,
+        "items": query_profiler.slow_endpoints(limit=limit, order_by=order_by),
+    }
+
+
+@router.delete("/slow-endpoints", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_slow_endpoints(
+    current_user: User = Depends(require_roles([UserRole.ADMIN])),
+):
+    """
+    Reset the query profiler aggregates for this worker. ADMIN ONLY.
+    """
+    query_profiler.reset_endpoint_stats()
@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Query, UploadFile, File, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.api.deps import get_current_user, require_roles
 from app.models.user import User, UserRole
 from app.models.dsr_activity import DSRActivityStatus
@@ -103,8 +103,8 @@ async def get_activity_import_template(
 @router.get("/export")
 async def export_activities_excel(
     project_public_id: UUID = Query(...),
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING])),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING], read_only=True)),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Export all activities for a project to Excel (Project Owner / Admin)."""
     service = DSRActivityService(db)
@@ -6,8 +6,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_roles
+from app.core.database import get_db, get_read_db
+from app.api.deps import get_current_user, get_current_reader, require_roles
 from app.models.user import User, UserRole
 from app.models.dsr_entry import DSRStatus
 from app.schemas.dsr_entry import (
@@ -22,6 +22,7 @@ from app.schemas.dsr_entry import (
     DSRRejectEntry,
     DSRRevokeEntry,
     DSRUserStatsSummary,
+    DSR_ENTRY_LIST_VIEWS,
 )
 from app.schemas.dsr_permission_request import (
     DSRPermissionRequestCreate,
@@ -30,9 +31,12 @@ from app.schemas.dsr_permission_request import (
     DSRPermissionRequestListResponse,
 )
 from app.services.dsr_service import DSRService
+from app.utils.fieldsets import FieldSelection, field_selection
 
 router = APIRouter()
 
+dsr_entry_list_fields = field_selection(DSREntryResponse, DSR_ENTRY_LIST_VIEWS)
+
 
 # ---------------------------------------------------------------
 # Entry CRUD (all authenticated users)
@@ -92,6 +96,7 @@ async def get_my_entries(
     date_to: Optional[date] = Query(default=None),
     status: Optional[DSRStatus] = Query(default=None),
     search: Optional[str] = Query(default=None),
+    selection: Optional[FieldSelection] = Depends(dsr_entry_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING])),
     db: AsyncSession = Depends(get_db),
 ):
@@ -105,7 +110,10 @@ async def get_my_entries(
         date_to=date_to,
         status=status,
         search=search,
+        fields=selection,
     )
+    if selection:
+        return selection.page(items, total=total, skip=skip, limit=limit)
     return DSREntryListResponse(items=items, total=total, skip=skip, limit=limit)
 
 
@@ -113,6 +121,7 @@ async def get_my_entries(
 async def get_pending_approval(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=500),
+    selection: Optional[FieldSelection] = Depends(dsr_entry_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER])),
     db: AsyncSession = Depends(get_db),
 ):
@@ -121,7 +130,9 @@ async def get_pending_approval(
     These are the entries that need admin action (approve or reject).
     """
     service = DSRService(db)
-    items, total = await service.get_pending_approval(current_user, skip=skip, limit=limit)
+    items, total = await service.get_pending_approval(current_user, skip=skip, limit=limit, fields=selection)
+    if selection:
+        return selection.page(items, total=total, skip=skip, limit=limit)
     return DSREntryListResponse(items=items, total=total, skip=skip, limit=limit)
 
 
@@ -165,8 +176,8 @@ async def get_calendar_status(
 
 @router.get("/entries/my-stats")
 async def get_my_dsr_stats(
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING])),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING], read_only=True)),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     User: get a count summary of their own DSR entries by status.
@@ -178,8 +189,8 @@ async def get_my_dsr_stats(
 
 @router.get("/entries/my-summary", response_model=DSRUserStatsSummary)
 async def get_my_stats_summary(
-    current_user: User = Depends(get_current_user),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_reader),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get a summary of hours (month/total), leaves, and missed days for the current user."""
     service = DSRService(db)
@@ -222,6 +233,7 @@ async def get_all_entries(
     date_to: Optional[date] = Query(default=None),
     status: Optional[DSRStatus] = Query(default=None),
     search: Optional[str] = Query(default=None, description="Search by user name or username"),
+    selection: Optional[FieldSelection] = Depends(dsr_entry_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER])),
     db: AsyncSession = Depends(get_db),
 ):
@@ -236,7 +248,10 @@ async def get_all_entries(
         date_to=date_to,
         status=status,
         search=search,
+        fields=selection,
     )
+    if selection:
+        return selection.page(items, total=total, skip=skip, limit=limit)
     return DSREntryListResponse(items=items, total=total, skip=skip, limit=limit)
 
 
@@ -350,8 +365,8 @@ async def handle_permission_request(
 @router.get("/permissions/stats")
 async def get_permission_stats(
     user_id: Optional[int] = Query(default=None),
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING])),
-    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.TRAINER, UserRole.SOURCING, UserRole.PLACEMENT, UserRole.COUNSELOR, UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MARKETING], read_only=True)),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get summary stats of permission requests (raised vs approved)."""
     service = DSRService(db)
@@ -5,8 +5,8 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_roles
+from app.core.database import get_db, get_read_db
+from app.api.deps import get_current_user, get_current_reader, require_roles
 from app.models.dsr_leave_application import DSRLeaveStatus
 from app.models.user import User, UserRole
 from app.schemas.dsr_leave_application import (
@@ -51,8 +51,8 @@ async def list_my_leaves(
 
 @router.get("/stats", response_model=DSRLeaveStats)
 async def get_leave_stats(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ):
     """User: Get personal leave statistics."""
     service = DSRLeaveService(db)
@@ -0,0 +1,47 @@
+from typing import List
+from uuid import UUID
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_current_user, get_db
+from app.models.user import User
+from app.schemas.job import JobResponse
+from app.services.job_service import JobService
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[JobResponse])
+async def get_my_jobs(
+    limit: int = Query(default=20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the current user's most recent background jobs.
+    """
+    return await JobService(db).get_my_jobs(current_user, limit=limit)
+
+
+@router.get("/{public_id}", response_model=JobResponse)
+async def get_job(
+    public_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the status and progress of a background job (own jobs; admins see all).
+    """
+    return await JobService(db).get_job(public_id, current_user)
+
+
+@router.post("/{public_id}/cancel", response_model=JobResponse)
+async def cancel_job(
+    public_id: UUID,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Cancel a job that has not started yet.
+    """
+    return await JobService(db).cancel_job(public_id, current_user)
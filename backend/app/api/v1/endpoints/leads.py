@@ -58,8 +58,8 @@ async def create_lead(
 
 @router.get("/stats", response_model=dict)
 async def get_lead_stats(
-    db: AsyncSession = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncSession = Depends(deps.get_read_db),
+    current_user: User = Depends(deps.get_current_reader),
     own_only: bool = Query(False)
 ) -> Any:
     """Get lead statistics"""
@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
 from app.api.deps import get_current_user, require_roles
 from app.models.user import User, UserRole
 from app.services.maintenance_service import MaintenanceService
+from app.services.log_partition_service import LogPartitionService
+from app.jobs.scheduler import scheduler
+from app.schemas.job import JobResponse, ScheduleResponse
 
 router = APIRouter()
 
@@ -19,3 +23,47 @@ async def clear_dsr_data(
     """
     service = MaintenanceService(db)
     return await service.clear_dsr_data(current_user)
+
+
+@router.post("/log-partitions/run", status_code=status.HTTP_200_OK)
+async def run_log_partition_maintenance(
+    current_user: User = Depends(require_roles([UserRole.ADMIN])),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create upcoming monthly log partitions and archive/drop expired ones.
+    ADMIN ONLY. Dropped partitions are only recoverable from the archive files.
+    """
+    return await LogPartitionService(db).run()
+
+
+@router.get("/schedules", response_model=List[ScheduleResponse])
+async def list_schedules(
+    runs: int = 5,
+    current_user: User = Depends(require_roles([UserRole.ADMIN])),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Configured cron schedules with their next run and recent run history
+    (status and duration of the job each firing enqueued).
+    ADMIN ONLY.
+    """
+    return await scheduler.describe(db, runs=min(max(runs, 1), 50))
+
+
+@router.post("/schedules/{name}/run", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def run_schedule_now(
+    name: str,
+    current_user: User = Depends(require_roles([UserRole.ADMIN])),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Fire a schedule now instead of waiting for its next slot.
+    ADMIN ONLY. Returns the queued job; poll /jobs/{id} for progress.
+    """
+    if name not in scheduler.schedules:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown schedule '{name}'")
+    try:
+        return await scheduler.run_now(db, name)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
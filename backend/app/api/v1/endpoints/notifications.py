@@ -1,12 +1,17 @@
+import asyncio
 from typing import List, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.models.user import User
 from app.schemas.notification import NotificationResponse, NotificationListResponse
+from app.core.config import settings
 from app.services.notification_service import NotificationService
+from app.services.notification_hub import notification_hub
+from app.utils.sse import KEEPALIVE, format_event
 
 router = APIRouter()
 
@@ -26,6 +31,52 @@ async def get_my_notifications(
     )
     return NotificationListResponse(items=items, unread_count=unread_count)
 
+@router.get("/stream")
+async def stream_my_notifications(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Push the current user's notification changes as server-sent events.
+
+    Starts with a ``snapshot`` event holding the unread count, followed by
+    ``notification``, ``read`` and ``read_all`` events carrying
+    ``unread_delta``, and ``resync`` when the client should refetch
+    ``/notifications/my``. EventSource cannot send headers, so browsers
+    authenticate with the ``token`` query parameter.
+    """
+    user_id = current_user.id
+    # Subscribe before counting so no event between the two is missed
+    queue = notification_hub.add_subscriber(user_id)
+    try:
+        unread_count = await NotificationService(db).get_unread_count(user_id)
+    except Exception:
+        notification_hub.remove_subscriber(user_id, queue)
+        raise
+    # The stream outlives this request's session; release its connection now
+    await db.close()
+
+    async def events():
+        try:
+            yield format_event("snapshot", {"event": "snapshot", "unread_count": unread_count})
+            while True:
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(), settings.NOTIFICATION_STREAM_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield KEEPALIVE
+                    continue
+                yield format_event(payload["event"], payload)
+        finally:
+            notification_hub.remove_subscriber(user_id, queue)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.put("/{public_id}/read", response_model=dict)
 async def mark_notification_as_read(
     public_id: UUID,
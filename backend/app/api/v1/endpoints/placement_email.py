@@ -85,7 +85,7 @@ async def send_candidate_profile_email(
             detail="Failed to send candidate profile email"
         )
         
-    return {"status": "success", "message": "Email sent successfully"}
+    return {"status": "success", "message": "Email queued for delivery"}
 
 @router.post("/send-bulk")
 async def send_bulk_candidate_profiles(
@@ -116,4 +116,4 @@ async def send_bulk_candidate_profiles(
             detail="Failed to send bulk candidate profiles"
         )
         
-    return {"status": "success", "message": "Bulk email sent successfully"}
+    return {"status": "success", "message": "Bulk email queued for delivery"}
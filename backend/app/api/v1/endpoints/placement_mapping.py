@@ -14,13 +14,19 @@ from app.schemas.placement_mapping import (
     PlacementMappingBulkCreate,
     AIScoreRequest,
     AIScoreResponse,
+    PLACEMENT_MAPPING_LIST_VIEWS,
 )
 from app.services.placement_mapping_service import PlacementMappingService
 from app.utils.activity_tracker import log_create, log_delete
+from app.utils.fieldsets import FieldSelection, field_selection
+from app.services.job_service import JobService
+from app.jobs import handlers as job_handlers
 
 
 router = APIRouter(prefix="/placement/mappings", tags=["Placement Mapping"])
 
+mapping_list_fields = field_selection(PlacementMapping, PLACEMENT_MAPPING_LIST_VIEWS)
+
 
 @router.get("/match/{job_role_public_id}", response_model=List[CandidateMatchResult])
 @rate_limit_medium()
@@ -117,6 +123,7 @@ async def bulk_map_candidates(
 async def get_job_role_mappings(
     request: Request,
     job_role_public_id: UUID,
+    selection: Optional[FieldSelection] = Depends(mapping_list_fields),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -124,13 +131,17 @@ async def get_job_role_mappings(
     Get all current mappings for a specific job role.
     """
     service = PlacementMappingService(db)
-    return await service.get_mapped_candidates(job_role_public_id)
+    mappings = await service.get_mapped_candidates(job_role_public_id, fields=selection)
+    if selection:
+        return selection.items(mappings)
+    return mappings
 
 
 @router.get("/", response_model=List[PlacementMapping])
 @rate_limit_medium()
 async def get_all_mappings(
     request: Request,
+    selection: Optional[FieldSelection] = Depends(mapping_list_fields),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -138,7 +149,10 @@ async def get_all_mappings(
     Get all current active placement mappings across all job roles.
     """
     service = PlacementMappingService(db)
-    return await service.get_all_mapped_candidates()
+    mappings = await service.get_all_mapped_candidates(fields=selection)
+    if selection:
+        return selection.items(mappings)
+    return mappings
 
 
 @router.get("/candidate/{candidate_id}", response_model=List[PlacementMapping])
@@ -190,66 +204,28 @@ async def unmap_candidate(
     
     return None
 
-from app.core.database import AsyncSessionLocal
-from fastapi import BackgroundTasks
-
-async def _run_export_placement_mappings(
-    user_id: int,
-    user_email: str,
-    user_name: str,
-    job_role_public_id: UUID,
-    columns: Optional[str] = None
-):
-    """Wrapper to run export in background with its own DB session"""
-    from loguru import logger
-    import sys
-    print(f"DEBUG: Background task STARTING for placement mapping export (User: {user_email})")
-    sys.stdout.flush()
-    logger.info(f"Background task STARTED for placement mapping export (User: {user_email})")
-    try:
-        async with AsyncSessionLocal() as db:
-            from app.models.user import User
-            current_user = User(
-                id=user_id, 
-                email=user_email, 
-                full_name=user_name,
-                username=user_email
-            )
-            
-            service = PlacementMappingService(db)
-            await service.export_placement_mappings(
-                job_role_public_id=job_role_public_id,
-                current_user=current_user,
-                columns=columns
-            )
-        logger.info(f"Background task COMPLETED for placement mapping export (User: {user_email})")
-        print(f"DEBUG: Background task COMPLETED for placement mapping export (User: {user_email})")
-        sys.stdout.flush()
-    except Exception as e:
-        logger.error(f"Background task FAILED for placement mapping export: {str(e)}", exc_info=True)
-        print(f"DEBUG: Background task FAILED for placement mapping export: {str(e)}")
-        sys.stdout.flush()
-
 @router.post("/export/{job_role_public_id}")
 @rate_limit_medium()
 async def export_placement_mappings(
     request: Request,
     job_role_public_id: UUID,
-    background_tasks: BackgroundTasks,
     columns: str = None,
-    current_user: User = Depends(get_current_active_user)
+    current_user: User = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Export placement mappings for a specific job role.
-    Runs as a background task and sends the report via email.
+    Runs in a job worker and sends the report via email.
     """
-    background_tasks.add_task(
-        _run_export_placement_mappings,
+    job = await JobService(db).enqueue(job_handlers.export_placement_mappings, dict(
         user_id=current_user.id,
         user_email=current_user.email,
         user_name=current_user.full_name or current_user.username,
         job_role_public_id=job_role_public_id,
         columns=columns
-    )
+    ), user_id=current_user.id)
     
-    return {"message": "Export started. You will receive an email shortly with the report."}
+    return {
+        "message": "Export started. You will receive an email shortly with the report.",
+        "job_id": job.public_id,
+    }
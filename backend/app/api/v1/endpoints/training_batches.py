@@ -4,7 +4,7 @@ from typing import List
 from uuid import UUID
 from fastapi import APIRouter, Depends, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.api.deps import require_roles
 from app.models.user import User, UserRole
 from app.schemas.training_batch import TrainingBatchCreate, TrainingBatchResponse, TrainingBatchUpdate, TrainingBatchExtend, TrainingBatchPaginatedResponse
@@ -80,8 +80,8 @@ async def get_training_batches(
 
 @router.get("/stats")
 async def get_training_batch_stats(
-    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER])),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER], read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get training batch statistics
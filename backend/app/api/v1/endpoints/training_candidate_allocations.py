@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, status, Request, Query, BackgroundTasks
+from fastapi import APIRouter, Depends, status, Request, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.api.deps import require_roles
@@ -12,14 +12,20 @@ from app.schemas.training_candidate_allocation import (
     TrainingCandidateAllocationResponse, 
     TrainingCandidateAllocationUpdate,
     TrainingCandidateAllocationPaginatedResponse,
-    TrainingCandidateAllocationReallocate
+    TrainingCandidateAllocationReallocate,
+    ALLOCATION_LIST_VIEWS
 )
 from app.services.training_candidate_allocation_service import TrainingCandidateAllocationService
 from app.utils.activity_tracker import log_create, log_update, log_delete
+from app.utils.fieldsets import FieldSelection, field_selection
+from app.services.job_service import JobService
+from app.jobs import handlers as job_handlers
 
 
 router = APIRouter(prefix="/training-candidate-allocations", tags=["Training Candidate Allocations"])
 
+allocation_list_fields = field_selection(TrainingCandidateAllocationResponse, ALLOCATION_LIST_VIEWS)
+
 
 @router.get("/", response_model=TrainingCandidateAllocationPaginatedResponse)
 async def get_all_allocations(
@@ -34,6 +40,7 @@ async def get_all_allocations(
     batch_tag: Optional[str] = Query(None),
     sort_by: str = Query("created_at"),
     sort_order: str = Query("desc"),
+    selection: Optional[FieldSelection] = Depends(allocation_list_fields),
     current_user: User = Depends(require_roles([UserRole.ADMIN, UserRole.MANAGER, UserRole.SOURCING, UserRole.TRAINER])),
     db: AsyncSession = Depends(get_db)
 ):
@@ -52,51 +59,16 @@ async def get_all_allocations(
         disability_types=disability_types,
         batch_tag=batch_tag,
         sort_by=sort_by,
-        sort_order=sort_order
+        sort_order=sort_order,
+        fields=selection
     )
+    if selection:
+        return selection.page(items, total=total)
     return {"items": items, "total": total}
 
 
-from app.core.database import get_db, AsyncSessionLocal
-
-
-async def _run_export_allocations(
-    user_id: int,
-    user_email: str,
-    user_name: str,
-    columns: Optional[str] = None,
-    **kwargs
-):
-    """Wrapper to run export in background with its own DB session"""
-    from loguru import logger
-    import sys
-    print(f"DEBUG: Background task STARTING for training allocations export (User: {user_email})")
-    sys.stdout.flush()
-    logger.info(f"Background task STARTED for training allocations export (User: {user_email})")
-    try:
-        async with AsyncSessionLocal() as db:
-            from app.models.user import User
-            current_user = User(
-                id=user_id, 
-                email=user_email, 
-                full_name=user_name,
-                username=user_email
-            )
-            
-            service = TrainingCandidateAllocationService(db)
-            await service.export_allocations(current_user=current_user, columns=columns, **kwargs)
-        logger.info(f"Background task COMPLETED for training allocations export (User: {user_email})")
-        print(f"DEBUG: Background task COMPLETED for training allocations export (User: {user_email})")
-        sys.stdout.flush()
-    except Exception as e:
-        logger.error(f"Background task FAILED for training allocations export: {str(e)}", exc_info=True)
-        print(f"DEBUG: Background task FAILED for training allocations export: {str(e)}")
-        sys.stdout.flush()
-
-
 @router.post("/export")
 async def export_allocations(
-    background_tasks: BackgroundTasks,
     search: Optional[str] = Query(None),
     batch_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -113,13 +85,11 @@ async def export_allocations(
     """
     Export all matching allocations and send via email.
     """
-    service = TrainingCandidateAllocationService(db)
     from loguru import logger
     logger.info(f"API: Export training allocations requested by {current_user.email}")
     
-    # Trigger export in background
-    background_tasks.add_task(
-        _run_export_allocations,
+    # Run the export in a job worker
+    job = await JobService(db).enqueue(job_handlers.export_allocations, dict(
         user_id=current_user.id,
         user_email=current_user.email,
         user_name=current_user.full_name or current_user.username,
@@ -133,9 +103,12 @@ async def export_allocations(
         batch_tag=batch_tag,
         sort_by=sort_by,
         sort_order=sort_order
-    )
+    ), user_id=current_user.id)
     
-    return {"message": f"Export started. The report will be sent to {current_user.email} shortly."}
+    return {
+        "message": f"Export started. The report will be sent to {current_user.email} shortly.",
+        "job_id": job.public_id,
+    }
 
 
 @router.post("/", response_model=TrainingCandidateAllocationResponse, status_code=status.HTTP_201_CREATED)
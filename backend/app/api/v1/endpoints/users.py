@@ -3,7 +3,7 @@
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.core.rate_limiter import rate_limit_medium
 from app.api.deps import get_current_user, require_roles
 from app.models.user import User, UserRole
@@ -89,8 +89,8 @@ async def update_current_user(
 @rate_limit_medium()
 async def get_user_stats(
     request: Request,
-    current_user: User = Depends(require_roles([UserRole.ADMIN])),
-    db: AsyncSession = Depends(get_db)
+    current_user: User = Depends(require_roles([UserRole.ADMIN], read_only=True)),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get user statistics (Admin or Manager only)
@@ -42,7 +42,9 @@ from app.api.v1.endpoints import (
     dsr_project_requests,
     company_holidays,
     notifications,
+    jobs,
     maintenance,
+    debug,
     skills,
     ai,
     ai_settings,
@@ -53,64 +55,70 @@ from app.api.v1.endpoints import (
 )
 
 
-# Create main v1 router
-router = APIRouter()
+def include_routers(parent: APIRouter, prefix: str = "") -> None:
+    """
+    Include every v1 endpoint router into ``parent`` under ``prefix``.
 
-# Include all endpoint routers
-router.include_router(auth.router)
-router.include_router(users.router)
-router.include_router(activity_logs.router)
-router.include_router(candidates.router)
-router.include_router(candidate_screening.router)
-router.include_router(candidate_documents.router)
-router.include_router(candidate_counseling.router)
-router.include_router(analytics.router)
-router.include_router(training_batches.router)
-router.include_router(training_candidate_allocations.router)
-router.include_router(settings.router)
-router.include_router(system_settings.router)
-router.include_router(tickets.router)
-router.include_router(training_attendance.router, prefix="/training-extensions")
-router.include_router(training_assignments.router, prefix="/training-extensions")
+    FastAPI rebuilds each route (dependencies, response fields) on every
+    ``include_router``, so the endpoint routers are included straight into
+    the application router instead of through an intermediate v1 router.
+    """
+    parent.include_router(auth.router, prefix=prefix)
+    parent.include_router(users.router, prefix=prefix)
+    parent.include_router(activity_logs.router, prefix=prefix)
+    parent.include_router(candidates.router, prefix=prefix)
+    parent.include_router(candidate_screening.router, prefix=prefix)
+    parent.include_router(candidate_documents.router, prefix=prefix)
+    parent.include_router(candidate_counseling.router, prefix=prefix)
+    parent.include_router(analytics.router, prefix=prefix)
+    parent.include_router(training_batches.router, prefix=prefix)
+    parent.include_router(training_candidate_allocations.router, prefix=prefix)
+    parent.include_router(settings.router, prefix=prefix)
+    parent.include_router(system_settings.router, prefix=prefix)
+    parent.include_router(tickets.router, prefix=prefix)
+    parent.include_router(training_attendance.router, prefix=prefix + "/training-extensions")
+    parent.include_router(training_assignments.router, prefix=prefix + "/training-extensions")
 
-router.include_router(training_events.router, prefix="/training-extensions")
-router.include_router(training_mock_interviews.router, prefix="/training-extensions")
-router.include_router(training_candidate_analyses.router, prefix="/training-extensions")
-router.include_router(training_batch_plans.router)
-router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
+    parent.include_router(training_events.router, prefix=prefix + "/training-extensions")
+    parent.include_router(training_mock_interviews.router, prefix=prefix + "/training-extensions")
+    parent.include_router(training_candidate_analyses.router, prefix=prefix + "/training-extensions")
+    parent.include_router(training_batch_plans.router, prefix=prefix)
+    parent.include_router(notifications.router, prefix=prefix + "/notifications", tags=["Notifications"])
+    parent.include_router(jobs.router, prefix=prefix + "/jobs", tags=["Jobs"])
 
-# CRM Routers
-router.include_router(companies.router, prefix="/crm/companies", tags=["CRM Companies"])
-router.include_router(contacts.router, prefix="/crm/contacts", tags=["CRM Contacts"])
-router.include_router(leads.router, prefix="/crm/leads", tags=["CRM Leads"])
-router.include_router(deals.router, prefix="/crm/deals", tags=["CRM Deals"])
-router.include_router(crm_tasks.router, prefix="/crm/tasks", tags=["CRM Tasks"])
-router.include_router(crm_activities.router, prefix="/crm/activities", tags=["CRM Activities"])
-# Placement Routers
-router.include_router(job_roles.router, prefix="/placement/job-roles", tags=["Placement Job Roles"])
-router.include_router(placement_mapping.router)
-router.include_router(placement_pipeline.router, prefix="/placement/pipeline", tags=["Placement Pipeline"])
-router.include_router(placement_interviews.router, prefix="/placement/interviews", tags=["Placement Interviews"])
-router.include_router(placement_offers.router, prefix="/placement/offers", tags=["Placement Offers"])
-router.include_router(placement_notes.router, prefix="/placement/notes", tags=["Placement Notes"])
+    # CRM Routers
+    parent.include_router(companies.router, prefix=prefix + "/crm/companies", tags=["CRM Companies"])
+    parent.include_router(contacts.router, prefix=prefix + "/crm/contacts", tags=["CRM Contacts"])
+    parent.include_router(leads.router, prefix=prefix + "/crm/leads", tags=["CRM Leads"])
+    parent.include_router(deals.router, prefix=prefix + "/crm/deals", tags=["CRM Deals"])
+    parent.include_router(crm_tasks.router, prefix=prefix + "/crm/tasks", tags=["CRM Tasks"])
+    parent.include_router(crm_activities.router, prefix=prefix + "/crm/activities", tags=["CRM Activities"])
+    # Placement Routers
+    parent.include_router(job_roles.router, prefix=prefix + "/placement/job-roles", tags=["Placement Job Roles"])
+    parent.include_router(placement_mapping.router, prefix=prefix)
+    parent.include_router(placement_pipeline.router, prefix=prefix + "/placement/pipeline", tags=["Placement Pipeline"])
+    parent.include_router(placement_interviews.router, prefix=prefix + "/placement/interviews", tags=["Placement Interviews"])
+    parent.include_router(placement_offers.router, prefix=prefix + "/placement/offers", tags=["Placement Offers"])
+    parent.include_router(placement_notes.router, prefix=prefix + "/placement/notes", tags=["Placement Notes"])
 
-# DSR Routers
-router.include_router(dsr_projects.router, prefix="/dsr/projects", tags=["DSR Projects"])
-router.include_router(dsr_activities.router, prefix="/dsr/activities", tags=["DSR Activities"])
-router.include_router(dsr_entries.router, prefix="/dsr", tags=["DSR Entries"])
-router.include_router(dsr_leaves.router, prefix="/dsr/leaves", tags=["DSR Leaves"])
-router.include_router(dsr_activity_types.router, prefix="/dsr/activity-types", tags=["DSR Activity Types"])
-router.include_router(dsr_project_requests.router, prefix="/dsr/project-requests", tags=["DSR Project Requests"])
-router.include_router(company_holidays.router, prefix="/dsr/holidays", tags=["Company Holidays"])
-router.include_router(maintenance.router, prefix="/maintenance", tags=["Maintenance"])
-router.include_router(skills.router, prefix="/skills", tags=["Skills"])
+    # DSR Routers
+    parent.include_router(dsr_projects.router, prefix=prefix + "/dsr/projects", tags=["DSR Projects"])
+    parent.include_router(dsr_activities.router, prefix=prefix + "/dsr/activities", tags=["DSR Activities"])
+    parent.include_router(dsr_entries.router, prefix=prefix + "/dsr", tags=["DSR Entries"])
+    parent.include_router(dsr_leaves.router, prefix=prefix + "/dsr/leaves", tags=["DSR Leaves"])
+    parent.include_router(dsr_activity_types.router, prefix=prefix + "/dsr/activity-types", tags=["DSR Activity Types"])
+    parent.include_router(dsr_project_requests.router, prefix=prefix + "/dsr/project-requests", tags=["DSR Project Requests"])
+    parent.include_router(company_holidays.router, prefix=prefix + "/dsr/holidays", tags=["Company Holidays"])
+    parent.include_router(maintenance.router, prefix=prefix + "/maintenance", tags=["Maintenance"])
+    parent.include_router(debug.router, prefix=prefix + "/debug", tags=["Debug"])
+    parent.include_router(skills.router, prefix=prefix + "/skills", tags=["Skills"])
 
-# AI Engine
-router.include_router(ai.router, prefix="/ai", tags=["AI Engine"])
-router.include_router(ai_settings.router, prefix="/ai/settings", tags=["AI Engine Settings"])
-router.include_router(ai_chat.router, prefix="/ai/chat", tags=["AI Engine Chat"])
-router.include_router(user_email_configuration.router, tags=["User Email Configuration"])
-router.include_router(placement_email.router, tags=["Placement Email"])
-router.include_router(consent.router, prefix="/consent", tags=["Consent"])
-router.include_router(public_mock_interviews.router)
+    # AI Engine
+    parent.include_router(ai.router, prefix=prefix + "/ai", tags=["AI Engine"])
+    parent.include_router(ai_settings.router, prefix=prefix + "/ai/settings", tags=["AI Engine Settings"])
+    parent.include_router(ai_chat.router, prefix=prefix + "/ai/chat", tags=["AI Engine Chat"])
+    parent.include_router(user_email_configuration.router, prefix=prefix, tags=["User Email Configuration"])
+    parent.include_router(placement_email.router, prefix=prefix, tags=["Placement Email"])
+    parent.include_router(consent.router, prefix=prefix + "/consent", tags=["Consent"])
+    parent.include_router(public_mock_interviews.router, prefix=prefix)
 
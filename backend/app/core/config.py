@@ -1,7 +1,7 @@
 """Application configuration using Pydantic Settings"""
 
 import os
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import AnyHttpUrl, PostgresDsn, validator
 
@@ -36,6 +36,33 @@ class Settings(BaseSettings):
         if isinstance(v, str):
             return v
         return f"postgresql+asyncpg://{values.get('POSTGRES_USER')}:{values.get('POSTGRES_PASSWORD')}@{values.get('POSTGRES_SERVER')}:{values.get('POSTGRES_PORT')}/{values.get('POSTGRES_DB')}"
+
+    # Read replica for get_read_db (dashboards, exports, analytics); unset = primary
+    DATABASE_READ_URL: Optional[str] = None
+    READ_REPLICA_MAX_LAG_SECONDS: float = 30.0  # Lagging further than this routes reads to the primary
+    READ_REPLICA_CHECK_INTERVAL_SECONDS: float = 10.0  # How often each worker re-checks replica lag
+
+    # Direct connection for the session-level features (notification LISTEN,
+    # scheduler leader lock) when DATABASE_URL goes through PgBouncer in
+    # transaction mode; unset = DATABASE_URL
+    DATABASE_DIRECT_URL: Optional[str] = None
+
+    # Connection pool (per process). DB_CONNECTION_BUDGET is the total the
+    # application may hold on the server. Each API worker's dedicated
+    # listener / scheduler connections come off the top; the rest is split
+    # evenly across DB_POOL_PROCESSES (default: WORKERS API workers + 1 job
+    # worker); half of each share is kept open, the rest is overflow.
+    # DB_POOL_SIZE / DB_MAX_OVERFLOW override.
+    DB_CONNECTION_BUDGET: int = 80
+    DB_POOL_PROCESSES: Optional[int] = None
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0  # Checkout wait before giving up
+    DB_POOL_RECYCLE_SECONDS: int = 1800  # Connections older than this are replaced at checkout
+    DB_POOL_PRE_PING: bool = False  # Recycle + LIFO replace the per-checkout ping
+    DB_POOL_SLOW_CHECKOUT_SECONDS: float = 0.5  # Checkouts waiting longer are logged as pool starvation
+    DB_STATEMENT_CACHE_SIZE: int = 100  # Prepared statements cached per connection
+    DB_PGBOUNCER_MODE: bool = False  # PgBouncer transaction pooling: no prepared statement caching
     
     # Redis (for rate limiting and caching) - OPTIONAL
     # Rate limiting uses in-memory storage by default
@@ -79,6 +106,65 @@ class Settings(BaseSettings):
     LOG_ROTATION: str = "500 MB"
     LOG_RETENTION: str = "30 days"
     LOG_FORMAT: str = "json"  # json or text
+    ACCESS_LOG_MODE: str = "full"  # full or sampled
+    ACCESS_LOG_SAMPLE_RATE: float = 0.1  # Fraction of successful requests logged in sampled mode
+    ACCESS_LOG_SLOW_REQUEST_SECONDS: float = 1.0  # Always logged in sampled mode
+    
+    # File Delivery (candidate document downloads)
+    FILE_DELIVERY_MODE: str = "direct"  # direct (app streams) or x-accel (nginx serves via X-Accel-Redirect)
+    FILE_ACCEL_REDIRECT_PREFIX: str = "/_protected/uploads/"  # internal nginx location aliased to uploads/
+    
+    # Metrics (Prometheus exposition at /metrics)
+    METRICS_ENABLED: bool = True
+    METRICS_SCRAPE_TOKEN: str = ""  # Bearer token the scraper sends; every scrape is refused while empty
+    
+    # Query Profiling (opt-in, adds per-request SQL statistics)
+    QUERY_PROFILER_ENABLED: bool = False
+    QUERY_PROFILER_N_PLUS_ONE_THRESHOLD: int = 10  # Same statement shape > N times per request
+    QUERY_PROFILER_SLOW_REQUEST_SECONDS: float = 1.0
+    
+    # Audit Logging (buffered activity log writer)
+    AUDIT_PIPELINE_ENABLED: bool = True
+    AUDIT_QUEUE_MAX_SIZE: int = 10000  # Rows beyond this spill to the spool file
+    AUDIT_BATCH_SIZE: int = 200  # Max rows per multi-row INSERT
+    AUDIT_FLUSH_INTERVAL_MS: int = 500
+    AUDIT_SPOOL_FILE: str = "logs/audit_spool.jsonl"  # Durable fallback on DB failure
+    
+    # Log Table Partitioning & Retention (activity_logs, crm_activity_logs, ai_task_logs)
+    LOG_PARTITION_MONTHS_AHEAD: int = 3  # Monthly partitions created ahead of time
+    ACTIVITY_LOG_RETENTION_DAYS: int = 0  # Audit trail; 0 keeps it forever, set to opt in to dropping old months
+    CRM_ACTIVITY_LOG_RETENTION_DAYS: int = 0  # 0 keeps CRM timelines forever
+    LOG_ARCHIVE_ENABLED: bool = True  # Write expired partitions to gzip before dropping
+    LOG_ARCHIVE_DIR: str = "logs/archive"
+    
+    # Notification Push (SSE stream at /notifications/stream)
+    NOTIFICATION_PUSH_LISTEN: bool = True  # Fan out across workers with Postgres LISTEN/NOTIFY
+    NOTIFICATION_CHANNEL: str = "notification_events"
+    NOTIFICATION_STREAM_HEARTBEAT_SECONDS: float = 15.0  # Keeps proxies from closing idle streams
+    NOTIFICATION_SUBSCRIBER_QUEUE_SIZE: int = 100  # Events buffered per slow client before resync
+    
+    # Candidate Filter Panel (/candidates/filter-options, served from memory)
+    CANDIDATE_FACETS_TTL_SECONDS: float = 300.0  # Bounds how long other workers' writes take to show; 0 rebuilds per request
+    
+    # Background Jobs (jobs table, run by `python -m app.jobs.worker`)
+    JOB_QUEUE_CONCURRENCY: Dict[str, int] = {"default": 4, "exports": 2, "maintenance": 1}  # Queues a worker serves, with slots each
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0  # How often an idle queue is checked for due jobs
+    JOB_HEARTBEAT_SECONDS: int = 15
+    JOB_STALE_AFTER_SECONDS: int = 120  # Running jobs without a heartbeat this long are requeued
+    JOB_RETRY_BASE_SECONDS: int = 30  # Doubled per attempt
+    JOB_RETRY_MAX_SECONDS: int = 1800
+    JOB_SHUTDOWN_GRACE_SECONDS: float = 30.0  # Running jobs get this long to finish on SIGTERM
+    JOB_RUN_IN_PROCESS: bool = False  # Development: run a worker inside the API process
+    JOB_HISTORY_RETENTION_DAYS: int = 30  # Finished jobs (and their schedule history) kept this long; 0 keeps all
+    
+    # Scheduler (cron schedules fired by one elected API worker; the work runs as jobs)
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TIMEZONE: str = "Asia/Kolkata"  # Cron expressions and daily stats use this zone
+    SCHEDULER_MISFIRE_GRACE_SECONDS: int = 3600  # Slots missed by up to this much (deploys) still fire
+    SCHEDULE_DSR_REMINDERS: str = "0 18 * * 1-6"  # Empty string disables a schedule
+    SCHEDULE_LOG_RETENTION: str = "30 2 * * *"
+    SCHEDULE_DAILY_ROLLUP: str = "15 0 * * *"
+    DSR_REMINDER_BATCH_SIZE: int = 100  # Users loaded and reminded per batch
     
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
@@ -93,6 +179,25 @@ class Settings(BaseSettings):
     EMAILS_FROM_EMAIL: Optional[str] = None
     EMAILS_FROM_NAME: Optional[str] = None
     
+    # Email Delivery (email_outbox table drained by the background dispatcher)
+    EMAIL_DISPATCHER_ENABLED: bool = True  # Disable on workers that should only enqueue
+    EMAIL_DISPATCH_BATCH_SIZE: int = 50  # Messages claimed per dispatch round
+    EMAIL_DISPATCH_INTERVAL_SECONDS: float = 2.0  # Poll interval when the outbox is idle
+    EMAIL_DISPATCH_LEASE_SECONDS: int = 300  # "sending" rows older than this are reclaimed
+    EMAIL_MAX_ATTEMPTS: int = 8
+    EMAIL_RETRY_BASE_SECONDS: int = 30  # Doubled per attempt
+    EMAIL_RETRY_MAX_SECONDS: int = 3600
+    EMAIL_RATE_LIMIT_PER_MINUTE: int = 120  # Per SMTP host, per app worker
+    EMAIL_PROVIDER_RATE_LIMITS: Dict[str, int] = {}  # Per-host overrides, e.g. {"smtp.gmail.com": 20}
+    EMAIL_OUTBOX_RETENTION_DAYS: int = 30  # Sent/failed messages kept this long; 0 keeps all
+    EMAIL_ATTACHMENT_DIR: str = "uploads/outbox"  # Generated attachments awaiting delivery
+    EMAIL_MAX_ATTACHMENT_BYTES: int = 18 * 1024 * 1024  # Per message, before base64 (~24 MB encoded)
+    EMAIL_BULK_ATTACHMENT_MODE: str = "split"  # Over the limit: split (several emails) or zip (one archive if it fits)
+    SMTP_POOL_MAX_CONNECTIONS: int = 2  # Open connections per (host, user)
+    SMTP_POOL_IDLE_SECONDS: int = 60  # Idle connections are closed after this
+    SMTP_POOL_MAX_MESSAGES_PER_CONNECTION: int = 100
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    
     # Email Recipients (Override in .env)
     SOURCING_EMAIL: str = "sourcing@winvinayafoundation.org"
     TIMESHEET_SUBMISSION_EMAIL: str = "timesheet.submission@winvinaya.com"
@@ -132,6 +237,11 @@ class Settings(BaseSettings):
     AI_MAX_RETRIES: int = 3                 # Retry failed tool calls
     AI_APPROVAL_RECORD_THRESHOLD: int = 5   # Tasks touching >N records need approval
     AI_LOG_RETENTION_DAYS: int = 90         # How long to keep AI task journals
+
+    # Document Text Extraction (PDF/DOCX parsed in worker processes, cached by sha256)
+    DOCUMENT_EXTRACTION_WORKERS: int = 2            # Processes per app worker
+    DOCUMENT_EXTRACTION_TIMEOUT_SECONDS: float = 20.0
+    DOCUMENT_EXTRACTION_MAX_PAGES: int = 50         # Later pages are ignored
     
     model_config = SettingsConfigDict(
         env_file=os.getenv("ENV_FILE", ".env"),
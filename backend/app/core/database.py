@@ -1,33 +1,156 @@
 """Database configuration and session management"""
 
-from typing import AsyncGenerator
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+import asyncio
+import time
+import uuid
+from typing import AsyncGenerator, Optional, Tuple
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError, TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import NullPool, AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_CAPACITY,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_READ_SESSIONS_TOTAL,
+    DB_REPLICA_LAG,
+    instrument_pool,
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that records how long each checkout waits for a connection,
+    counts checkouts that time out and logs slow ones (pool starvation).
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            DB_POOL_CHECKOUT_WAIT.observe(waited)
+            if waited >= settings.DB_POOL_SLOW_CHECKOUT_SECONDS:
+                logger.warning(f"Waited {waited:.2f}s for a database connection: {self.status()}")
+
+
+def direct_connections() -> int:
+    """Connections each API worker holds outside its pool (LISTEN, scheduler lock)"""
+    return int(settings.NOTIFICATION_PUSH_LISTEN) + int(settings.SCHEDULER_ENABLED)
+
+
+def pool_limits() -> Tuple[int, int]:
+    """
+    (pool_size, max_overflow) for one process: DB_CONNECTION_BUDGET, less the
+    API workers' dedicated connections, split across DB_POOL_PROCESSES, half
+    kept open and half overflow, unless DB_POOL_SIZE / DB_MAX_OVERFLOW are set.
+    """
+    processes = settings.DB_POOL_PROCESSES or settings.WORKERS + 1
+    budget = settings.DB_CONNECTION_BUDGET - settings.WORKERS * direct_connections()
+    share = max(budget // processes, 1)
+    pool_size = settings.DB_POOL_SIZE if settings.DB_POOL_SIZE is not None else max((share + 1) // 2, 1)
+    max_overflow = (
+        settings.DB_MAX_OVERFLOW if settings.DB_MAX_OVERFLOW is not None else max(share - pool_size, 0)
+    )
+    return pool_size, max_overflow
+
+
+def _connect_args() -> dict:
+    if settings.DB_PGBOUNCER_MODE:
+        # In transaction mode consecutive statements may reach different
+        # server connections, so nothing may rely on a statement prepared
+        # earlier on "this" connection: disable asyncpg's and SQLAlchemy's
+        # caches and give every prepared statement a unique name
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        }
+    return {"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+
+def direct_dsn() -> Optional[str]:
+    """
+    asyncpg DSN for connections that keep session state (LISTEN, advisory
+    locks). In PgBouncer mode DATABASE_URL cannot carry that state from one
+    transaction to the next, so only DATABASE_DIRECT_URL qualifies; None
+    when it is not set.
+    """
+    url = settings.DATABASE_DIRECT_URL or (None if settings.DB_PGBOUNCER_MODE else settings.DATABASE_URL)
+    return url.replace("postgresql+asyncpg://", "postgresql://", 1) if url else None
+
+
+async def connect_direct():
+    """A raw asyncpg connection to direct_dsn(), outside the pool"""
+    import asyncpg
+
+    dsn = direct_dsn()
+    if dsn is None:
+        raise RuntimeError("DB_PGBOUNCER_MODE needs DATABASE_DIRECT_URL for session-level connections")
+    # Only a handful of short statements run here; nothing worth preparing
+    return await asyncpg.connect(dsn, statement_cache_size=0)
+
+
+def _create_engine(url: str, poolclass=AsyncAdaptedQueuePool) -> AsyncEngine:
+    options = {}
+    if settings.ENVIRONMENT == "testing":
+        poolclass = NullPool
+    else:
+        pool_size, max_overflow = pool_limits()
+        options = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            # Reuse the most recently returned connection, so surplus ones sit
+            # idle and are recycled instead of every connection staying warm
+            "pool_use_lifo": True,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        }
+    return create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=poolclass,
+        connect_args=_connect_args(),
+        # Disable SSL for local connections (avoids SSLKEYLOGFILE env var issues)
+        # connect_args={"ssl": False},
+        **options,
+    )
+
+
+def _session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
 
 
 # Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    poolclass=NullPool if settings.ENVIRONMENT == "testing" else None,
-    # Disable SSL for local connections (avoids SSLKEYLOGFILE env var issues)
-    # connect_args={"ssl": False},  
-)
+engine = _create_engine(settings.DATABASE_URL, InstrumentedQueuePool)
+
+instrument_pool(engine.sync_engine)
+if isinstance(engine.pool, InstrumentedQueuePool):
+    DB_POOL_CAPACITY.set(sum(pool_limits()))
 
 # Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+AsyncSessionLocal = _session_factory(engine)
+
+# Optional read replica for get_read_db
+read_engine: Optional[AsyncEngine] = (
+    _create_engine(settings.DATABASE_READ_URL) if settings.DATABASE_READ_URL else None
 )
+ReadSessionLocal: Optional[async_sessionmaker] = _session_factory(read_engine) if read_engine else None
 
 
 class Base(DeclarativeBase):
@@ -55,6 +178,107 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+# Seconds of replay lag; 0 on a primary and on a replica that has replayed
+# everything it received (pg_last_xact_replay_timestamp stops moving when
+# the primary is idle, so it alone would overstate the lag)
+_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+_REPLICA_PROBE_TIMEOUT = 2.0
+
+
+class ReplicaHealth:
+    """
+    Per-worker view of whether the read replica may serve reads: reachable and
+    no more than READ_REPLICA_MAX_LAG_SECONDS behind. Re-checked at most every
+    READ_REPLICA_CHECK_INTERVAL_SECONDS; requests in between use the last answer.
+    """
+
+    def __init__(self) -> None:
+        self.usable: Optional[bool] = None  # None until the first check
+        self.checked_at: Optional[float] = None
+
+    async def is_usable(self, bind: AsyncEngine) -> bool:
+        now = time.monotonic()
+        if self.checked_at is not None and now - self.checked_at < settings.READ_REPLICA_CHECK_INTERVAL_SECONDS:
+            return self.usable
+        # Claim the check first so concurrent requests do not probe as well
+        self.checked_at = now
+        try:
+            lag = await asyncio.wait_for(self._lag(bind), _REPLICA_PROBE_TIMEOUT)
+        except (OSError, SQLAlchemyError, asyncio.TimeoutError) as exc:
+            self._set(False, f"unreachable ({type(exc).__name__})")
+            return False
+        DB_REPLICA_LAG.set(lag)
+        if lag > settings.READ_REPLICA_MAX_LAG_SECONDS:
+            self._set(False, f"{lag:.0f}s behind")
+        else:
+            self._set(True, "caught up")
+        return self.usable
+
+    def mark_down(self, reason: str) -> None:
+        """Stop routing to the replica until the next check"""
+        self.checked_at = time.monotonic()
+        self._set(False, reason)
+
+    async def _lag(self, bind: AsyncEngine) -> float:
+        async with bind.connect() as connection:
+            return float((await connection.execute(_REPLICA_LAG_SQL)).scalar() or 0)
+
+    def _set(self, usable: bool, reason: str) -> None:
+        if usable != self.usable:
+            if usable:
+                logger.info(f"Read replica {reason}; routing reads to it")
+            else:
+                logger.warning(f"Read replica {reason}; routing reads to the primary")
+        self.usable = usable
+
+
+replica_health = ReplicaHealth()
+
+_READ_ONLY = text("SET TRANSACTION READ ONLY")
+
+
+async def _open_read_session() -> AsyncSession:
+    if ReadSessionLocal is not None and await replica_health.is_usable(read_engine):
+        session = ReadSessionLocal()
+        try:
+            await session.execute(_READ_ONLY)
+            DB_READ_SESSIONS_TOTAL.labels(target="replica").inc()
+            return session
+        except (OSError, DBAPIError) as exc:
+            await session.close()
+            replica_health.mark_down(f"failed a checkout ({type(exc).__name__})")
+    session = AsyncSessionLocal()
+    try:
+        await session.execute(_READ_ONLY)
+    except Exception:
+        await session.close()
+        raise
+    DB_READ_SESSIONS_TOTAL.labels(target="primary").inc()
+    return session
+
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for endpoints that only read (dashboards, exports, analytics).
+
+    The session runs in a READ ONLY transaction on the read replica when one
+    is configured, reachable and caught up, and on the primary otherwise.
+    It is never committed, so writes through it fail instead of landing.
+    Reads may be up to READ_REPLICA_MAX_LAG_SECONDS stale.
+    """
+    session = await _open_read_session()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
 async def init_db() -> None:
     """Initialize database - create all tables"""
     async with engine.begin() as conn:
@@ -64,3 +288,5 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database connections"""
     await engine.dispose()
+    if read_engine is not None:
+        await read_engine.dispose()
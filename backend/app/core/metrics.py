@@ -0,0 +1,312 @@
+"""Prometheus metrics registry and helpers
+
+All application metrics are declared here so instrumented modules only import
+the metric objects they update. When uvicorn runs several workers, set the
+``PROMETHEUS_MULTIPROC_DIR`` environment variable to an empty, writable
+directory before start-up; each worker then writes its samples there and
+``/metrics`` aggregates them across workers.
+"""
+
+import os
+import time
+import functools
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    REGISTRY,
+)
+from sqlalchemy import event
+
+
+MULTIPROCESS_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SLOW_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+
+# ── HTTP ──────────────────────────────────────────────────────────────────────
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTP requests by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# ── Database pool ─────────────────────────────────────────────────────────────
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections currently checked out of the SQLAlchemy pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections open beyond pool_size (max_overflow headroom in use)",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to obtain a connection from the pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CAPACITY = Gauge(
+    "db_pool_capacity_connections",
+    "Connections the SQLAlchemy pool may open (pool_size + max_overflow)",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after waiting pool_timeout for a connection",
+)
+DB_READ_SESSIONS_TOTAL = Counter(
+    "db_read_sessions_total",
+    "Read-only sessions opened by get_read_db, by the server they were routed to",
+    ["target"],
+)
+DB_REPLICA_LAG = Gauge(
+    "db_replica_lag_seconds",
+    "Replication lag of the read replica at its last health check",
+    multiprocess_mode="max",
+)
+
+# ── AI providers ──────────────────────────────────────────────────────────────
+AI_REQUEST_DURATION = Histogram(
+    "ai_provider_request_duration_seconds",
+    "LLM provider call latency",
+    ["provider", "operation"],
+    buckets=SLOW_BUCKETS,
+)
+AI_REQUESTS_TOTAL = Counter(
+    "ai_provider_requests_total",
+    "LLM provider calls by outcome",
+    ["provider", "operation", "outcome"],
+)
+AI_TOKENS_TOTAL = Counter(
+    "ai_provider_tokens_total",
+    "Tokens consumed as reported by the provider",
+    ["provider", "model"],
+)
+
+# ── Email ─────────────────────────────────────────────────────────────────────
+EMAIL_SEND_DURATION = Histogram(
+    "email_send_duration_seconds",
+    "Time to hand a message to the SMTP server",
+    ["sender", "outcome"],
+    buckets=SLOW_BUCKETS,
+)
+EMAIL_OUTBOX_DEPTH = Gauge(
+    "email_outbox_depth",
+    "Messages in the email outbox not yet sent or failed",
+    multiprocess_mode="max",
+)
+EMAIL_DELIVERIES_TOTAL = Counter(
+    "email_deliveries_total",
+    "Outbox delivery attempts by category and outcome (sent, retry, failed)",
+    ["category", "outcome"],
+)
+EMAIL_DELIVERY_LATENCY = Histogram(
+    "email_delivery_latency_seconds",
+    "Time from enqueue to acceptance by the SMTP server",
+    ["category"],
+    buckets=SLOW_BUCKETS + (300.0, 900.0, 3600.0),
+)
+EMAIL_SMTP_CONNECTIONS_TOTAL = Counter(
+    "email_smtp_connections_opened_total",
+    "SMTP connections opened by the delivery pool",
+    ["provider"],
+)
+
+# ── Notification push ─────────────────────────────────────────────────────────
+NOTIFICATION_SUBSCRIBERS = Gauge(
+    "notification_stream_subscribers",
+    "Open notification push streams",
+    multiprocess_mode="livesum",
+)
+NOTIFICATION_EVENTS_TOTAL = Counter(
+    "notification_events_total",
+    "Notification push events by outcome (published, delivered, dropped)",
+    ["outcome"],
+)
+
+# ── Background tasks ──────────────────────────────────────────────────────────
+BACKGROUND_TASKS_IN_PROGRESS = Gauge(
+    "background_tasks_in_progress",
+    "Background tasks queued or running in this worker",
+    ["task"],
+    multiprocess_mode="livesum",
+)
+BACKGROUND_TASK_DURATION = Histogram(
+    "background_task_duration_seconds",
+    "Background task run time by outcome",
+    ["task", "outcome"],
+    buckets=SLOW_BUCKETS,
+)
+
+# ── Job queue ─────────────────────────────────────────────────────────────────
+JOB_QUEUE_DEPTH = Gauge(
+    "job_queue_depth",
+    "Queued jobs waiting for a worker",
+    ["queue"],
+    multiprocess_mode="max",
+)
+JOBS_IN_PROGRESS = Gauge(
+    "jobs_in_progress",
+    "Jobs running in job worker processes",
+    ["queue"],
+    multiprocess_mode="livesum",
+)
+JOBS_TOTAL = Counter(
+    "jobs_total",
+    "Job runs by outcome (succeeded, retry, failed, interrupted)",
+    ["name", "outcome"],
+)
+JOB_DURATION = Histogram(
+    "job_duration_seconds",
+    "Job run time",
+    ["name"],
+    buckets=SLOW_BUCKETS + (300.0, 900.0, 1800.0),
+)
+JOB_QUEUE_WAIT = Histogram(
+    "job_queue_wait_seconds",
+    "Time from a job becoming due to a worker starting it",
+    ["queue"],
+    buckets=SLOW_BUCKETS + (300.0, 900.0),
+)
+
+# ── Scheduler ─────────────────────────────────────────────────────────────────
+SCHEDULER_LEADER = Gauge(
+    "scheduler_leader",
+    "1 in the worker currently holding the scheduler leadership lock",
+    multiprocess_mode="livesum",
+)
+SCHEDULED_RUNS_TOTAL = Counter(
+    "scheduled_runs_total",
+    "Schedule firings that enqueued a job",
+    ["schedule"],
+)
+
+# ── Audit log pipeline ────────────────────────────────────────────────────────
+AUDIT_QUEUE_DEPTH = Gauge(
+    "audit_log_queue_depth",
+    "Activity log rows waiting for the background writer",
+    multiprocess_mode="livesum",
+)
+AUDIT_EVENTS_TOTAL = Counter(
+    "audit_log_events_total",
+    "Activity log rows by pipeline outcome (enqueued, written, overflow, spooled, replayed, dropped)",
+    ["outcome"],
+)
+AUDIT_FLUSH_DURATION = Histogram(
+    "audit_log_flush_duration_seconds",
+    "Time to write one batch of activity log rows",
+    buckets=LATENCY_BUCKETS,
+)
+AUDIT_BATCH_SIZE = Histogram(
+    "audit_log_batch_size",
+    "Rows written per activity log flush",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+
+# ── Candidate filter panel ────────────────────────────────────────────────────
+CANDIDATE_FACETS_BUILD_DURATION = Histogram(
+    "candidate_facets_build_duration_seconds",
+    "Time to rebuild the in-memory candidate facet index",
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@contextmanager
+def observe_email_send(sender: str) -> Iterator[dict]:
+    """
+    Time an SMTP send. The caller sets ``result["outcome"]`` when the send
+    fails without raising (the default outcome is ``success``).
+    """
+    result = {"outcome": "success"}
+    start = time.perf_counter()
+    try:
+        yield result
+    except Exception:
+        result["outcome"] = "error"
+        raise
+    finally:
+        EMAIL_SEND_DURATION.labels(sender=sender, outcome=result["outcome"]).observe(
+            time.perf_counter() - start
+        )
+
+
+def tracked_task(name: str, func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Wrap a coroutine function handed to ``BackgroundTasks.add_task`` so queue
+    depth and run time are visible. The in-progress gauge is raised when the
+    task is scheduled and lowered when it finishes.
+    """
+    BACKGROUND_TASKS_IN_PROGRESS.labels(task=name).inc()
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        outcome = "success"
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            outcome = "error"
+            raise
+        finally:
+            BACKGROUND_TASKS_IN_PROGRESS.labels(task=name).dec()
+            BACKGROUND_TASK_DURATION.labels(task=name, outcome=outcome).observe(
+                time.perf_counter() - start
+            )
+
+    return wrapper
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Serialize all metrics, aggregating across workers in multiprocess mode"""
+    if MULTIPROCESS_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead() -> None:
+    """Drop this worker's live gauges from the multiprocess aggregate"""
+    if MULTIPROCESS_DIR:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def instrument_pool(sync_engine: Any) -> None:
+    """Keep the pool gauges current on every checkout and checkin"""
+    pool = sync_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return
+
+    def _on_checkout(*_args) -> None:
+        DB_POOL_CHECKED_OUT.set(pool.checkedout())
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    def _on_checkin(*_args) -> None:
+        # Fired before the connection is returned to the queue
+        DB_POOL_CHECKED_OUT.set(max(pool.checkedout() - 1, 0))
+        DB_POOL_OVERFLOW.set(max(pool.overflow(), 0))
+
+    event.listen(sync_engine, "checkout", _on_checkout)
+    event.listen(sync_engine, "checkin", _on_checkin)
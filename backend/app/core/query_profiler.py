@@ -0,0 +1,177 @@
+"""Per-request SQL query profiling and N+1 detection
+
+Hooks SQLAlchemy engine events to count the statements, database time and rows
+returned for the request currently being served. Statements are reduced to a
+"shape" (literals and bind values stripped) so repeated lookups issued from a
+loop can be flagged as likely N+1 patterns.
+
+Profiling is opt-in via ``settings.QUERY_PROFILER_ENABLED``. Aggregates are kept
+in-process, so with several uvicorn workers each worker reports its own view.
+"""
+
+import re
+import time
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+_TYPE_CAST = re.compile(r"::\w+(?:\[\])?")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"(\$\d+|%\(\w+\)s|:\w+|\?)")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*(?:\?\s*,\s*)*\?\s*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape.
+
+    Type casts are dropped, literals and bind parameters are replaced by ``?``
+    and ``IN (...)`` lists of any length collapse to ``IN (?)``, so the same
+    query issued with different arguments maps to the same shape.
+    """
+    shape = _TYPE_CAST.sub("", statement)
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _BIND_PARAM.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _IN_LIST.sub("IN (?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class RequestQueryStats:
+    """SQL statistics collected for a single request"""
+
+    statement_count: int = 0
+    db_time: float = 0.0
+    rows: int = 0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float, rows: int) -> None:
+        self.statement_count += 1
+        self.db_time += duration
+        self.rows += max(rows, 0)
+        self.shapes[normalize_statement(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[tuple[str, int]]:
+        """Statement shapes executed more than ``threshold`` times"""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count > threshold
+        ]
+
+
+@dataclass
+class EndpointStats:
+    """Rolling aggregate for one route template"""
+
+    requests: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+    total_db_time: float = 0.0
+    total_statements: int = 0
+    max_statements: int = 0
+    n_plus_one_requests: int = 0
+
+    def to_dict(self, endpoint: str) -> Dict[str, Any]:
+        requests = self.requests or 1
+        return {
+            "endpoint": endpoint,
+            "requests": self.requests,
+            "avg_duration_ms": round(self.total_duration / requests * 1000, 2),
+            "max_duration_ms": round(self.max_duration * 1000, 2),
+            "avg_db_time_ms": round(self.total_db_time / requests * 1000, 2),
+            "avg_statements": round(self.total_statements / requests, 2),
+            "max_statements": self.max_statements,
+            "n_plus_one_requests": self.n_plus_one_requests,
+        }
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "query_profiler_stats", default=None
+)
+_endpoint_stats: Dict[str, EndpointStats] = {}
+_endpoint_lock = threading.Lock()
+
+
+def start_request() -> RequestQueryStats:
+    """Begin collecting statistics for the current request context"""
+    stats = RequestQueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    """Statistics for the request being served, if profiling is active"""
+    return _current_stats.get()
+
+
+def record_endpoint(
+    endpoint: str,
+    duration: float,
+    stats: RequestQueryStats,
+    n_plus_one: bool,
+) -> None:
+    """Fold a finished request into the per-endpoint aggregate"""
+    with _endpoint_lock:
+        agg = _endpoint_stats.setdefault(endpoint, EndpointStats())
+        agg.requests += 1
+        agg.total_duration += duration
+        agg.max_duration = max(agg.max_duration, duration)
+        agg.total_db_time += stats.db_time
+        agg.total_statements += stats.statement_count
+        agg.max_statements = max(agg.max_statements, stats.statement_count)
+        if n_plus_one:
+            agg.n_plus_one_requests += 1
+
+
+def slow_endpoints(limit: int = 20, order_by: str = "avg_duration_ms") -> List[Dict[str, Any]]:
+    """Return the slowest endpoints seen by this worker"""
+    with _endpoint_lock:
+        rows = [agg.to_dict(endpoint) for endpoint, agg in _endpoint_stats.items()]
+    rows.sort(key=lambda row: row.get(order_by, 0), reverse=True)
+    return rows[:limit]
+
+
+def reset_endpoint_stats() -> None:
+    """Clear the per-endpoint aggregate"""
+    with _endpoint_lock:
+        _endpoint_stats.clear()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_profiler_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("query_profiler_start")
+    if not starts:
+        return
+    duration = time.perf_counter() - starts.pop()
+
+    rows = getattr(cursor, "rowcount", -1)
+    if rows is None or rows < 0:
+        # The asyncpg adapter buffers SELECT results and reports rowcount -1
+        rows = len(getattr(cursor, "_rows", None) or ())
+    stats.record(statement, duration, rows)
+
+
+def install(engine: AsyncEngine | Engine) -> None:
+    """Attach the profiling listeners to an engine (idempotent)"""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
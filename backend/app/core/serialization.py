@@ -0,0 +1,59 @@
+"""Fast JSON encoding for responses and event streams
+
+``dumps`` encodes with orjson, which handles str/int/float/bool/None, dict,
+list, tuple, datetime/date/time, UUID, Enum and dataclasses natively. The
+fallback hook covers the rest of what ``jsonable_encoder`` accepts:
+
+* pydantic models, dumped in JSON mode by alias (as FastAPI does);
+* UUID subclasses such as asyncpg's, as strings;
+* Decimal, as int when integral and float otherwise (FastAPI's rule);
+* ORM instances, as their loaded attributes minus SQLAlchemy state;
+* sets, frozensets and generators, as lists; bytes, as UTF-8 text.
+
+``FastJSONResponse`` is the application's default response class. FastAPI
+still turns ``response_model`` results into plain data with pydantic first;
+endpoints returning large untyped payloads (ORM rows, nested dicts) can skip
+``jsonable_encoder`` entirely by returning ``FastJSONResponse(data)``.
+"""
+
+from decimal import Decimal
+from types import GeneratorType
+from typing import Any
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True)
+    if isinstance(value, UUID):
+        # Subclasses, e.g. asyncpg's, which orjson does not pick up natively
+        return str(value)
+    if isinstance(value, Decimal):
+        return int(value) if value.as_tuple().exponent >= 0 else float(value)
+    if isinstance(value, (set, frozenset, GeneratorType)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode()
+    state = getattr(value, "__dict__", None)
+    if state is not None and hasattr(value, "_sa_instance_state"):
+        return {key: item for key, item in state.items() if not key.startswith("_sa")}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF-8 JSON"""
+    return orjson.dumps(value, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
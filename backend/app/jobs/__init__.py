@@ -0,0 +1,9 @@
+"""Background jobs - durable work queued in the jobs table and run by app.jobs.worker"""
+
+from app.jobs.registry import JobContext, PermanentJobError, job_handler
+
+__all__ = [
+    "JobContext",
+    "PermanentJobError",
+    "job_handler",
+]
@@ -0,0 +1,150 @@
+"""
+Job handlers. Each runs in a worker process with its own database session;
+payloads hold only JSON values, so records are reloaded here by id.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.jobs.registry import JobContext, PermanentJobError, job_handler
+from app.models.candidate import Candidate
+from app.models.user import User
+
+
+def _requesting_user(user_id: int, user_email: str, user_name: str) -> User:
+    """Stand-in for the user who asked for an export (the services only read these fields)"""
+    return User(id=user_id, email=user_email, full_name=user_name, username=user_email)
+
+
+@job_handler("registration_email", queue="default", priority=10, max_attempts=5)
+async def send_registration_email(ctx: JobContext, candidate_id: int) -> None:
+    from app.utils.email import send_registration_emails
+
+    async with AsyncSessionLocal() as db:
+        candidate = await db.get(Candidate, candidate_id)
+        if candidate is None:
+            raise PermanentJobError(f"Candidate {candidate_id} no longer exists")
+        await send_registration_emails(candidate)
+
+
+@job_handler("candidate_export", queue="exports", timeout_seconds=1800)
+async def export_candidates(
+    ctx: JobContext,
+    user_id: int,
+    user_email: str,
+    user_name: str,
+    columns: Optional[str] = None,
+    **filters,
+) -> dict:
+    from app.services.candidate_service import CandidateService
+
+    logger.info(f"Job {ctx.public_id}: candidate export for {user_email}")
+    await ctx.progress(10, "Building candidate report")
+    async with AsyncSessionLocal() as db:
+        await CandidateService(db).export_candidates(
+            current_user=_requesting_user(user_id, user_email, user_name),
+            columns=columns,
+            **filters,
+        )
+    return {"emailed_to": user_email}
+
+
+@job_handler("allocation_export", queue="exports", timeout_seconds=1800)
+async def export_allocations(
+    ctx: JobContext,
+    user_id: int,
+    user_email: str,
+    user_name: str,
+    columns: Optional[str] = None,
+    **filters,
+) -> dict:
+    from app.services.training_candidate_allocation_service import TrainingCandidateAllocationService
+
+    logger.info(f"Job {ctx.public_id}: training allocations export for {user_email}")
+    await ctx.progress(10, "Building allocations report")
+    async with AsyncSessionLocal() as db:
+        await TrainingCandidateAllocationService(db).export_allocations(
+            current_user=_requesting_user(user_id, user_email, user_name),
+            columns=columns,
+            **filters,
+        )
+    return {"emailed_to": user_email}
+
+
+@job_handler("placement_mapping_export", queue="exports", timeout_seconds=1800)
+async def export_placement_mappings(
+    ctx: JobContext,
+    user_id: int,
+    user_email: str,
+    user_name: str,
+    job_role_public_id: str,
+    columns: Optional[str] = None,
+) -> dict:
+    from uuid import UUID
+    from app.services.placement_mapping_service import PlacementMappingService
+
+    logger.info(f"Job {ctx.public_id}: placement mapping export for {user_email}")
+    await ctx.progress(10, "Building placement report")
+    async with AsyncSessionLocal() as db:
+        await PlacementMappingService(db).export_placement_mappings(
+            job_role_public_id=UUID(job_role_public_id),
+            current_user=_requesting_user(user_id, user_email, user_name),
+            columns=columns,
+        )
+    return {"emailed_to": user_email}
+
+
+# ── Scheduled (see app.jobs.scheduler) ────────────────────────────────────────
+@job_handler("dsr_reminders", queue="default", max_attempts=2)
+async def send_dsr_reminders(ctx: JobContext, report_date: str, message: Optional[str] = None) -> dict:
+    from app.services.dsr_notification_service import DSRNotificationService
+
+    async with AsyncSessionLocal() as db:
+        summary = await DSRNotificationService(db).remind_missing_users(date.fromisoformat(report_date), message)
+        await db.commit()
+    return summary
+
+
+@job_handler("log_retention", queue="maintenance", max_attempts=2, timeout_seconds=3600)
+async def enforce_retention(ctx: JobContext) -> dict:
+    from app.repositories.email_outbox_repository import EmailOutboxRepository
+    from app.repositories.job_repository import JobRepository
+    from app.services.log_partition_service import LogPartitionService
+
+    async with AsyncSessionLocal() as db:
+        partitions = await LogPartitionService(db).run()
+    await ctx.progress(70, "Log partitions rolled over")
+
+    now = datetime.now(timezone.utc)
+    purged = {"jobs": 0, "emails": 0}
+    async with AsyncSessionLocal() as db:
+        if settings.JOB_HISTORY_RETENTION_DAYS > 0:
+            purged["jobs"] = await JobRepository(db).purge_finished(
+                now - timedelta(days=settings.JOB_HISTORY_RETENTION_DAYS)
+            )
+        if settings.EMAIL_OUTBOX_RETENTION_DAYS > 0:
+            purged["emails"] = await EmailOutboxRepository(db).purge_finished(
+                now - timedelta(days=settings.EMAIL_OUTBOX_RETENTION_DAYS)
+            )
+        await db.commit()
+
+    return {
+        "partitions_created": partitions["created"],
+        "partitions_dropped": [dropped["partition"] for dropped in partitions["dropped"]],
+        "jobs_purged": purged["jobs"],
+        "emails_purged": purged["emails"],
+    }
+
+
+@job_handler("daily_rollup", queue="maintenance", max_attempts=3)
+async def roll_up_daily_stats(ctx: JobContext, day: str) -> dict:
+    from app.services.daily_stats_service import DailyStatsService
+
+    async with AsyncSessionLocal() as db:
+        values = await DailyStatsService(db).rollup(date.fromisoformat(day))
+        await db.commit()
+    return {"day": day, **values}
@@ -0,0 +1,89 @@
+"""Job handler registry and the context handed to running jobs"""
+
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.job_repository import JobRepository
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help (bad payload, missing record)"""
+
+
+@dataclass
+class JobContext:
+    """What a handler knows about the job it is running"""
+    job_id: int
+    public_id: str
+    attempt: int
+    max_attempts: int
+    created_by_user_id: Optional[int] = None
+
+    async def progress(self, percent: int, message: Optional[str] = None) -> None:
+        """
+        Record progress (0-100) for the status API. Written in its own short
+        transaction so it is visible while the handler is still running.
+        """
+        try:
+            async with AsyncSessionLocal() as db:
+                await JobRepository(db).set_progress(
+                    self.job_id, max(0, min(int(percent), 100)), (message or "")[:255] or None
+                )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Could not record progress for job {self.public_id}: {str(e)}")
+
+
+JobFunc = Callable[..., Awaitable[Any]]
+
+
+@dataclass(frozen=True)
+class JobDefinition:
+    name: str
+    func: JobFunc
+    queue: str
+    priority: int
+    max_attempts: int
+    timeout_seconds: Optional[float]
+
+
+_handlers: Dict[str, JobDefinition] = {}
+
+
+def job_handler(
+    name: str,
+    *,
+    queue: str = "default",
+    priority: int = 0,
+    max_attempts: int = 3,
+    timeout_seconds: Optional[float] = None,
+) -> Callable[[JobFunc], JobFunc]:
+    """
+    Register ``async def handler(ctx: JobContext, **payload)`` under ``name``.
+    The decorated function is returned unchanged apart from a ``job``
+    attribute holding its definition, which ``JobService.enqueue`` reads.
+    """
+    def decorator(func: JobFunc) -> JobFunc:
+        if name in _handlers and _handlers[name].func is not func:
+            raise ValueError(f"Job handler '{name}' is already registered")
+        definition = JobDefinition(
+            name=name,
+            func=func,
+            queue=queue,
+            priority=priority,
+            max_attempts=max_attempts,
+            timeout_seconds=timeout_seconds,
+        )
+        _handlers[name] = definition
+        func.job = definition
+        return func
+
+    return decorator
+
+
+def get_handler(name: str) -> Optional[JobDefinition]:
+    return _handlers.get(name)
+
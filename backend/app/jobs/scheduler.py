@@ -0,0 +1,246 @@
+"""
+Cron scheduler for recurring work (DSR reminders, retention, daily rollups).
+
+Every API worker runs the scheduler loop, but only the one holding a Postgres
+session-level advisory lock fires schedules. The lock lives on a dedicated
+connection: if that worker exits or loses the connection, Postgres releases
+the lock and another worker takes over within a tick.
+
+Firing a schedule only enqueues a job, so the work runs on the job workers
+with their retries, progress and history. Each firing is recorded in
+``scheduled_runs`` under a unique (schedule, slot) key, which keeps a slot
+from firing twice across a leadership hand-over. Slots missed while no
+scheduler was running (a deploy) still fire if they are less than
+SCHEDULER_MISFIRE_GRACE_SECONDS old.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from loguru import logger
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import SCHEDULED_RUNS_TOTAL, SCHEDULER_LEADER
+from app.jobs.registry import JobFunc
+from app.models.job import Job
+from app.models.scheduled_run import ScheduledRun
+from app.repositories.scheduled_run_repository import ScheduledRunRepository
+from app.services.job_service import JobService
+from app.utils.cron import CronExpression
+
+
+# pg_try_advisory_lock key held by the leader
+_LEADER_LOCK_KEY = 0x73636864  # "schd"
+
+_TICK_SECONDS = 30
+
+
+@dataclass(frozen=True)
+class Schedule:
+    name: str
+    cron: CronExpression
+    handler: JobFunc
+    # Builds the job payload from the slot's local wall-clock time
+    payload: Callable[[datetime], dict]
+
+
+def configured_schedules() -> List[Schedule]:
+    from app.jobs import handlers
+
+    entries = [
+        (
+            "dsr_reminders",
+            settings.SCHEDULE_DSR_REMINDERS,
+            handlers.send_dsr_reminders,
+            lambda slot: {"report_date": slot.date().isoformat()},
+        ),
+        (
+            "log_retention",
+            settings.SCHEDULE_LOG_RETENTION,
+            handlers.enforce_retention,
+            lambda slot: {},
+        ),
+        (
+            "daily_rollup",
+            settings.SCHEDULE_DAILY_ROLLUP,
+            handlers.roll_up_daily_stats,
+            lambda slot: {"day": (slot.date() - timedelta(days=1)).isoformat()},
+        ),
+    ]
+    return [
+        Schedule(name=name, cron=CronExpression(expression), handler=handler, payload=payload)
+        for name, expression, handler, payload in entries
+        if expression.strip()
+    ]
+
+
+class Scheduler:
+    """Fires due schedules from whichever worker holds the leadership lock"""
+
+    def __init__(self, schedules: List[Schedule], tz: str, misfire_grace_seconds: int) -> None:
+        self.schedules: Dict[str, Schedule] = {schedule.name: schedule for schedule in schedules}
+        self.tz = ZoneInfo(tz)
+        self.misfire_grace = timedelta(seconds=misfire_grace_seconds)
+        self.is_leader = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+    async def start(self) -> None:
+        if self.running or not self.schedules:
+            return
+        from app.core.database import direct_dsn
+
+        if direct_dsn() is None:
+            # Through a transaction pooler the advisory lock would be released
+            # (or leak to another client) after every statement
+            logger.error("Scheduler not started: DB_PGBOUNCER_MODE needs DATABASE_DIRECT_URL for its leader lock")
+            return
+        self._task = asyncio.create_task(self._run(), name="scheduler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _set_leader(self, leader: bool) -> None:
+        if leader != self.is_leader:
+            SCHEDULER_LEADER.set(1 if leader else 0)
+            logger.info("Scheduler leadership acquired" if leader else "Scheduler leadership released")
+        self.is_leader = leader
+
+    async def _run(self) -> None:
+        from app.core.database import connect_direct
+
+        delay = 1.0
+        while True:
+            connection = None
+            try:
+                connection = await connect_direct()
+                delay = 1.0
+                while True:
+                    if not self.is_leader:
+                        self._set_leader(
+                            await connection.fetchval("SELECT pg_try_advisory_lock($1)", _LEADER_LOCK_KEY)
+                        )
+                    else:
+                        # The lock is held for as long as this connection lives
+                        await connection.execute("SELECT 1")
+                    if self.is_leader:
+                        await self._tick()
+                    await asyncio.sleep(_TICK_SECONDS)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Scheduler connection lost: {str(e)}; retrying in {delay:.0f}s")
+            finally:
+                self._set_leader(False)
+                if connection is not None and not connection.is_closed():
+                    connection.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+    async def _tick(self) -> None:
+        from app.core.database import AsyncSessionLocal
+
+        try:
+            async with AsyncSessionLocal() as db:
+                await self.fire_due(db)
+                await db.commit()
+        except Exception as e:
+            logger.error(f"Scheduler tick failed: {str(e)}")
+
+    # ── Firing ────────────────────────────────────────────────────────────────
+    def local_now(self, now: Optional[datetime] = None) -> datetime:
+        """Naive wall-clock time in the scheduler zone, which cron expressions use"""
+        return (now or datetime.now(timezone.utc)).astimezone(self.tz).replace(tzinfo=None)
+
+    async def fire_due(self, db: AsyncSession, now: Optional[datetime] = None) -> List[ScheduledRun]:
+        """Enqueue a job for every schedule whose latest slot has not fired yet"""
+        local = self.local_now(now)
+        fired = []
+        for schedule in self.schedules.values():
+            slot = schedule.cron.latest_before(local, self.misfire_grace)
+            if slot is not None:
+                run = await self._fire(db, schedule, slot)
+                if run is not None:
+                    fired.append(run)
+        return fired
+
+    async def run_now(self, db: AsyncSession, name: str) -> Job:
+        """Fire a schedule immediately, outside its cron slots"""
+        schedule = self.schedules[name]
+        slot = self.local_now().replace(microsecond=0)
+        run = await self._fire(db, schedule, slot)
+        if run is None:
+            raise ValueError(f"{name} already fired for {slot}")
+        return run.job
+
+    async def _fire(self, db: AsyncSession, schedule: Schedule, slot: datetime) -> Optional[ScheduledRun]:
+        scheduled_for = slot.replace(tzinfo=self.tz).astimezone(timezone.utc)
+        try:
+            async with db.begin_nested():
+                run = await ScheduledRunRepository(db).create({
+                    "schedule": schedule.name,
+                    "scheduled_for": scheduled_for,
+                })
+        except IntegrityError:
+            return None  # Already fired for this slot
+
+        run.job = await JobService(db).enqueue(schedule.handler, schedule.payload(slot))
+        await db.flush()
+        SCHEDULED_RUNS_TOTAL.labels(schedule=schedule.name).inc()
+        logger.info(f"Schedule {schedule.name} fired for {slot:%Y-%m-%d %H:%M} (job {run.job.public_id})")
+        return run
+
+    # ── History ───────────────────────────────────────────────────────────────
+    async def describe(self, db: AsyncSession, runs: int = 5) -> List[dict]:
+        """Each schedule with its next slot and most recent runs, newest first"""
+        repository = ScheduledRunRepository(db)
+        local = self.local_now()
+        described = []
+        for schedule in self.schedules.values():
+            recent = []
+            for run in await repository.recent(schedule.name, runs):
+                job = run.job
+                duration = None
+                if job is not None and job.started_at and job.finished_at:
+                    duration = (job.finished_at - job.started_at).total_seconds()
+                recent.append({
+                    "scheduled_for": run.scheduled_for,
+                    "job_id": job.public_id if job else None,
+                    "status": job.status if job else None,
+                    "started_at": job.started_at if job else None,
+                    "finished_at": job.finished_at if job else None,
+                    "duration_seconds": duration,
+                    "result": job.result if job else None,
+                    "last_error": job.last_error if job else None,
+                })
+            described.append({
+                "name": schedule.name,
+                "cron": schedule.cron.expression,
+                "timezone": str(self.tz),
+                "next_run_at": schedule.cron.next_after(local).replace(tzinfo=self.tz),
+                "recent_runs": recent,
+            })
+        return described
+
+
+scheduler = Scheduler(
+    configured_schedules(),
+    tz=settings.SCHEDULER_TIMEZONE,
+    misfire_grace_seconds=settings.SCHEDULER_MISFIRE_GRACE_SECONDS,
+)
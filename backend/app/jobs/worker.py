@@ -0,0 +1,296 @@
+"""
+Job worker process.
+
+    ENV_FILE=.env python -m app.jobs.worker [--queues exports=2,default]
+
+Each queue gets its own claim loop with a fixed number of slots, so a burst of
+exports cannot starve registration emails. Jobs are claimed with
+FOR UPDATE SKIP LOCKED, so any number of worker processes can share the
+table. Running jobs are heartbeated; jobs of a worker that died are requeued
+by whichever worker notices first.
+
+On SIGTERM/SIGINT the worker stops claiming, gives running jobs
+JOB_SHUTDOWN_GRACE_SECONDS to finish and puts the rest back in the queue
+without using up an attempt.
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import socket
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from fastapi.encoders import jsonable_encoder
+from loguru import logger
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import (
+    JOB_DURATION,
+    JOB_QUEUE_DEPTH,
+    JOB_QUEUE_WAIT,
+    JOBS_IN_PROGRESS,
+    JOBS_TOTAL,
+)
+from app.jobs.registry import JobContext, PermanentJobError, get_handler
+from app.models.job import Job
+from app.repositories.job_repository import JobRepository
+from app.services.job_service import retry_delay
+
+
+def parse_queues(spec: Optional[str], defaults: Dict[str, int]) -> Dict[str, int]:
+    """
+    ``"exports=2,default"`` -> ``{"exports": 2, "default": <configured or 1>}``.
+    Without a spec every configured queue is served.
+    """
+    if not spec:
+        return dict(defaults)
+    queues: Dict[str, int] = {}
+    for item in spec.split(","):
+        name, _, slots = item.strip().partition("=")
+        if not name:
+            continue
+        queues[name] = max(int(slots), 1) if slots else defaults.get(name, 1)
+    return queues
+
+
+class JobWorker:
+    """Claims and runs jobs for a set of queues with per-queue concurrency limits"""
+
+    def __init__(
+        self,
+        queues: Dict[str, int],
+        poll_interval: float,
+        heartbeat_seconds: float,
+        stale_after_seconds: float,
+        shutdown_grace_seconds: float,
+    ) -> None:
+        self.queues = queues
+        self.poll_interval = poll_interval
+        self.heartbeat_seconds = heartbeat_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.shutdown_grace_seconds = shutdown_grace_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"[:100]
+        self._jobs: Dict[int, asyncio.Task] = {}
+        self._stopping: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+    async def start(self) -> None:
+        """Run in the background of the current event loop (in-process mode)"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self.run(), name="job-worker")
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self.request_stop()
+        await self._task
+        self._task = None
+
+    def request_stop(self) -> None:
+        if self._stopping is not None:
+            self._stopping.set()
+
+    async def run(self) -> None:
+        """Serve the queues until ``request_stop`` is called"""
+        self._stopping = asyncio.Event()
+        stop_waiter = asyncio.ensure_future(self._stopping.wait())
+        loops = [
+            asyncio.create_task(self._queue_loop(queue, slots, stop_waiter), name=f"job-queue-{queue}")
+            for queue, slots in self.queues.items()
+        ]
+        loops.append(asyncio.create_task(self._maintain(), name="job-maintenance"))
+        logger.info(f"Job worker {self.worker_id} serving {self.queues}")
+
+        await stop_waiter
+        for loop in loops:
+            loop.cancel()
+        await asyncio.gather(*loops, return_exceptions=True)
+        await self._drain()
+        logger.info(f"Job worker {self.worker_id} stopped")
+
+    async def _drain(self) -> None:
+        """Let running jobs finish within the grace period, then requeue the rest"""
+        if not self._jobs:
+            return
+        logger.info(f"Waiting up to {self.shutdown_grace_seconds:.0f}s for {len(self._jobs)} running job(s)")
+        _, pending = await asyncio.wait(list(self._jobs.values()), timeout=self.shutdown_grace_seconds)
+        if not pending:
+            return
+        interrupted = [job_id for job_id, task in self._jobs.items() if task in pending]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await self._record(lambda repo, now: repo.release(interrupted))
+            logger.warning(f"Requeued {len(interrupted)} interrupted job(s)")
+        except Exception as e:
+            logger.error(f"Could not requeue interrupted jobs (they recover once stale): {str(e)}")
+
+    # ── Claiming ──────────────────────────────────────────────────────────────
+    async def _queue_loop(self, queue: str, slots: int, stop_waiter: asyncio.Future) -> None:
+        active: Set[asyncio.Task] = set()
+        while True:
+            claimed = []
+            free = slots - len(active)
+            if free > 0:
+                try:
+                    claimed = await self._claim(queue, free)
+                except Exception as e:
+                    logger.error(f"Claiming jobs from '{queue}' failed: {str(e)}")
+            for job in claimed:
+                task = asyncio.create_task(self._execute(job), name=f"job-{job.public_id}")
+                self._jobs[job.id] = task
+                active.add(task)
+                task.add_done_callback(active.discard)
+            if claimed and len(active) < slots:
+                continue  # More may be due
+            # Sleep until a slot frees up, the poll interval passes or shutdown starts
+            await asyncio.wait(
+                {*active, stop_waiter}, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+            )
+
+    async def _claim(self, queue: str, limit: int) -> list[Job]:
+        async with AsyncSessionLocal() as db:
+            jobs = await JobRepository(db).claim(queue, limit, self.worker_id, datetime.now(timezone.utc))
+            await db.commit()
+        return jobs
+
+    # ── Running ───────────────────────────────────────────────────────────────
+    async def _execute(self, job: Job) -> None:
+        definition = get_handler(job.name)
+        ctx = JobContext(
+            job_id=job.id,
+            public_id=str(job.public_id),
+            attempt=job.attempts,
+            max_attempts=job.max_attempts,
+            created_by_user_id=job.created_by_user_id,
+        )
+        if job.started_at and job.run_at:
+            JOB_QUEUE_WAIT.labels(queue=job.queue).observe(
+                max((job.started_at - job.run_at).total_seconds(), 0)
+            )
+        JOBS_IN_PROGRESS.labels(queue=job.queue).inc()
+        start = time.perf_counter()
+        outcome = "succeeded"
+        try:
+            if definition is None:
+                raise PermanentJobError(f"No handler registered for '{job.name}'")
+            call = definition.func(ctx, **(job.payload or {}))
+            if definition.timeout_seconds:
+                result = await asyncio.wait_for(call, definition.timeout_seconds)
+            else:
+                result = await call
+            stored = jsonable_encoder(result) if isinstance(result, dict) else None
+            await self._record(lambda repo, now: repo.mark_succeeded(job.id, stored, now))
+            logger.info(f"Job {job.public_id} ({job.name}) succeeded in {time.perf_counter() - start:.1f}s")
+        except asyncio.CancelledError:
+            outcome = "interrupted"
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"[:4000]
+            if isinstance(e, PermanentJobError) or job.attempts >= job.max_attempts:
+                outcome = "failed"
+                logger.error(f"Job {job.public_id} ({job.name}) failed after {job.attempts} attempt(s): {error}")
+                await self._record_quietly(lambda repo, now: repo.mark_failed(job.id, error, now))
+            else:
+                outcome = "retry"
+                delay = retry_delay(job.attempts)
+                logger.warning(f"Job {job.public_id} ({job.name}) failed, retrying in {delay:.0f}s: {error}")
+                await self._record_quietly(
+                    lambda repo, now: repo.mark_retry(job.id, now + timedelta(seconds=delay), error)
+                )
+        finally:
+            self._jobs.pop(job.id, None)
+            JOBS_IN_PROGRESS.labels(queue=job.queue).dec()
+            JOBS_TOTAL.labels(name=job.name, outcome=outcome).inc()
+            JOB_DURATION.labels(name=job.name).observe(time.perf_counter() - start)
+
+    async def _record(self, update: Callable[[JobRepository, datetime], Awaitable[Any]]) -> None:
+        async with AsyncSessionLocal() as db:
+            await update(JobRepository(db), datetime.now(timezone.utc))
+            await db.commit()
+
+    async def _record_quietly(self, update: Callable[[JobRepository, datetime], Awaitable[Any]]) -> None:
+        # When the outcome cannot be written the job stays "running" and is
+        # picked up again by stale recovery
+        try:
+            await self._record(update)
+        except Exception as e:
+            logger.error(f"Could not record job outcome: {str(e)}")
+
+    # ── Heartbeats and recovery ───────────────────────────────────────────────
+    async def _maintain(self) -> None:
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    repository = JobRepository(db)
+                    now = datetime.now(timezone.utc)
+                    await repository.heartbeat(list(self._jobs), now)
+                    recovered = await repository.recover_stale(
+                        now - timedelta(seconds=self.stale_after_seconds), now
+                    )
+                    depths = await repository.queue_depths()
+                    await db.commit()
+                if recovered:
+                    logger.warning(f"Recovered {recovered} job(s) abandoned by a stopped worker")
+                for queue in self.queues:
+                    JOB_QUEUE_DEPTH.labels(queue=queue).set(depths.get(queue, 0))
+            except Exception as e:
+                logger.error(f"Job heartbeat failed: {str(e)}")
+            await asyncio.sleep(self.heartbeat_seconds)
+
+
+def create_worker(queues: Optional[Dict[str, int]] = None) -> JobWorker:
+    # Importing the handlers registers them
+    import app.jobs.handlers  # noqa: F401
+
+    return JobWorker(
+        queues=queues or dict(settings.JOB_QUEUE_CONCURRENCY),
+        poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+        heartbeat_seconds=settings.JOB_HEARTBEAT_SECONDS,
+        stale_after_seconds=settings.JOB_STALE_AFTER_SECONDS,
+        shutdown_grace_seconds=settings.JOB_SHUTDOWN_GRACE_SECONDS,
+    )
+
+
+async def _serve(queues: Dict[str, int]) -> None:
+    from app.core import metrics
+    from app.core.database import close_db
+
+    worker = create_worker(queues)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.request_stop)
+    try:
+        await worker.run()
+    finally:
+        await close_db()
+        metrics.mark_worker_dead()
+
+
+def main(argv: Optional[list] = None) -> None:
+    from app.core.logging import setup_logging
+
+    parser = argparse.ArgumentParser(description="Run background jobs from the jobs table")
+    parser.add_argument(
+        "--queues",
+        help="Comma-separated queue[=slots] list, e.g. 'exports=2,default'. "
+             "Defaults to every queue in JOB_QUEUE_CONCURRENCY.",
+    )
+    args = parser.parse_args(argv)
+    setup_logging()
+    asyncio.run(_serve(parse_queues(args.queues, settings.JOB_QUEUE_CONCURRENCY)))
+
+
+if __name__ == "__main__":
+    main()
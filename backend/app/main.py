@@ -10,17 +10,30 @@ from slowapi.errors import RateLimitExceeded
 
 from app.core.config import settings
 from app.core.logging import setup_logging
-from app.core.database import init_db, close_db, get_db
+from app.core.database import init_db, close_db, get_db, engine, AsyncSessionLocal
+from app.core import query_profiler, metrics
 from app.core.rate_limiter import limiter
+from app.core.serialization import FastJSONResponse
 from app.middleware.logging import LoggingMiddleware
 from app.middleware.error_handler import ErrorHandlerMiddleware
-from app.api.v1.router import router as v1_router
+from app.middleware.query_profiler import QueryProfilerMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.api.v1.router import include_routers as include_v1_routers
+from app.api.deps import verify_metrics_token
 from loguru import logger
 from fastapi.exceptions import RequestValidationError
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
+    # Background services are only needed to run the app, not to build it
+    from app.services.activity_log_pipeline import activity_log_pipeline
+    from app.services.log_partition_service import LogPartitionService
+    from app.services.email_outbox_service import email_dispatcher
+    from app.services.notification_hub import notification_hub
+    from app.jobs.scheduler import scheduler
+    from app.services import document_text_service
+
     # Startup
     logger.info("Starting up application...")
     setup_logging()
@@ -29,13 +42,47 @@ async def lifespan(app: FastAPI):
     # await init_db()
     # logger.info("Database initialized")
     
+    # Make sure this month's and upcoming log partitions exist
+    try:
+        async with AsyncSessionLocal() as db:
+            await LogPartitionService(db).ensure_partitions()
+    except Exception as e:
+        logger.warning(f"Log partition rollover skipped: {str(e)}")
+    
+    if settings.AUDIT_PIPELINE_ENABLED:
+        await activity_log_pipeline.start()
+    
+    if settings.EMAIL_DISPATCHER_ENABLED:
+        await email_dispatcher.start()
+    
+    if settings.NOTIFICATION_PUSH_LISTEN:
+        await notification_hub.start()
+    
+    if settings.SCHEDULER_ENABLED:
+        await scheduler.start()
+    
+    # Jobs normally run in `python -m app.jobs.worker` processes
+    job_worker = None
+    if settings.JOB_RUN_IN_PROCESS:
+        from app.jobs.worker import create_worker
+        job_worker = create_worker()
+        await job_worker.start()
+    
     logger.info(f"Application started - Environment: {settings.ENVIRONMENT}")
     
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    await scheduler.stop()
+    if job_worker is not None:
+        await job_worker.stop()
+    await notification_hub.stop()
+    await email_dispatcher.stop()
+    await activity_log_pipeline.stop()
+    document_text_service.shutdown_pool()
     await close_db()
+    metrics.mark_worker_dead()
     logger.info("Application shutdown complete")
 
 
@@ -47,6 +94,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url=None,  # Disable default ReDoc, we'll create custom one
     openapi_url="/openapi.json",
+    default_response_class=FastJSONResponse,
     lifespan=lifespan,
 )
 
@@ -75,17 +123,19 @@ app.add_middleware(
 )
 
 # Add custom middleware
+if settings.QUERY_PROFILER_ENABLED:
+    query_profiler.install(engine)
+    app.add_middleware(QueryProfilerMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(ErrorHandlerMiddleware)
 
 # Include API routers with versioning
-app.include_router(
-    v1_router,
-    prefix=settings.API_V1_PREFIX,
-)
+include_v1_routers(app.router, prefix=settings.API_V1_PREFIX)
 
 # Add more API versions here as needed
-# app.include_router(v2_router, prefix="/api/v2")
+# include_v2_routers(app.router, prefix="/api/v2")
 
 
 # Health check endpoints
@@ -168,6 +218,25 @@ async def health_check(db: AsyncSession = Depends(get_db)):
     )
 
 
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(_: None = Depends(verify_metrics_token)):
+    """
+    Prometheus scrape endpoint, behind the METRICS_SCRAPE_TOKEN bearer token
+    
+    Exposes request latency per route template, in-flight requests, DB pool
+    usage and wait time, AI provider latency/tokens/errors, email send latency
+    and background task depth. Aggregated across workers when
+    PROMETHEUS_MULTIPROC_DIR is set.
+    """
+    from fastapi.responses import Response
+    
+    if not settings.METRICS_ENABLED:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Not Found"})
+    
+    payload, content_type = metrics.render_latest()
+    return Response(content=payload, media_type=content_type)
+
+
 @app.get("/", tags=["Root"])
 async def root():
     """
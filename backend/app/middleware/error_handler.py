@@ -1,60 +1,82 @@
 """Global error handling middleware"""
 
-from typing import Callable
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from sqlalchemy.exc import SQLAlchemyError
 from pydantic import ValidationError
 from loguru import logger
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle errors globally"""
-    
-    async def dispatch(self, request: Request, call_next: Callable):
+def error_response(exc: Exception) -> JSONResponse:
+    """Map an unhandled exception to the standardized error response"""
+    if isinstance(exc, ValidationError):
+        logger.error(f"Validation error: {str(exc)}")
+        return JSONResponse(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            content={
+                "error": "Validation Error",
+                "detail": exc.errors(),
+                "message": "Invalid input data"
+            }
+        )
+
+    if isinstance(exc, SQLAlchemyError):
+        logger.error(f"Database error: {str(exc)}")
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={
+                "error": "Database Error",
+                "message": "A database error occurred. Please try again later."
+            }
+        )
+
+    if isinstance(exc, ValueError):
+        logger.error(f"Value error: {str(exc)}")
+        return JSONResponse(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            content={
+                "error": "Bad Request",
+                "message": str(exc)
+            }
+        )
+
+    logger.exception(f"Unhandled exception: {str(exc)}")
+    return JSONResponse(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        content={
+            "error": "Internal Server Error",
+            "message": "An unexpected error occurred. Please try again later."
+        }
+    )
+
+
+class ErrorHandlerMiddleware:
+    """Pure ASGI middleware to handle errors globally"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Handle all exceptions and return standardized error responses"""
-        
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
-            
-        except ValidationError as e:
-            logger.error(f"Validation error: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                content={
-                    "error": "Validation Error",
-                    "detail": e.errors(),
-                    "message": "Invalid input data"
-                }
-            )
-            
-        except SQLAlchemyError as e:
-            logger.error(f"Database error: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "Database Error",
-                    "message": "A database error occurred. Please try again later."
-                }
-            )
-            
-        except ValueError as e:
-            logger.error(f"Value error: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                content={
-                    "error": "Bad Request",
-                    "message": str(e)
-                }
-            )
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            logger.exception(f"Unhandled exception: {str(e)}")
-            return JSONResponse(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                content={
-                    "error": "Internal Server Error",
-                    "message": "An unexpected error occurred. Please try again later."
-                }
-            )
+            if response_started:
+                # Headers are already on the wire (e.g. a failing stream); nothing to replace
+                logger.exception(f"Exception after response started: {str(e)}")
+                raise
+            response = error_response(e)
+            await response(scope, receive, send)
@@ -1,61 +1,106 @@
 """Request/Response logging middleware"""
 
 import time
-from typing import Callable
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+import random
 from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.config import settings
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware to log all requests and responses"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Log request and response details"""
-        
-        # Generate request ID
-        request_id = request.headers.get("X-Request-ID", f"{int(time.time() * 1000)}")
-        
-        # Log request
-        logger.bind(
-            request_id=request_id,
-            method=request.method,
-            url=str(request.url),
-            client_ip=request.client.host if request.client else None,
-        ).info("Incoming request")
-        
-        # Process request and measure time
-        start_time = time.time()
-        
-        try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # Log response
+
+def _client_ip(scope: Scope) -> str | None:
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def _request_id(scope: Scope) -> str:
+    for name, value in scope.get("headers", ()):
+        if name == b"x-request-id":
+            return value.decode("latin-1")
+    return f"{int(time.time() * 1000)}"
+
+
+def _url(scope: Scope) -> str:
+    query = scope.get("query_string", b"")
+    path = scope.get("root_path", "") + scope["path"]
+    return f"{path}?{query.decode('latin-1')}" if query else path
+
+
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware to log all requests and responses.
+
+    Adds X-Request-ID and X-Process-Time (time to response headers) to every
+    response and binds ``request_id`` into the loguru context for the whole
+    request. With ``ACCESS_LOG_MODE = "sampled"`` only a fraction of successful
+    requests is logged; errors and slow requests are always logged.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.sampled = settings.ACCESS_LOG_MODE == "sampled"
+        self.sample_rate = settings.ACCESS_LOG_SAMPLE_RATE
+        self.slow_seconds = settings.ACCESS_LOG_SLOW_REQUEST_SECONDS
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _request_id(scope)
+        method = scope["method"]
+        url = _url(scope)
+        status_code = 500
+
+        if not self.sampled:
             logger.bind(
                 request_id=request_id,
-                method=request.method,
-                url=str(request.url),
-                status_code=response.status_code,
-                duration=f"{process_time:.3f}s",
-            ).info("Request completed")
-            
-            # Add custom headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Process-Time"] = f"{process_time:.3f}"
-            
-            return response
-            
-        except Exception as e:
-            process_time = time.time() - start_time
-            
-            # Log error
+                method=method,
+                url=url,
+                client_ip=_client_ip(scope),
+            ).info("Incoming request")
+
+        start_time = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Process-Time"] = f"{time.perf_counter() - start_time:.3f}"
+            await send(message)
+
+        with logger.contextualize(request_id=request_id):
+            try:
+                await self.app(scope, receive, send_wrapper)
+            except Exception as e:
+                process_time = time.perf_counter() - start_time
+                logger.bind(
+                    request_id=request_id,
+                    method=method,
+                    url=url,
+                    duration=f"{process_time:.3f}s",
+                    error=str(e),
+                ).error("Request failed")
+                raise
+
+        process_time = time.perf_counter() - start_time
+        if self._should_log(status_code, process_time):
+            fields = {"client_ip": _client_ip(scope)} if self.sampled else {}
             logger.bind(
                 request_id=request_id,
-                method=request.method,
-                url=str(request.url),
+                method=method,
+                url=url,
+                status_code=status_code,
                 duration=f"{process_time:.3f}s",
-                error=str(e),
-            ).error("Request failed")
-            
-            raise
+                **fields,
+            ).info("Request completed")
+
+    def _should_log(self, status_code: int, process_time: float) -> bool:
+        if not self.sampled:
+            return True
+        if status_code >= 400 or process_time >= self.slow_seconds:
+            return True
+        return random.random() < self.sample_rate
@@ -0,0 +1,46 @@
+"""Prometheus request metrics middleware"""
+
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    HTTP_REQUESTS_TOTAL,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+from app.middleware.routing import route_template
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware to record request counts and latency per route template"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Observe latency labelled by the matched route, not the raw URL"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start_time
+            in_progress.dec()
+            # Label by template so /candidates/{public_id} is one series, not one per id
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(duration)
+            HTTP_REQUESTS_TOTAL.labels(method=method, route=route, status=str(status_code)).inc()
@@ -0,0 +1,66 @@
+"""Per-request SQL profiling middleware"""
+
+import time
+from loguru import logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import query_profiler
+from app.core.config import settings
+from app.middleware.routing import route_template
+
+
+class QueryProfilerMiddleware:
+    """Pure ASGI middleware to count SQL statements and flag N+1 patterns per request"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Collect query statistics and expose them as Server-Timing"""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = query_profiler.start_request()
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.perf_counter() - start_time
+                headers = MutableHeaders(scope=message)
+                headers["Server-Timing"] = (
+                    f'db;dur={stats.db_time * 1000:.2f};desc="{stats.statement_count} queries", '
+                    f"app;dur={elapsed * 1000:.2f}"
+                )
+                headers["X-DB-Query-Count"] = str(stats.statement_count)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        duration = time.perf_counter() - start_time
+        endpoint = f"{scope['method']} {route_template(scope)}"
+        threshold = settings.QUERY_PROFILER_N_PLUS_ONE_THRESHOLD
+        repeated = stats.repeated_shapes(threshold)
+
+        query_profiler.record_endpoint(endpoint, duration, stats, n_plus_one=bool(repeated))
+
+        log = logger.bind(
+            endpoint=endpoint,
+            status_code=status_code,
+            duration=f"{duration:.3f}s",
+            db_statements=stats.statement_count,
+            db_time=f"{stats.db_time:.3f}s",
+            db_rows=stats.rows,
+        )
+        if repeated:
+            log.bind(repeated_statements=[
+                {"count": count, "statement": shape[:300]} for shape, count in repeated
+            ]).warning(f"Possible N+1 query pattern in {endpoint}")
+        elif duration >= settings.QUERY_PROFILER_SLOW_REQUEST_SECONDS:
+            log.warning("Slow request")
+        else:
+            log.debug("Query profile")
@@ -0,0 +1,16 @@
+"""Helpers shared by the ASGI middleware"""
+
+from starlette.types import Scope
+
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    Path template of the route that served the request (e.g.
+    /api/v1/candidates/{public_id}). The router stores the matched route in
+    the scope, so this is only meaningful once the app has been called.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
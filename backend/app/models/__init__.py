@@ -6,6 +6,11 @@ from app.models.candidate import Candidate
 from app.models.candidate_assignment import CandidateAssignment
 from app.models.candidate_screening import CandidateScreening
 from app.models.candidate_document import CandidateDocument
+from app.models.document_text import DocumentText
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus, EmailTransport
+from app.models.job import Job, JobStatus
+from app.models.scheduled_run import ScheduledRun
+from app.models.daily_stat import DailyStat
 from app.models.candidate_counseling import CandidateCounseling
 from app.models.training_batch import TrainingBatch
 from app.models.training_batch_extension import TrainingBatchExtension
@@ -56,6 +61,14 @@ __all__ = [
     "CandidateAssignment",
     "CandidateScreening",
     "CandidateDocument",
+    "DocumentText",
+    "EmailOutbox",
+    "EmailOutboxStatus",
+    "EmailTransport",
+    "Job",
+    "JobStatus",
+    "ScheduledRun",
+    "DailyStat",
     "CandidateCounseling",
     "TrainingBatch",
     "TrainingBatchExtension",
@@ -1,7 +1,7 @@
 """Activity Log model for tracking API operations"""
 
 import enum
-from sqlalchemy import String, Integer, JSON, ForeignKey, Enum
+from sqlalchemy import String, Integer, JSON, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column
 from app.models.base import BaseModel
 
@@ -17,9 +17,19 @@ class ActionType(str, enum.Enum):
 
 
 class ActivityLog(BaseModel):
-    """Activity log database model"""
+    """
+    Activity log database model
+
+    The table is range partitioned by month on created_at (primary key is
+    id + created_at in the database); see LogPartitionService.
+    """
     
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        Index("ix_activity_logs_created_at", "created_at"),
+        Index("ix_activity_logs_user_created", "user_id", "created_at"),
+        Index("ix_activity_logs_resource_created", "resource_type", "resource_id", "created_at"),
+    )
     
     user_id: Mapped[int | None] = mapped_column(
         Integer,
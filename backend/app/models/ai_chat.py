@@ -98,9 +98,9 @@ class AIChatMessage(BaseModel):
     )
 
     # ── Action Audit Linking ──────────────────────────────────────────────────
+    # No FK: ai_task_logs is partitioned and its rows expire with retention
     task_log_id: Mapped[int | None] = mapped_column(
         Integer,
-        ForeignKey("ai_task_logs.id", ondelete="SET NULL"),
         nullable=True,
         index=True,
         comment="If this message triggered an agentic task (tool use), it's linked here."
@@ -108,7 +108,11 @@ class AIChatMessage(BaseModel):
 
     # ── Relationships ──────────────────────────────────────────────────────────
     session: Mapped[AIChatSession] = relationship("AIChatSession", back_populates="messages")
-    task_log: Mapped[AITaskLog | None] = relationship("AITaskLog", foreign_keys=[task_log_id])
+    task_log: Mapped[AITaskLog | None] = relationship(
+        "AITaskLog",
+        primaryjoin="foreign(AIChatMessage.task_log_id) == AITaskLog.id",
+        viewonly=True,
+    )
 
     def __repr__(self) -> str:
         return f"<AIChatMessage(id={self.id}, session_id={self.session_id}, role={self.role})>"
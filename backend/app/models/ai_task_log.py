@@ -7,7 +7,7 @@ import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text, JSON, Integer, Float, ForeignKey, Enum, Uuid, DateTime
+from sqlalchemy import String, Text, JSON, Integer, Float, ForeignKey, Enum, Uuid, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import BaseModel
@@ -45,14 +45,20 @@ class AITaskLog(BaseModel):
     Every time the AI engine executes a task, a row is created here.
     Think of it as the AI's co-worker notepad — readable, auditable,
     and reviewable by admins.
+
+    Range partitioned by month on created_at; partitions older than
+    AI_LOG_RETENTION_DAYS are archived and dropped by LogPartitionService.
     """
 
     __tablename__ = "ai_task_logs"
+    __table_args__ = (
+        Index("ix_ai_task_logs_created_at", "created_at"),
+        Index("ix_ai_task_logs_status_created", "status", "created_at"),
+    )
 
     # ── Identity ──────────────────────────────────────────────────────────────
     public_id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
-        unique=True,
         index=True,
         nullable=False,
         default=uuid.uuid4,
@@ -4,7 +4,7 @@ from __future__ import annotations
 import uuid
 from datetime import date
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Boolean, JSON, Date, Uuid
+from sqlalchemy import String, Boolean, JSON, Date, Uuid, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -23,6 +23,14 @@ class Candidate(BaseModel):
     """Candidate database model"""
     
     __tablename__ = "candidates"
+    __table_args__ = (
+        # Default candidate list order over live rows
+        Index(
+            "ix_candidates_live_created",
+            text("created_at DESC"),
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
     
     # Public UUID for external API (security)
     public_id: Mapped[uuid.UUID] = mapped_column(
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Integer, ForeignKey, DateTime, Text, JSON
+from sqlalchemy import String, Integer, ForeignKey, DateTime, Text, JSON, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -16,6 +16,10 @@ class CandidateCounseling(BaseModel):
     """Candidate Counseling database model - for career counseling"""
     
     __tablename__ = "candidate_counseling"
+    __table_args__ = (
+        # get_by_counselor: one counselor's records, newest first
+        Index("ix_candidate_counseling_counselor_date", "counselor_id", text("counseling_date DESC")),
+    )
     
     # Foreign Key
     candidate_id: Mapped[int] = mapped_column(
@@ -35,6 +35,11 @@ class CandidateDocument(BaseModel):
     file_path: Mapped[str] = mapped_column(String(500), nullable=False)
     file_size: Mapped[int | None] = mapped_column(Integer, nullable=True)  # in bytes
     mime_type: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    content_sha256: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        index=True
+    )  # hex digest; identical uploads share one stored object
     
     # Optional metadata
     description: Mapped[str | None] = mapped_column(String(500), nullable=True)
@@ -5,7 +5,7 @@ import uuid
 import enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, JSON, Integer, ForeignKey, Enum, Uuid
+from sqlalchemy import String, JSON, Integer, ForeignKey, Enum, Uuid, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -38,14 +38,22 @@ class CRMActivityType(str, enum.Enum):
 
 
 class CRMActivityLog(BaseModel):
-    """CRM Activity log database model for audit trail"""
+    """
+    CRM Activity log database model for audit trail
+
+    Range partitioned by month on created_at, so public_id cannot carry a
+    unique constraint (random uuid4 values are unique in practice).
+    """
     
     __tablename__ = "crm_activity_logs"
+    __table_args__ = (
+        Index("ix_crm_activity_logs_created_at", "created_at"),
+        Index("ix_crm_activity_logs_entity_created", "entity_type", "entity_id", "created_at"),
+    )
     
     # Public UUID for external API (security)
     public_id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
-        unique=True,
         index=True,
         nullable=False,
         default=uuid.uuid4,
@@ -0,0 +1,24 @@
+"""Daily stat model - counters rolled up nightly by the scheduler"""
+
+from datetime import date
+
+from sqlalchemy import String, Integer, Date, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import BaseModel
+
+
+class DailyStat(BaseModel):
+    """One metric value for one calendar day (in SCHEDULER_TIMEZONE)"""
+
+    __tablename__ = "daily_stats"
+    __table_args__ = (
+        UniqueConstraint("metric", "day", name="uq_daily_stats_metric_day"),
+    )
+
+    metric: Mapped[str] = mapped_column(String(100), nullable=False)
+    day: Mapped[date] = mapped_column(Date, nullable=False, index=True)
+    value: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<DailyStat(metric={self.metric}, day={self.day}, value={self.value})>"
@@ -0,0 +1,25 @@
+"""Document text model - cached text extracted from uploaded files"""
+
+from sqlalchemy import String, Text, Integer, Boolean
+from sqlalchemy.orm import Mapped, mapped_column
+from app.models.base import BaseModel
+
+
+class DocumentText(BaseModel):
+    """
+    Text extracted from a PDF/DOCX, keyed by the sha256 of the file bytes.
+    Shared by every document (and upload) with the same content, so resume
+    parsing, AI scoring and search never parse the same file twice.
+    """
+    
+    __tablename__ = "document_texts"
+    
+    content_sha256: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
+    kind: Mapped[str] = mapped_column(String(10), nullable=False)  # pdf, docx, text
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    page_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    truncated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)  # hit the page limit
+    extractor_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    
+    def __repr__(self) -> str:
+        return f"<DocumentText(id={self.id}, sha256={self.content_sha256[:12]}, kind={self.kind})>"
@@ -5,7 +5,7 @@ import uuid
 import enum
 from datetime import date, datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Boolean, Integer, Date, DateTime, ForeignKey, Enum, Uuid, Text, String
+from sqlalchemy import Boolean, Integer, Date, DateTime, ForeignKey, Enum, Uuid, Text, String, Index, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
@@ -42,6 +42,15 @@ class DSREntry(BaseModel):
     """
 
     __tablename__ = "dsr_entries"
+    __table_args__ = (
+        # get_by_user_and_date and the reminder "has submitted" EXISTS
+        Index(
+            "ix_dsr_entries_user_report_date",
+            "user_id",
+            "report_date",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
 
     public_id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
@@ -5,7 +5,7 @@ import uuid
 import enum
 from datetime import date, datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Boolean, Integer, Date, DateTime, ForeignKey, Enum, Uuid, Text, String
+from sqlalchemy import Boolean, Integer, Date, DateTime, ForeignKey, Enum, Uuid, Text, String, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -27,6 +27,16 @@ class DSRLeaveApplication(BaseModel):
     """
 
     __tablename__ = "dsr_leave_applications"
+    __table_args__ = (
+        # "Is this user on approved leave on day X" checks
+        Index(
+            "ix_dsr_leave_applications_user_approved",
+            "user_id",
+            "start_date",
+            "end_date",
+            postgresql_where=text("status = 'approved' AND is_deleted = false"),
+        ),
+    )
 
     public_id: Mapped[uuid.UUID] = mapped_column(
         Uuid,
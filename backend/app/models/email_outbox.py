@@ -0,0 +1,78 @@
+"""Email outbox model - outgoing messages waiting for the background dispatcher"""
+
+import enum
+from datetime import datetime
+
+from sqlalchemy import String, Text, JSON, Integer, ForeignKey, Enum, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.models.base import BaseModel
+
+
+class EmailOutboxStatus(str, enum.Enum):
+    """Delivery state of an outbox message"""
+    PENDING = "pending"    # Waiting for its next attempt
+    SENDING = "sending"    # Claimed by a dispatcher
+    SENT = "sent"          # Accepted by the SMTP server
+    FAILED = "failed"      # Permanently rejected or out of attempts
+
+
+class EmailTransport(str, enum.Enum):
+    """Which SMTP account delivers the message"""
+    SYSTEM = "system"      # Application SMTP settings
+    USER = "user"          # The sender's UserEmailConfiguration
+
+
+class EmailOutbox(BaseModel):
+    """
+    One outgoing email. Senders insert a row and return; the dispatcher in
+    app.services.email_outbox_service delivers it over pooled SMTP connections
+    and retries transient failures with exponential backoff.
+
+    SMTP credentials are never copied here: user-sent mail references the
+    sender's configuration, which is read at delivery time. Attachments are
+    stored as file paths (generated content is written to EMAIL_ATTACHMENT_DIR
+    and removed once the message is final).
+    """
+
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt", "status", "next_attempt_at"),
+    )
+
+    category: Mapped[str] = mapped_column(String(50), nullable=False, default="system", index=True)
+    transport: Mapped[EmailTransport] = mapped_column(
+        Enum(EmailTransport, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+        default=EmailTransport.SYSTEM,
+    )
+    sender_config_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("user_email_configurations.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    to_email: Mapped[str] = mapped_column(String(255), nullable=False)
+    cc: Mapped[list | None] = mapped_column(JSON, nullable=True)  # List of addresses
+    subject: Mapped[str] = mapped_column(String(500), nullable=False)
+    html_body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    text_body: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # [{"filename": ..., "path": ..., "spooled": bool}]; spooled files belong to the outbox
+    attachments: Mapped[list | None] = mapped_column(JSON, nullable=True)
+
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        Enum(EmailOutboxStatus, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+        default=EmailOutboxStatus.PENDING,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    locked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    sent_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<EmailOutbox(id={self.id}, to={self.to_email}, status={self.status})>"
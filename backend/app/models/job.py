@@ -0,0 +1,88 @@
+"""Job model - durable background work picked up by the job worker processes"""
+
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import String, Text, JSON, Integer, ForeignKey, Enum, Uuid, DateTime, Index, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.models.base import BaseModel
+
+
+class JobStatus(str, enum.Enum):
+    """Lifecycle of a queued job"""
+    QUEUED = "queued"        # Waiting for run_at and a free worker slot
+    RUNNING = "running"      # Claimed by a worker
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"        # Permanent error or out of attempts
+    CANCELLED = "cancelled"  # Cancelled before a worker picked it up
+
+
+class Job(BaseModel):
+    """
+    One unit of background work. API handlers insert a row and return; a
+    worker started with ``python -m app.jobs.worker`` claims it with
+    FOR UPDATE SKIP LOCKED, runs the registered handler for ``name`` with
+    ``payload`` as keyword arguments and records the outcome.
+
+    Higher ``priority`` runs first within a queue. Running jobs refresh
+    ``heartbeat_at``; a job whose worker stops heartbeating is put back in
+    the queue (or failed once it is out of attempts).
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Claim lookups only ever scan queued rows
+        Index(
+            "ix_jobs_claim",
+            "queue",
+            text("priority DESC"),
+            "run_at",
+            postgresql_where=text("status = 'queued'"),
+        ),
+        Index("ix_jobs_status_heartbeat", "status", "heartbeat_at"),
+    )
+
+    public_id: Mapped[uuid.UUID] = mapped_column(
+        Uuid,
+        unique=True,
+        index=True,
+        nullable=False,
+        default=uuid.uuid4,
+    )
+    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    queue: Mapped[str] = mapped_column(String(50), nullable=False, default="default")
+    payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)  # Handler keyword arguments
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    status: Mapped[JobStatus] = mapped_column(
+        Enum(JobStatus, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+        default=JobStatus.QUEUED,
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    run_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    locked_by: Mapped[str | None] = mapped_column(String(100), nullable=True)  # host:pid of the worker
+
+    progress: Mapped[int] = mapped_column(Integer, nullable=False, default=0)  # 0-100
+    progress_message: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    result: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_by_user_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("users.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<Job(id={self.id}, name={self.name}, status={self.status})>"
@@ -1,12 +1,23 @@
 from datetime import datetime
 import uuid
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base import Base
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Feed: a user's notifications, newest first; the partial index serves
+        # the unread badge count, unread-only feed and mark-all-read
+        Index("ix_notifications_user_created", "user_id", text("created_at DESC")),
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_read = false"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     public_id = Column(UUID(as_uuid=True), default=uuid.uuid4, unique=True, index=True)
@@ -1,7 +1,7 @@
 import enum
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, ForeignKey, Float, Text, DateTime, UniqueConstraint, String, Boolean, Enum
+from sqlalchemy import Integer, ForeignKey, Float, Text, DateTime, UniqueConstraint, String, Boolean, Enum, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -181,6 +181,9 @@ class PlacementMapping(BaseModel):
     # Constraints
     __table_args__ = (
         UniqueConstraint("candidate_id", "job_role_id", name="uq_candidate_job_role_mapping"),
+        # get_by_candidate_active / get_by_job_role_active
+        Index("ix_placement_mappings_candidate_active", "candidate_id", postgresql_where=text("is_active = true")),
+        Index("ix_placement_mappings_job_role_active", "job_role_id", postgresql_where=text("is_active = true")),
     )
     
     def __repr__(self) -> str:
@@ -0,0 +1,37 @@
+"""Scheduled run model - one row per firing of a cron schedule"""
+
+from datetime import datetime
+
+from sqlalchemy import String, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import BaseModel
+from app.models.job import Job
+
+
+class ScheduledRun(BaseModel):
+    """
+    Records that ``schedule`` fired for the slot ``scheduled_for`` and which
+    job carries out the work. The unique constraint makes a firing happen at
+    most once even if two schedulers briefly both believe they are leader.
+    Status and duration come from the job; runs are purged with their jobs.
+    """
+
+    __tablename__ = "scheduled_runs"
+    __table_args__ = (
+        UniqueConstraint("schedule", "scheduled_for", name="uq_scheduled_runs_schedule_slot"),
+    )
+
+    schedule: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    scheduled_for: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    job_id: Mapped[int | None] = mapped_column(
+        Integer,
+        ForeignKey("jobs.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True,
+    )
+
+    job: Mapped[Job | None] = relationship(Job, lazy="joined")
+
+    def __repr__(self) -> str:
+        return f"<ScheduledRun(schedule={self.schedule}, scheduled_for={self.scheduled_for})>"
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import date
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, ForeignKey, String, Text, Date
+from sqlalchemy import Integer, ForeignKey, String, Text, Date, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -17,6 +17,19 @@ class TrainingAttendance(BaseModel):
     """Training Attendance database model with period-based tracking"""
     
     __tablename__ = "training_attendance"
+    __table_args__ = (
+        # Batch register for a day and the per-period existence check on save
+        Index(
+            "ix_training_attendance_batch_date",
+            "batch_id",
+            "date",
+            "candidate_id",
+            "period_id",
+            postgresql_where=text("is_deleted = false"),
+        ),
+        # Per-candidate attendance percentage subqueries in allocation lists
+        Index("ix_training_attendance_candidate_batch", "candidate_id", "batch_id", "status"),
+    )
     
     batch_id: Mapped[int] = mapped_column(
         Integer,
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import uuid
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, ForeignKey, JSON, Boolean, String, Uuid
+from sqlalchemy import Integer, ForeignKey, JSON, Boolean, String, Uuid, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import BaseModel
 
@@ -16,6 +16,14 @@ class TrainingCandidateAllocation(BaseModel):
     """Training Candidate Allocation database model - links candidates to batches"""
     
     __tablename__ = "training_candidate_allocations"
+    __table_args__ = (
+        Index(
+            "ix_training_candidate_allocations_live_batch_status",
+            "batch_id",
+            "status",
+            postgresql_where=text("is_deleted = false"),
+        ),
+    )
     
     # Public UUID for external API (security)
     public_id: Mapped[uuid.UUID] = mapped_column(
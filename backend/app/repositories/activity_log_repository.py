@@ -2,10 +2,11 @@
 
 from typing import Optional, List
 from datetime import datetime
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, and_, or_, func, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.activity_log import ActivityLog, ActionType
 from app.repositories.base import BaseRepository
+from app.services.log_partition_service import retention_floor
 
 
 class ActivityLogRepository(BaseRepository[ActivityLog]):
@@ -46,6 +47,16 @@ class ActivityLogRepository(BaseRepository[ActivityLog]):
         await self.db.refresh(log_entry)
         return log_entry
     
+    async def insert_many(self, rows: List[dict]) -> int:
+        """
+        Insert many activity log rows with a single multi-row INSERT.
+        Does not commit; the caller owns the transaction.
+        """
+        if not rows:
+            return 0
+        await self.db.execute(insert(ActivityLog).values(rows))
+        return len(rows)
+    
     async def get_by_user(
         self,
         user_id: int,
@@ -105,9 +116,17 @@ class ActivityLogRepository(BaseRepository[ActivityLog]):
         """
         Get filtered activity logs with pagination
         
+        The table is partitioned by month on created_at, so the date range is
+        always bounded below by the retention window: both queries then only
+        touch the partitions that can hold matching rows.
+        
         Returns:
             Tuple of (logs, total_count)
         """
+        floor = retention_floor(ActivityLog.__tablename__)
+        if floor is not None and (start_date is None or start_date < floor):
+            start_date = floor
+        
         conditions = [ActivityLog.is_deleted == False]
         
         if user_id is not None:
@@ -1,7 +1,7 @@
 """Candidate Document Repository"""
 
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, func, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.candidate_document import CandidateDocument
 from app.repositories.base import BaseRepository
@@ -39,6 +39,28 @@ class CandidateDocumentRepository(BaseRepository[CandidateDocument]):
         )
         return list(result.scalars().all())
     
+    async def count_file_references(self, file_path: str, exclude_id: Optional[int] = None) -> int:
+        """Count non-deleted documents (active or not) that point at a stored file"""
+        query = select(func.count(CandidateDocument.id)).where(
+            CandidateDocument.file_path == file_path,
+            CandidateDocument.is_deleted == False
+        )
+        if exclude_id is not None:
+            query = query.where(CandidateDocument.id != exclude_id)
+        result = await self.db.execute(query)
+        return result.scalar() or 0
+    
+    async def lock_file(self, file_path: str) -> None:
+        """
+        Hold a transaction-scoped lock on a stored file so that deleting it
+        and reusing it for a new document cannot interleave (Postgres only)
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        await self.db.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext(:file_path))"), {"file_path": file_path}
+        )
+    
     async def delete_by_file_path(self, file_path: str) -> bool:
         """Delete document by file path"""
         result = await self.db.execute(
@@ -1,21 +1,190 @@
 """Candidate Repository"""
 
 from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from uuid import UUID
-from sqlalchemy import select, func, Integer, or_, and_, case, cast, Numeric
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy import (
+    select, func, Integer, or_, and_, case, cast, column, literal, Numeric, String, JSON, literal_column, true, union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, aggregate_order_by
+from sqlalchemy.orm import joinedload, selectinload, aliased
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.candidate import Candidate
 from app.models.candidate_screening import CandidateScreening
 from app.models.candidate_document import CandidateDocument
 from app.models.candidate_counseling import CandidateCounseling
 from app.models.candidate_assignment import CandidateAssignment
+from app.models.user import User
 from app.repositories.base import BaseRepository
+from app.utils.fieldsets import FieldSelection
 
 
 MAIN_STATUSES = ['Completed', 'In Progress', 'Rejected', 'Pending']
 
+_JSON_FALSE = literal_column("'false'::json", JSON)
+_JSON_EMPTY_ARRAY = literal_column("'[]'::json", JSON)
+# JSON values Python treats as falsy
+_JSON_EMPTY = [literal_column(f"'{value}'::jsonb") for value in ('null', '{}', '[]', '""', 'false', '0')]
+
+
+def _present(value):
+    """SQL truth test matching ``if value:`` on the decoded JSON"""
+    return and_(value.isnot(None), cast(value, JSONB).notin_(_JSON_EMPTY))
+
+
+def _display_name(user):
+    return func.coalesce(func.nullif(user.full_name, ''), user.username)
+
+
+@lru_cache(maxsize=None)
+def _list_columns(with_documents: bool) -> tuple:
+    """
+    Columns of CandidateListItem, computed in SQL.
+
+    Mirrors CandidateListResponse.extract_flattened_data so the flat
+    projection and the ORM path render the same rows; the list views then
+    skip loading entities, relationships and the per-row validator. Built
+    once: constructing the expressions costs more than running the query.
+    """
+    screener = aliased(User, name="screener")
+    counselor = aliased(User, name="counselor")
+    assignee = aliased(User, name="assignee")
+    S, K, A = CandidateScreening, CandidateCounseling, CandidateAssignment
+    disability = Candidate.disability_details
+    experience = Candidate.work_experience
+    s_others, k_others = S.others, K.others
+
+    def degree(key):
+        return Candidate.education_details[('degrees', 0, key)]
+
+    def counseled(value):
+        return case((K.id.is_(None), _JSON_EMPTY_ARRAY), else_=value)
+
+    columns = [
+        Candidate.id, Candidate.public_id, Candidate.name, Candidate.gender, Candidate.email,
+        Candidate.phone, Candidate.whatsapp_number, Candidate.dob, Candidate.pincode,
+        Candidate.city, Candidate.district, Candidate.state, Candidate.created_at, Candidate.other,
+        func.coalesce(disability['is_disabled'], _JSON_FALSE).label('is_disabled'),
+        disability['disability_type'].label('disability_type'),
+        disability['disability_percentage'].label('disability_percentage'),
+        func.coalesce(experience['is_experienced'], _JSON_FALSE).label('is_experienced'),
+        experience['year_of_experience'].label('year_of_experience'),
+        func.coalesce(experience['currently_employed'], _JSON_FALSE).label('currently_employed'),
+        degree('degree_name').label('education_level'),
+        degree('year_of_passing').label('year_of_passing'),
+        degree('specialization').label('specialization'),
+        Candidate.other['registration_type'].label('registration_type'),
+        # Screening
+        case(
+            (S.id.is_(None), 'Pending'),
+            (func.coalesce(S.status, '') == '', 'In Progress'),
+            else_=S.status,
+        ).label('screening_status'),
+        S.consent_status, S.family_details,
+        S.created_at.label('screening_date'),
+        S.updated_at.label('screening_updated_at'),
+        s_others['source_of_info'].label('source_of_info'),
+        s_others['family_annual_income'].label('family_annual_income'),
+        s_others['reason'].label('screening_comments'),
+        _display_name(screener).label('screened_by_name'),
+        case(
+            (and_(_present(s_others), _present(S.skills)), func.json_build_object('others', s_others, 'skills', S.skills)),
+            (_present(s_others), func.json_build_object('others', s_others)),
+            (_present(S.skills), func.json_build_object('skills', S.skills)),
+            else_=None,
+        ).label('screening'),
+        # Counseling
+        K.status.label('counseling_status'),
+        K.counseling_date, K.feedback,
+        func.coalesce(func.nullif(counselor.full_name, ''), K.counselor_name).label('counselor_name'),
+        counseled(K.skills).label('skills'),
+        counseled(K.questions).label('questions'),
+        counseled(K.workexperience).label('workexperience'),
+        counseled(func.coalesce(k_others['suitable_job_roles'], _JSON_EMPTY_ARRAY)).label('suitable_job_roles'),
+        case(
+            (func.json_typeof(k_others['assigned_to']) == 'string', func.json_build_array(k_others['assigned_to'])),
+            (and_(func.json_typeof(k_others['assigned_to']) == 'array', _present(k_others['assigned_to'])), k_others['assigned_to']),
+            else_=_JSON_EMPTY_ARRAY,
+        ).label('assigned_to'),
+        k_others['remarks'].as_string().label('remarks'),
+        case((_present(k_others), func.json_build_object('others', k_others)), else_=None).label('counseling'),
+        # Assignment
+        A.user_id.label('assigned_to_id'),
+        _display_name(assignee).label('assigned_to_name'),
+    ]
+    if with_documents:
+        documents = (
+            select(func.coalesce(
+                func.array_agg(aggregate_order_by(CandidateDocument.document_type, CandidateDocument.id)),
+                cast(literal_column("'{}'"), ARRAY(String)),
+            ))
+            .where(
+                CandidateDocument.candidate_id == Candidate.id,
+                CandidateDocument.is_active == True,
+                CandidateDocument.is_deleted == False,
+            )
+            .scalar_subquery()
+        )
+        columns.append(documents.label('documents_uploaded'))
+    # (target, onclause, the column that needs it)
+    joins = [
+        (screener, screener.id == S.screened_by_id, 'screened_by_name'),
+        (counselor, counselor.id == K.counselor_id, 'counselor_name'),
+        (assignee, assignee.id == A.user_id, 'assigned_to_name'),
+    ]
+    return tuple(columns), tuple(joins)
+
+
+_LIST_OPTIONS = (
+    joinedload(Candidate.screening).joinedload(CandidateScreening.screened_by),
+    joinedload(Candidate.counseling).joinedload(CandidateCounseling.counselor),
+    joinedload(Candidate.assignment).joinedload(CandidateAssignment.user),
+)
+
+
+# Facets of the candidate filter panel, see CandidateRepository.get_facets
+FACETS = (
+    "disability_types", "disability_percentages", "education_levels", "years_of_passing", "cities",
+    "registration_types", "beneficiary_statuses", "screening_statuses", "screening_reasons", "counseling_statuses",
+)
+
+
+def _number(value: str):
+    """JSON numbers come back from ->> as text"""
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+
+def filter_options(facets: Dict[str, List[Tuple[str, int]]]) -> dict:
+    """The /filter-options payload: each facet's distinct values, in the order the filter panel shows them"""
+    values = {name: [value for value, _ in counts] for name, counts in facets.items()}
+    return {
+        "disability_types": sorted(values["disability_types"]),
+        "education_levels": sorted(values["education_levels"]),
+        "cities": sorted(values["cities"]),
+        "counseling_statuses": sorted(values["counseling_statuses"]),
+        # 'Pending' is the virtual status of candidates without a screening
+        "screening_statuses": sorted(set(values["screening_statuses"]) | {"Pending"}),
+        "disability_percentages": sorted(
+            (_number(value) for value in values["disability_percentages"]),
+            key=lambda value: (isinstance(value, str), value),
+        ),
+        "screening_reasons": sorted(values["screening_reasons"]),
+        "years_of_passing": sorted(values["years_of_passing"], reverse=True),
+        "registration_types": sorted(set(values["registration_types"]) | {"Registered", "Excel"}),
+        "beneficiary_statuses": sorted(values["beneficiary_statuses"]),
+    }
+
+
+def _with_list_joins(stmt):
+    """The outer joins the list filters refer to"""
+    return stmt.outerjoin(Candidate.screening).outerjoin(Candidate.counseling).outerjoin(Candidate.assignment)
+
 
 class CandidateRepository(BaseRepository[Candidate]):
     """Repository for Candidate model"""
@@ -76,56 +245,100 @@ class CandidateRepository(BaseRepository[Candidate]):
         assigned_to_id: Optional[int] = None,
         extra_filters: Optional[dict] = None,
         registration_type: Optional[str] = None,
-        status_of_beneficiary: Optional[list] = None
+        status_of_beneficiary: Optional[list] = None,
+        flat: bool = False,
+        fields: Optional[FieldSelection] = None
     ):
         """Get multiples candidates with counseling loaded for list view, with optional search filtering, category filters, and sorting"""
-        from sqlalchemy import or_, and_
-        stmt = (
-            select(Candidate)
-            .outerjoin(Candidate.screening)
-            .outerjoin(Candidate.counseling)
-            .outerjoin(Candidate.assignment)
-            .options(
-                joinedload(Candidate.screening).joinedload(CandidateScreening.screened_by),
-                selectinload(Candidate.documents),
-                joinedload(Candidate.counseling).joinedload(CandidateCounseling.counselor),
-                joinedload(Candidate.assignment).joinedload(CandidateAssignment.user)
-            )
+        conditions = self._filter_conditions(
+            include_deleted=include_deleted,
+            search=search,
+            disability_types=disability_types,
+            education_levels=education_levels,
+            cities=cities,
+            counseling_status=counseling_status,
+            is_experienced=is_experienced,
+            screening_status=screening_status,
+            disability_percentages=disability_percentages,
+            gender=gender,
+            year_of_passing=year_of_passing,
+            year_of_experience=year_of_experience,
+            currently_employed=currently_employed,
+            assigned_to_id=assigned_to_id,
+            extra_filters=extra_filters,
+            registration_type=registration_type,
+            status_of_beneficiary=status_of_beneficiary,
         )
+        stmt = _with_list_joins(select(Candidate)).where(*conditions)
+        count_stmt = _with_list_joins(select(func.count(Candidate.id)).select_from(Candidate)).where(*conditions)
+
+        # Count total matching records
+        count_result = await self.db.execute(count_stmt)
+        total = count_result.scalar() or 0
+        
+        # Apply sorting
+        if sort_by:
+            # Handle sorting by fields that might be in relationships or complex
+            # For now, focus on main Candidate fields
+            if hasattr(Candidate, sort_by):
+                column = getattr(Candidate, sort_by)
+                if sort_order.lower() == "asc":
+                    stmt = stmt.order_by(column.asc())
+                else:
+                    stmt = stmt.order_by(column.desc())
+        else:
+            # Default sorting
+            stmt = stmt.order_by(Candidate.created_at.desc())
+
+        # Now apply pagination for the data fetch
+        stmt = stmt.offset(skip).limit(limit)
+        if flat:
+            return await self._list_rows(stmt, with_documents=True, fields=fields), total
+        result = await self.db.execute(stmt.options(*_LIST_OPTIONS, selectinload(Candidate.documents)))
+        return result.scalars().unique().all(), total
+
+    def _filter_conditions(
+        self,
+        include_deleted: bool = False,
+        search: Optional[str] = None,
+        disability_types: Optional[list] = None,
+        education_levels: Optional[list] = None,
+        cities: Optional[list] = None,
+        counseling_status: Optional[str] = None,
+        is_experienced: Optional[bool] = None,
+        screening_status: Optional[str] = None,
+        disability_percentages: Optional[list] = None,
+        gender: Optional[str] = None,
+        year_of_passing: Optional[list] = None,
+        year_of_experience: Optional[str] = None,
+        currently_employed: Optional[bool] = None,
+        assigned_to_id: Optional[int] = None,
+        extra_filters: Optional[dict] = None,
+        registration_type: Optional[str] = None,
+        status_of_beneficiary: Optional[list] = None,
+    ) -> list:
+        """WHERE clauses for the candidate list filters, over the joins added by ``_with_list_joins``"""
+        conditions = []
 
         if assigned_to_id is not None:
             # If assigned_to_id is 0 or -1 (depending on convention), we might want to filter for unassigned
             if assigned_to_id == 0:
-                stmt = stmt.where(CandidateAssignment.id.is_(None))
+                conditions.append(CandidateAssignment.id.is_(None))
             else:
-                stmt = stmt.where(CandidateAssignment.user_id == assigned_to_id)
+                conditions.append(CandidateAssignment.user_id == assigned_to_id)
 
-        
         if not include_deleted:
-            stmt = stmt.where(Candidate.is_deleted == False) 
-        
-        # Base count query
-        count_stmt = select(func.count(Candidate.id)).select_from(Candidate).outerjoin(Candidate.screening).outerjoin(Candidate.counseling).outerjoin(Candidate.assignment)
-        if not include_deleted:
-            count_stmt = count_stmt.where(Candidate.is_deleted == False)
-        
-        if assigned_to_id is not None:
-            if assigned_to_id == 0:
-                count_stmt = count_stmt.where(CandidateAssignment.id.is_(None))
-            else:
-                count_stmt = count_stmt.where(CandidateAssignment.user_id == assigned_to_id)
-        
+            conditions.append(Candidate.is_deleted == False)
+
         # Apply search filters if provided
         if search:
-            search_filter = or_(
+            conditions.append(or_(
                 Candidate.name.ilike(f"%{search}%"),
                 Candidate.email.ilike(f"%{search}%"),
                 Candidate.phone.ilike(f"%{search}%"),
                 Candidate.city.ilike(f"%{search}%")
-            )
-            stmt = stmt.where(search_filter)
-            count_stmt = count_stmt.where(search_filter)
-        
+            ))
+
         # Apply category filters
         if disability_types and len(disability_types) > 0:
             # Filter by disability_type in JSON field
@@ -136,9 +349,8 @@ class CandidateRepository(BaseRepository[Candidate]):
                         Candidate.disability_details['disability_type'].as_string() == d_type
                     )
             if disability_filters:
-                stmt = stmt.where(or_(*disability_filters))
-                count_stmt = count_stmt.where(or_(*disability_filters))
-        
+                conditions.append(or_(*disability_filters))
+
         if disability_percentages and len(disability_percentages) > 0:
             # Filter by disability_percentage range (min-max)
             # Expecting format "min-max" e.g. "40-80" in the first element if passed as list of strings from query param
@@ -165,12 +377,10 @@ class CandidateRepository(BaseRepository[Candidate]):
                 # Use AND for range bounds (min AND max)
                 # But if multiple ranges were supported (unlikely here), they'd be OR'd.
                 # Here we have one range effectively.
-                stmt = stmt.where(and_(*percentage_filters))
-                count_stmt = count_stmt.where(and_(*percentage_filters))
+                conditions.append(and_(*percentage_filters))
 
         if gender:
-            stmt = stmt.where(Candidate.gender == gender)
-            count_stmt = count_stmt.where(Candidate.gender == gender)
+            conditions.append(Candidate.gender == gender)
 
         if registration_type:
             if registration_type.lower() == 'registered':
@@ -183,8 +393,7 @@ class CandidateRepository(BaseRepository[Candidate]):
             else:
                 reg_filter = Candidate.other['registration_type'].as_string().ilike(registration_type)
             
-            stmt = stmt.where(reg_filter)
-            count_stmt = count_stmt.where(reg_filter)
+            conditions.append(reg_filter)
 
         if status_of_beneficiary and len(status_of_beneficiary) > 0:
             beneficiary_filters = []
@@ -194,8 +403,7 @@ class CandidateRepository(BaseRepository[Candidate]):
                         Candidate.other['status_of_beneficiary'].as_string() == b_status
                     )
             if beneficiary_filters:
-                stmt = stmt.where(or_(*beneficiary_filters))
-                count_stmt = count_stmt.where(or_(*beneficiary_filters))
+                conditions.append(or_(*beneficiary_filters))
 
         if extra_filters:
             # Handle dynamic JSON filters for screening/counseling 'others' field
@@ -216,26 +424,19 @@ class CandidateRepository(BaseRepository[Candidate]):
 
                 if key.startswith('screening_others.'):
                     field_name = key.replace('screening_others.', '')
-                    conditions = [
+                    filter_conditions = [
                         func.json_extract_path_text(CandidateScreening.others, field_name).ilike(f'%{v}%')
                         for v in selected_values
                     ]
-                    filter_clause = or_(*conditions) if len(conditions) > 1 else conditions[0]
-                    stmt = stmt.where(filter_clause)
-                    count_stmt = count_stmt.where(filter_clause)
+                    conditions.append(or_(*filter_conditions) if len(filter_conditions) > 1 else filter_conditions[0])
                 elif key.startswith('counseling_others.'):
                     field_name = key.replace('counseling_others.', '')
-                    conditions = [
+                    filter_conditions = [
                         func.json_extract_path_text(CandidateCounseling.others, field_name).ilike(f'%{v}%')
                         for v in selected_values
                     ]
-                    filter_clause = or_(*conditions) if len(conditions) > 1 else conditions[0]
-                    stmt = stmt.where(filter_clause)
-                    count_stmt = count_stmt.where(filter_clause)
-
-
+                    conditions.append(or_(*filter_conditions) if len(filter_conditions) > 1 else filter_conditions[0])
 
-        
         if education_levels and len(education_levels) > 0:
             # Filter by education level (degree name) in JSON field
             education_filters = []
@@ -247,29 +448,19 @@ class CandidateRepository(BaseRepository[Candidate]):
                         Candidate.education_details['degrees'].as_string().ilike(f"%{edu_level}%")
                     )
             if education_filters:
-                stmt = stmt.where(or_(*education_filters))
-                count_stmt = count_stmt.where(or_(*education_filters))
+                conditions.append(or_(*education_filters))
 
-        
         if cities and len(cities) > 0:
-            stmt = stmt.where(Candidate.city.in_(cities))
-            count_stmt = count_stmt.where(Candidate.city.in_(cities))
+            conditions.append(Candidate.city.in_(cities))
         
         if counseling_status:
-            stmt = stmt.where(CandidateCounseling.status == counseling_status)
-            count_stmt = count_stmt.where(CandidateCounseling.status == counseling_status)
+            conditions.append(CandidateCounseling.status == counseling_status)
         
         if is_experienced is not None:
             if is_experienced:
-                stmt = stmt.where(Candidate.work_experience['is_experienced'].as_string() == 'true')
-                count_stmt = count_stmt.where(Candidate.work_experience['is_experienced'].as_string() == 'true')
+                conditions.append(Candidate.work_experience['is_experienced'].as_string() == 'true')
             else:
-                stmt = stmt.where(or_(
-                    Candidate.work_experience['is_experienced'].as_string() == 'false',
-                    Candidate.work_experience['is_experienced'].as_string().is_(None),
-                    Candidate.work_experience.is_(None)
-                ))
-                count_stmt = count_stmt.where(or_(
+                conditions.append(or_(
                     Candidate.work_experience['is_experienced'].as_string() == 'false',
                     Candidate.work_experience['is_experienced'].as_string().is_(None),
                     Candidate.work_experience.is_(None)
@@ -277,15 +468,9 @@ class CandidateRepository(BaseRepository[Candidate]):
         
         if currently_employed is not None:
             if currently_employed:
-                stmt = stmt.where(Candidate.work_experience['currently_employed'].as_string() == 'true')
-                count_stmt = count_stmt.where(Candidate.work_experience['currently_employed'].as_string() == 'true')
+                conditions.append(Candidate.work_experience['currently_employed'].as_string() == 'true')
             else:
-                stmt = stmt.where(or_(
-                    Candidate.work_experience['currently_employed'].as_string() == 'false',
-                    Candidate.work_experience['currently_employed'].as_string().is_(None),
-                    Candidate.work_experience.is_(None)
-                ))
-                count_stmt = count_stmt.where(or_(
+                conditions.append(or_(
                     Candidate.work_experience['currently_employed'].as_string() == 'false',
                     Candidate.work_experience['currently_employed'].as_string().is_(None),
                     Candidate.work_experience.is_(None)
@@ -305,14 +490,11 @@ class CandidateRepository(BaseRepository[Candidate]):
                         ),
                         Numeric
                     )
-                    stmt = stmt.where(numeric_expr >= min_exp).where(numeric_expr <= max_exp)
-                    count_stmt = count_stmt.where(numeric_expr >= min_exp).where(numeric_expr <= max_exp)
+                    conditions.extend([numeric_expr >= min_exp, numeric_expr <= max_exp])
                 except (ValueError, TypeError):
-                    stmt = stmt.where(Candidate.work_experience['year_of_experience'].as_string().ilike(f"%{year_of_experience}%"))
-                    count_stmt = count_stmt.where(Candidate.work_experience['year_of_experience'].as_string().ilike(f"%{year_of_experience}%"))
+                    conditions.append(Candidate.work_experience['year_of_experience'].as_string().ilike(f"%{year_of_experience}%"))
             else:
-                stmt = stmt.where(Candidate.work_experience['year_of_experience'].as_string().ilike(f"%{year_of_experience}%"))
-                count_stmt = count_stmt.where(Candidate.work_experience['year_of_experience'].as_string().ilike(f"%{year_of_experience}%"))
+                conditions.append(Candidate.work_experience['year_of_experience'].as_string().ilike(f"%{year_of_experience}%"))
 
         if year_of_passing and len(year_of_passing) > 0:
             yop_filters = []
@@ -322,51 +504,36 @@ class CandidateRepository(BaseRepository[Candidate]):
                         Candidate.education_details['degrees'].as_string().ilike(f'%"year_of_passing": {yop}%')
                     )
             if yop_filters:
-                stmt = stmt.where(or_(*yop_filters))
-                count_stmt = count_stmt.where(or_(*yop_filters))
+                conditions.append(or_(*yop_filters))
         
         if screening_status:
             if screening_status == 'Pending':
-                stmt = stmt.where(CandidateScreening.id.is_(None))
-                count_stmt = count_stmt.where(CandidateScreening.id.is_(None))
+                conditions.append(CandidateScreening.id.is_(None))
             elif screening_status == 'In Progress':
                 # Treat empty/null as In Progress
-                stmt = stmt.where(or_(
+                conditions.append(or_(
                     CandidateScreening.status == 'In Progress',
                     CandidateScreening.status.is_(None),
                     CandidateScreening.status == ''
-                ), CandidateScreening.id.isnot(None))
-                count_stmt = count_stmt.where(or_(
-                    CandidateScreening.status == 'In Progress',
-                    CandidateScreening.status.is_(None),
-                    CandidateScreening.status == ''
-                ), CandidateScreening.id.isnot(None))
+                ))
+                conditions.append(CandidateScreening.id.isnot(None))
             else:
-                stmt = stmt.where(CandidateScreening.status == screening_status)
-                count_stmt = count_stmt.where(CandidateScreening.status == screening_status)
-        
-        # Count total matching records
-        count_result = await self.db.execute(count_stmt)
-        total = count_result.scalar() or 0
-        
-        # Apply sorting
-        if sort_by:
-            # Handle sorting by fields that might be in relationships or complex
-            # For now, focus on main Candidate fields
-            if hasattr(Candidate, sort_by):
-                column = getattr(Candidate, sort_by)
-                if sort_order.lower() == "asc":
-                    stmt = stmt.order_by(column.asc())
-                else:
-                    stmt = stmt.order_by(column.desc())
-        else:
-            # Default sorting
-            stmt = stmt.order_by(Candidate.created_at.desc())
-
-        # Now apply pagination for the data fetch
-        stmt = stmt.offset(skip).limit(limit)
+                conditions.append(CandidateScreening.status == screening_status)
+
+        return conditions
+
+    async def _list_rows(self, stmt, with_documents: bool, fields: Optional[FieldSelection] = None) -> List[dict]:
+        """Run a list query as the flat projection: one dict per CandidateListItem instead of ORM objects.
+        With ``fields`` only the selected columns, and the user joins they need, are computed."""
+        columns, joins = _list_columns(with_documents)
+        if fields is not None:
+            columns = [column for column in columns if column.key in fields]
+            joins = [join for join in joins if join[2] in fields]
+        stmt = stmt.with_only_columns(*columns)
+        for target, onclause, _ in joins:
+            stmt = stmt.outerjoin(target, onclause)
         result = await self.db.execute(stmt)
-        return result.scalars().unique().all(), total
+        return [dict(row) for row in result.mappings()]
 
     async def get_new_candidates_by_date(self, start_date: datetime, end_date: datetime) -> List[Candidate]:
         """Get candidates created within a date range"""
@@ -396,7 +563,9 @@ class CandidateRepository(BaseRepository[Candidate]):
         counseling_status: Optional[str] = None,
         gender: Optional[str] = None,
         assigned_to_id: Optional[int] = None,
-        extra_filters: Optional[dict] = None
+        extra_filters: Optional[dict] = None,
+        flat: bool = False,
+        fields: Optional[FieldSelection] = None
     ):
         """Get candidates without screening records or with non-completed screening, with optional search filtering, category filters, and sorting"""
         # A candidate is "unscreened" ONLY if they have no screening record at all
@@ -408,11 +577,6 @@ class CandidateRepository(BaseRepository[Candidate]):
             .outerjoin(Candidate.counseling)
             .outerjoin(Candidate.assignment)
             .where(unscreened_filter)
-            .options(
-                joinedload(Candidate.screening).joinedload(CandidateScreening.screened_by),
-                joinedload(Candidate.counseling).joinedload(CandidateCounseling.counselor),
-                joinedload(Candidate.assignment).joinedload(CandidateAssignment.user)
-            )
         )
         
         if assigned_to_id is not None:
@@ -526,7 +690,9 @@ class CandidateRepository(BaseRepository[Candidate]):
 
         # Apply pagination
         stmt = stmt.offset(skip).limit(limit)
-        result = await self.db.execute(stmt)
+        if flat:
+            return await self._list_rows(stmt, with_documents=False, fields=fields), total
+        result = await self.db.execute(stmt.options(*_LIST_OPTIONS))
         return result.scalars().unique().all(), total
 
     async def get_screened(
@@ -545,7 +711,9 @@ class CandidateRepository(BaseRepository[Candidate]):
         is_experienced: Optional[bool] = None,
         gender: Optional[str] = None,
         assigned_to_id: Optional[int] = None,
-        extra_filters: Optional[dict] = None
+        extra_filters: Optional[dict] = None,
+        flat: bool = False,
+        fields: Optional[FieldSelection] = None
     ):
         """Get candidates with 'Completed' screening records loaded, with optional counseling status filter, document status filter, search filtering, category filters, and sorting"""
 
@@ -559,12 +727,6 @@ class CandidateRepository(BaseRepository[Candidate]):
             .outerjoin(Candidate.assignment)
             .where(CandidateScreening.id.isnot(None))
             .where(base_filter)
-            .options(
-                joinedload(Candidate.screening).joinedload(CandidateScreening.screened_by),
-                selectinload(Candidate.documents),
-                joinedload(Candidate.counseling).joinedload(CandidateCounseling.counselor),
-                joinedload(Candidate.assignment).joinedload(CandidateAssignment.user)
-            )
         )
         
         if assigned_to_id is not None:
@@ -748,7 +910,9 @@ class CandidateRepository(BaseRepository[Candidate]):
             stmt = stmt.limit(limit)
         if skip > 0:
             stmt = stmt.offset(skip)
-        result = await self.db.execute(stmt)
+        if flat:
+            return await self._list_rows(stmt, with_documents=True, fields=fields), total
+        result = await self.db.execute(stmt.options(*_LIST_OPTIONS, selectinload(Candidate.documents)))
         return result.scalars().unique().all(), total
 
 
@@ -1004,148 +1168,83 @@ class CandidateRepository(BaseRepository[Candidate]):
                 "docs_total": 0, "docs_completed": 0, "docs_pending": 0
             }
 
-    async def get_filter_options(self) -> dict:
-        """Get all unique values for filterable fields across all candidates"""
-        try:
-            # Get unique disability types
-            stmt_disability = select(Candidate.disability_details).where(
-                Candidate.disability_details.isnot(None),
-                Candidate.is_deleted == False
-            )
-            result_disability = await self.db.execute(stmt_disability)
-            disability_types = set()
-            for row in result_disability.scalars().all():
-                if row and isinstance(row, dict):
-                    disability_type = row.get('disability_type')
-                    if disability_type:
-                        disability_types.add(disability_type)
-            
-            # Get unique education levels (from degree names)
-            stmt_education = select(Candidate.education_details).where(
-                Candidate.education_details.isnot(None),
-                Candidate.is_deleted == False
-            )
-            result_education = await self.db.execute(stmt_education)
-            education_levels = set()
-            for row in result_education.scalars().all():
-                if row and isinstance(row, dict):
-                    degrees = row.get('degrees', [])
-                    for degree in degrees:
-                        if isinstance(degree, dict):
-                            degree_name = degree.get('degree_name')
-                            if degree_name:
-                                education_levels.add(degree_name)
-            
-            # Get unique years of passing
-            result_education_yop = await self.db.execute(stmt_education)
-            years_of_passing = set()
-            for row in result_education_yop.scalars().all():
-                if row and isinstance(row, dict):
-                    degrees = row.get('degrees', [])
-                    for degree in degrees:
-                        if isinstance(degree, dict):
-                            yop = degree.get('year_of_passing')
-                            if yop:
-                                years_of_passing.add(str(yop))
-            
-            # Get unique cities
-            stmt_cities = select(func.distinct(Candidate.city)).where(
-                Candidate.city.isnot(None),
-                Candidate.city != '',
-                Candidate.is_deleted == False
-            )
-            result_cities = await self.db.execute(stmt_cities)
-            cities = sorted([city for city in result_cities.scalars().all() if city])
-            
-            # Get unique registration types
-            stmt_reg_types = select(Candidate.other).where(
-                Candidate.other.isnot(None),
-                Candidate.is_deleted == False
-            )
-            result_reg_types = await self.db.execute(stmt_reg_types)
-            registration_types = set()
-            beneficiary_statuses = set()
-            for row in result_reg_types.scalars().all():
-                if row and isinstance(row, dict):
-                    reg_type = row.get('registration_type')
-                    if reg_type:
-                        normalized_reg_type = reg_type.strip().capitalize()
-                        if normalized_reg_type:
-                            registration_types.add(normalized_reg_type)
-                    else:
-                        registration_types.add("Registered")
-                    
-                    status_of_beneficiary = row.get('status_of_beneficiary')
-                    if status_of_beneficiary:
-                        beneficiary_statuses.add(status_of_beneficiary)
-                else:
-                    registration_types.add("Registered")
-            
-            # Ensure at least "Registered" and "Excel" are present
-            registration_types.add("Registered")
-            registration_types.add("Excel")
-            
-            # Get unique screening statuses
-            stmt_screening = select(func.distinct(CandidateScreening.status)).where(
-                CandidateScreening.status.isnot(None)
-            )
-            result_screening = await self.db.execute(stmt_screening)
-            screening_statuses = [status for status in result_screening.scalars().all() if status]
-            # Add 'Pending' as a virtual status for candidates with no screening record
-            if 'Pending' not in screening_statuses:
-                screening_statuses.append('Pending')
-            
-            # Get unique counseling statuses
-            stmt_counseling = select(func.distinct(CandidateCounseling.status)).where(
-                CandidateCounseling.status.isnot(None)
+    async def get_facets(self, conditions: Optional[list] = None) -> Dict[str, List[Tuple[str, int]]]:
+        """
+        (value, candidate count) pairs for every facet in FACETS, most common
+        first, in one statement. ``conditions`` (from ``_filter_conditions``)
+        narrows the candidates; by default every non-deleted candidate counts.
+        """
+        if conditions is None:
+            conditions = [Candidate.is_deleted == False]
+        matching = _with_list_joins(
+            select(
+                Candidate.id,
+                Candidate.city,
+                Candidate.disability_details,
+                Candidate.education_details,
+                Candidate.other,
+                CandidateScreening.id.label("screening_id"),
+                CandidateScreening.status.label("screening_status"),
+                CandidateScreening.others.label("screening_others"),
+                CandidateCounseling.status.label("counseling_status"),
+            ).select_from(Candidate)
+        ).where(*conditions).cte("matching")
+        m = matching.c
+
+        degrees_json = m.education_details['degrees']
+        degree = func.json_array_elements(
+            case((func.json_typeof(degrees_json) == 'array', degrees_json))
+        ).table_valued(column("value", JSON)).lateral("degree")
+        with_degrees = matching.join(degree, true())
+
+        registration_type = func.trim(m.other['registration_type'].as_string())
+        screening_status = case(
+            (m.screening_id.is_(None), 'Pending'),
+            (func.coalesce(m.screening_status, '') == '', 'In Progress'),
+            else_=m.screening_status,
+        )
+        values = {
+            "disability_types": (m.disability_details['disability_type'].as_string(), matching),
+            "disability_percentages": (m.disability_details['disability_percentage'].as_string(), matching),
+            "education_levels": (degree.c.value['degree_name'].as_string(), with_degrees),
+            "years_of_passing": (degree.c.value['year_of_passing'].as_string(), with_degrees),
+            "cities": (m.city, matching),
+            # Python's str.capitalize(); no registration type means "Registered"
+            "registration_types": (func.coalesce(
+                func.nullif(func.concat(func.upper(func.left(registration_type, 1)), func.lower(func.substr(registration_type, 2))), ''),
+                'Registered',
+            ), matching),
+            "beneficiary_statuses": (m.other['status_of_beneficiary'].as_string(), matching),
+            "screening_statuses": (screening_status, matching),
+            "screening_reasons": (m.screening_others['reason'].as_string(), matching),
+            "counseling_statuses": (m.counseling_status, matching),
+        }
+        stmt = union_all(*(
+            select(
+                literal(name).label("facet"),
+                cast(value, String).label("value"),
+                func.count(m.id.distinct()).label("count"),
             )
-            result_counseling = await self.db.execute(stmt_counseling)
-            counseling_statuses = sorted([status for status in result_counseling.scalars().all() if status])
-
-            # Get unique disability percentages
-            stmt_disability_perc = select(Candidate.disability_details).where(Candidate.disability_details.isnot(None))
-            result_disability_perc = await self.db.execute(stmt_disability_perc)
-            disability_percentages = set()
-            for row in result_disability_perc.scalars().all():
-                if row and isinstance(row, dict):
-                    perc = row.get('disability_percentage')
-                    if perc is not None:
-                        disability_percentages.add(perc)
-
-            # Get unique screening reasons
-            stmt_screening_reasons = select(CandidateScreening.others).where(CandidateScreening.others.isnot(None))
-            result_screening_reasons = await self.db.execute(stmt_screening_reasons)
-            screening_reasons = set()
-            for row in result_screening_reasons.scalars().all():
-                if row and isinstance(row, dict):
-                    reason = row.get('reason')
-                    if reason:
-                        screening_reasons.add(reason)
-            
-            return {
-                "disability_types": sorted(list(disability_types)),
-                "education_levels": sorted(list(education_levels)),
-                "cities": cities,
-                "counseling_statuses": counseling_statuses,
-                "screening_statuses": sorted(screening_statuses),
-                "disability_percentages": sorted(list(disability_percentages)),
-                "screening_reasons": sorted(list(screening_reasons)),
-                "years_of_passing": sorted(list(years_of_passing), reverse=True),
-                "registration_types": sorted(list(registration_types)),
-                "beneficiary_statuses": sorted(list(beneficiary_statuses))
-            }
-        except Exception as e:
-            import traceback
-            print(f"Error getting filter options: {e}")
-            print(traceback.format_exc())
-            return {
-                "disability_types": [],
-                "education_levels": [],
-                "cities": [],
-                "counseling_statuses": []
-            }
+            .select_from(source)
+            .where(value.isnot(None), cast(value, String) != '')
+            .group_by(value)
+            for name, (value, source) in values.items()
+        ))
+
+        facets = {name: [] for name in FACETS}
+        for name, value, count in await self.db.execute(stmt):
+            facets[name].append((value, count))
+        for counts in facets.values():
+            counts.sort(key=lambda item: (-item[1], item[0]))
+        return facets
 
+    async def get_filter_options(self) -> dict:
+        """Get all unique values for filterable fields across all candidates"""
+        return filter_options(await self.get_facets())
 
+    async def get_filter_facets(self, **filters) -> Dict[str, List[Tuple[str, int]]]:
+        """Facet counts over the candidates matching the list filters (see ``get_multi``)"""
+        return await self.get_facets(self._filter_conditions(**filters))
 
     async def get_screening_stats(self, assigned_to_id: Optional[int] = None) -> dict:
         """Get candidate screening statistics for tabs, with optional assignment filter"""
@@ -0,0 +1,43 @@
+"""Daily Stat Repository"""
+
+from datetime import date
+from typing import Dict, List, Optional
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.daily_stat import DailyStat
+from app.repositories.base import BaseRepository
+
+
+class DailyStatRepository(BaseRepository[DailyStat]):
+    """Repository for nightly rolled-up counters"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(DailyStat, db)
+
+    async def upsert_day(self, day: date, values: Dict[str, int]) -> None:
+        """Write one day's metrics in a single statement; re-running a day overwrites it"""
+        if not values:
+            return
+        query = insert(DailyStat).values([
+            {"metric": metric, "day": day, "value": value, "is_deleted": False}
+            for metric, value in values.items()
+        ])
+        query = query.on_conflict_do_update(
+            constraint="uq_daily_stats_metric_day",
+            set_={"value": query.excluded.value, "updated_at": func.now()},
+        )
+        await self.db.execute(query)
+
+    async def get_range(
+        self, start: date, end: date, metrics: Optional[List[str]] = None
+    ) -> List[DailyStat]:
+        query = select(DailyStat).where(
+            DailyStat.day >= start,
+            DailyStat.day <= end,
+            DailyStat.is_deleted == False,
+        )
+        if metrics:
+            query = query.where(DailyStat.metric.in_(metrics))
+        result = await self.db.execute(query.order_by(DailyStat.day, DailyStat.metric))
+        return list(result.scalars().all())
@@ -0,0 +1,35 @@
+"""Document Text Repository"""
+
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.document_text import DocumentText
+from app.repositories.base import BaseRepository
+
+
+class DocumentTextRepository(BaseRepository[DocumentText]):
+    """Repository for cached document text"""
+    
+    def __init__(self, db: AsyncSession):
+        super().__init__(DocumentText, db)
+    
+    async def get_by_hash(self, content_sha256: str, extractor_version: int) -> Optional[DocumentText]:
+        """Cached text for a content hash, if produced by the current extractor"""
+        result = await self.db.execute(
+            select(DocumentText).where(
+                DocumentText.content_sha256 == content_sha256,
+                DocumentText.extractor_version == extractor_version,
+                DocumentText.is_deleted == False
+            )
+        )
+        return result.scalar_one_or_none()
+    
+    async def upsert(self, values: dict) -> None:
+        """Store extracted text; concurrent extractions of the same file keep the newest"""
+        query = insert(DocumentText).values(**values)
+        query = query.on_conflict_do_update(
+            index_elements=[DocumentText.content_sha256],
+            set_={key: query.excluded[key] for key in values if key != "content_sha256"},
+        )
+        await self.db.execute(query)
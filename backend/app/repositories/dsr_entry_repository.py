@@ -7,6 +7,7 @@ from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.dsr_entry import DSREntry, DSRStatus
 from app.repositories.base import BaseRepository
+from app.utils.fieldsets import FieldSelection
 
 
 class DSREntryRepository(BaseRepository[DSREntry]):
@@ -41,6 +42,7 @@ class DSREntryRepository(BaseRepository[DSREntry]):
         date_to: Optional[date] = None,
         status: Optional[DSRStatus] = None,
         search: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
     ) -> Tuple[List[DSREntry], int]:
         base = and_(DSREntry.user_id == user_id, DSREntry.is_deleted == False)
         query = select(DSREntry).where(base)
@@ -64,6 +66,8 @@ class DSREntryRepository(BaseRepository[DSREntry]):
 
         total = (await self.db.execute(count_query)).scalar_one()
         query = query.order_by(DSREntry.report_date.desc()).offset(skip).limit(limit)
+        if fields is not None:
+            query = query.options(*fields.load_options(DSREntry))
         result = await self.db.execute(query)
         return list(result.scalars().all()), total
 
@@ -76,6 +80,7 @@ class DSREntryRepository(BaseRepository[DSREntry]):
         date_to: Optional[date] = None,
         status: Optional[DSRStatus] = None,
         search: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
     ) -> Tuple[List[DSREntry], int]:
         """Admin view — all entries across all users with filters and search"""
         from app.models.user import User
@@ -107,6 +112,8 @@ class DSREntryRepository(BaseRepository[DSREntry]):
 
         total = (await self.db.execute(count_query)).scalar_one()
         query = query.order_by(DSREntry.report_date.desc(), DSREntry.user_id).offset(skip).limit(limit)
+        if fields is not None:
+            query = query.options(*fields.load_options(DSREntry))
         result = await self.db.execute(query)
         return list(result.scalars().all()), total
 
@@ -125,6 +132,7 @@ class DSREntryRepository(BaseRepository[DSREntry]):
         status: DSRStatus,
         skip: int = 0,
         limit: int = 100,
+        fields: Optional[FieldSelection] = None,
     ) -> Tuple[List[DSREntry], int]:
         """Get all entries across all users matching a given status, ordered oldest first."""
         base = and_(DSREntry.status == status, DSREntry.is_deleted == False)
@@ -138,6 +146,8 @@ class DSREntryRepository(BaseRepository[DSREntry]):
             .offset(skip)
             .limit(limit)
         )
+        if fields is not None:
+            query = query.options(*fields.load_options(DSREntry))
         result = await self.db.execute(query)
         return list(result.scalars().all()), total
 
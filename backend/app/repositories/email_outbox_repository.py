@@ -0,0 +1,109 @@
+"""Email Outbox Repository"""
+
+from datetime import datetime
+from typing import List
+from sqlalchemy import select, update, delete, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.email_outbox import EmailOutbox, EmailOutboxStatus
+from app.repositories.base import BaseRepository
+
+
+class EmailOutboxRepository(BaseRepository[EmailOutbox]):
+    """Repository for queued outgoing email"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(EmailOutbox, db)
+
+    async def claim_due(self, limit: int, now: datetime, stale_before: datetime) -> List[EmailOutbox]:
+        """
+        Mark up to ``limit`` due messages as sending and return them.
+
+        SKIP LOCKED lets several app workers claim concurrently without
+        handing out the same row twice. Rows left in "sending" by a worker
+        that died mid-delivery are reclaimed once their lease has expired.
+        """
+        due = (
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.is_deleted == False,
+                or_(
+                    and_(
+                        EmailOutbox.status == EmailOutboxStatus.PENDING,
+                        EmailOutbox.next_attempt_at <= now,
+                    ),
+                    and_(
+                        EmailOutbox.status == EmailOutboxStatus.SENDING,
+                        EmailOutbox.locked_at < stale_before,
+                    ),
+                ),
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(due.scalar_subquery()))
+            .values(
+                status=EmailOutboxStatus.SENDING,
+                locked_at=now,
+                attempts=EmailOutbox.attempts + 1,
+            )
+            .returning(EmailOutbox)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def mark_sent(self, ids: List[int], sent_at: datetime) -> None:
+        if not ids:
+            return
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id.in_(ids))
+            .values(status=EmailOutboxStatus.SENT, sent_at=sent_at, locked_at=None, last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_retry(self, id: int, next_attempt_at: datetime, error: str) -> None:
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == id)
+            .values(
+                status=EmailOutboxStatus.PENDING,
+                next_attempt_at=next_attempt_at,
+                locked_at=None,
+                last_error=error,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_failed(self, id: int, error: str) -> None:
+        await self.db.execute(
+            update(EmailOutbox)
+            .where(EmailOutbox.id == id)
+            .values(status=EmailOutboxStatus.FAILED, locked_at=None, last_error=error)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def count_pending(self) -> int:
+        """Messages not yet delivered or given up on (the outbox depth)"""
+        result = await self.db.execute(
+            select(func.count(EmailOutbox.id)).where(
+                EmailOutbox.status.in_([EmailOutboxStatus.PENDING, EmailOutboxStatus.SENDING]),
+                EmailOutbox.is_deleted == False,
+            )
+        )
+        return result.scalar() or 0
+
+    async def purge_finished(self, before: datetime) -> int:
+        """Delete sent and failed messages last touched before ``before``"""
+        result = await self.db.execute(
+            delete(EmailOutbox)
+            .where(
+                EmailOutbox.status.in_([EmailOutboxStatus.SENT, EmailOutboxStatus.FAILED]),
+                EmailOutbox.updated_at < before,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -0,0 +1,188 @@
+"""Job Repository"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.job import Job, JobStatus
+from app.repositories.base import BaseRepository
+
+
+class JobRepository(BaseRepository[Job]):
+    """Repository for background jobs"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(Job, db)
+
+    async def get_by_public_id(self, public_id: UUID) -> Optional[Job]:
+        result = await self.db.execute(
+            select(Job).where(Job.public_id == public_id, Job.is_deleted == False)
+        )
+        return result.scalar_one_or_none()
+
+    async def list_for_user(self, user_id: int, limit: int = 20) -> List[Job]:
+        result = await self.db.execute(
+            select(Job)
+            .where(Job.created_by_user_id == user_id, Job.is_deleted == False)
+            .order_by(Job.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def claim(self, queue: str, limit: int, worker_id: str, now: datetime) -> List[Job]:
+        """
+        Mark up to ``limit`` due jobs of ``queue`` as running and return them,
+        highest priority first. SKIP LOCKED lets any number of workers claim
+        concurrently without handing out the same job twice.
+        """
+        due = (
+            select(Job.id)
+            .where(
+                Job.queue == queue,
+                Job.status == JobStatus.QUEUED,
+                Job.run_at <= now,
+                Job.is_deleted == False,
+            )
+            .order_by(Job.priority.desc(), Job.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        query = (
+            update(Job)
+            .where(Job.id.in_(due.scalar_subquery()))
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=Job.attempts + 1,
+                started_at=now,
+                heartbeat_at=now,
+                locked_by=worker_id,
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(query)
+        return sorted(result.scalars().all(), key=lambda job: (-job.priority, job.run_at))
+
+    async def heartbeat(self, ids: List[int], now: datetime) -> None:
+        if not ids:
+            return
+        await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(ids), Job.status == JobStatus.RUNNING)
+            .values(heartbeat_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def set_progress(self, id: int, progress: int, message: Optional[str]) -> None:
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == id)
+            .values(progress=progress, progress_message=message)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_succeeded(self, id: int, result: Optional[Dict[str, Any]], now: datetime) -> None:
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == id)
+            .values(
+                status=JobStatus.SUCCEEDED,
+                progress=100,
+                result=result,
+                finished_at=now,
+                locked_by=None,
+                last_error=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_retry(self, id: int, run_at: datetime, error: str) -> None:
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == id)
+            .values(status=JobStatus.QUEUED, run_at=run_at, locked_by=None, last_error=error)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_failed(self, id: int, error: str, now: datetime) -> None:
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == id)
+            .values(status=JobStatus.FAILED, finished_at=now, locked_by=None, last_error=error)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def release(self, ids: List[int]) -> None:
+        """Put jobs interrupted by a worker shutdown back without using up an attempt"""
+        if not ids:
+            return
+        await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(ids), Job.status == JobStatus.RUNNING)
+            .values(status=JobStatus.QUEUED, attempts=Job.attempts - 1, locked_by=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def recover_stale(self, stale_before: datetime, now: datetime) -> int:
+        """
+        Requeue running jobs whose worker stopped heartbeating, or fail them
+        when they are out of attempts. Returns how many jobs were touched.
+        """
+        stale = (
+            Job.status == JobStatus.RUNNING,
+            Job.heartbeat_at < stale_before,
+        )
+        failed = await self.db.execute(
+            update(Job)
+            .where(*stale, Job.attempts >= Job.max_attempts)
+            .values(
+                status=JobStatus.FAILED,
+                finished_at=now,
+                locked_by=None,
+                last_error="Worker stopped responding",
+            )
+            .execution_options(synchronize_session=False)
+        )
+        requeued = await self.db.execute(
+            update(Job)
+            .where(*stale)
+            .values(
+                status=JobStatus.QUEUED,
+                run_at=now,
+                locked_by=None,
+                last_error="Worker stopped responding",
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return failed.rowcount + requeued.rowcount
+
+    async def cancel(self, id: int, now: datetime) -> bool:
+        """Cancel a job that has not started yet; False when a worker already has it"""
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == id, Job.status == JobStatus.QUEUED)
+            .values(status=JobStatus.CANCELLED, finished_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+
+    async def queue_depths(self) -> Dict[str, int]:
+        result = await self.db.execute(
+            select(Job.queue, func.count())
+            .where(Job.status == JobStatus.QUEUED, Job.is_deleted == False)
+            .group_by(Job.queue)
+        )
+        return {queue: count for queue, count in result.all()}
+
+    async def purge_finished(self, before: datetime) -> int:
+        """Delete succeeded, failed and cancelled jobs that finished before ``before``"""
+        result = await self.db.execute(
+            delete(Job)
+            .where(
+                Job.status.in_([JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED]),
+                Job.finished_at < before,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from uuid import UUID
-from sqlalchemy import select, update, func
+from sqlalchemy import select, update, insert, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.notification import Notification
 from app.repositories.base import BaseRepository
@@ -9,6 +9,19 @@ class NotificationRepository(BaseRepository[Notification]):
     def __init__(self, db: AsyncSession):
         super().__init__(Notification, db)
 
+    async def insert_many(self, rows: List[dict]) -> List[Notification]:
+        """
+        Insert all rows and return them in input order. SQLAlchemy batches the
+        parameter sets into a single multi-row INSERT ... RETURNING.
+        """
+        if not rows:
+            return []
+        result = await self.db.execute(
+            insert(Notification).returning(Notification, sort_by_parameter_order=True),
+            rows,
+        )
+        return list(result.scalars().all())
+
     async def get_by_public_id(self, public_id: UUID) -> Optional[Notification]:
         result = await self.db.execute(
             select(Notification).where(Notification.public_id == public_id)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.placement_mapping import PlacementMapping
 from app.repositories.base import BaseRepository
+from app.utils.fieldsets import FieldSelection
 
 
 class PlacementMappingRepository(BaseRepository[PlacementMapping]):
@@ -43,25 +44,35 @@ class PlacementMappingRepository(BaseRepository[PlacementMapping]):
         )
         result = await self.db.execute(stmt)
         return result.scalars().first()
-    async def get_all_active(self) -> List[PlacementMapping]:
+    def _list_options(self, fields: Optional[FieldSelection] = None) -> list:
+        """Eager loads for the mapping lists; with ``fields`` only the selected relationships"""
+        relationships = {
+            "candidate": selectinload(self.model.candidate).options(
+                selectinload(self.Candidate.screening).selectinload(self.CandidateScreening.screened_by),
+                selectinload(self.Candidate.documents),
+                selectinload(self.Candidate.counseling).selectinload(self.CandidateCounseling.counselor),
+                selectinload(self.Candidate.allocations).selectinload(self.TrainingCandidateAllocation.batch)
+            ),
+            "job_role": selectinload(self.model.job_role).selectinload(self.JobRole.company),
+            "mapped_by": selectinload(self.model.mapped_by),
+        }
+        if fields is None:
+            return list(relationships.values())
+        relationships["unmapped_by"] = selectinload(self.model.unmapped_by)
+        return fields.load_options(self.model) + [
+            option for name, option in relationships.items() if name in fields
+        ]
+
+    async def get_all_active(self, fields: Optional[FieldSelection] = None) -> List[PlacementMapping]:
         stmt = (
             select(self.model)
             .where(self.model.is_active == True)
-            .options(
-                selectinload(self.model.candidate).options(
-                    selectinload(self.Candidate.screening).selectinload(self.CandidateScreening.screened_by),
-                    selectinload(self.Candidate.documents),
-                    selectinload(self.Candidate.counseling).selectinload(self.CandidateCounseling.counselor),
-                    selectinload(self.Candidate.allocations).selectinload(self.TrainingCandidateAllocation.batch)
-                ),
-                selectinload(self.model.job_role).selectinload(self.JobRole.company),
-                selectinload(self.model.mapped_by)
-            )
+            .options(*self._list_options(fields))
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_by_job_role_active(self, job_role_id: int) -> List[PlacementMapping]:
+    async def get_by_job_role_active(self, job_role_id: int, fields: Optional[FieldSelection] = None) -> List[PlacementMapping]:
         stmt = (
             select(self.model)
             .where(
@@ -70,16 +81,7 @@ class PlacementMappingRepository(BaseRepository[PlacementMapping]):
                     self.model.is_active == True
                 )
             )
-            .options(
-                selectinload(self.model.candidate).options(
-                    selectinload(self.Candidate.screening).selectinload(self.CandidateScreening.screened_by),
-                    selectinload(self.Candidate.documents),
-                    selectinload(self.Candidate.counseling).selectinload(self.CandidateCounseling.counselor),
-                    selectinload(self.Candidate.allocations).selectinload(self.TrainingCandidateAllocation.batch)
-                ),
-                selectinload(self.model.job_role).selectinload(self.JobRole.company),
-                selectinload(self.model.mapped_by)
-            )
+            .options(*self._list_options(fields))
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
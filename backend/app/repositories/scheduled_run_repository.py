@@ -0,0 +1,23 @@
+"""Scheduled Run Repository"""
+
+from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.scheduled_run import ScheduledRun
+from app.repositories.base import BaseRepository
+
+
+class ScheduledRunRepository(BaseRepository[ScheduledRun]):
+    """Repository for schedule firing history"""
+
+    def __init__(self, db: AsyncSession):
+        super().__init__(ScheduledRun, db)
+
+    async def recent(self, schedule: str, limit: int = 5) -> List[ScheduledRun]:
+        result = await self.db.execute(
+            select(ScheduledRun)
+            .where(ScheduledRun.schedule == schedule, ScheduledRun.is_deleted == False)
+            .order_by(ScheduledRun.scheduled_for.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
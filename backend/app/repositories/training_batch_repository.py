@@ -1,13 +1,25 @@
 """Training Batch Repository"""
 
 from typing import Optional, List, Any, Union
-from sqlalchemy import select, update, or_, desc, asc
+from sqlalchemy import select, update, or_, and_, desc, asc, case, cast, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.candidate import Candidate
+from app.models.candidate_counseling import CandidateCounseling
 from app.models.training_batch import TrainingBatch
+from app.models.training_candidate_allocation import TrainingCandidateAllocation
 from app.repositories.base import BaseRepository
 
 
+# Batch statuses whose allocated candidates count as "in training"
+ACTIVE_BATCH_STATUSES = ("planned", "running", "extended")
+
+# Candidate buckets in priority order: a candidate is counted once, in the
+# first bucket any of their allocations qualifies for
+CANDIDATE_BUCKETS = ("in_training", "moved_to_placement", "completed_candidates", "dropped_out")
+
+
 class TrainingBatchRepository(BaseRepository[TrainingBatch]):
     """Repository for TrainingBatch CRUD operations"""
     
@@ -144,3 +156,88 @@ class TrainingBatchRepository(BaseRepository[TrainingBatch]):
         
         result = await self.db.execute(query_select)
         return result.unique().scalar_one_or_none()
+
+    async def get_stats(self) -> dict:
+        """
+        Batch counts by status and non-overlapping candidate buckets, in two
+        statements: a grouped aggregate over batches, and one pass over the
+        allocations that gives each candidate the highest-priority bucket
+        any of their allocations qualifies for (see CANDIDATE_BUCKETS).
+        """
+        women = cast(self.model.disability_types, JSONB).has_key("Women")
+        batch_rows = await self.db.execute(
+            select(
+                self.model.status,
+                func.count().label("batches"),
+                func.count().filter(women).label("women"),
+            )
+            .where(self.model.is_deleted == False)
+            .group_by(self.model.status)
+        )
+        by_status = {row.status: row for row in batch_rows}
+
+        registered = or_(
+            Candidate.other.is_(None),
+            Candidate.other["registration_type"].as_string() == "Registered",
+        )
+        allocation = TrainingCandidateAllocation
+        bucket = case(
+            (
+                and_(self.model.status.in_(ACTIVE_BATCH_STATUSES), allocation.is_dropout == False),
+                1,
+            ),
+            (allocation.status == "moved_to_placement", 2),
+            (allocation.status == "completed", 3),
+            (allocation.is_dropout == True, 4),
+        )
+        per_candidate = (
+            select(func.min(bucket).label("bucket"))
+            .select_from(allocation)
+            .join(Candidate, allocation.candidate_id == Candidate.id)
+            .outerjoin(
+                self.model,
+                and_(self.model.id == allocation.batch_id, self.model.is_deleted == False),
+            )
+            .where(allocation.is_deleted == False, registered)
+            .group_by(allocation.candidate_id)
+            .subquery()
+        )
+        total_selected = (
+            select(func.count(Candidate.id))
+            .join(CandidateCounseling, Candidate.id == CandidateCounseling.candidate_id)
+            .where(
+                Candidate.is_deleted == False,
+                func.lower(CandidateCounseling.status) == "selected",
+                registered,
+            )
+            .scalar_subquery()
+        )
+        candidate_row = (
+            await self.db.execute(
+                select(
+                    total_selected.label("total_selected"),
+                    *(
+                        func.count().filter(per_candidate.c.bucket == priority).label(name)
+                        for priority, name in enumerate(CANDIDATE_BUCKETS, start=1)
+                    ),
+                ).select_from(per_candidate)
+            )
+        ).one()
+        buckets = {name: getattr(candidate_row, name) for name in CANDIDATE_BUCKETS}
+
+        def batches(*statuses: str) -> int:
+            return sum(by_status[name].batches for name in statuses if name in by_status)
+
+        return {
+            "total": sum(row.batches for row in by_status.values()),
+            "planned": batches("planned"),
+            "running": batches("running"),
+            "completed": batches("closed"),
+            "total_selected": candidate_row.total_selected or 0,
+            **buckets,
+            # Traditional 'Graduates' count
+            "completed_training": buckets["moved_to_placement"] + buckets["completed_candidates"],
+            # Selected but never allocated; the buckets and this sum to total_selected
+            "ready_for_training": max(0, (candidate_row.total_selected or 0) - sum(buckets.values())),
+            "women": sum(row.women for row in by_status.values()),
+        }
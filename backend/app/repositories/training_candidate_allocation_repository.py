@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.training_candidate_allocation import TrainingCandidateAllocation
 from app.models.candidate import Candidate
 from app.repositories.base import BaseRepository
+from app.utils.fieldsets import FieldSelection
 
 
 class TrainingCandidateAllocationRepository(BaseRepository[TrainingCandidateAllocation]):
@@ -94,9 +95,11 @@ class TrainingCandidateAllocationRepository(BaseRepository[TrainingCandidateAllo
         disability_types: Optional[str] = None,
         batch_tag: Optional[str] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        fields: Optional[FieldSelection] = None
     ) -> tuple[List[TrainingCandidateAllocation], int]:
-        """Global retrieval with expert filtering and metrics aggregation for reports"""
+        """Global retrieval with expert filtering and metrics aggregation for reports.
+        With ``fields`` only the selected columns, relationships and metrics are loaded."""
         from sqlalchemy import func, desc, asc, and_, cast, Numeric, Float
         from sqlalchemy.orm import selectinload, joinedload
         from app.models.training_attendance import TrainingAttendance
@@ -167,12 +170,17 @@ class TrainingCandidateAllocationRepository(BaseRepository[TrainingCandidateAllo
             desc(PlacementMapping.mapped_at)
         ).limit(1).correlate(self.model).scalar_subquery()
 
-        # 2. Build main query
+        # 2. Build main query (the metric subqueries run per row, so only the selected ones)
+        metrics = {
+            "attendance_percentage": attendance_percentage,
+            "placed_company": placed_company,
+            "placed_date": placed_date,
+        }
+        if fields is not None:
+            metrics = {name: metric for name, metric in metrics.items() if name in fields}
         query = select(
-            self.model, 
-            attendance_percentage.label("attendance_percentage"),
-            placed_company.label("placed_company"),
-            placed_date.label("placed_date")
+            self.model,
+            *(metric.label(name) for name, metric in metrics.items())
         ).join(Candidate).where(self.model.is_deleted == False)
 
         count_query = select(func.count(self.model.id)).where(self.model.is_deleted == False)
@@ -253,10 +261,18 @@ class TrainingCandidateAllocationRepository(BaseRepository[TrainingCandidateAllo
             query = query.order_by(asc(sort_attr))
 
         # Pagination and Eager Loading
-        query = query.offset(skip).limit(limit).options(
-            selectinload(self.model.candidate).selectinload(Candidate.documents),
-            joinedload(self.model.batch)
-        )
+        query = query.offset(skip).limit(limit)
+        if fields is None:
+            query = query.options(
+                selectinload(self.model.candidate).selectinload(Candidate.documents),
+                joinedload(self.model.batch)
+            )
+        else:
+            query = query.options(*fields.load_options(self.model))
+            if "candidate" in fields:
+                query = query.options(selectinload(self.model.candidate).selectinload(Candidate.documents))
+            if "batch" in fields:
+                query = query.options(joinedload(self.model.batch))
 
         # Execute
         count_result = await self.db.execute(count_query)
@@ -269,9 +285,8 @@ class TrainingCandidateAllocationRepository(BaseRepository[TrainingCandidateAllo
         for row in rows:
             item = row[0]
             # Attach metrics to the model instance for pydantic serialization
-            item.attendance_percentage = row[1]
-            item.placed_company = row[2]
-            item.placed_date = row[3]
+            for name, value in zip(metrics, row[1:]):
+                setattr(item, name, value)
             items.append(item)
         
         return items, total
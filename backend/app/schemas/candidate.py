@@ -191,8 +191,8 @@ class CandidateMini(BaseModel):
         return super().model_validate(obj, *args, **kwargs)
 
 
-class CandidateListResponse(BaseModel):
-    """Simplified response for list endpoints"""
+class CandidateListFields(BaseModel):
+    """Fields of a candidate list row, shared by the ORM and flat list schemas"""
     id: int
     public_id: UUID
     name: str
@@ -249,6 +249,10 @@ class CandidateListResponse(BaseModel):
     year_of_passing: Optional[int] = None
     registration_type: Optional[str] = None
     other: Optional[dict] = None
+
+
+class CandidateListResponse(CandidateListFields):
+    """Simplified response for list endpoints"""
     
     @model_validator(mode='before')
     @classmethod
@@ -563,6 +567,30 @@ class CandidateListResponse(BaseModel):
         from_attributes = True
 
 
+class CandidateListItem(CandidateListFields):
+    """
+    Row of the candidate list views, as produced by CandidateRepository's
+    flat projection: every field is already a column of the row, so this
+    only validates. Same JSON shape as CandidateListResponse.
+    """
+
+
+# Named field sets for ?view= on the candidate list endpoints, one per table
+_CANDIDATE_TABLE_FIELDS = [
+    "name", "gender", "phone", "email", "city", "state", "created_at",
+    "is_disabled", "disability_type", "education_level",
+]
+CANDIDATE_LIST_VIEWS = {
+    "compact": _CANDIDATE_TABLE_FIELDS,
+    "screening": _CANDIDATE_TABLE_FIELDS + [
+        "screening_status", "screening_updated_at", "screened_by_name", "assigned_to_id", "assigned_to_name",
+    ],
+    "counseling": _CANDIDATE_TABLE_FIELDS + [
+        "screening_status", "counseling_status", "counseling_date", "counselor_name", "assigned_to",
+    ],
+}
+
+
 class CandidateStats(BaseModel):
     total: int
     male: int
@@ -597,7 +625,7 @@ class ScreeningStats(BaseModel):
 
 class CandidatePaginatedResponse(BaseModel):
     """Paginated response for candidate listing"""
-    items: List[CandidateListResponse]
+    items: List[CandidateListItem]
     total: int
 
 
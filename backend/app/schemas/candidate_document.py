@@ -38,6 +38,7 @@ class CandidateDocumentResponse(CandidateDocumentBase):
     """Schema for document response"""
     id: int
     candidate_id: int
+    content_sha256: Optional[str] = None
     created_at: datetime
     updated_at: datetime
     
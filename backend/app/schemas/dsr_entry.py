@@ -169,6 +169,17 @@ class DSREntryListResponse(BaseModel):
     limit: int
 
 
+# Named field sets for ?view= on the DSR entry lists
+DSR_ENTRY_LIST_VIEWS = {
+    # History / review tables: one row per day, no line items
+    "compact": [
+        "user_id", "user.full_name", "user.username", "report_date", "status",
+        "submitted_at", "is_leave", "leave_type", "reviewed_at",
+    ],
+    "calendar": ["report_date", "status", "is_leave", "leave_type"],
+}
+
+
 class DSRMissingUserResponse(BaseModel):
     """Info about a user who hasn't submitted DSR for a given date"""
     user_id: int
@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict
+
+from app.models.job import JobStatus
+
+
+class JobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    public_id: UUID
+    name: str
+    queue: str
+    status: JobStatus
+    progress: int
+    progress_message: Optional[str] = None
+    attempts: int
+    max_attempts: int
+    result: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+
+class ScheduledRunResponse(BaseModel):
+    scheduled_for: datetime
+    job_id: Optional[UUID] = None
+    status: Optional[JobStatus] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    duration_seconds: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    last_error: Optional[str] = None
+
+
+class ScheduleResponse(BaseModel):
+    name: str
+    cron: str
+    timezone: str
+    next_run_at: datetime
+    recent_runs: List[ScheduledRunResponse]
@@ -88,6 +88,16 @@ class PlacementMapping(PlacementMappingInDBBase):
         return super().model_validate(obj, *args, **kwargs)
 
 
+# Named field sets for ?view= on the mapping list endpoints
+PLACEMENT_MAPPING_LIST_VIEWS = {
+    "compact": [
+        "candidate_id", "job_role_id", "status", "match_score", "priority", "source", "mapped_at",
+        "candidate.public_id", "candidate.name", "candidate.phone", "candidate.email", "candidate.city",
+        "job_role.public_id", "job_role.title", "job_role.company",
+    ],
+}
+
+
 # Matching Engine Schemas
 class MatchMatchInfo(BaseModel):
     is_match: bool
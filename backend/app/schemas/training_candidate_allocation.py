@@ -73,6 +73,20 @@ class TrainingCandidateAllocationResponse(TrainingCandidateAllocationBase):
         from_attributes = True
 
 
+# Named field sets for ?view= on the allocation list endpoint
+ALLOCATION_LIST_VIEWS = {
+    "compact": [
+        "status", "is_dropout", "created_at",
+        "candidate.name", "candidate.email", "candidate.phone", "candidate.gender",
+        "batch.batch_name", "batch.status", "batch.start_date", "batch.approx_close_date",
+    ],
+    "report": [
+        "status", "is_dropout", "dropout_remark", "created_at", "candidate", "batch",
+        "attendance_percentage", "placed_company", "placed_date",
+    ],
+}
+
+
 class TrainingCandidateAllocationPaginatedResponse(BaseModel):
     """Paginated response for candidate allocations"""
     items: List[TrainingCandidateAllocationResponse]
@@ -0,0 +1,221 @@
+"""Buffered, batched writer for activity (audit) logs
+
+Request handlers hand finished log rows to ``activity_log_pipeline.submit``.
+While the pipeline is running (started from the application lifespan) rows go
+into a bounded in-process queue and a background task writes them with one
+multi-row INSERT every ``AUDIT_FLUSH_INTERVAL_MS`` or ``AUDIT_BATCH_SIZE`` rows,
+whichever comes first, in its own session. If the database write fails, or the
+queue is full, rows are appended to a local JSON-lines spool file which is
+replayed on the next start-up.
+
+When the pipeline is not running (tests, scripts, one-off tools) rows are
+written synchronously through the caller's session, as before.
+"""
+
+import asyncio
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, List, Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import (
+    AUDIT_BATCH_SIZE,
+    AUDIT_EVENTS_TOTAL,
+    AUDIT_FLUSH_DURATION,
+    AUDIT_QUEUE_DEPTH,
+)
+
+
+_DATETIME_FIELDS = ("created_at", "updated_at")
+# Columns a queued row sets for the bulk insert that create_log fills itself
+_BULK_ONLY_FIELDS = _DATETIME_FIELDS + ("is_deleted",)
+
+# Queued by stop(): the writer flushes the batch in hand and returns
+_STOP = object()
+
+
+def _encode(row: dict) -> str:
+    return json.dumps(row, default=lambda v: v.isoformat() if isinstance(v, datetime) else str(v))
+
+
+def _decode(line: str) -> dict:
+    row = json.loads(line)
+    for key in _DATETIME_FIELDS:
+        if isinstance(row.get(key), str):
+            row[key] = datetime.fromisoformat(row[key])
+    return row
+
+
+class ActivityLogPipeline:
+    """Bounded queue drained by a background multi-row INSERT writer"""
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        spool_path: str,
+    ) -> None:
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spool_path = Path(spool_path)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Replay any spooled rows, then start the background writer"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        await self.replay_spool()
+        self._task = asyncio.create_task(self._run(), name="activity-log-writer")
+        logger.info(
+            f"Activity log pipeline started (batch={self.batch_size}, "
+            f"interval={self.flush_interval * 1000:.0f}ms, queue={self.max_size})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the writer after flushing everything still queued"""
+        if not self.running:
+            return
+        # Cancelling would lose the batch the writer holds; let it finish instead
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        await self._flush(self._drain_nowait())
+        AUDIT_QUEUE_DEPTH.set(0)
+        logger.info("Activity log pipeline stopped")
+
+    async def submit(self, db: AsyncSession, row: dict) -> None:
+        """
+        Queue a log row for the background writer, or write it through the
+        caller's session when the pipeline is not running.
+        """
+        if not self.running:
+            from app.repositories.activity_log_repository import ActivityLogRepository
+
+            await ActivityLogRepository(db).create_log(**{
+                key: value for key, value in row.items() if key not in _BULK_ONLY_FIELDS
+            })
+            return
+
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            # Backpressure: never block the request on audit logging
+            AUDIT_EVENTS_TOTAL.labels(outcome="overflow").inc()
+            self._spool([row])
+            return
+        AUDIT_EVENTS_TOTAL.labels(outcome="enqueued").inc()
+        AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is _STOP:
+                return
+            batch = [row]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is _STOP:
+                    stopping = True
+                    break
+                batch.append(row)
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+            await self._flush(batch)
+
+    def _drain_nowait(self) -> List[dict]:
+        rows = []
+        while self._queue is not None and not self._queue.empty():
+            rows.append(self._queue.get_nowait())
+        return rows
+
+    async def _flush(self, rows: List[dict]) -> None:
+        if not rows:
+            return
+        start = time.perf_counter()
+        try:
+            await self._write(rows)
+        except asyncio.CancelledError:
+            # Cancelled mid-write (e.g. a hard shutdown): keep the rows for replay
+            self._spool(rows)
+            raise
+        except Exception as e:
+            logger.error(f"Activity log flush failed, spooling {len(rows)} rows: {str(e)}")
+            self._spool(rows)
+            return
+        finally:
+            AUDIT_FLUSH_DURATION.observe(time.perf_counter() - start)
+        AUDIT_BATCH_SIZE.observe(len(rows))
+        AUDIT_EVENTS_TOTAL.labels(outcome="written").inc(len(rows))
+
+    async def _write(self, rows: List[dict]) -> None:
+        from app.core.database import AsyncSessionLocal
+        from app.repositories.activity_log_repository import ActivityLogRepository
+
+        async with AsyncSessionLocal() as db:
+            for offset in range(0, len(rows), self.batch_size):
+                await ActivityLogRepository(db).insert_many(rows[offset:offset + self.batch_size])
+            await db.commit()
+
+    def _spool(self, rows: List[dict]) -> None:
+        try:
+            self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spool_path, "a", encoding="utf-8") as spool:
+                spool.write("".join(_encode(row) + "\n" for row in rows))
+            AUDIT_EVENTS_TOTAL.labels(outcome="spooled").inc(len(rows))
+        except OSError as e:
+            AUDIT_EVENTS_TOTAL.labels(outcome="dropped").inc(len(rows))
+            logger.error(f"Activity log spool write failed, {len(rows)} rows lost: {str(e)}")
+
+    async def replay_spool(self) -> int:
+        """Write rows left in the spool file by an earlier failure"""
+        if not self.spool_path.exists():
+            return 0
+        replaying = self.spool_path.with_suffix(f".replay-{os.getpid()}")
+        try:
+            # Rename first so concurrent workers don't replay the same rows
+            os.replace(self.spool_path, replaying)
+        except FileNotFoundError:
+            return 0
+
+        with open(replaying, encoding="utf-8") as spool:
+            rows = [_decode(line) for line in spool if line.strip()]
+        try:
+            await self._write(rows)
+        except Exception as e:
+            logger.error(f"Activity log spool replay failed, keeping {len(rows)} rows: {str(e)}")
+            self._spool(rows)
+            replaying.unlink(missing_ok=True)
+            return 0
+        replaying.unlink(missing_ok=True)
+        AUDIT_EVENTS_TOTAL.labels(outcome="replayed").inc(len(rows))
+        logger.info(f"Replayed {len(rows)} spooled activity log rows")
+        return len(rows)
+
+
+activity_log_pipeline = ActivityLogPipeline(
+    max_size=settings.AUDIT_QUEUE_MAX_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_MS / 1000,
+    spool_path=settings.AUDIT_SPOOL_FILE,
+)
@@ -43,13 +43,15 @@ class CandidateDocumentService:
                 if doc_type_matches and doc_source_matches and doc.is_active:
                     await self.repository.update(doc.id, {"is_active": False})
 
-        # Save file to storage
+        # Save file to storage; the lock on the stored object lasts until this
+        # document is committed, so a concurrent delete sees it as a reference
         file_info = await FileStorageService.save_file(
             file=file,
             candidate_public_id=str(candidate.public_id),
             document_type=document_type,
             candidate_name=candidate.name,
-            candidate_id=candidate.id
+            candidate_id=candidate.id,
+            before_store=self.repository.lock_file
         )
         
         # Create document record
@@ -60,6 +62,7 @@ class CandidateDocumentService:
             "file_path": file_info["file_path"],
             "file_size": file_info["file_size"],
             "mime_type": file_info["mime_type"],
+            "content_sha256": file_info["content_sha256"],
             "description": description,
             "document_source": document_source,
             "is_active": True, # New upload is active by default
@@ -131,10 +134,16 @@ class CandidateDocumentService:
         """Delete a document and its file (marks it inactive in DB)"""
         document = await self.get_document(document_id)
         
-        # Delete file from storage
-        FileStorageService.delete_file(document.file_path)
+        # Until commit, no upload can reuse the stored object we may remove
+        await self.repository.lock_file(document.file_path)
+        shared = await self.repository.count_file_references(document.file_path, exclude_id=document.id)
         
         # Mark as inactive in DB and soft delete
         await self.repository.update(document.id, {"is_active": False})
-        return await self.repository.delete(document.id)
+        deleted = await self.repository.delete(document.id)
+        
+        # Delete file from storage unless another document shares the stored object
+        if not shared:
+            FileStorageService.delete_file(document.file_path)
+        return deleted
 
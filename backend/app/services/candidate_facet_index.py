@@ -0,0 +1,149 @@
+"""In-memory facet index behind /candidates/filter-options
+
+The filter panel needs the distinct values of every filterable candidate
+field. ``CandidateRepository.get_facets`` computes them, with candidate counts,
+in one aggregate statement. Each worker keeps the last result and answers the
+panel from memory, with the JSON body rendered once and a strong ETag so a
+browser revalidating an unchanged index gets a 304.
+
+A snapshot is rebuilt on the next read after:
+
+* a session in this worker commits an insert, update or delete of a
+  candidate, screening or counseling, whether flushed through the ORM or sent
+  as a bulk statement;
+* CANDIDATE_FACETS_TTL_SECONDS, which bounds how long writes made by other
+  workers (or raw SQL) take to show up.
+
+Readers that find the snapshot stale wait for a single rebuild rather than
+each running the aggregate.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from email.utils import formatdate
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.core.metrics import CANDIDATE_FACETS_BUILD_DURATION
+from app.core.serialization import dumps
+from app.models.candidate import Candidate
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.candidate_screening import CandidateScreening
+from app.repositories.candidate_repository import CandidateRepository, filter_options
+from app.utils.file_delivery import is_not_modified
+
+
+# Writes to these change what the filter panel offers
+_FACET_MODELS = (Candidate, CandidateScreening, CandidateCounseling)
+
+_CHANGED_KEY = "candidate_facets_changed"
+
+
+def facet_payload(facets: Dict[str, List[Tuple[str, int]]]) -> Dict[str, List[dict]]:
+    """Facet counts as JSON: ``{facet: [{"value": ..., "count": ...}, ...]}``, most common first"""
+    return {name: [{"value": value, "count": count} for value, count in counts] for name, counts in facets.items()}
+
+
+@dataclass(frozen=True)
+class FacetSnapshot:
+    """One build of the index: the facet counts and the rendered filter options"""
+
+    facets: Dict[str, List[Tuple[str, int]]]
+    body: bytes
+    etag: str
+    built_at: float
+
+    @classmethod
+    def build(cls, facets: Dict[str, List[Tuple[str, int]]]) -> "FacetSnapshot":
+        body = dumps(filter_options(facets))
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        return cls(facets=facets, body=body, etag=etag, built_at=time.time())
+
+    def response(self, request: Request) -> Response:
+        """The filter options with validators; 304 when the client's copy is current"""
+        headers = {
+            "etag": self.etag,
+            "last-modified": formatdate(self.built_at, usegmt=True),
+            # Behind authentication: browsers may keep it but must revalidate
+            "cache-control": "private, no-cache",
+        }
+        if is_not_modified(request, self.etag, self.built_at):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, media_type="application/json", headers=headers)
+
+
+class CandidateFacetIndex:
+    """The current snapshot, and when it has to be rebuilt"""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[FacetSnapshot] = None
+        self._expires_at = 0.0
+        # Bumped by every committed write; a snapshot is current while it
+        # was built at the latest version
+        self._version = 0
+        self._built_version = -1
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self._version += 1
+
+    def _current(self) -> Optional[FacetSnapshot]:
+        if self._built_version == self._version and time.monotonic() < self._expires_at:
+            return self._snapshot
+        return None
+
+    async def get(self, db: AsyncSession) -> FacetSnapshot:
+        snapshot = self._current()
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self._current()
+            if snapshot is not None:
+                return snapshot
+            # Writes committed while the aggregate runs leave the result stale
+            version = self._version
+            with CANDIDATE_FACETS_BUILD_DURATION.time():
+                snapshot = FacetSnapshot.build(await CandidateRepository(db).get_facets())
+            self._snapshot = snapshot
+            self._built_version = version
+            self._expires_at = time.monotonic() + self.ttl_seconds
+            return snapshot
+
+
+candidate_facets = CandidateFacetIndex(settings.CANDIDATE_FACETS_TTL_SECONDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flushed_changes(session: Session, flush_context) -> None:
+    # new/dirty/deleted still hold the pre-flush state here
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, _FACET_MODELS):
+            session.info[_CHANGED_KEY] = True
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_bulk_changes(state: ORMExecuteState) -> None:
+    if state.is_insert or state.is_update or state.is_delete:
+        mapper = state.bind_mapper
+        if mapper is not None and issubclass(mapper.class_, _FACET_MODELS):
+            state.session.info[_CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session: Session) -> None:
+    if session.info.pop(_CHANGED_KEY, False):
+        candidate_facets.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_CHANGED_KEY, None)
@@ -6,8 +6,6 @@ from typing import List, Optional, Any
 from uuid import UUID
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from openpyxl import Workbook
-from openpyxl.styles import Font
 
 from app.models.candidate import Candidate
 from app.models.user import User, UserRole
@@ -15,8 +13,10 @@ from app.models.candidate_assignment import CandidateAssignment
 from app.schemas.candidate import CandidateCreate, CandidateUpdate
 from app.schemas.candidate_assignment import CandidateAssignmentCreate
 from app.repositories.candidate_repository import CandidateRepository
+from app.services.candidate_facet_index import FacetSnapshot, candidate_facets, facet_payload
 from app.services.pincode_service import get_pincode_details
 from app.utils.email import send_email, send_export_email
+from app.utils.fieldsets import FieldSelection
 
 
 class CandidateService:
@@ -139,9 +139,13 @@ class CandidateService:
         registration_type: Optional[str] = None,
         current_user: Optional[User] = None,
         is_global: bool = False,
-        status_of_beneficiary: Optional[list] = None
+        status_of_beneficiary: Optional[list] = None,
+        flat: bool = True,
+        fields: Optional[FieldSelection] = None
     ) -> dict:
-        """Get list of candidates with total count, supporting optional search, filters, and sorting"""
+        """Get list of candidates with total count, supporting optional search, filters, and sorting.
+        Items are flat CandidateListItem rows unless ``flat`` is False (ORM objects, as the export needs);
+        ``fields`` limits them to a sparse fieldset."""
         
         # Determine assigned_to_id based on user role
         assigned_to_id = None
@@ -169,7 +173,9 @@ class CandidateService:
             assigned_to_id=assigned_to_id,
             extra_filters=extra_filters,
             registration_type=registration_type,
-            status_of_beneficiary=status_of_beneficiary
+            status_of_beneficiary=status_of_beneficiary,
+            flat=flat,
+            fields=fields
         )
         return {"items": items, "total": total}
 
@@ -236,7 +242,8 @@ class CandidateService:
         is_experienced: Optional[bool] = None,
         counseling_status: Optional[str] = None,
         current_user: Optional[User] = None,
-        is_global: bool = False
+        is_global: bool = False,
+        fields: Optional[FieldSelection] = None
     ) -> dict:
         """Get list of candidates without screening records with total count, supporting optional search, filters and sorting"""
         
@@ -256,7 +263,9 @@ class CandidateService:
             screening_status=screening_status,
             is_experienced=is_experienced,
             counseling_status=counseling_status,
-            assigned_to_id=assigned_to_id
+            assigned_to_id=assigned_to_id,
+            flat=True,
+            fields=fields
         )
         return {"items": items, "total": total}
 
@@ -276,7 +285,8 @@ class CandidateService:
         screening_status: Optional[str] = None,
         is_experienced: Optional[bool] = None,
         current_user: Optional[User] = None,
-        is_global: bool = False
+        is_global: bool = False,
+        fields: Optional[FieldSelection] = None
     ) -> dict:
         """Get list of candidates with screening records with total count, supporting optional search, filters, document status filter, and sorting"""
         
@@ -297,13 +307,28 @@ class CandidateService:
             cities=cities,
             screening_status=screening_status,
             is_experienced=is_experienced,
-            assigned_to_id=assigned_to_id
+            assigned_to_id=assigned_to_id,
+            flat=True,
+            fields=fields
         )
         return {"items": items, "total": total}
 
-    async def get_filter_options(self) -> dict:
-        """Get all unique values for filterable fields"""
-        return await self.repository.get_filter_options()
+    async def get_filter_options(self) -> FacetSnapshot:
+        """Unique values for filterable fields, from the in-memory facet index"""
+        return await candidate_facets.get(self.db)
+
+    async def get_facets(
+        self,
+        current_user: Optional[User] = None,
+        is_global: bool = False,
+        **filters
+    ) -> dict:
+        """Candidate counts per facet value within the current list filters (same filters as ``get_candidates``)"""
+        assigned_to_id = None
+        if current_user and current_user.role == UserRole.SOURCING and not is_global:
+            assigned_to_id = current_user.id
+        facets = await self.repository.get_filter_facets(assigned_to_id=assigned_to_id, **filters)
+        return facet_payload(facets)
 
     async def assign_candidate(
         self, 
@@ -407,7 +432,8 @@ class CandidateService:
             current_user=current_user,
             is_global=is_global,
             status_of_beneficiary=status_of_beneficiary,
-            registration_type=registration_type
+            registration_type=registration_type,
+            flat=False
         )
         candidates = res["items"]
         
@@ -436,6 +462,9 @@ class CandidateService:
             ]
 
         # 3. Generate Excel
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Candidates Report"
@@ -0,0 +1,92 @@
+"""Nightly rollup of per-day activity counters into daily_stats"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.candidate import Candidate
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.candidate_screening import CandidateScreening
+from app.models.dsr_entry import DSREntry, DSRStatus
+from app.models.placement_mapping import PlacementMapping
+from app.models.placement_offer import PlacementOffer
+from app.models.training_candidate_allocation import TrainingCandidateAllocation
+from app.repositories.daily_stat_repository import DailyStatRepository
+from app.repositories.training_batch_repository import TrainingBatchRepository
+
+
+# Metric name -> model whose rows created that day are counted
+CREATED_COUNTS = {
+    "candidates_registered": Candidate,
+    "screenings_created": CandidateScreening,
+    "counselings_created": CandidateCounseling,
+    "training_allocations_created": TrainingCandidateAllocation,
+    "placement_mappings_created": PlacementMapping,
+    "placement_offers_created": PlacementOffer,
+}
+
+
+# Point-in-time dashboard figures stored as "<prefix><key>" metrics. They can
+# only be taken for the day that just ended, so backfills leave them alone.
+SNAPSHOTS = {
+    "training_": TrainingBatchRepository,
+}
+
+
+def day_bounds(day: date) -> tuple[datetime, datetime]:
+    """Start and end of ``day`` in SCHEDULER_TIMEZONE, as aware datetimes"""
+    start = datetime.combine(day, time.min, tzinfo=ZoneInfo(settings.SCHEDULER_TIMEZONE))
+    return start, start + timedelta(days=1)
+
+
+class DailyStatsService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = DailyStatRepository(db)
+
+    async def rollup(self, day: date) -> Dict[str, int]:
+        """
+        Count ``day``'s activity in one query and store it; safe to re-run.
+        Rolling up yesterday also records the SNAPSHOTS dashboard figures.
+        """
+        start, end = day_bounds(day)
+        columns = [
+            select(func.count())
+            .select_from(model)
+            .where(model.created_at >= start, model.created_at < end, model.is_deleted == False)
+            .scalar_subquery()
+            .label(metric)
+            for metric, model in CREATED_COUNTS.items()
+        ]
+        columns.append(
+            select(func.count())
+            .select_from(DSREntry)
+            .where(
+                DSREntry.report_date == day,
+                DSREntry.status.in_([DSRStatus.SUBMITTED, DSRStatus.APPROVED]),
+                DSREntry.is_deleted == False,
+            )
+            .scalar_subquery()
+            .label("dsr_submitted")
+        )
+        row = (await self.db.execute(select(*columns))).one()
+        values = {metric: int(value or 0) for metric, value in row._mapping.items()}
+        if day == datetime.now(ZoneInfo(settings.SCHEDULER_TIMEZONE)).date() - timedelta(days=1):
+            for prefix, repository in SNAPSHOTS.items():
+                stats = await repository(self.db).get_stats()
+                values.update({f"{prefix}{key}": int(value) for key, value in stats.items()})
+        await self.repo.upsert_day(day, values)
+        return values
+
+    async def get_stats(
+        self, start: date, end: date, metrics: Optional[List[str]] = None
+    ) -> Dict[str, List[dict]]:
+        """Series per metric: {metric: [{"day": ..., "value": ...}, ...]}"""
+        series: Dict[str, List[dict]] = {}
+        for stat in await self.repo.get_range(start, end, metrics):
+            series.setdefault(stat.metric, []).append({"day": stat.day, "value": stat.value})
+        return series
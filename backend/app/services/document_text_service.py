@@ -0,0 +1,125 @@
+"""Document text extraction service
+
+PDF/DOCX parsing is CPU-bound (PyPDF2 is pure Python), so it runs in a
+process pool instead of on the event loop, with a page limit and a per-document
+timeout. Results are cached in ``document_texts`` keyed by the sha256 of the
+file bytes, which is also the key of the content-addressed file store, so a
+stored document's text can be found without reading the file at all.
+"""
+
+import asyncio
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.models.candidate_document import CandidateDocument
+from app.repositories.document_text_repository import DocumentTextRepository
+from app.utils.document_text import extract_text
+
+
+# Bump when extraction output changes so cached rows are re-extracted
+EXTRACTOR_VERSION = 1
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.DOCUMENT_EXTRACTION_WORKERS)
+    return _pool
+
+
+def _discard_pool() -> None:
+    """Throw away a pool whose worker is stuck on a pathological document"""
+    global _pool
+    pool, _pool = _pool, None
+    if pool is None:
+        return
+    # ProcessPoolExecutor cannot cancel a running task; stop its workers instead
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pool() -> None:
+    """Release the worker processes (application shutdown)"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class DocumentTextService:
+    """Extracts and caches the text of uploaded documents"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repository = DocumentTextRepository(db)
+
+    async def extract_bytes(self, data: bytes) -> str:
+        """Text of a document given its bytes (e.g. a fresh upload)"""
+        content_sha256 = await run_in_threadpool(lambda: hashlib.sha256(data).hexdigest())
+        cached = await self.repository.get_by_hash(content_sha256, EXTRACTOR_VERSION)
+        if cached:
+            return cached.text
+        return await self._extract_and_store(content_sha256, data)
+
+    async def extract_document(self, document: CandidateDocument) -> str:
+        """Text of a stored candidate document, parsed at most once per distinct file"""
+        if document.content_sha256:
+            cached = await self.repository.get_by_hash(document.content_sha256, EXTRACTOR_VERSION)
+            if cached:
+                return cached.text
+
+        if not Path(document.file_path).is_file():
+            raise ValueError(f"File for document {document.id} is missing from storage.")
+        data = await run_in_threadpool(_read_file, document.file_path)
+
+        if not document.content_sha256:
+            # Documents uploaded before content hashing: backfill the hash
+            document.content_sha256 = await run_in_threadpool(lambda: hashlib.sha256(data).hexdigest())
+        return await self._extract_and_store(document.content_sha256, data)
+
+    async def _extract_and_store(self, content_sha256: str, data: bytes) -> str:
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            _get_pool(), extract_text, data, settings.DOCUMENT_EXTRACTION_MAX_PAGES
+        )
+        try:
+            result = await asyncio.wait_for(future, settings.DOCUMENT_EXTRACTION_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            _discard_pool()
+            logger.warning(f"Text extraction timed out for document {content_sha256[:12]}")
+            raise ValueError("Document took too long to read; try a smaller or simpler file.")
+        except BrokenProcessPool:
+            _discard_pool()
+            raise ValueError("Document could not be read.")
+
+        if result["truncated"]:
+            logger.info(
+                f"Text extraction stopped at {settings.DOCUMENT_EXTRACTION_MAX_PAGES} of "
+                f"{result['page_count']} pages for document {content_sha256[:12]}"
+            )
+
+        await self.repository.upsert({
+            "content_sha256": content_sha256,
+            "kind": result["kind"],
+            "text": result["text"],
+            "page_count": result["page_count"],
+            "truncated": result["truncated"],
+            "extractor_version": EXTRACTOR_VERSION,
+        })
+        return result["text"]
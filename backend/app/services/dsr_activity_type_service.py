@@ -4,7 +4,6 @@ from typing import List, Optional, Tuple, Dict
 from uuid import UUID
 from fastapi import HTTPException, status, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
-import openpyxl
 from io import BytesIO
 
 from app.models.dsr_activity_type import DSRActivityType
@@ -137,6 +136,8 @@ class DSRActivityTypeService:
             rows = list(reader)
         elif filename.endswith(('.xlsx', '.xls')):
             try:
+                import openpyxl
+
                 wb = openpyxl.load_workbook(BytesIO(content), data_only=True)
                 sheet = wb.active
                 
@@ -1,23 +1,37 @@
-"""DSR Notification Service — reminder stub, ready to wire to email/Celery"""
+"""DSR Notification Service — submission reminders as in-app notifications and email"""
 
 import logging
 from datetime import date
 from typing import List
+from sqlalchemy import select, and_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.models.company_holiday import CompanyHoliday
+from app.models.dsr_entry import DSREntry, DSRStatus
+from app.models.dsr_leave_application import DSRLeaveApplication, DSRLeaveStatus
+from app.models.user import User
+from app.services.email_outbox_service import enqueue_email
+from app.services.notification_service import NotificationService
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_REMINDER_MESSAGE = "Please submit your Daily Status Report."
+
 
 class DSRNotificationService:
     """
     Handles DSR reminder notifications.
 
-    Currently logs reminder events. To integrate real email/push notifications,
-    replace _dispatch_reminder() with your email/Celery task call.
+    Each reminder is an in-app notification (pushed to open streams) plus an
+    email queued in the outbox, both in the caller's transaction. Users are
+    handled DSR_REMINDER_BATCH_SIZE at a time, with one notification INSERT
+    per batch.
     """
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.notifications = NotificationService(db)
 
     async def send_dsr_reminder(
         self,
@@ -31,45 +45,123 @@ class DSRNotificationService:
         Returns a summary dict with sent count and any failures.
         """
         results = {"sent": 0, "failed": 0, "details": []}
+        batch_size = max(settings.DSR_REMINDER_BATCH_SIZE, 1)
+        text = message or DEFAULT_REMINDER_MESSAGE
 
-        for user_id in user_ids:
-            try:
-                await self._dispatch_reminder(user_id, report_date, message)
-                results["sent"] += 1
-                results["details"].append({"user_id": user_id, "status": "sent"})
-                logger.info(
-                    "DSR reminder dispatched: user_id=%s, report_date=%s",
-                    user_id,
-                    report_date,
-                )
-            except Exception as exc:  # pragma: no cover
-                results["failed"] += 1
-                results["details"].append({"user_id": user_id, "status": "failed", "error": str(exc)})
-                logger.error(
-                    "DSR reminder failed: user_id=%s, error=%s",
-                    user_id,
-                    exc,
+        for start in range(0, len(user_ids), batch_size):
+            batch = user_ids[start:start + batch_size]
+            result = await self.db.execute(
+                select(User).where(
+                    User.id.in_(batch),
+                    User.is_active == True,
+                    User.is_deleted == False,
                 )
+            )
+            users = {u.id: u for u in result.scalars().all()}
+
+            found = [users[user_id] for user_id in batch if user_id in users]
+            for user_id in batch:
+                if user_id not in users:
+                    results["failed"] += 1
+                    results["details"].append({"user_id": user_id, "status": "failed", "error": "User not found or inactive"})
+            if not found:
+                continue
+
+            # One INSERT for the whole batch's in-app notifications
+            await self.notifications.notify_dsr_reminder([user.id for user in found], str(report_date), text)
+
+            for user in found:
+                try:
+                    await self._email_reminder(user, report_date, text)
+                    results["sent"] += 1
+                    results["details"].append({"user_id": user.id, "status": "sent"})
+                except Exception as exc:
+                    results["failed"] += 1
+                    results["details"].append({"user_id": user.id, "status": "failed", "error": str(exc)})
+                    logger.error(
+                        "DSR reminder failed: user_id=%s, error=%s",
+                        user.id,
+                        exc,
+                    )
+            await self.db.flush()
 
+        logger.info(
+            "DSR reminders for %s: %s sent, %s failed",
+            report_date,
+            results["sent"],
+            results["failed"],
+        )
         return results
 
-    async def _dispatch_reminder(
+    async def remind_missing_users(self, report_date: date, message: str | None = None) -> dict:
+        """
+        Scheduled reminder: every active user without a submitted DSR for
+        ``report_date``, leaving out users on approved leave. Nothing is sent
+        on company holidays.
+        """
+        holiday = await self.db.execute(
+            select(CompanyHoliday.holiday_name).where(
+                CompanyHoliday.holiday_date == report_date,
+                CompanyHoliday.is_deleted == False,
+            )
+        )
+        holiday_name = holiday.scalars().first()
+        if holiday_name:
+            logger.info("Skipping DSR reminders for %s: %s", report_date, holiday_name)
+            return {"sent": 0, "failed": 0, "skipped": f"Company holiday: {holiday_name}"}
+
+        submitted = exists().where(
+            DSREntry.user_id == User.id,
+            DSREntry.report_date == report_date,
+            DSREntry.status.in_([DSRStatus.SUBMITTED, DSRStatus.APPROVED]),
+            DSREntry.is_deleted == False,
+        )
+        on_leave = exists().where(
+            DSRLeaveApplication.user_id == User.id,
+            DSRLeaveApplication.status == DSRLeaveStatus.APPROVED,
+            DSRLeaveApplication.is_deleted == False,
+            and_(
+                DSRLeaveApplication.start_date <= report_date,
+                DSRLeaveApplication.end_date >= report_date,
+            ),
+        )
+        result = await self.db.execute(
+            select(User.id).where(
+                User.is_active == True,
+                User.is_deleted == False,
+                ~submitted,
+                ~on_leave,
+            ).order_by(User.id)
+        )
+        user_ids = list(result.scalars().all())
+        if not user_ids:
+            return {"sent": 0, "failed": 0}
+
+        summary = await self.send_dsr_reminder(user_ids, report_date, message)
+        # The per-user details are only useful for the interactive endpoint
+        return {"sent": summary["sent"], "failed": summary["failed"]}
+
+    async def _email_reminder(
         self,
-        user_id: int,
+        user: User,
         report_date: date,
-        message: str | None,
+        text: str,
     ) -> None:
-        """
-        Dispatch a single reminder. 
+        """Queue the reminder email for one user (the notification is sent per batch)"""
+        from app.utils.email import jinja_env
 
-        Replace this method body to integrate:
-        - Email: await email_service.send(user_id, subject, body)
-        - Celery: send_reminder_task.delay(user_id, str(report_date))
-        - WebSocket/Push: await ws_manager.notify(user_id, payload)
-        """
-        logger.info(
-            "[STUB] Would send DSR reminder to user_id=%s for date=%s. Message: %s",
-            user_id,
-            report_date,
-            message or "Please submit your Daily Status Report.",
+        if not user.email:
+            return
+        html = jinja_env.get_template("dsr_reminder.html").render(
+            user_name=user.full_name or user.username,
+            report_date=report_date.strftime("%d %b %Y"),
+            message=text,
+            dsr_url=f"{settings.FRONTEND_URL.rstrip('/')}/dashboard/dsr" if settings.FRONTEND_URL else None,
+        )
+        await enqueue_email(
+            user.email,
+            f"Reminder: Submit your DSR for {report_date.strftime('%d %b %Y')}",
+            html_body=html,
+            category="dsr_reminder",
+            db=self.db,
         )
@@ -33,6 +33,7 @@ from app.repositories.dsr_leave_application_repository import DSRLeaveApplicatio
 from app.repositories.dsr_activity_type_repository import DSRActivityTypeRepository
 from app.services.dsr_notification_service import DSRNotificationService
 from app.services.company_holiday_service import CompanyHolidayService
+from app.utils.fieldsets import FieldSelection
 
 
 def _require_privileged_user(current_user: User) -> None:
@@ -349,11 +350,12 @@ class DSRService:
         date_to: Optional[date] = None,
         status: Optional[DSRStatus] = None,
         search: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
     ) -> Tuple[List[DSREntry], int]:
         return await self.repo.get_entries_by_user(
             current_user.id, skip=skip, limit=limit,
             date_from=date_from, date_to=date_to, status=status,
-            search=search,
+            search=search, fields=fields,
         )
 
     async def get_all_entries(
@@ -366,12 +368,13 @@ class DSRService:
         date_to: Optional[date] = None,
         status: Optional[DSRStatus] = None,
         search: Optional[str] = None,
+        fields: Optional[FieldSelection] = None,
     ) -> Tuple[List[DSREntry], int]:
         _require_privileged_user(current_user)
         return await self.repo.get_all_entries(
             skip=skip, limit=limit, user_id=user_id,
             date_from=date_from, date_to=date_to, status=status,
-            search=search,
+            search=search, fields=fields,
         )
 
     async def get_entry(self, public_id: UUID, current_user: User) -> DSREntry:
@@ -622,6 +625,7 @@ class DSRService:
         current_user: User,
         skip: int = 0,
         limit: int = 100,
+        fields: Optional[FieldSelection] = None,
     ) -> Tuple[List[DSREntry], int]:
         """Admin: list all SUBMITTED entries awaiting admin review, oldest first."""
         _require_privileged_user(current_user)
@@ -629,6 +633,7 @@ class DSRService:
             status=DSRStatus.SUBMITTED,
             skip=skip,
             limit=limit,
+            fields=fields,
         )
 
     async def get_pending_submissions(self, current_user: User) -> List[dict]:
@@ -0,0 +1,388 @@
+"""Email outbox and background delivery
+
+Senders call ``enqueue_email``, which inserts an ``email_outbox`` row and
+returns immediately. ``email_dispatcher`` (started from the application
+lifespan) claims due rows in batches with ``FOR UPDATE SKIP LOCKED``, so any
+number of app workers can dispatch side by side, and delivers them over pooled
+SMTP connections, throttled per SMTP host.
+
+Transient failures (connection problems, 4xx replies) are retried with
+exponential backoff up to EMAIL_MAX_ATTEMPTS; 5xx rejections and messages that
+can no longer be built (sender configuration removed, attachment missing) fail
+at once. A row stays in the table with its final status and last error.
+"""
+
+import asyncio
+import os
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.mime.application import MIMEApplication
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formatdate
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import aiosmtplib
+from loguru import logger
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import (
+    EMAIL_DELIVERIES_TOTAL,
+    EMAIL_DELIVERY_LATENCY,
+    EMAIL_OUTBOX_DEPTH,
+    observe_email_send,
+)
+from app.models.email_outbox import EmailOutbox, EmailTransport
+from app.models.user_email_configuration import UserEmailConfiguration
+from app.repositories.email_outbox_repository import EmailOutboxRepository
+from app.services.smtp_pool import SMTPConnectionPool, SMTPTransport, TokenBucket
+
+
+class PermanentDeliveryError(Exception):
+    """The message can never be delivered as queued; retrying will not help"""
+
+
+def system_transport() -> SMTPTransport:
+    """The application's own SMTP account, used for system notifications"""
+    port = settings.SMTP_PORT or 587
+    use_tls = settings.SMTP_TLS if settings.SMTP_TLS is not None else True
+    return SMTPTransport(
+        host=settings.SMTP_HOST or "s.mail25.info",
+        port=port,
+        username=settings.SMTP_USER or "no-reply@winvinaya.com",
+        password=settings.SMTP_PASSWORD or "Admin##2025@",
+        encryption=("ssl" if port == 465 else "tls") if use_tls else "none",
+        from_email=settings.EMAILS_FROM_EMAIL or "no-reply@winvinaya.com",
+        from_name=settings.EMAILS_FROM_NAME or "winvinaya",
+    )
+
+
+def user_transport(config: UserEmailConfiguration) -> SMTPTransport:
+    return SMTPTransport(
+        host=config.smtp_server,
+        port=config.smtp_port,
+        username=config.smtp_username,
+        password=config.smtp_password,
+        encryption=config.encryption or "none",
+        from_email=config.sender_email,
+        from_name=config.sender_name,
+    )
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next attempt after ``attempts`` failed ones (with ±20% jitter)"""
+    delay = min(
+        settings.EMAIL_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.EMAIL_RETRY_MAX_SECONDS,
+    )
+    return delay * random.uniform(0.8, 1.2)
+
+
+def is_permanent(error: BaseException) -> bool:
+    """Whether a delivery error should stop further attempts"""
+    if isinstance(error, PermanentDeliveryError):
+        return True
+    if isinstance(error, aiosmtplib.SMTPRecipientsRefused):
+        return any(refusal.code >= 500 for refusal in error.recipients)
+    if isinstance(error, aiosmtplib.SMTPAuthenticationError):
+        # Credentials may be fixed in Settings before attempts run out
+        return False
+    if isinstance(error, aiosmtplib.SMTPResponseException):
+        return 500 <= error.code < 600
+    return False
+
+
+def build_message(transport: SMTPTransport, message: EmailOutbox) -> MIMEMultipart:
+    """Render an outbox row as a MIME message (reads attachment files)"""
+    mime = MIMEMultipart("mixed")
+    body = MIMEMultipart("alternative")
+    if message.text_body:
+        body.attach(MIMEText(message.text_body, "plain"))
+    if message.html_body:
+        body.attach(MIMEText(message.html_body, "html"))
+    mime.attach(body)
+
+    domain = transport.from_email.rpartition("@")[2] or "localhost"
+    mime["From"] = transport.sender
+    mime["To"] = message.to_email
+    if message.cc:
+        mime["Cc"] = ", ".join(message.cc)
+    mime["Subject"] = message.subject
+    mime["Date"] = formatdate(localtime=True)
+    # Stable across retries so a resend after a lost reply can be de-duplicated
+    mime["Message-ID"] = f"<outbox-{message.id}.{int(message.created_at.timestamp())}@{domain}>"
+
+    for attachment in message.attachments or []:
+        try:
+            with open(attachment["path"], "rb") as f:
+                part = MIMEApplication(f.read(), Name=attachment["filename"])
+        except FileNotFoundError:
+            raise PermanentDeliveryError(f"Attachment {attachment['filename']} is no longer available")
+        part["Content-Disposition"] = f'attachment; filename="{attachment["filename"]}"'
+        mime.attach(part)
+    return mime
+
+
+def _spool_attachment(content: bytes) -> str:
+    directory = Path(settings.EMAIL_ATTACHMENT_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{uuid.uuid4().hex}.bin"
+    with open(path, "wb") as f:
+        f.write(content)
+    return str(path)
+
+
+def _remove_spooled(messages: List[EmailOutbox]) -> None:
+    for message in messages:
+        for attachment in message.attachments or []:
+            if attachment.get("spooled"):
+                try:
+                    os.remove(attachment["path"])
+                except OSError:
+                    pass
+
+
+async def enqueue_email(
+    to_email: str,
+    subject: str,
+    *,
+    html_body: Optional[str] = None,
+    text_body: Optional[str] = None,
+    cc: Optional[List[str]] = None,
+    attachments: Optional[List[Tuple[str, bytes]]] = None,
+    attachment_paths: Optional[List[Tuple[str, str]]] = None,
+    spooled_paths: Optional[List[Tuple[str, str]]] = None,
+    category: str = "system",
+    sender_config_id: Optional[int] = None,
+    db: Optional[AsyncSession] = None,
+) -> int:
+    """
+    Queue an email for background delivery and return its outbox id.
+
+    ``attachments`` are (filename, bytes) pairs written to EMAIL_ATTACHMENT_DIR;
+    ``attachment_paths`` are (filename, path) pairs for files already stored,
+    read at delivery time; ``spooled_paths`` are (filename, path) pairs for
+    files handed over to the outbox, deleted once the message is final. With
+    ``sender_config_id`` the message goes out through that user's SMTP
+    configuration, otherwise through the system account. When ``db`` is
+    given the row joins the caller's transaction; otherwise it is committed
+    in a session of its own.
+    """
+    files = [
+        {"filename": filename, "path": path, "spooled": False}
+        for filename, path in attachment_paths or []
+    ]
+    files += [
+        {"filename": filename, "path": path, "spooled": True}
+        for filename, path in spooled_paths or []
+    ]
+    for filename, content in attachments or []:
+        path = await run_in_threadpool(_spool_attachment, content)
+        files.append({"filename": filename, "path": path, "spooled": True})
+
+    values = {
+        "category": category,
+        "transport": EmailTransport.USER if sender_config_id else EmailTransport.SYSTEM,
+        "sender_config_id": sender_config_id,
+        "to_email": to_email,
+        "cc": cc or None,
+        "subject": subject,
+        "html_body": html_body,
+        "text_body": text_body,
+        "attachments": files or None,
+        "next_attempt_at": datetime.now(timezone.utc),
+    }
+    if db is not None:
+        message = await EmailOutboxRepository(db).create(values)
+    else:
+        from app.core.database import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as session:
+            message = await EmailOutboxRepository(session).create(values)
+            await session.commit()
+
+    email_dispatcher.wake()
+    return message.id
+
+
+class EmailDispatcher:
+    """Background loop that drains the outbox over pooled SMTP connections"""
+
+    def __init__(self, batch_size: int, interval: float, lease_seconds: int) -> None:
+        self.batch_size = batch_size
+        self.interval = interval
+        self.lease_seconds = lease_seconds
+        self.pool = SMTPConnectionPool(
+            max_connections=settings.SMTP_POOL_MAX_CONNECTIONS,
+            idle_seconds=settings.SMTP_POOL_IDLE_SECONDS,
+            max_messages=settings.SMTP_POOL_MAX_MESSAGES_PER_CONNECTION,
+            timeout=settings.SMTP_TIMEOUT_SECONDS,
+        )
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="email-dispatcher")
+        logger.info(
+            f"Email dispatcher started (batch={self.batch_size}, interval={self.interval}s, "
+            f"connections/account={self.pool.max_connections})"
+        )
+
+    async def stop(self) -> None:
+        """Stop dispatching; messages claimed mid-round are reclaimed after their lease"""
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.pool.close_all()
+        logger.info("Email dispatcher stopped")
+
+    def wake(self) -> None:
+        """Start the next round now instead of at the next poll"""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                claimed = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Email dispatch round failed: {str(e)}")
+                claimed = 0
+            await self.pool.close_idle()
+            if claimed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    async def dispatch_once(self) -> int:
+        """Claim one batch of due messages, deliver it and record the outcomes"""
+        from app.core.database import AsyncSessionLocal
+
+        now = datetime.now(timezone.utc)
+        async with AsyncSessionLocal() as db:
+            repository = EmailOutboxRepository(db)
+            messages = await repository.claim_due(
+                self.batch_size, now, now - timedelta(seconds=self.lease_seconds)
+            )
+            await db.commit()
+            transports = await self._transports(db, messages)
+        if not messages:
+            return 0
+
+        errors = await asyncio.gather(*(
+            self._deliver(message, transports.get(message.id)) for message in messages
+        ))
+
+        finished = []
+        async with AsyncSessionLocal() as db:
+            repository = EmailOutboxRepository(db)
+            sent_at = datetime.now(timezone.utc)
+            await repository.mark_sent(
+                [message.id for message, error in zip(messages, errors) if error is None], sent_at
+            )
+            for message, error in zip(messages, errors):
+                if error is None:
+                    EMAIL_DELIVERIES_TOTAL.labels(category=message.category, outcome="sent").inc()
+                    EMAIL_DELIVERY_LATENCY.labels(category=message.category).observe(
+                        (sent_at - message.created_at).total_seconds()
+                    )
+                    finished.append(message)
+                    continue
+
+                reason = f"{type(error).__name__}: {str(error)}"[:2000]
+                if is_permanent(error) or message.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+                    await repository.mark_failed(message.id, reason)
+                    EMAIL_DELIVERIES_TOTAL.labels(category=message.category, outcome="failed").inc()
+                    logger.error(f"Email {message.id} to {message.to_email} failed permanently: {reason}")
+                    finished.append(message)
+                else:
+                    delay = retry_delay(message.attempts)
+                    await repository.mark_retry(message.id, sent_at + timedelta(seconds=delay), reason)
+                    EMAIL_DELIVERIES_TOTAL.labels(category=message.category, outcome="retry").inc()
+                    logger.warning(
+                        f"Email {message.id} to {message.to_email} failed (attempt {message.attempts}), "
+                        f"retrying in {delay:.0f}s: {reason}"
+                    )
+            EMAIL_OUTBOX_DEPTH.set(await repository.count_pending())
+            await db.commit()
+
+        await run_in_threadpool(_remove_spooled, finished)
+        return len(messages)
+
+    async def _transports(
+        self, db: AsyncSession, messages: List[EmailOutbox]
+    ) -> Dict[int, SMTPTransport]:
+        """SMTP account for each message; missing or inactive user configs are left out"""
+        config_ids = {m.sender_config_id for m in messages if m.transport == EmailTransport.USER}
+        configs = {}
+        if config_ids:
+            result = await db.execute(
+                select(UserEmailConfiguration).where(
+                    UserEmailConfiguration.id.in_(config_ids),
+                    UserEmailConfiguration.is_active == True,
+                    UserEmailConfiguration.is_deleted == False,
+                )
+            )
+            configs = {config.id: user_transport(config) for config in result.scalars().all()}
+
+        transports = {}
+        for message in messages:
+            if message.transport == EmailTransport.SYSTEM:
+                transports[message.id] = system_transport()
+            elif message.sender_config_id in configs:
+                transports[message.id] = configs[message.sender_config_id]
+        return transports
+
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            rate = settings.EMAIL_PROVIDER_RATE_LIMITS.get(host, settings.EMAIL_RATE_LIMIT_PER_MINUTE)
+            self._buckets[host] = TokenBucket(rate)
+        return self._buckets[host]
+
+    async def _deliver(
+        self, message: EmailOutbox, transport: Optional[SMTPTransport]
+    ) -> Optional[BaseException]:
+        """Send one message; returns the error instead of raising"""
+        try:
+            if transport is None:
+                raise PermanentDeliveryError("Sender email configuration is missing or inactive")
+            await self._bucket(transport.host).acquire()
+            async with self.pool.connection(transport) as client:
+                # Built while holding a connection slot, so at most
+                # SMTP_POOL_MAX_CONNECTIONS encoded messages per account are in memory
+                mime = await run_in_threadpool(build_message, transport, message)
+                with observe_email_send(message.category):
+                    refused, _ = await client.send_message(mime)
+            if refused:
+                logger.warning(f"Email {message.id} refused for {', '.join(refused)}")
+        except Exception as e:
+            return e
+        return None
+
+
+email_dispatcher = EmailDispatcher(
+    batch_size=settings.EMAIL_DISPATCH_BATCH_SIZE,
+    interval=settings.EMAIL_DISPATCH_INTERVAL_SECONDS,
+    lease_seconds=settings.EMAIL_DISPATCH_LEASE_SECONDS,
+)
@@ -2,18 +2,32 @@
 
 import os
 import uuid
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 from fastapi import UploadFile, HTTPException
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime
 
 
 class FileStorageService:
-    """Service for managing file uploads with structured folder organization"""
+    """
+    Service for managing file uploads in a content-addressed store
+
+    Uploads are streamed in UPLOAD_CHUNK_SIZE pieces to a temp file (disk I/O
+    runs in the thread pool), hashed and size-checked as they arrive, then
+    moved to uploads/objects/<sha256[:2]>/<sha256[2:4]>/<sha256><ext>. An
+    identical re-upload reuses the stored object instead of writing a copy.
+    """
     
-    # Base upload directory
+    # Base upload directory (files stored before content addressing)
     BASE_UPLOAD_DIR = Path("uploads/candidates")
     
+    # Content-addressed object store and its staging area
+    OBJECT_STORE_DIR = Path("uploads/objects")
+    TEMP_UPLOAD_DIR = OBJECT_STORE_DIR / "tmp"
+    UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+    
     # Allowed file types and max sizes
     ALLOWED_EXTENSIONS = {
         "resume": {".pdf", ".doc", ".docx"},
@@ -78,26 +92,36 @@ class FileStorageService:
                 detail=f"Invalid file type for {document_type}. Allowed: {', '.join(allowed_exts)}"
             )
         
-        # Check file size (if file has size attribute)
-        if hasattr(file, 'size') and file.size:
-            if file.size > FileStorageService.MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File too large. Maximum size: {FileStorageService.MAX_FILE_SIZE / (1024*1024)}MB"
-                )
+        # Cheap early rejection when the client declared a size; the real
+        # limit is enforced while streaming in save_file
+        if file.size and file.size > FileStorageService.MAX_FILE_SIZE:
+            FileStorageService._raise_too_large()
+    
+    @staticmethod
+    def _raise_too_large() -> None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"File too large. Maximum size: {FileStorageService.MAX_FILE_SIZE / (1024*1024)}MB"
+        )
+    
+    @staticmethod
+    def object_path(content_sha256: str, ext: str) -> Path:
+        """Location of a stored object for a content hash"""
+        return (
+            FileStorageService.OBJECT_STORE_DIR
+            / content_sha256[:2]
+            / content_sha256[2:4]
+            / f"{content_sha256}{ext}"
+        )
+    
+    @staticmethod
+    def _commit_object(temp_path: Path, object_path: Path) -> None:
+        """Move a staged upload into the store, or drop it if the object already exists"""
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        if object_path.exists():
+            temp_path.unlink()
         else:
-            # Fallback: Check size by seeking to end
-            try:
-                file.file.seek(0, 2)
-                size = file.file.tell()
-                file.file.seek(0)
-                if size > FileStorageService.MAX_FILE_SIZE:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"File too large. Maximum size: {FileStorageService.MAX_FILE_SIZE / (1024*1024)}MB"
-                    )
-            except Exception:
-                pass # If verify fails here, we will catch it during save
+            os.replace(temp_path, object_path)
     
     @staticmethod
     async def save_file(
@@ -105,64 +129,75 @@ class FileStorageService:
         candidate_public_id: str,
         document_type: str,
         candidate_name: str = "unknown",
-        candidate_id: Optional[int] = None
+        candidate_id: Optional[int] = None,
+        before_store: Optional[Callable[[str], Awaitable[None]]] = None
     ) -> dict:
         """
-        Save uploaded file to structured folder:
-        uploads/candidates/{name}_{id}/{document_type}/
-        Returns dict with file info: {file_path, file_name, file_size, mime_type}
+        Stream an uploaded file into the content-addressed store
+        before_store, if given, is awaited with the object path just before
+        the object is stored or reused (callers lock it against deletion).
+        Returns dict with file info: {file_path, file_name, file_size, mime_type, content_sha256}
         """
         # Validate file
         FileStorageService.validate_file(file, document_type)
         
-        # Sanitize candidate name for folder name
-        safe_name = FileStorageService._sanitize_filename(candidate_name).lower()
-        suffix = f"_{candidate_id}" if candidate_id else f"_{candidate_public_id[:8]}"
-        candidate_folder = f"{safe_name}{suffix}"
-        
-        # Create folder structure: uploads/candidates/{candidate_folder}/{document_type}/
-        folder_path = FileStorageService.BASE_UPLOAD_DIR / candidate_folder / document_type
-        folder_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate unique filename
-        unique_filename = FileStorageService._generate_unique_filename(file.filename)
-        file_path = folder_path / unique_filename
+        FileStorageService.TEMP_UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = FileStorageService.TEMP_UPLOAD_DIR / f"{uuid.uuid4().hex}.part"
+        digest = hashlib.sha256()
+        file_size = 0
         
-        # Save file
         try:
-            content = await file.read()
-            with open(file_path, "wb") as f:
-                f.write(content)
+            out = await run_in_threadpool(open, temp_path, "wb")
+            try:
+                while chunk := await file.read(FileStorageService.UPLOAD_CHUNK_SIZE):
+                    file_size += len(chunk)
+                    if file_size > FileStorageService.MAX_FILE_SIZE:
+                        FileStorageService._raise_too_large()
+                    digest.update(chunk)
+                    await run_in_threadpool(out.write, chunk)
+            finally:
+                await run_in_threadpool(out.close)
             
-            # Get file size
-            file_size = len(content)
+            content_sha256 = digest.hexdigest()
+            ext = FileStorageService._get_file_extension(file.filename)
+            object_path = FileStorageService.object_path(content_sha256, ext)
+            if before_store is not None:
+                await before_store(str(object_path))
+            await run_in_threadpool(FileStorageService._commit_object, temp_path, object_path)
             
-            # Return file info
             return {
-                "file_path": str(file_path),
-                "file_name": unique_filename,
+                "file_path": str(object_path),
+                "file_name": FileStorageService._generate_unique_filename(file.filename),
                 "file_size": file_size,
-                "mime_type": file.content_type
+                "mime_type": file.content_type,
+                "content_sha256": content_sha256,
             }
         
+        except HTTPException:
+            temp_path.unlink(missing_ok=True)
+            raise
         except Exception as e:
             # Clean up if something goes wrong
-            if file_path.exists():
-                file_path.unlink()
+            temp_path.unlink(missing_ok=True)
             raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
     
     @staticmethod
     def delete_file(file_path: str) -> bool:
-        """Delete a file from storage"""
+        """
+        Delete a file from storage
+        Stored objects can be shared by several documents; callers must check
+        that no other document references the path first, under the same lock
+        that uploads take before reusing it.
+        """
         try:
             path = Path(file_path)
             if path.exists() and path.is_file():
                 path.unlink()
                 
-                # Try to remove empty parent directories
+                # Try to remove the emptied fan-out directories
                 try:
-                    path.parent.rmdir()  # document_type folder
-                    path.parent.parent.rmdir()  # public_id folder
+                    path.parent.rmdir()  # sha256[2:4] folder
+                    path.parent.parent.rmdir()  # sha256[:2] folder
                 except OSError:
                     # Directories not empty, that's fine
                     pass
@@ -0,0 +1,89 @@
+"""Index usage statistics from pg_stat_user_indexes / pg_stat_user_tables
+
+Counters are cumulative since the last ``pg_stat_reset()`` (or server start),
+so read them after the database has seen representative traffic. An index
+with no scans that is neither unique nor a primary key only costs writes;
+an index whose columns are a leading prefix of another index on the same
+table is usually redundant. Tables that read many rows through sequential
+scans point at a query with no supporting index.
+"""
+
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+_INDEX_USAGE_SQL = text(
+    """
+    SELECT
+        s.relname AS table_name,
+        s.indexrelname AS index_name,
+        s.idx_scan AS scans,
+        s.idx_tup_read AS tuples_read,
+        pg_relation_size(s.indexrelid) AS size_bytes,
+        i.indisunique AS is_unique,
+        i.indisprimary AS is_primary,
+        i.indpred IS NOT NULL AS is_partial,
+        string_to_array(i.indkey::text, ' ') AS key_columns,
+        pg_get_indexdef(s.indexrelid) AS definition
+    FROM pg_stat_user_indexes s
+    JOIN pg_index i ON i.indexrelid = s.indexrelid
+    WHERE s.schemaname = current_schema()
+    ORDER BY s.relname, s.indexrelname
+    """
+)
+
+_TABLE_SCANS_SQL = text(
+    """
+    SELECT
+        relname AS table_name,
+        seq_scan,
+        seq_tup_read,
+        COALESCE(idx_scan, 0) AS idx_scan,
+        n_live_tup AS live_rows
+    FROM pg_stat_user_tables
+    WHERE schemaname = current_schema()
+    ORDER BY seq_tup_read DESC
+    """
+)
+
+
+class IndexUsageService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def index_usage(self) -> List[dict]:
+        """Every index in the schema with its scan count, size and audit flags"""
+        rows = [dict(row._mapping) for row in await self.db.execute(_INDEX_USAGE_SQL)]
+        for row in rows:
+            row["unused"] = row["scans"] == 0 and not (row["is_unique"] or row["is_primary"])
+            row["covered_by"] = _covering_index(row, rows)
+        return rows
+
+    async def sequential_scans(self, min_rows: int = 1000) -> List[dict]:
+        """Tables of at least ``min_rows`` live rows, most sequentially read first"""
+        result = await self.db.execute(_TABLE_SCANS_SQL)
+        return [
+            dict(row._mapping)
+            for row in result
+            if row.live_rows >= min_rows and row.seq_scan > 0
+        ]
+
+
+def _covering_index(row: dict, rows: List[dict]):
+    """Name of another index on the table whose leading columns repeat this one's"""
+    if row["is_unique"] or row["is_primary"] or row["is_partial"]:
+        return None
+    columns = row["key_columns"]
+    for other in rows:
+        if other is row or other["table_name"] != row["table_name"] or other["is_partial"]:
+            continue
+        if other["key_columns"][:len(columns)] != columns:
+            continue
+        # Of two identical indexes, report only the later one as redundant
+        if other["key_columns"] == columns and not (other["is_unique"] or other["is_primary"]):
+            if other["index_name"] > row["index_name"]:
+                continue
+        return other["index_name"]
+    return None
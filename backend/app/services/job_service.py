@@ -0,0 +1,80 @@
+"""Enqueueing and inspecting background jobs (run by app.jobs.worker)"""
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.jobs.registry import JobFunc
+from app.models.job import Job
+from app.models.user import User, UserRole
+from app.repositories.job_repository import JobRepository
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next attempt after ``attempts`` failed ones (with ±20% jitter)"""
+    delay = min(
+        settings.JOB_RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0),
+        settings.JOB_RETRY_MAX_SECONDS,
+    )
+    return delay * random.uniform(0.8, 1.2)
+
+
+class JobService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = JobRepository(db)
+
+    async def enqueue(
+        self,
+        handler: JobFunc,
+        payload: Optional[Dict[str, Any]] = None,
+        *,
+        user_id: Optional[int] = None,
+        priority: Optional[int] = None,
+        delay_seconds: float = 0,
+    ) -> Job:
+        """
+        Queue ``handler`` (a function decorated with ``job_handler``) to run
+        with ``payload`` as keyword arguments. The row is part of the caller's
+        transaction, so the job only becomes visible to workers on commit.
+        """
+        definition = getattr(handler, "job", None)
+        if definition is None:
+            raise ValueError(f"{handler!r} is not registered with @job_handler")
+        return await self.repo.create({
+            "name": definition.name,
+            "queue": definition.queue,
+            "payload": jsonable_encoder(payload or {}),
+            "priority": definition.priority if priority is None else priority,
+            "max_attempts": definition.max_attempts,
+            "run_at": datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+            "created_by_user_id": user_id,
+        })
+
+    async def get_job(self, public_id: UUID, current_user: User) -> Job:
+        """A job visible to ``current_user``: their own, or any job for admins"""
+        job = await self.repo.get_by_public_id(public_id)
+        if not job:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        if job.created_by_user_id != current_user.id and current_user.role != UserRole.ADMIN:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+        return job
+
+    async def get_my_jobs(self, current_user: User, limit: int = 20) -> List[Job]:
+        return await self.repo.list_for_user(current_user.id, limit)
+
+    async def cancel_job(self, public_id: UUID, current_user: User) -> Job:
+        job = await self.get_job(public_id, current_user)
+        if not await self.repo.cancel(job.id, datetime.now(timezone.utc)):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Job is already {job.status.value} and can no longer be cancelled"
+            )
+        await self.db.refresh(job)
+        return job
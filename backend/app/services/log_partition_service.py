@@ -0,0 +1,250 @@
+"""Monthly partition rollover and retention for the log tables
+
+``activity_logs``, ``crm_activity_logs`` and ``ai_task_logs`` are range
+partitioned by month on ``created_at`` (UTC). Each has monthly partitions named
+``<table>_pYYYY_MM`` plus a ``<table>_default`` partition that catches rows
+falling outside every monthly range.
+
+``ensure_partitions`` creates the upcoming months ahead of time so inserts never
+land in the default partition. ``enforce_retention`` drops monthly partitions
+that lie entirely before the table's retention cut-off, optionally archiving
+them first to ``LOG_ARCHIVE_DIR/<partition>.jsonl.gz``. Dropping a partition is
+a metadata operation: no bulk DELETE, no table or index bloat, so index size and
+query latency stay proportional to the retention window rather than history.
+"""
+
+import asyncio
+import gzip
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from loguru import logger
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+
+PARTITIONED_LOG_TABLES = ("activity_logs", "crm_activity_logs", "ai_task_logs")
+
+_PARTITION_NAME = re.compile(
+    r"^(?P<parent>" + "|".join(PARTITIONED_LOG_TABLES) + r")_"
+    r"(?:p(?P<year>\d{4})_(?P<month>\d{2})|default)$"
+)
+
+# Serialises rollover/retention across workers and the maintenance endpoint
+_ADVISORY_LOCK_KEY = 0x6C6F6770  # "logp"
+
+_ARCHIVE_CHUNK_ROWS = 1000
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of the UTC month containing ``value``"""
+    value = value.astimezone(timezone.utc) if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime, months: int) -> datetime:
+    """Shift a month-start datetime by a number of months"""
+    index = value.year * 12 + value.month - 1 + months
+    return value.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    return f"{table}_p{month:%Y_%m}"
+
+
+def is_partition_table(name: str) -> bool:
+    """True for a monthly or default partition of one of the log tables"""
+    return _PARTITION_NAME.match(name) is not None
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    """Month covered by a monthly partition, or None for the default partition"""
+    match = _PARTITION_NAME.match(name)
+    if not match or not match.group("year"):
+        return None
+    return datetime(int(match.group("year")), int(match.group("month")), 1, tzinfo=timezone.utc)
+
+
+def retention_days(table: str) -> int:
+    """Configured retention for a log table; 0 keeps rows forever"""
+    return {
+        "activity_logs": settings.ACTIVITY_LOG_RETENTION_DAYS,
+        "crm_activity_logs": settings.CRM_ACTIVITY_LOG_RETENTION_DAYS,
+        "ai_task_logs": settings.AI_LOG_RETENTION_DAYS,
+    }[table]
+
+
+def retention_floor(table: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Oldest ``created_at`` still inside the retention window, or None when the
+    table is kept forever. Adding this as a lower bound lets the planner prune
+    partitions that are due for removal but have not been dropped yet.
+    """
+    days = retention_days(table)
+    if days <= 0:
+        return None
+    return (now or datetime.now(timezone.utc)) - timedelta(days=days)
+
+
+class LogPartitionService:
+    """Creates upcoming monthly partitions and drops expired ones"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def run(self, now: Optional[datetime] = None) -> dict:
+        """Roll partitions forward, then enforce retention on every log table"""
+        now = now or datetime.now(timezone.utc)
+        return {
+            "created": await self.ensure_partitions(now=now),
+            "dropped": await self.enforce_retention(now=now),
+        }
+
+    async def ensure_partitions(
+        self,
+        months_ahead: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> List[str]:
+        """Create monthly partitions from the current month to ``months_ahead``"""
+        months_ahead = settings.LOG_PARTITION_MONTHS_AHEAD if months_ahead is None else months_ahead
+        current = month_start(now or datetime.now(timezone.utc))
+        created = []
+
+        await self._lock()
+        for table in PARTITIONED_LOG_TABLES:
+            if not await self._is_partitioned(table):
+                logger.warning(f"{table} is not partitioned; run the log partitioning migration")
+                continue
+            existing = set(await self._partitions(table))
+            for offset in range(months_ahead + 1):
+                month = add_months(current, offset)
+                name = partition_name(table, month)
+                if name not in existing:
+                    await self._create_partition(table, month)
+                    created.append(name)
+        await self.db.commit()
+
+        if created:
+            logger.info(f"Created log partitions: {', '.join(created)}")
+        return created
+
+    async def enforce_retention(self, now: Optional[datetime] = None) -> List[dict]:
+        """Archive and drop partitions entirely older than each table's retention window"""
+        now = now or datetime.now(timezone.utc)
+        dropped = []
+
+        for table in PARTITIONED_LOG_TABLES:
+            floor = retention_floor(table, now)
+            if floor is None or not await self._is_partitioned(table):
+                continue
+
+            for name in await self._partitions(table):
+                month = partition_month(name)
+                if month is None or add_months(month, 1) > floor:
+                    continue
+                await self._lock()
+                archive = await self._archive(name, f'SELECT * FROM "{name}"', {})
+                await self.db.execute(text(f'DROP TABLE "{name}"'))
+                await self.db.commit()
+                dropped.append({"partition": name, "archive": archive})
+                logger.info(f"Dropped expired log partition {name} (archive: {archive or 'disabled'})")
+
+            # Stray rows in the default partition are trimmed row by row
+            default = f"{table}_default"
+            await self._lock()
+            await self._archive(
+                f"{default}_before_{floor:%Y%m%d}",
+                f'SELECT * FROM "{default}" WHERE created_at < :floor',
+                {"floor": floor},
+            )
+            await self.db.execute(
+                text(f'DELETE FROM "{default}" WHERE created_at < :floor'), {"floor": floor}
+            )
+            await self.db.commit()
+
+        return dropped
+
+    async def _lock(self) -> None:
+        await self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+
+    async def _is_partitioned(self, table: str) -> bool:
+        result = await self.db.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = :table AND pg_table_is_visible(c.oid))"
+            ),
+            {"table": table},
+        )
+        return bool(result.scalar())
+
+    async def _partitions(self, table: str) -> List[str]:
+        result = await self.db.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "WHERE parent.relname = :table AND pg_table_is_visible(parent.oid) "
+                "ORDER BY child.relname"
+            ),
+            {"table": table},
+        )
+        return list(result.scalars().all())
+
+    async def _create_partition(self, table: str, month: datetime) -> None:
+        name = partition_name(table, month)
+        default = f"{table}_default"
+        lower, upper = month, add_months(month, 1)
+        bounds = f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        in_range = "created_at >= :lower AND created_at < :upper"
+        params = {"lower": lower, "upper": upper}
+
+        result = await self.db.execute(
+            text(f'SELECT EXISTS (SELECT 1 FROM "{default}" WHERE {in_range})'), params
+        )
+        if not result.scalar():
+            await self.db.execute(text(f'CREATE TABLE "{name}" PARTITION OF "{table}" {bounds}'))
+            return
+
+        # Postgres refuses to create a partition whose range already has rows in
+        # the default partition, so move them across while it is detached.
+        await self.db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"'))
+        await self.db.execute(text(f'CREATE TABLE "{name}" PARTITION OF "{table}" {bounds}'))
+        await self.db.execute(
+            text(f'INSERT INTO "{name}" SELECT * FROM "{default}" WHERE {in_range}'), params
+        )
+        await self.db.execute(text(f'DELETE FROM "{default}" WHERE {in_range}'), params)
+        await self.db.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT'))
+
+    async def _archive(self, name: str, query: str, params: dict) -> Optional[str]:
+        """Stream query rows into a gzip JSON-lines file; returns its path"""
+        if not settings.LOG_ARCHIVE_ENABLED:
+            return None
+
+        archive_dir = Path(settings.LOG_ARCHIVE_DIR)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        path = archive_dir / f"{name}.jsonl.gz"
+        partial = path.with_suffix(f".partial-{os.getpid()}")
+
+        rows = 0
+        result = await self.db.stream(text(query), params)
+        archive = await asyncio.to_thread(gzip.open, partial, "wt", encoding="utf-8")
+        try:
+            async for chunk in result.partitions(_ARCHIVE_CHUNK_ROWS):
+                lines = "".join(json.dumps(dict(row._mapping), default=str) + "\n" for row in chunk)
+                await asyncio.to_thread(archive.write, lines)
+                rows += len(chunk)
+        finally:
+            await asyncio.to_thread(archive.close)
+
+        if not rows:
+            partial.unlink(missing_ok=True)
+            return None
+        os.replace(partial, path)
+        return str(path)
@@ -0,0 +1,234 @@
+"""In-process fan-out of notification events, fed across workers by Postgres NOTIFY
+
+Each open ``/notifications/stream`` connection subscribes here for its user.
+``publish`` is called inside the transaction that changes notifications:
+
+* when the hub is listening (started from the application lifespan), it issues
+  ``pg_notify`` in that transaction. Postgres delivers the payload at commit,
+  and only on commit, to every worker's listener connection, which hands it to
+  that worker's local subscribers;
+* otherwise (LISTEN disabled, tests, scripts) the event is kept on the session
+  and delivered to local subscribers after the session commits.
+
+``publish_many`` does the same for a fan-out to many users: the events are
+packed into as few NOTIFY payloads as fit and sent in a single statement.
+
+Events carry unread-count deltas, so clients keep their badge current without
+polling. Subscribers that fall behind, and all subscribers after the listener
+reconnects, get a ``resync`` event telling the client to fetch the list once.
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Set, Tuple
+
+from loguru import logger
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import NOTIFICATION_EVENTS_TOTAL, NOTIFICATION_SUBSCRIBERS
+
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+_MAX_PAYLOAD_BYTES = 7900
+
+_PENDING_KEY = "notification_hub_events"
+
+RESYNC = {"event": "resync"}
+
+
+class NotificationHub:
+    """Per-user subscriber queues plus the LISTEN connection that feeds them"""
+
+    def __init__(self, channel: str, queue_size: int) -> None:
+        self.channel = channel
+        self.queue_size = queue_size
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = defaultdict(set)
+        self._task: Optional[asyncio.Task] = None
+        self._connection = None
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None and not self._connection.is_closed()
+
+    # ── Subscribers ───────────────────────────────────────────────────────────
+    def add_subscriber(self, user_id: int) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[user_id].add(queue)
+        NOTIFICATION_SUBSCRIBERS.inc()
+        return queue
+
+    def remove_subscriber(self, user_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is None or queue not in queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+        NOTIFICATION_SUBSCRIBERS.dec()
+
+    @asynccontextmanager
+    async def subscribe(self, user_id: int) -> AsyncIterator[asyncio.Queue]:
+        queue = self.add_subscriber(user_id)
+        try:
+            yield queue
+        finally:
+            self.remove_subscriber(user_id, queue)
+
+    def _offer(self, queue: asyncio.Queue, payload: dict) -> None:
+        try:
+            queue.put_nowait(payload)
+            NOTIFICATION_EVENTS_TOTAL.labels(outcome="delivered").inc()
+        except asyncio.QueueFull:
+            # A stalled client: drop what it has not read and ask it to refetch
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+            NOTIFICATION_EVENTS_TOTAL.labels(outcome="dropped").inc()
+
+    def dispatch_local(self, user_id: int, payload: dict) -> None:
+        """Hand an event to this worker's subscribers for ``user_id``"""
+        for queue in list(self._subscribers.get(user_id, ())):
+            self._offer(queue, payload)
+
+    def resync_all(self) -> None:
+        for queues in list(self._subscribers.values()):
+            for queue in list(queues):
+                self._offer(queue, RESYNC)
+
+    # ── Publishing ────────────────────────────────────────────────────────────
+    async def publish(self, db: AsyncSession, user_id: int, payload: dict) -> None:
+        """Queue an event for ``user_id`` that is delivered when ``db`` commits"""
+        NOTIFICATION_EVENTS_TOTAL.labels(outcome="published").inc()
+        if self.listening:
+            message = json.dumps({"user_id": user_id, "payload": payload}, default=str)
+            if len(message.encode()) > _MAX_PAYLOAD_BYTES:
+                message = json.dumps({"user_id": user_id, "payload": RESYNC})
+            await db.execute(
+                text("SELECT pg_notify(:channel, :message)"),
+                {"channel": self.channel, "message": message},
+            )
+            return
+        db.sync_session.info.setdefault(_PENDING_KEY, []).append((self, user_id, payload))
+
+    async def publish_many(self, db: AsyncSession, events: Sequence[Tuple[int, dict]]) -> None:
+        """Queue (user_id, payload) events, delivered when ``db`` commits, in one statement"""
+        if not events:
+            return
+        NOTIFICATION_EVENTS_TOTAL.labels(outcome="published").inc(len(events))
+        if self.listening:
+            await db.execute(
+                text("SELECT pg_notify(:channel, message) FROM unnest(CAST(:messages AS text[])) AS message"),
+                {"channel": self.channel, "messages": self._pack(events)},
+            )
+            return
+        db.sync_session.info.setdefault(_PENDING_KEY, []).extend(
+            (self, user_id, payload) for user_id, payload in events
+        )
+
+    @staticmethod
+    def _pack(events: Sequence[Tuple[int, dict]]) -> List[str]:
+        """Group events into ``{"events": [...]}`` messages that each fit a NOTIFY payload"""
+        messages: List[str] = []
+        batch: List[str] = []
+        size = 0
+        for user_id, payload in events:
+            item = json.dumps({"user_id": user_id, "payload": payload}, default=str)
+            if len(item.encode()) > _MAX_PAYLOAD_BYTES - 20:
+                item = json.dumps({"user_id": user_id, "payload": RESYNC})
+            item_size = len(item.encode()) + 1
+            if batch and size + item_size > _MAX_PAYLOAD_BYTES - 20:
+                messages.append('{"events":[' + ",".join(batch) + "]}")
+                batch, size = [], 0
+            batch.append(item)
+            size += item_size
+        if batch:
+            messages.append('{"events":[' + ",".join(batch) + "]}")
+        return messages
+
+    # ── Cross-worker listener ─────────────────────────────────────────────────
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        from app.core.database import direct_dsn
+
+        if direct_dsn() is None:
+            # LISTEN through a transaction pooler would silently stop receiving
+            logger.error(
+                "Notification listener not started: DB_PGBOUNCER_MODE needs DATABASE_DIRECT_URL; "
+                "pushes reach only clients connected to the sending worker"
+            )
+            return
+        self._task = asyncio.create_task(self._listen(), name="notification-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._close()
+
+    async def _close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None and not connection.is_closed():
+            try:
+                await connection.close(timeout=5)
+            except Exception:
+                connection.terminate()
+
+    def _on_notify(self, _connection, _pid, _channel, message: str) -> None:
+        try:
+            data = json.loads(message)
+            for item in data.get("events", [data]):
+                self.dispatch_local(int(item["user_id"]), item["payload"])
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring malformed notification event: {str(e)}")
+
+    async def _listen(self) -> None:
+        from app.core.database import connect_direct
+
+        delay = 1.0
+        while True:
+            try:
+                self._connection = await connect_direct()
+                await self._connection.add_listener(self.channel, self._on_notify)
+                logger.info(f"Listening for notification events on '{self.channel}'")
+                delay = 1.0
+                # Events sent while we were not listening are lost; let clients catch up
+                self.resync_all()
+                while True:
+                    # A cheap round trip notices half-open connections
+                    await asyncio.sleep(30)
+                    await self._connection.execute("SELECT 1")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Notification listener disconnected: {str(e)}; retrying in {delay:.0f}s")
+            await self._close()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 60.0)
+
+
+notification_hub = NotificationHub(
+    channel=settings.NOTIFICATION_CHANNEL,
+    queue_size=settings.NOTIFICATION_SUBSCRIBER_QUEUE_SIZE,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending(session: Session) -> None:
+    for hub, user_id, payload in session.info.pop(_PENDING_KEY, ()):
+        hub.dispatch_local(user_id, payload)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
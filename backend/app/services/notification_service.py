@@ -1,12 +1,76 @@
 import logging
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.repositories.notification_repository import NotificationRepository
 from app.models.notification import Notification
+from app.services.notification_hub import notification_hub
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass(frozen=True)
+class NotificationTemplate:
+    """Title, message and link as str.format patterns over the notification params"""
+    title: str
+    message: str
+    link: Optional[str] = None
+
+    def render(self, params: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        return {
+            "title": self.title.format(**params),
+            "message": self.message.format(**params),
+            "link": self.link.format(**params) if self.link else None,
+        }
+
+
+# Notification type -> template; the type is stored on each row
+NOTIFICATION_TEMPLATES: Dict[str, NotificationTemplate] = {
+    "dsr_approved": NotificationTemplate(
+        title="DSR Approved",
+        message="Your DSR for {report_date} has been approved.",
+        link="/dashboard/dsr?id={dsr_public_id}",
+    ),
+    "dsr_rejected": NotificationTemplate(
+        title="DSR Resubmission Required",
+        message="Your DSR for {report_date} was rejected: {reason}",
+        link="/dashboard/dsr?id={dsr_public_id}",
+    ),
+    "permission_granted": NotificationTemplate(
+        title="DSR Permission Granted",
+        message="You can now submit DSR for {target_date}.",
+        link="/dashboard/dsr?id={dsr_public_id}",
+    ),
+    "permission_rejected": NotificationTemplate(
+        title="DSR Permission Rejected",
+        message="Your request for {target_date} was rejected: {reason}",
+        link="/dashboard/dsr",
+    ),
+    "dsr_reminder": NotificationTemplate(
+        title="DSR Reminder",
+        message="{message}",
+        link="/dashboard/dsr",
+    ),
+}
+
+
+def _event(notification: Notification) -> dict:
+    return {
+        "event": "notification",
+        "unread_delta": 1,
+        "notification": {
+            "public_id": str(notification.public_id),
+            "title": notification.title,
+            "message": notification.message,
+            "type": notification.type,
+            "link": notification.link,
+            "is_read": False,
+            "created_at": notification.created_at.isoformat() if notification.created_at else None,
+        },
+    }
+
+
 class NotificationService:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -20,14 +84,43 @@ class NotificationService:
         notif_type: str,
         link: Optional[str] = None
     ) -> Notification:
-        notif_data = {
+        notifications = await self.create_notifications([{
             "user_id": user_id,
             "title": title,
             "message": message,
             "type": notif_type,
             "link": link
-        }
-        return await self.repo.create(notif_data)
+        }])
+        return notifications[0]
+
+    async def create_notifications(self, rows: List[dict]) -> List[Notification]:
+        """
+        Insert notification rows (user_id, title, message, type, link) in one
+        statement and push one batched event to the recipients' streams.
+        """
+        notifications = await self.repo.insert_many(rows)
+        await notification_hub.publish_many(
+            self.db, [(notification.user_id, _event(notification)) for notification in notifications]
+        )
+        return notifications
+
+    async def notify_users(
+        self,
+        user_ids: Iterable[int],
+        template: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Notification]:
+        """
+        Send the same templated notification to every user in ``user_ids``.
+        The text is rendered once, so notifying a whole team costs one INSERT
+        however large it is.
+        """
+        rendered = NOTIFICATION_TEMPLATES[template].render(params or {})
+        rows = [
+            {"user_id": user_id, "type": template, **rendered}
+            for user_id in dict.fromkeys(user_ids)
+        ]
+        return await self.create_notifications(rows)
 
     async def get_my_notifications(
         self, 
@@ -39,44 +132,58 @@ class NotificationService:
         unread_count = await self.repo.get_unread_count(user_id)
         return items, unread_count
 
+    async def get_unread_count(self, user_id: int) -> int:
+        return await self.repo.get_unread_count(user_id)
+
     async def mark_as_read(self, public_id: UUID, user_id: int) -> bool:
-        return await self.repo.mark_as_read(public_id, user_id)
+        notification = await self.repo.get_by_public_id(public_id)
+        if not notification or notification.user_id != user_id:
+            return False
+        was_unread = not notification.is_read
+        success = await self.repo.mark_as_read(public_id, user_id)
+        if success and was_unread:
+            await notification_hub.publish(self.db, user_id, {
+                "event": "read",
+                "public_id": str(public_id),
+                "unread_delta": -1,
+            })
+        return success
 
     async def mark_all_as_read(self, user_id: int) -> int:
-        return await self.repo.mark_all_as_read(user_id)
+        count = await self.repo.mark_all_as_read(user_id)
+        if count:
+            await notification_hub.publish(self.db, user_id, {
+                "event": "read_all",
+                "unread_delta": -count,
+            })
+        return count
 
     async def notify_dsr_approved(self, user_id: int, report_date: str, dsr_public_id: UUID):
-        await self.create_notification(
-            user_id=user_id,
-            title="DSR Approved",
-            message=f"Your DSR for {report_date} has been approved.",
-            notif_type="dsr_approved",
-            link=f"/dashboard/dsr?id={dsr_public_id}"
-        )
+        await self.notify_users([user_id], "dsr_approved", {
+            "report_date": report_date,
+            "dsr_public_id": dsr_public_id,
+        })
 
     async def notify_dsr_rejected(self, user_id: int, report_date: str, reason: str, dsr_public_id: UUID):
-        await self.create_notification(
-            user_id=user_id,
-            title="DSR Resubmission Required",
-            message=f"Your DSR for {report_date} was rejected: {reason}",
-            notif_type="dsr_rejected",
-            link=f"/dashboard/dsr?id={dsr_public_id}"
-        )
+        await self.notify_users([user_id], "dsr_rejected", {
+            "report_date": report_date,
+            "reason": reason,
+            "dsr_public_id": dsr_public_id,
+        })
 
     async def notify_permission_granted(self, user_id: int, target_date: str, dsr_public_id: UUID):
-        await self.create_notification(
-            user_id=user_id,
-            title="DSR Permission Granted",
-            message=f"You can now submit DSR for {target_date}.",
-            notif_type="permission_granted",
-            link=f"/dashboard/dsr?id={dsr_public_id}"
-        )
+        await self.notify_users([user_id], "permission_granted", {
+            "target_date": target_date,
+            "dsr_public_id": dsr_public_id,
+        })
 
     async def notify_permission_rejected(self, user_id: int, target_date: str, reason: str):
-        await self.create_notification(
-            user_id=user_id,
-            title="DSR Permission Rejected",
-            message=f"Your request for {target_date} was rejected: {reason}",
-            notif_type="permission_rejected",
-            link="/dashboard/dsr"
-        )
+        await self.notify_users([user_id], "permission_rejected", {
+            "target_date": target_date,
+            "reason": reason,
+        })
+
+    async def notify_dsr_reminder(self, user_ids: Iterable[int], report_date: str, message: Optional[str] = None):
+        return await self.notify_users(user_ids, "dsr_reminder", {
+            "message": message or f"Please submit your DSR for {report_date}.",
+        })
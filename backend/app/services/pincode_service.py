@@ -1,6 +1,5 @@
 """Pincode Service for fetching location details"""
 
-import httpx
 from loguru import logger
 from fastapi import HTTPException, status
 
@@ -10,6 +9,8 @@ async def get_pincode_details(pincode: str, country_code: str = "IN") -> dict:
     Fetch city, district, and state from pincode using external API.
     Uses: https://api.postalpincode.in/pincode/{pincode}
     """
+    import httpx
+
     url = f"https://api.postalpincode.in/pincode/{pincode}"
     
     async with httpx.AsyncClient() as client:
@@ -1,32 +1,80 @@
 import logging
 import os
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
-from typing import Optional, List, Dict, Any
+import uuid
+import zipfile
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
+from app.core.config import settings
 from app.models.placement_mapping import PlacementMapping
 from app.models.candidate import Candidate
 from app.models.job_role import JobRole
 from app.models.contact import Contact
 from app.models.candidate_document import CandidateDocument
 from app.services.user_email_configuration_service import UserEmailConfigurationService
-from app.services.file_storage_service import FileStorageService
+from app.services.email_outbox_service import enqueue_email
 
 logger = logging.getLogger(__name__)
 
+
+def _stat_documents(documents: List[CandidateDocument]) -> Dict[int, int]:
+    """Size in bytes of each stored document file, keyed by document id (missing files left out)"""
+    sizes = {}
+    for doc in documents:
+        try:
+            sizes[doc.id] = os.stat(doc.file_path).st_size
+        except OSError:
+            logger.error(f"Document {doc.document_name} ({doc.id}) is missing from storage")
+    return sizes
+
+
+def split_bundles(sizes: List[int], budget: int) -> List[List[int]]:
+    """
+    Group items (given by their byte sizes, in order) into consecutive bundles
+    whose total stays within ``budget``. Returns lists of item indexes.
+    """
+    bundles: List[List[int]] = []
+    current: List[int] = []
+    total = 0
+    for index, size in enumerate(sizes):
+        if current and total + size > budget:
+            bundles.append(current)
+            current, total = [], 0
+        current.append(index)
+        total += size
+    if current:
+        bundles.append(current)
+    return bundles
+
+
+def _zip_files(files: List[Tuple[str, str]], destination: Path) -> int:
+    """Write (archive name, path) pairs into a zip file chunk by chunk; returns its size"""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    used = set()
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for arcname, path in files:
+            name, counter = arcname, 1
+            while name in used:
+                stem, dot, suffix = arcname.rpartition(".")
+                name = f"{stem} ({counter}).{suffix}" if dot else f"{arcname} ({counter})"
+                counter += 1
+            used.add(name)
+            archive.write(path, arcname=name)
+    return destination.stat().st_size
+
+
 class PlacementEmailService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.email_config_service = UserEmailConfigurationService(db)
 
     async def send_candidate_to_company(
-        self, 
-        mapping_id: int, 
+        self,
+        mapping_id: int,
         user_id: int,
         custom_email: Optional[str] = None,
         custom_subject: Optional[str] = None,
@@ -55,15 +103,22 @@ class PlacementEmailService:
     ) -> bool:
         """
         Send multiple candidate profiles and selected documents to the company contact.
+
+        Mappings, candidates and documents are loaded with one query each.
+        When the attachments exceed EMAIL_MAX_ATTACHMENT_BYTES the send is
+        split into several emails, or with EMAIL_BULK_ATTACHMENT_MODE=zip
+        packed into one archive when that fits.
         """
         if not mapping_ids:
             raise HTTPException(status_code=400, detail="No candidates selected")
 
-        # 1. Fetch First Mapping to get Job Role and Contact Info
-        query = select(PlacementMapping).where(PlacementMapping.id == mapping_ids[0])
-        result = await self.db.execute(query)
-        first_mapping = result.scalar_one_or_none()
-        
+        # 1. Fetch Mappings; the first one gives Job Role and Contact Info
+        result = await self.db.execute(
+            select(PlacementMapping).where(PlacementMapping.id.in_(mapping_ids))
+        )
+        mappings = {m.id: m for m in result.scalars().all()}
+        first_mapping = mappings.get(mapping_ids[0])
+
         if not first_mapping:
             raise HTTPException(status_code=404, detail="Placement mapping not found")
 
@@ -72,7 +127,7 @@ class PlacementEmailService:
              raise HTTPException(status_code=404, detail="Job role not found")
 
         contact = await self.db.get(Contact, job_role.contact_id)
-        
+
         if not contact or not (custom_email or contact.email):
             raise HTTPException(status_code=400, detail="Company contact email not available")
 
@@ -80,72 +135,40 @@ class PlacementEmailService:
         email_config = await self.email_config_service.get_config(user_id)
         if not email_config or not email_config.is_active:
             raise HTTPException(
-                status_code=400, 
+                status_code=400,
                 detail="User email service not configured or inactive. Please setup in Settings."
             )
 
-        # 3. Create Multipart Message
+        # 3. Recipients
         recipient_email = custom_email or contact.email
         recipient_name = contact.full_name
-        
-        msg = MIMEMultipart()
-        msg['From'] = f"{email_config.sender_name} <{email_config.sender_email}>"
-        msg['To'] = recipient_email
-        if custom_cc:
-            msg['Cc'] = custom_cc
-
-        # 4. Collect Candidate Details and Attachments
-        candidates_info = []
-        is_bulk = len(mapping_ids) > 1
-        
-        for mid in mapping_ids:
-            m_query = select(PlacementMapping).where(PlacementMapping.id == mid)
-            m_res = await self.db.execute(m_query)
-            m = m_res.scalar_one_or_none()
-            if not m: continue
-            
-            c = await self.db.get(Candidate, m.candidate_id)
-            if not c: continue
-            
-            candidates_info.append(c)
-            
-            # Identify which documents to attach
-            docs_to_attach = []
-            if document_ids:
-                # Use specified document IDs for this candidate
-                d_query = select(CandidateDocument).where(
-                    CandidateDocument.candidate_id == c.id,
-                    CandidateDocument.id.in_(document_ids)
-                )
-                d_res = await self.db.execute(d_query)
-                docs_to_attach = d_res.scalars().all()
-            else:
-                # Default: latest resume only
-                resume_query = select(CandidateDocument).where(
-                    CandidateDocument.candidate_id == c.id,
-                    CandidateDocument.document_type == 'resume'
-                ).order_by(CandidateDocument.created_at.desc())
-                resume_result = await self.db.execute(resume_query)
-                resume = resume_result.scalars().first()
-                if resume:
-                    docs_to_attach = [resume]
-
-            # Attach each document
-            for doc in docs_to_attach:
-                full_path = FileStorageService.get_file_path(doc.file_path)
-                if full_path and os.path.exists(full_path):
-                    try:
-                        with open(full_path, "rb") as f:
-                            part = MIMEApplication(f.read(), Name=doc.document_name)
-                        part['Content-Disposition'] = f'attachment; filename="{doc.document_name}"'
-                        msg.attach(part)
-                    except Exception as e:
-                        logger.error(f"Failed to attach document {doc.document_name} for {c.name}: {str(e)}")
+        cc = [address.strip() for address in (custom_cc or "").split(",") if address.strip()]
+
+        # 4. Collect Candidate Details and Attachments, in the order requested
+        candidate_ids = [mappings[mid].candidate_id for mid in mapping_ids if mid in mappings]
+        result = await self.db.execute(select(Candidate).where(Candidate.id.in_(candidate_ids)))
+        candidates_by_id = {c.id: c for c in result.scalars().all()}
+        candidates_info = list({
+            cid: candidates_by_id[cid] for cid in candidate_ids if cid in candidates_by_id
+        }.values())
 
         if not candidates_info:
             raise HTTPException(status_code=404, detail="No valid candidates found for the selected IDs")
 
-        # 5. Set Subject and Body
+        documents = await self._documents_to_attach([c.id for c in candidates_info], document_ids)
+        sizes = await run_in_threadpool(_stat_documents, [d for docs in documents.values() for d in docs])
+
+        budget = settings.EMAIL_MAX_ATTACHMENT_BYTES
+        for docs in documents.values():
+            for doc in docs:
+                if sizes.get(doc.id, 0) > budget:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"{doc.document_name} is larger than the {budget // (1024 * 1024)} MB email attachment limit"
+                    )
+
+        # 5. Set Subject
+        is_bulk = len(mapping_ids) > 1
         if is_bulk:
             names = ", ".join([c.name for c in candidates_info[:2]])
             if len(candidates_info) > 2:
@@ -153,15 +176,101 @@ class PlacementEmailService:
             subject = custom_subject or f"Candidate Profiles for {job_role.title} - {names}"
         else:
             subject = custom_subject or f"Profile for {job_role.title} - {candidates_info[0].name}"
-        
-        msg['Subject'] = subject
 
-        if custom_message:
-            message_body = custom_message
+        def attachments_for(candidates: List[Candidate]) -> List[Tuple[str, str]]:
+            return [
+                (doc.document_name, doc.file_path)
+                for c in candidates
+                for doc in documents.get(c.id, [])
+                if doc.id in sizes
+            ]
+
+        candidate_sizes = [
+            sum(sizes.get(doc.id, 0) for doc in documents.get(c.id, [])) for c in candidates_info
+        ]
+
+        # 6. Queue for delivery through the user's SMTP account
+        async def queue(part_subject, part_candidates, attachment_paths=None, spooled_paths=None):
+            await enqueue_email(
+                recipient_email,
+                part_subject,
+                text_body=custom_message or self._compose_body(
+                    recipient_name, job_role, part_candidates, is_bulk,
+                    email_config.sender_name, archived=bool(spooled_paths),
+                ),
+                cc=cc,
+                attachment_paths=attachment_paths,
+                spooled_paths=spooled_paths,
+                category="placement",
+                sender_config_id=email_config.id,
+                db=self.db,
+            )
+
+        if sum(candidate_sizes) <= budget:
+            await queue(subject, candidates_info, attachments_for(candidates_info))
+            return True
+
+        if settings.EMAIL_BULK_ATTACHMENT_MODE == "zip":
+            archive = Path(settings.EMAIL_ATTACHMENT_DIR) / f"{uuid.uuid4().hex}.zip"
+            files = [
+                (f"{c.name}/{doc.document_name}", doc.file_path)
+                for c in candidates_info
+                for doc in documents.get(c.id, [])
+                if doc.id in sizes
+            ]
+            archive_size = await run_in_threadpool(_zip_files, files, archive)
+            if archive_size <= budget:
+                filename = f"{job_role.title} - Candidate Profiles.zip".replace("/", "-")
+                await queue(subject, candidates_info, spooled_paths=[(filename, str(archive))])
+                return True
+            archive.unlink(missing_ok=True)
+            logger.info(f"Zipped attachments ({archive_size} bytes) exceed the limit; splitting instead")
+
+        bundles = split_bundles(candidate_sizes, budget)
+        for number, bundle in enumerate(bundles, start=1):
+            part_candidates = [candidates_info[i] for i in bundle]
+            await queue(
+                f"{subject} (Part {number} of {len(bundles)})",
+                part_candidates,
+                attachments_for(part_candidates),
+            )
+        logger.info(f"Placement email for {len(candidates_info)} candidates split into {len(bundles)} parts")
+        return True
+
+    async def _documents_to_attach(
+        self, candidate_ids: List[int], document_ids: Optional[List[int]]
+    ) -> Dict[int, List[CandidateDocument]]:
+        """Selected documents, or each candidate's latest resume, grouped by candidate"""
+        query = select(CandidateDocument).where(CandidateDocument.candidate_id.in_(candidate_ids))
+        if document_ids:
+            query = query.where(CandidateDocument.id.in_(document_ids)).order_by(CandidateDocument.id)
         else:
-            if is_bulk:
-                profiles_text = "\n".join([f"- {c.name} ({c.email})" for c in candidates_info])
-                message_body = f"""
+            # Default: latest resume only
+            query = query.where(
+                CandidateDocument.document_type == 'resume'
+            ).order_by(
+                CandidateDocument.candidate_id, CandidateDocument.created_at.desc()
+            ).distinct(CandidateDocument.candidate_id)
+        result = await self.db.execute(query)
+
+        documents: Dict[int, List[CandidateDocument]] = {}
+        for doc in result.scalars().all():
+            documents.setdefault(doc.candidate_id, []).append(doc)
+        return documents
+
+    @staticmethod
+    def _compose_body(
+        recipient_name: str,
+        job_role: JobRole,
+        candidates: List[Candidate],
+        is_bulk: bool,
+        sender_name: Optional[str],
+        archived: bool = False,
+    ) -> str:
+        attached = "the attached archive" if archived else "the attached documents"
+        if is_bulk:
+            profiles_text = "\n".join([f"- {c.name} ({c.email})" for c in candidates])
+            return f"""
 Dear {recipient_name},
 
 I hope this email finds you well.
@@ -170,52 +279,27 @@ We are pleased to share the profiles of the following candidates for the {job_ro
 
 {profiles_text}
 
-Please find the attached documents for your review. We look forward to your feedback and scheduling the next steps.
+Please find {attached} for your review. We look forward to your feedback and scheduling the next steps.
 
 Best regards,
-{email_config.sender_name or 'WinVinaya Placement Team'}
+{sender_name or 'WinVinaya Placement Team'}
                 """
-            else:
-                c = candidates_info[0]
-                message_body = f"""
+
+        c = candidates[0]
+        return f"""
 Dear {recipient_name},
 
 I hope this email finds you well.
 
-We are pleased to share the profile of {c.name} for the {job_role.title} position at your organization. 
+We are pleased to share the profile of {c.name} for the {job_role.title} position at your organization.
 
 Candidate Summary:
 - Name: {c.name}
 - Email: {c.email}
 - Phone: {c.phone}
 
-Please find the attached documents for your review. We look forward to your feedback and scheduling the next steps.
+Please find {attached} for your review. We look forward to your feedback and scheduling the next steps.
 
 Best regards,
-{email_config.sender_name or 'WinVinaya Placement Team'}
+{sender_name or 'WinVinaya Placement Team'}
                 """
-
-        msg.attach(MIMEText(message_body, 'plain'))
-
-        # 6. Send via SMTP
-        return await self._send_smtp_message(email_config, msg)
-
-    async def _send_smtp_message(self, email_config: Any, msg: MIMEMultipart) -> bool:
-        """Private helper for SMTP transmission"""
-        try:
-            if email_config.encryption == "ssl":
-                smtp_client = smtplib.SMTP_SSL(email_config.smtp_server, email_config.smtp_port, timeout=30)
-            else:
-                smtp_client = smtplib.SMTP(email_config.smtp_server, email_config.smtp_port, timeout=30)
-                smtp_client.ehlo()
-                if email_config.encryption == "tls":
-                    smtp_client.starttls()
-                    smtp_client.ehlo()
-            
-            smtp_client.login(email_config.smtp_username, email_config.smtp_password)
-            smtp_client.send_message(msg)
-            smtp_client.quit()
-            return True
-        except Exception as e:
-            logger.error(f"Failed to send placement email: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Email sending failed: {str(e)}")
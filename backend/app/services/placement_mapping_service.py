@@ -10,6 +10,7 @@ from app.models.candidate import Candidate
 from app.repositories.placement_mapping_repository import PlacementMappingRepository
 from app.repositories.job_role_repository import JobRoleRepository
 from app.repositories.candidate_repository import CandidateRepository
+from app.utils.fieldsets import FieldSelection
 from app.schemas.placement_mapping import (
     PlacementMappingCreate, 
     CandidateMatchResult, 
@@ -28,14 +29,16 @@ class PlacementMappingService:
         self.job_role_repo = JobRoleRepository(db)
         self.candidate_repo = CandidateRepository(db)
 
-    async def get_mapped_candidates(self, job_role_public_id: UUID) -> List[PlacementMapping]:
+    async def get_mapped_candidates(
+        self, job_role_public_id: UUID, fields: Optional[FieldSelection] = None
+    ) -> List[PlacementMapping]:
         job_role = await self.job_role_repo.get_by_public_id(job_role_public_id)
         if not job_role:
             raise HTTPException(status_code=404, detail="Job role not found")
-        return await self.repository.get_by_job_role_active(job_role.id)
+        return await self.repository.get_by_job_role_active(job_role.id, fields=fields)
 
-    async def get_all_mapped_candidates(self) -> List[PlacementMapping]:
-        return await self.repository.get_all_active()
+    async def get_all_mapped_candidates(self, fields: Optional[FieldSelection] = None) -> List[PlacementMapping]:
+        return await self.repository.get_all_active(fields=fields)
 
     async def map_candidate(self, mapping_in: PlacementMappingCreate, user_id: int) -> PlacementMapping:
         # Check if already mapped
@@ -0,0 +1,180 @@
+"""Pooled SMTP connections and per-provider send rate limits
+
+Opening an SMTP session costs a TCP connect, a TLS handshake and an AUTH round
+trip, which is most of the time spent handing over a typical message. The pool
+keeps authenticated connections open per (host, port, user) and reuses them
+for the next message, up to SMTP_POOL_MAX_MESSAGES_PER_CONNECTION, closing
+them after SMTP_POOL_IDLE_SECONDS of inactivity.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import aiosmtplib
+from loguru import logger
+
+from app.core.metrics import EMAIL_SMTP_CONNECTIONS_TOTAL
+
+
+# Reused connections idle longer than this are checked with NOOP before use
+_PING_AFTER_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class SMTPTransport:
+    """How to reach and authenticate against one SMTP account"""
+    host: str
+    port: int
+    username: Optional[str]
+    password: Optional[str] = field(repr=False, default=None)
+    encryption: str = "tls"  # ssl (implicit TLS), tls (STARTTLS) or none
+    from_email: str = ""
+    from_name: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[str, int, Optional[str]]:
+        return (self.host, self.port, self.username)
+
+    @property
+    def sender(self) -> str:
+        return f"{self.from_name} <{self.from_email}>" if self.from_name else self.from_email
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per ``per`` seconds, with bursts up to ``rate``"""
+
+    def __init__(self, rate: int, per: float = 60.0) -> None:
+        self.capacity = float(max(rate, 1))
+        self.fill_rate = self.capacity / per
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.fill_rate)
+                self._refill()
+            self.tokens -= 1
+
+
+@dataclass
+class _Connection:
+    client: aiosmtplib.SMTP
+    messages: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+
+
+async def open_connection(transport: SMTPTransport, timeout: float) -> aiosmtplib.SMTP:
+    """Connect, negotiate TLS and log in"""
+    client = aiosmtplib.SMTP(
+        hostname=transport.host,
+        port=transport.port,
+        username=transport.username or None,
+        password=transport.password or None,
+        use_tls=transport.encryption == "ssl",
+        start_tls=transport.encryption == "tls",
+        timeout=timeout,
+    )
+    await client.connect()
+    return client
+
+
+class SMTPConnectionPool:
+    """Authenticated SMTP connections kept open per (host, port, user)"""
+
+    def __init__(
+        self,
+        max_connections: int,
+        idle_seconds: float,
+        max_messages: int,
+        timeout: float,
+        connect: Optional[Callable[[SMTPTransport, float], Awaitable[aiosmtplib.SMTP]]] = None,
+    ) -> None:
+        self.max_connections = max_connections
+        self.idle_seconds = idle_seconds
+        self.max_messages = max_messages
+        self.timeout = timeout
+        self._connect = connect or open_connection
+        self._idle: Dict[tuple, List[_Connection]] = {}
+        self._slots: Dict[tuple, asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def connection(self, transport: SMTPTransport) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Borrow a connection for one message. It goes back to the pool when the
+        block succeeds and is closed when it raises, since the session state
+        is then unknown.
+        """
+        slot = self._slots.setdefault(transport.key, asyncio.Semaphore(self.max_connections))
+        async with slot:
+            conn = await self._checkout(transport)
+            try:
+                yield conn.client
+            except BaseException:
+                await self._close(conn)
+                raise
+            conn.messages += 1
+            conn.last_used = time.monotonic()
+            if conn.messages >= self.max_messages:
+                await self._close(conn)
+            else:
+                self._idle.setdefault(transport.key, []).append(conn)
+
+    async def _checkout(self, transport: SMTPTransport) -> _Connection:
+        idle = self._idle.get(transport.key, [])
+        while idle:
+            conn = idle.pop()
+            age = time.monotonic() - conn.last_used
+            if age > self.idle_seconds or not conn.client.is_connected:
+                await self._close(conn)
+                continue
+            if age > _PING_AFTER_SECONDS:
+                try:
+                    await conn.client.noop()
+                except aiosmtplib.SMTPException:
+                    await self._close(conn)
+                    continue
+            return conn
+
+        client = await self._connect(transport, self.timeout)
+        EMAIL_SMTP_CONNECTIONS_TOTAL.labels(provider=transport.host).inc()
+        return _Connection(client=client)
+
+    async def _close(self, conn: _Connection) -> None:
+        try:
+            if conn.client.is_connected:
+                await conn.client.quit()
+        except Exception:
+            conn.client.close()
+
+    async def close_idle(self) -> int:
+        """Close connections idle past the timeout; returns how many were closed"""
+        now = time.monotonic()
+        closed = 0
+        for key, idle in list(self._idle.items()):
+            keep = []
+            for conn in idle:
+                if now - conn.last_used > self.idle_seconds:
+                    await self._close(conn)
+                    closed += 1
+                else:
+                    keep.append(conn)
+            self._idle[key] = keep
+        return closed
+
+    async def close_all(self) -> None:
+        for idle in self._idle.values():
+            for conn in idle:
+                await self._close(conn)
+        self._idle.clear()
+        logger.debug("SMTP connection pool closed")
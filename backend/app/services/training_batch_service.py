@@ -230,124 +230,4 @@ class TrainingBatchService:
 
     async def get_stats(self) -> dict:
         """Get balanced training statistics where candidates are counted in non-overlapping buckets"""
-        from sqlalchemy import func, select, and_, distinct, or_
-        from app.models.training_candidate_allocation import TrainingCandidateAllocation
-        from app.models.candidate import Candidate
-        from app.models.candidate_counseling import CandidateCounseling
-        
-        # 1. Batch Statistics
-        batch_query = select(self.repository.model).where(self.repository.model.is_deleted == False)
-        result = await self.db.execute(batch_query)
-        batches = result.scalars().all()
-        
-        batch_stats = {
-            "total": len(batches),
-            "planned": sum(1 for b in batches if b.status == "planned"),
-            "running": sum(1 for b in batches if b.status == "running"),
-            "completed": sum(1 for b in batches if b.status == "closed"),
-        }
-        
-        # 2. Candidate Statistics - Hierarchical and Non-Overlapping
-        
-        # Step A: Total Selected Candidates
-        total_selected_query = select(func.count(Candidate.id)).join(
-            CandidateCounseling, Candidate.id == CandidateCounseling.candidate_id
-        ).where(
-            and_(
-                Candidate.is_deleted == False,
-                func.lower(CandidateCounseling.status) == "selected",
-                or_(
-                    Candidate.other.is_(None),
-                    Candidate.other['registration_type'].as_string() == 'Registered'
-                )
-            )
-        )
-        total_selected = (await self.db.execute(total_selected_query)).scalar() or 0
-
-        # Step B: Identify Candidates in each category (Non-overlapping)
-        # Priority 1: Currently in Training (Active batches)
-        active_batch_ids = [b.id for b in batches if b.status in ['planned', 'running', 'extended']]
-        in_training_ids = set()
-        if active_batch_ids:
-            it_query = select(distinct(TrainingCandidateAllocation.candidate_id)).join(
-                Candidate, TrainingCandidateAllocation.candidate_id == Candidate.id
-            ).where(
-                and_(
-                    TrainingCandidateAllocation.batch_id.in_(active_batch_ids),
-                    TrainingCandidateAllocation.is_deleted == False,
-                    TrainingCandidateAllocation.is_dropout == False,
-                    or_(
-                        Candidate.other.is_(None),
-                        Candidate.other['registration_type'].as_string() == 'Registered'
-                    )
-                )
-            )
-            in_training_ids = set((await self.db.execute(it_query)).scalars().all())
-
-        # Priority 2: Moved to Placement (Not in training, but has moved_to_placement status)
-        moved_query = select(distinct(TrainingCandidateAllocation.candidate_id)).join(
-            Candidate, TrainingCandidateAllocation.candidate_id == Candidate.id
-        ).where(
-            and_(
-                TrainingCandidateAllocation.status == 'moved_to_placement',
-                TrainingCandidateAllocation.is_deleted == False,
-                or_(
-                    Candidate.other.is_(None),
-                    Candidate.other['registration_type'].as_string() == 'Registered'
-                ),
-                ~TrainingCandidateAllocation.candidate_id.in_(in_training_ids) if in_training_ids else True
-            )
-        )
-        moved_ids = set((await self.db.execute(moved_query)).scalars().all())
-
-        # Priority 3: Completed (Not in training/moved, but has completed status)
-        excluded_ids = in_training_ids | moved_ids
-        completed_query = select(distinct(TrainingCandidateAllocation.candidate_id)).join(
-            Candidate, TrainingCandidateAllocation.candidate_id == Candidate.id
-        ).where(
-            and_(
-                TrainingCandidateAllocation.status == 'completed',
-                TrainingCandidateAllocation.is_deleted == False,
-                or_(
-                    Candidate.other.is_(None),
-                    Candidate.other['registration_type'].as_string() == 'Registered'
-                ),
-                ~TrainingCandidateAllocation.candidate_id.in_(excluded_ids) if excluded_ids else True
-            )
-        )
-        completed_ids = set((await self.db.execute(completed_query)).scalars().all())
-
-        # Priority 4: Dropped Out (Not in any of the above, but marked as dropout)
-        excluded_ids = excluded_ids | completed_ids
-        dropped_query = select(distinct(TrainingCandidateAllocation.candidate_id)).join(
-            Candidate, TrainingCandidateAllocation.candidate_id == Candidate.id
-        ).where(
-            and_(
-                TrainingCandidateAllocation.is_dropout == True,
-                TrainingCandidateAllocation.is_deleted == False,
-                or_(
-                    Candidate.other.is_(None),
-                    Candidate.other['registration_type'].as_string() == 'Registered'
-                ),
-                ~TrainingCandidateAllocation.candidate_id.in_(excluded_ids) if excluded_ids else True
-            )
-        )
-        dropped_ids = set((await self.db.execute(dropped_query)).scalars().all())
-
-        # Priority 5: Ready (Selected but not in any of the above)
-        # We calculate this as: Total Selected - (In Training + Moved + Completed + Dropped)
-        # This ensures the sum is always equal to total_selected
-        ever_allocated_count = len(in_training_ids | moved_ids | completed_ids | dropped_ids)
-        ready_count = max(0, total_selected - ever_allocated_count)
-
-        return {
-            **batch_stats,
-            "total_selected": total_selected,
-            "in_training": len(in_training_ids),
-            "moved_to_placement": len(moved_ids),
-            "completed_candidates": len(completed_ids),
-            "completed_training": len(moved_ids | completed_ids), # Traditional 'Graduates' count
-            "dropped_out": len(dropped_ids),
-            "ready_for_training": ready_count,
-            "women": sum(1 for b in batches if b.disability_types and "Women" in b.disability_types)
-        }
+        return await self.repository.get_stats()
@@ -7,8 +7,6 @@ from fastapi import HTTPException
 from sqlalchemy import select, and_, or_, func, desc
 from sqlalchemy.orm import selectinload, joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
-from openpyxl import Workbook
-from openpyxl.styles import Font
 
 from app.models.training_candidate_allocation import TrainingCandidateAllocation
 from app.models.candidate import Candidate
@@ -20,6 +18,7 @@ from app.repositories.training_batch_repository import TrainingBatchRepository
 from app.repositories.candidate_repository import CandidateRepository
 from app.models.user import User
 from app.utils.email import send_email, send_export_email
+from app.utils.fieldsets import FieldSelection
 
 
 class TrainingCandidateAllocationService:
@@ -440,7 +439,8 @@ class TrainingCandidateAllocationService:
         disability_types: Optional[str] = None,
         batch_tag: Optional[str] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        fields: Optional[FieldSelection] = None
     ) -> tuple[List[TrainingCandidateAllocation], int]:
         """Global retrieval with expert filtering and metrics aggregation for reports"""
         return await self.repository.get_multi(
@@ -454,7 +454,8 @@ class TrainingCandidateAllocationService:
             disability_types=disability_types,
             batch_tag=batch_tag,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            fields=fields
         )
 
     async def export_allocations(
@@ -511,6 +512,9 @@ class TrainingCandidateAllocationService:
             ]
 
         # 3. Generate Excel
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Training Allocations Report"
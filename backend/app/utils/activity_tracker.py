@@ -2,11 +2,13 @@
 
 import uuid
 from typing import Optional, Any, Dict
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timezone
 from fastapi import Request
+from pydantic import BaseModel as PydanticBaseModel
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.activity_log import ActionType
-from app.services.activity_log_service import ActivityLogService
+from app.services.activity_log_pipeline import activity_log_pipeline
 
 
 def get_client_ip(request: Request) -> Optional[str]:
@@ -33,13 +35,54 @@ def get_user_agent(request: Request) -> Optional[str]:
     return request.headers.get("User-Agent")
 
 
+SENSITIVE_FIELDS = {'password', 'hashed_password', 'token', 'secret', 'api_key'}
+
+
+def _json_safe(value: Any) -> Any:
+    """Convert non-serializable scalar types to strings"""
+    if isinstance(value, (uuid.UUID, datetime, date, time)):
+        return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+    return value
+
+
+def _snapshot(obj: Any) -> Dict[str, Any]:
+    """
+    Cheap field snapshot of a dict, Pydantic model or ORM instance.
+
+    ORM instances are read from their loaded column state only, so taking a
+    snapshot never triggers lazy loads or walks relationships. Pydantic models
+    only contribute fields that were explicitly set.
+    """
+    if obj is None:
+        return {}
+    if isinstance(obj, dict):
+        return obj
+    if isinstance(obj, PydanticBaseModel):
+        return obj.model_dump(exclude_unset=True)
+
+    state = sa_inspect(obj, raiseerr=False)
+    if state is not None and hasattr(state, "mapper"):
+        loaded = state.dict
+        return {
+            attr.key: loaded[attr.key]
+            for attr in state.mapper.column_attrs
+            if attr.key in loaded
+        }
+
+    if hasattr(obj, 'dict'):
+        return obj.dict()
+    if hasattr(obj, '__dict__'):
+        return {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
+    return {}
+
+
 def get_changes(before: Any, after: Any) -> Optional[Dict[str, Any]]:
     """
     Compute changes between before and after objects
     
     Args:
-        before: Object before changes (can be dict or Pydantic model)
-        after: Object after changes (can be dict or Pydantic model)
+        before: Object before changes (can be dict, Pydantic model or ORM instance)
+        after: Object after changes (can be dict, Pydantic model or ORM instance)
         
     Returns:
         Dictionary with 'before' and 'after' keys containing changed fields only
@@ -47,46 +90,27 @@ def get_changes(before: Any, after: Any) -> Optional[Dict[str, Any]]:
     if before is None and after is None:
         return None
     
-    # Convert to dict if needed
-    if hasattr(before, 'dict'):
-        before_dict = before.dict()
-    elif hasattr(before, '__dict__'):
-        before_dict = {k: v for k, v in before.__dict__.items() if not k.startswith('_')}
-    else:
-        before_dict = before or {}
-    
-    if hasattr(after, 'dict'):
-        after_dict = after.dict()
-    elif hasattr(after, '__dict__'):
-        after_dict = {k: v for k, v in after.__dict__.items() if not k.startswith('_')}
-    else:
-        after_dict = after or {}
+    # The same instance updated in place has no observable before/after difference
+    if before is after:
+        return None
     
-    # Filter out sensitive fields
-    sensitive_fields = {'password', 'hashed_password', 'token', 'secret', 'api_key'}
+    before_dict = _snapshot(before)
+    after_dict = _snapshot(after)
     
     before_filtered = {}
     after_filtered = {}
     
-    # Find changed fields
-    all_keys = set(before_dict.keys()) | set(after_dict.keys())
-    for key in all_keys:
-        if key in sensitive_fields:
+    # Compare field by field; only changed values are serialized
+    for key in before_dict.keys() | after_dict.keys():
+        if key in SENSITIVE_FIELDS:
             continue
         
         before_val = before_dict.get(key)
         after_val = after_dict.get(key)
         
-        # Only include if values are different
         if before_val != after_val:
-            # Convert non-serializable types to strings
-            if isinstance(before_val, (uuid.UUID, datetime, date, time)):
-                before_val = before_val.isoformat() if hasattr(before_val, 'isoformat') else str(before_val)
-            if isinstance(after_val, (uuid.UUID, datetime, date, time)):
-                after_val = after_val.isoformat() if hasattr(after_val, 'isoformat') else str(after_val)
-                
-            before_filtered[key] = before_val
-            after_filtered[key] = after_val
+            before_filtered[key] = _json_safe(before_val)
+            after_filtered[key] = _json_safe(after_val)
     
     if not before_filtered and not after_filtered:
         return None
@@ -102,7 +126,7 @@ def extract_safe_metadata(obj: Any) -> Optional[Dict[str, Any]]:
     Extract safe metadata from an object, filtering sensitive fields
     
     Args:
-        obj: Object to extract metadata from (can be dict or Pydantic model)
+        obj: Object to extract metadata from (can be dict, Pydantic model or ORM instance)
         
     Returns:
         Dictionary with safe fields only, or None if no safe fields exist
@@ -110,31 +134,44 @@ def extract_safe_metadata(obj: Any) -> Optional[Dict[str, Any]]:
     if obj is None:
         return None
     
-    # Convert to dict if needed
-    if hasattr(obj, 'dict'):
-        obj_dict = obj.dict()
-    elif hasattr(obj, '__dict__'):
-        obj_dict = {k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
-    else:
-        obj_dict = obj if isinstance(obj, dict) else {}
-    
-    # Filter out sensitive fields
-    sensitive_fields = {'password', 'hashed_password', 'token', 'secret', 'api_key'}
-    filtered = {}
-    
-    for k, v in obj_dict.items():
-        if k in sensitive_fields:
-            continue
-        
-        # Convert non-serializable types to strings for JSON serialization
-        if isinstance(v, (datetime, date, time, uuid.UUID)):
-            filtered[k] = v.isoformat() if hasattr(v, 'isoformat') else str(v)
-        else:
-            filtered[k] = v
+    filtered = {
+        k: _json_safe(v)
+        for k, v in _snapshot(obj).items()
+        if k not in SENSITIVE_FIELDS
+    }
     
     return filtered if filtered else None
 
 
+async def _record(
+    db: AsyncSession,
+    request: Request,
+    *,
+    user_id: Optional[int],
+    action_type: ActionType,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[int] = None,
+    changes: Optional[dict] = None,
+    status_code: Optional[int] = None,
+) -> None:
+    """Capture the request context now and hand the row to the audit pipeline"""
+    now = datetime.now(timezone.utc)
+    await activity_log_pipeline.submit(db, {
+        "user_id": user_id,
+        "action_type": action_type,
+        "endpoint": request.url.path,
+        "method": request.method,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "changes": changes,
+        "ip_address": get_client_ip(request),
+        "user_agent": get_user_agent(request),
+        "status_code": status_code,
+        "created_at": now,
+        "updated_at": now,
+        "is_deleted": False,
+    })
+
 
 async def log_create(
     db: AsyncSession,
@@ -146,23 +183,19 @@ async def log_create(
     status_code: int = 201
 ) -> None:
     """Log a CREATE action with complete object metadata"""
-    activity_service = ActivityLogService(db)
-    
     # Extract metadata from created object for complete audit trail
     metadata = None
     if created_object:
         metadata = extract_safe_metadata(created_object)
     
-    await activity_service.log_activity(
+    await _record(
+        db,
+        request,
         user_id=user_id,
         action_type=ActionType.CREATE,
-        endpoint=str(request.url.path),
-        method=request.method,
         resource_type=resource_type,
         resource_id=resource_id,
         changes=metadata,
-        ip_address=get_client_ip(request),
-        user_agent=get_user_agent(request),
         status_code=status_code,
     )
 
@@ -178,19 +211,16 @@ async def log_update(
     status_code: int = 200
 ) -> None:
     """Log an UPDATE action with before/after changes"""
-    activity_service = ActivityLogService(db)
     changes = get_changes(before, after)
     
-    await activity_service.log_activity(
+    await _record(
+        db,
+        request,
         user_id=user_id,
         action_type=ActionType.UPDATE,
-        endpoint=str(request.url.path),
-        method=request.method,
         resource_type=resource_type,
         resource_id=resource_id,
         changes=changes,
-        ip_address=get_client_ip(request),
-        user_agent=get_user_agent(request),
         status_code=status_code,
     )
 
@@ -204,24 +234,20 @@ async def log_delete(
     status_code: int = 204
 ) -> None:
     """Log a DELETE action with a descriptive message"""
-    activity_service = ActivityLogService(db)
-    
     # Create a simple descriptive message
     metadata = {
         "message": f"{resource_type.capitalize()} deleted",
         "resource_id": resource_id
     }
     
-    await activity_service.log_activity(
+    await _record(
+        db,
+        request,
         user_id=user_id,
         action_type=ActionType.DELETE,
-        endpoint=str(request.url.path),
-        method=request.method,
         resource_type=resource_type,
         resource_id=resource_id,
         changes=metadata,
-        ip_address=get_client_ip(request),
-        user_agent=get_user_agent(request),
         status_code=status_code,
     )
 
@@ -235,16 +261,13 @@ async def log_read(
     status_code: int = 200
 ) -> None:
     """Log a READ action (for sensitive data)"""
-    activity_service = ActivityLogService(db)
-    await activity_service.log_activity(
+    await _record(
+        db,
+        request,
         user_id=user_id,
         action_type=ActionType.READ,
-        endpoint=str(request.url.path),
-        method=request.method,
         resource_type=resource_type,
         resource_id=resource_id,
-        ip_address=get_client_ip(request),
-        user_agent=get_user_agent(request),
         status_code=status_code,
     )
 
@@ -256,23 +279,19 @@ async def log_login(
     status_code: int = 200
 ) -> None:
     """Log a LOGIN action with descriptive message"""
-    activity_service = ActivityLogService(db)
-    
     # Create a simple descriptive message
     metadata = {
         "message": "User logged in successfully",
         "status": "success" if status_code == 200 else "failed"
     }
     
-    await activity_service.log_activity(
+    await _record(
+        db,
+        request,
         user_id=user_id,
         action_type=ActionType.LOGIN,
-        endpoint=str(request.url.path),
-        method=request.method,
         resource_type="auth",
         changes=metadata,
-        ip_address=get_client_ip(request),
-        user_agent=get_user_agent(request),
         status_code=status_code,
     )
 
@@ -284,21 +303,17 @@ async def log_logout(
     status_code: int = 200
 ) -> None:
     """Log a LOGOUT action with descriptive message"""
-    activity_service = ActivityLogService(db)
-    
     # Create a simple descriptive message
     metadata = {
         "message": "User logged out",
     }
     
-    await activity_service.log_activity(
+    await _record(
+        db,
+        request,
         user_id=user_id,
         action_type=ActionType.LOGOUT,
-        endpoint=str(request.url.path),
-        method=request.method,
         resource_type="auth",
         changes=metadata,
-        ip_address=get_client_ip(request),
-        user_agent=get_user_agent(request),
         status_code=status_code,
     )
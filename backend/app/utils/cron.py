@@ -0,0 +1,105 @@
+"""Five-field cron expressions (minute hour day-of-month month day-of-week)
+
+Supports ``*``, lists (``1,15``), ranges (``1-5``), steps (``*/15``, ``0-30/10``)
+and day-of-week 0-7 with both 0 and 7 meaning Sunday. As in cron, when both
+day fields are restricted a day matches if either of them does.
+Times are naive wall-clock values in whatever zone the caller works in.
+"""
+
+from datetime import datetime, timedelta
+from typing import FrozenSet, Optional, Tuple
+
+
+_FIELDS: Tuple[Tuple[str, int, int], ...] = (
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day", 1, 31),
+    ("month", 1, 12),
+    ("weekday", 0, 7),
+)
+
+
+def _parse_field(spec: str, name: str, low: int, high: int) -> FrozenSet[int]:
+    values = set()
+    for part in spec.split(","):
+        base, _, step_text = part.partition("/")
+        step = int(step_text) if step_text else 1
+        if step < 1:
+            raise ValueError(f"Invalid step in {name} field: {part!r}")
+        if base == "*":
+            start, end = low, high
+        elif "-" in base:
+            start_text, end_text = base.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(base)
+            end = high if step_text else start
+        if not low <= start <= end <= high:
+            raise ValueError(f"{name} field {part!r} is outside {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    """A parsed cron schedule"""
+
+    def __init__(self, expression: str) -> None:
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {len(parts)}: {expression!r}")
+        self.expression = expression
+        fields = [
+            _parse_field(spec, name, low, high)
+            for spec, (name, low, high) in zip(parts, _FIELDS)
+        ]
+        self.minutes, self.hours, self.days, self.months, weekdays = fields
+        # Cron counts Sunday as 0 (or 7); Python's weekday() counts Monday as 0
+        self.weekdays = frozenset((day - 1) % 7 for day in weekdays)
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.expression!r})"
+
+    def _day_matches(self, value: datetime) -> bool:
+        in_days = value.day in self.days
+        in_weekdays = value.weekday() in self.weekdays
+        if self._any_day or self._any_weekday:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def matches(self, value: datetime) -> bool:
+        return (
+            value.minute in self.minutes
+            and value.hour in self.hours
+            and value.month in self.months
+            and self._day_matches(value)
+        )
+
+    def next_after(self, value: datetime) -> datetime:
+        """First matching minute strictly after ``value``"""
+        current = value.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = current + timedelta(days=366 * 5)
+        while current < limit:
+            if current.month not in self.months:
+                year, month = divmod(current.month, 12)
+                current = current.replace(year=current.year + year, month=month + 1, day=1, hour=0, minute=0)
+            elif not self._day_matches(current):
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+            elif current.hour not in self.hours:
+                current = current.replace(minute=0) + timedelta(hours=1)
+            elif current.minute not in self.minutes:
+                current += timedelta(minutes=1)
+            else:
+                return current
+        raise ValueError(f"{self.expression!r} never matches")
+
+    def latest_before(self, value: datetime, window: timedelta) -> Optional[datetime]:
+        """Most recent matching minute at or before ``value``, if within ``window``"""
+        current = value.replace(second=0, microsecond=0)
+        earliest = value - window
+        while current >= earliest:
+            if self.matches(current):
+                return current
+            current -= timedelta(minutes=1)
+        return None
@@ -0,0 +1,90 @@
+"""
+Plain-text extraction from PDF and DOCX bytes.
+
+Kept free of application imports so it is cheap to load in the extraction
+worker processes (see app.services.document_text_service).
+"""
+
+import io
+import re
+import zipfile
+from typing import Tuple
+from xml.etree import ElementTree
+
+
+PDF = "pdf"
+DOCX = "docx"
+TEXT = "text"
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def detect_kind(data: bytes) -> str:
+    """Identify a document by its leading bytes rather than its filename"""
+    if data[:5] == b"%PDF-":
+        return PDF
+    if data[:4] == b"PK\x03\x04":
+        try:
+            with zipfile.ZipFile(io.BytesIO(data)) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return DOCX
+        except zipfile.BadZipFile:
+            pass
+        raise ValueError("Unsupported archive; only .docx documents can be read.")
+    try:
+        data[:4096].decode("utf-8")
+    except UnicodeDecodeError:
+        raise ValueError("Unsupported document type; upload a PDF, DOCX or text file.")
+    return TEXT
+
+
+def _pdf_text(data: bytes, max_pages: int) -> Tuple[str, int, bool]:
+    import PyPDF2
+
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    total = len(reader.pages)
+    pages = []
+    for page in reader.pages[:max_pages]:
+        pages.append(page.extract_text() or "")
+    return "\n".join(pages), total, total > max_pages
+
+
+def _docx_text(data: bytes) -> Tuple[str, int, bool]:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        root = ElementTree.fromstring(archive.read("word/document.xml"))
+    paragraphs = []
+    for paragraph in root.iter(f"{_WORD_NS}p"):
+        parts = []
+        for node in paragraph.iter():
+            if node.tag == f"{_WORD_NS}t" and node.text:
+                parts.append(node.text)
+            elif node.tag == f"{_WORD_NS}tab":
+                parts.append("\t")
+            elif node.tag in (f"{_WORD_NS}br", f"{_WORD_NS}cr"):
+                parts.append("\n")
+        paragraphs.append("".join(parts))
+    # DOCX has no fixed pagination; report one logical page
+    return "\n".join(paragraphs), 1, False
+
+
+def extract_text(data: bytes, max_pages: int) -> dict:
+    """
+    Extract text from a document. Runs inside a worker process, so it only
+    takes and returns picklable values.
+    """
+    kind = detect_kind(data)
+    if kind == PDF:
+        text, page_count, truncated = _pdf_text(data, max_pages)
+    elif kind == DOCX:
+        text, page_count, truncated = _docx_text(data)
+    else:
+        text, page_count, truncated = data.decode("utf-8", errors="replace"), 1, False
+
+    # Collapse runs of blank lines left by PDF layout
+    text = re.sub(r"\n{3,}", "\n\n", text).replace("\x00", "").strip()
+    return {
+        "kind": kind,
+        "text": text,
+        "page_count": page_count,
+        "truncated": truncated,
+    }
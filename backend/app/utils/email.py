@@ -2,14 +2,11 @@
 
 import logging
 import os
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.application import MIMEApplication
 from typing import List, Optional, Any, Tuple
-import aiosmtplib
 from datetime import datetime
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from app.core.config import settings
+from app.services.email_outbox_service import enqueue_email
 
 logger = logging.getLogger(__name__)
 
@@ -26,68 +23,27 @@ async def send_email(
     subject: str,
     html_content: str,
     cc: Optional[List[str]] = None,
-    attachments: Optional[List[Tuple[str, bytes]]] = None
+    attachments: Optional[List[Tuple[str, bytes]]] = None,
+    category: str = "system",
 ) -> bool:
-    """Generic function to send HTML emails via SMTP"""
-    
-    # Configuration with fallbacks
-    smtp_host = settings.SMTP_HOST or "s.mail25.info"
-    smtp_port = settings.SMTP_PORT or 587
-    smtp_user = settings.SMTP_USER or "no-reply@winvinaya.com"
-    smtp_password = settings.SMTP_PASSWORD or "Admin##2025@"
-    from_email = settings.EMAILS_FROM_EMAIL or "no-reply@winvinaya.com"
-    from_name = settings.EMAILS_FROM_NAME or "winvinaya"
-    smtp_tls = settings.SMTP_TLS if settings.SMTP_TLS is not None else True
-
-    message = MIMEMultipart("mixed")
-    
-    # Create the alternative part for HTML/Text
-    alt_part = MIMEMultipart("alternative")
-    alt_part.attach(MIMEText(html_content, "html"))
-    message.attach(alt_part)
-    
-    message["From"] = f"{from_name} <{from_email}>"
-    message["To"] = to_email
-    message["Subject"] = subject
-    
-    if cc:
-        message["Cc"] = ", ".join(cc)
-
-    # Attach files if provided
-    if attachments:
-        for filename, content in attachments:
-            part = MIMEApplication(content)
-            part.add_header("Content-Disposition", f"attachment; filename=\"{filename}\"")
-            message.attach(part)
-
-    # Determine TLS strategy
-    use_tls_strategy = smtp_tls and smtp_port == 465
-    start_tls_strategy = smtp_tls and smtp_port != 465
-
+    """
+    Queue an HTML email for delivery through the system SMTP account.
+    Returns True once the message is in the outbox; the background dispatcher
+    sends it and retries transient failures.
+    """
     try:
-        # Debug log for credentials (masked)
-        pass_hint = f"{smtp_password[:2]}...{smtp_password[-1]}" if len(smtp_password) > 2 else "***"
-        logger.info(f"Attempting SMTP send: {smtp_host}:{smtp_port} as {smtp_user} (Pass: {pass_hint})")
-        
-        await aiosmtplib.send(
-            message,
-            hostname=smtp_host,
-            port=smtp_port,
-            username=smtp_user,
-            password=smtp_password,
-            use_tls=use_tls_strategy,
-            start_tls=start_tls_strategy,
+        outbox_id = await enqueue_email(
+            to_email,
+            subject,
+            html_body=html_content,
+            cc=cc,
+            attachments=attachments,
+            category=category,
         )
-        logger.info(f"Email sent successfully to {to_email}")
+        logger.info(f"Email to {to_email} queued (outbox id {outbox_id})")
         return True
-    except aiosmtplib.SMTPAuthenticationError as e:
-        logger.error(f"SMTP Authentication failed for {smtp_user} at {smtp_host}: {str(e)}")
-        return False
-    except aiosmtplib.SMTPConnectError as e:
-        logger.error(f"SMTP Connection failed to {smtp_host}:{smtp_port}: {str(e)}")
-        return False
     except Exception as e:
-        logger.error(f"Unexpected error sending email to {to_email}: {str(e)}", exc_info=True)
+        logger.error(f"Failed to queue email to {to_email}: {str(e)}", exc_info=True)
         return False
 
 
@@ -105,7 +61,7 @@ async def send_registration_emails(candidate: Any):
         candidate_subject = "Welcome to WinVinaya - Registration Successful"
         template = jinja_env.get_template("candidate_registration.html")
         candidate_html = template.render(name=candidate.name)
-        await send_email(candidate.email, candidate_subject, candidate_html)
+        await send_email(candidate.email, candidate_subject, candidate_html, category="registration")
         
         # 2. Send to Sourcing Team
         sourcing_team_email = settings.SOURCING_EMAIL
@@ -120,7 +76,7 @@ async def send_registration_emails(candidate: Any):
             
         template = jinja_env.get_template("new_candidate_alert.html")
         team_html = template.render(candidate=candidate, disability_type=disability_type)
-        await send_email(sourcing_team_email, team_subject, team_html)
+        await send_email(sourcing_team_email, team_subject, team_html, category="registration")
         
     except Exception as e:
         logger.error(f"Error in send_registration_emails: {str(e)}")
@@ -175,14 +131,16 @@ async def send_export_email(
         
         attachments = [(filename, file_content)]
         
-        await send_email(
+        queued = await send_email(
             to_email=to_email,
             subject=subject,
             html_content=html_content,
-            attachments=attachments
+            attachments=attachments,
+            category="export",
         )
-        logger.info(f"Export email sent successfully to {to_email} for {report_name}")
-        return True
+        if queued:
+            logger.info(f"Export email queued for {to_email} for {report_name}")
+        return queued
     except Exception as e:
         logger.error(f"Failed to send export email: {str(e)}")
         return False
@@ -203,7 +161,7 @@ async def send_dsr_submission_email(user_name: str, report_date: str, items: Lis
             items=items,
             total_hours=total_hours
         )
-        await send_email(recipient, subject, html_content)
+        await send_email(recipient, subject, html_content, category="dsr_submission")
     except Exception as e:
         logger.error(f"Error in send_dsr_submission_email: {str(e)}")
 
@@ -218,7 +176,7 @@ async def send_consent_form_email(candidate_name: str, candidate_email: str, con
             consent_url=consent_url,
             current_year=datetime.now().year
         )
-        return await send_email(candidate_email, subject, html_content)
+        return await send_email(candidate_email, subject, html_content, category="consent")
     except Exception as e:
         logger.error(f"Error in send_consent_form_email: {str(e)}")
         return False
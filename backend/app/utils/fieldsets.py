@@ -0,0 +1,199 @@
+"""
+Sparse fieldsets for list endpoints (``?fields=`` / ``?view=``).
+
+A list endpoint opts in with a dependency built by ``field_selection``:
+
+    CANDIDATE_FIELDS = field_selection(CandidateListItem, CANDIDATE_LIST_VIEWS)
+
+    @router.get("/", response_model=CandidatePaginatedResponse)
+    async def list_candidates(..., selection = Depends(CANDIDATE_FIELDS)):
+        items, total = ...
+        if selection:
+            return selection.page(items, total=total)
+        return {"items": items, "total": total}
+
+``fields`` is a comma-separated list of the item schema's fields; a dotted
+name (``batch.batch_name``) keeps part of a nested object. ``view`` names a
+predefined set; both may be combined. ``id`` and ``public_id`` are always
+returned when the schema has them, so rows stay addressable.
+
+Items are validated into a schema holding only the selected top-level
+fields, so unselected attributes (and relationships) are never read and
+repositories can skip loading them: they receive the selection and check
+``"candidate" in selection``. Nested objects are still validated with their
+full schema and only trimmed on output. Without ``fields``/``view`` the
+dependency yields None and the endpoint answers as before.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple, Type, get_args, get_origin
+
+from fastapi import HTTPException, Query, Response, status
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import load_only, raiseload
+
+
+ALWAYS_INCLUDED = ("id", "public_id")
+
+
+def _nested_model(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """The pydantic model inside Optional[...] / List[...], and whether it is a list"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    origin = get_origin(annotation)
+    for arg in get_args(annotation):
+        model, is_list = _nested_model(arg)
+        if model is not None:
+            return model, is_list or origin in (list, List)
+    return None, False
+
+
+@lru_cache(maxsize=256)
+def _sparse_model(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    fields = {name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names}
+    return create_model(
+        f"{schema.__name__}Sparse",
+        __config__=ConfigDict(from_attributes=True),
+        **fields,
+    )
+
+
+class FieldSelection:
+    """The fields one request asked for, checked against the item schema"""
+
+    def __init__(self, schema: Type[BaseModel], fields: Mapping[str, Optional[FrozenSet[str]]]):
+        self.schema = schema
+        # top-level name -> nested names kept (None: the whole value)
+        self.fields: Dict[str, Optional[FrozenSet[str]]] = dict(fields)
+        self.model = _sparse_model(schema, tuple(sorted(self.fields)))
+        self._include = self._build_include()
+
+    @classmethod
+    def parse(cls, schema: Type[BaseModel], names: Iterable[str]) -> "FieldSelection":
+        """Build a selection from field names; unknown names are a 400"""
+        fields: Dict[str, Optional[set]] = {name: None for name in ALWAYS_INCLUDED if name in schema.model_fields}
+        unknown = []
+        for raw in names:
+            name = raw.strip()
+            if not name:
+                continue
+            top, _, sub = name.partition(".")
+            field = schema.model_fields.get(top)
+            if field is None:
+                unknown.append(name)
+                continue
+            if not sub:
+                fields[top] = None
+                continue
+            nested, _ = _nested_model(field.annotation)
+            if nested is None or sub not in nested.model_fields:
+                unknown.append(name)
+                continue
+            if top not in fields:
+                fields[top] = set()
+            if fields[top] is not None:
+                fields[top].add(sub)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+        return cls(schema, {name: frozenset(sub) if sub is not None else None for name, sub in fields.items()})
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
+
+    def load_options(self, entity) -> list:
+        """
+        Loader options for a mapped class (or alias) whose rows become the items:
+        load_only() the selected columns (plus primary and foreign keys of the
+        selected relationships) and raiseload() the relationships not selected.
+        """
+        mapper = sa_inspect(entity).mapper
+        columns = set()
+        for attr in mapper.column_attrs:
+            if attr.key in self.fields or any(column.primary_key for column in attr.columns):
+                columns.add(attr.key)
+        options = []
+        for relationship in mapper.relationships:
+            if relationship.key in self.fields:
+                columns.update(mapper.get_property_by_column(column).key for column in relationship.local_columns)
+            else:
+                options.append(raiseload(getattr(entity, relationship.key)))
+        return [load_only(*(getattr(entity, key) for key in sorted(columns)))] + options
+
+    def _build_include(self) -> Optional[dict]:
+        if all(sub is None for sub in self.fields.values()):
+            return None
+        include = {}
+        for name, sub in self.fields.items():
+            if sub is None:
+                include[name] = True
+                continue
+            _, is_list = _nested_model(self.schema.model_fields[name].annotation)
+            nested = {key: True for key in sub}
+            include[name] = {"__all__": nested} if is_list else nested
+        return include
+
+    def _validate(self, items: Iterable[Any]) -> List[BaseModel]:
+        return [self.model.model_validate(item) for item in items]
+
+    def items(self, items: Iterable[Any]) -> Response:
+        """JSON response of the items as a bare list"""
+        adapter = TypeAdapter(List[self.model])
+        include = {"__all__": self._include} if self._include else None
+        return Response(adapter.dump_json(self._validate(items), include=include), media_type="application/json")
+
+    def page(self, items: Iterable[Any], **extra: Any) -> Response:
+        """JSON response of ``{"items": [...], **extra}`` (total, skip, limit, ...)"""
+        page = _page_model(self.model, tuple(sorted(extra)))(items=self._validate(items), **extra)
+        include = {"items": {"__all__": self._include}, **{key: True for key in extra}} if self._include else None
+        return Response(page.model_dump_json(include=include), media_type="application/json")
+
+
+@lru_cache(maxsize=256)
+def _page_model(item_model: Type[BaseModel], extra: Tuple[str, ...]) -> Type[BaseModel]:
+    return create_model(
+        f"{item_model.__name__}Page",
+        items=(List[item_model], ...),
+        **{key: (Any, None) for key in extra},
+    )
+
+
+def field_selection(schema: Type[BaseModel], views: Optional[Mapping[str, Sequence[str]]] = None):
+    """
+    FastAPI dependency reading ``?fields=`` and ``?view=`` for a list endpoint
+    whose items are ``schema``. Yields a FieldSelection, or None when neither
+    parameter is given.
+    """
+    views = dict(views or {})
+    if schema.__pydantic_decorators__.model_validators:
+        # Validators may read or set fields a selection leaves out
+        raise TypeError(f"{schema.__name__} has model validators and cannot be used for sparse fieldsets")
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields to return; 'parent.child' keeps part of a nested object",
+        ),
+        view: Optional[str] = Query(
+            None,
+            description=f"Predefined field set: {', '.join(views) or 'none defined'}",
+        ),
+    ) -> Optional[FieldSelection]:
+        if fields is None and view is None:
+            return None
+        names: List[str] = []
+        if view is not None:
+            if view not in views:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Unknown view '{view}'. Available: {', '.join(views)}",
+                )
+            names.extend(views[view])
+        if fields:
+            names.extend(fields.split(","))
+        return FieldSelection.parse(schema, names)
+
+    return dependency
@@ -0,0 +1,187 @@
+"""Stored file delivery with conditional requests, byte ranges and nginx offload"""
+
+import os
+import stat
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from fastapi import Request
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.core.config import settings
+
+
+# Files the app may hand to nginx; anything else is streamed by the app
+UPLOAD_ROOT = Path("uploads")
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong validator in nginx's format, so it matches what nginx sends in x-accel mode"""
+    return f'"{int(stat_result.st_mtime):x}-{stat_result.st_size:x}"'
+
+
+def content_disposition(disposition: str, filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{filename}"'
+
+
+def is_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """Evaluate If-None-Match, then If-Modified-Since (RFC 9110 precedence)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+    return False
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` range into inclusive (start, end).
+    Returns None when the header is absent or not a single byte range (the
+    whole file is sent), and raises ValueError when it is unsatisfiable.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_text, _, end_text = header[len("bytes="):].strip().partition("-")
+    try:
+        if not start_text:
+            length = int(end_text)
+            if length <= 0:
+                raise ValueError("empty suffix range")
+            return max(size - length, 0), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        return None
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+
+class RangeFileResponse(FileResponse):
+    """
+    FileResponse that honours a single byte range and hands the body to the
+    server with the ASGI zero-copy send extension when the server offers it.
+    """
+
+    def __init__(self, *args, byte_range: Optional[Tuple[int, int]] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.byte_range = byte_range
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        size = self.stat_result.st_size
+        offset, count = 0, size
+        if self.byte_range is not None:
+            start, end = self.byte_range
+            offset, count = start, end - start + 1
+            self.status_code = 206
+            self.headers["content-range"] = f"bytes {start}-{end}/{size}"
+            self.headers["content-length"] = str(count)
+        self.headers["accept-ranges"] = "bytes"
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+            with open(self.path, "rb") as file:
+                await send({"type": ZEROCOPY_EXTENSION, "file": file, "offset": offset, "count": count})
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(offset)
+            remaining = count
+            while remaining:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+def _accel_path(path: Path) -> Optional[str]:
+    """Internal nginx URI for a file under UPLOAD_ROOT, or None if it is elsewhere"""
+    try:
+        relative = path.resolve().relative_to(UPLOAD_ROOT.resolve())
+    except ValueError:
+        return None
+    return settings.FILE_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(relative.as_posix())
+
+
+async def deliver_file(
+    request: Request,
+    path: Path,
+    *,
+    filename: str,
+    media_type: str,
+    disposition: str = "attachment",
+) -> Response:
+    """
+    Respond with a stored file after the caller has authorized access.
+
+    Conditional requests are answered with 304 here. Otherwise, with
+    FILE_DELIVERY_MODE=x-accel the body is left to nginx via X-Accel-Redirect
+    (nginx does sendfile and Range itself); in direct mode the app streams it.
+    """
+    stat_result = await anyio.to_thread.run_sync(os.stat, path)
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise FileNotFoundError(str(path))
+
+    etag = file_etag(stat_result)
+    headers = {
+        "etag": etag,
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        # Documents are private: browsers may cache but must revalidate
+        "cache-control": "private, no-cache",
+    }
+
+    if is_not_modified(request, etag, stat_result.st_mtime):
+        return Response(status_code=304, headers=headers)
+
+    headers["content-disposition"] = content_disposition(disposition, filename)
+
+    if settings.FILE_DELIVERY_MODE == "x-accel":
+        accel_path = _accel_path(path)
+        if accel_path is not None:
+            headers["x-accel-redirect"] = accel_path
+            return Response(media_type=media_type, headers=headers)
+
+    try:
+        byte_range = parse_range(request.headers.get("range"), stat_result.st_size)
+    except ValueError:
+        return Response(
+            status_code=416,
+            headers={"content-range": f"bytes */{stat_result.st_size}"},
+        )
+
+    # If-Range: only honour the range when the client's copy is still current
+    if_range = request.headers.get("if-range")
+    if byte_range is not None and if_range is not None and if_range not in (etag, headers["last-modified"]):
+        byte_range = None
+
+    return RangeFileResponse(
+        path,
+        media_type=media_type,
+        headers=headers,
+        stat_result=stat_result,
+        byte_range=byte_range,
+    )
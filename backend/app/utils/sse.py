@@ -0,0 +1,22 @@
+"""Server-sent events framing
+
+Frames are built as bytes with the orjson encoder, so StreamingResponse
+sends them without a further encode per chunk.
+"""
+
+from typing import Any
+
+from app.core.serialization import dumps
+
+
+KEEPALIVE = b": keepalive\n\n"
+
+
+def format_event(event: str, data: Any) -> bytes:
+    """One SSE frame with a named event and a JSON data line"""
+    return b"event: " + event.encode() + b"\ndata: " + dumps(data) + b"\n\n"
+
+
+def format_data(data: Any) -> bytes:
+    """One unnamed SSE frame (a ``message`` event) with a JSON data line"""
+    return b"data: " + dumps(data) + b"\n\n"
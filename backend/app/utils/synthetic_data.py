@@ -0,0 +1,901 @@
+"""
+Deterministic synthetic data for benchmarks, load tests and scale testing.
+
+``SyntheticDataset`` produces rows (plain dicts ready for ``insert(model)``)
+for the candidate funnel and the tables around it:
+
+* users (one admin, the rest spread over the working roles);
+* candidates with the JSON shapes the API writes, then screenings,
+  counselings and documents for the candidates that got that far;
+* training batches, their timetable periods, allocations and per-period
+  attendance;
+* companies, contacts, job roles and placement mappings;
+* DSR projects, activities and entries with line items;
+* CRM leads and the deals converted from them;
+* AI task logs with their plans and step journals.
+
+Rows carry explicit ids so related rows can reference each other; the
+sequences must be moved past them after loading (``reset_sequences``). The
+same seed and scale always give the same rows, except that dates are laid
+out relative to ``today``. Each table is generated on demand and streamed,
+so large scales do not have to fit in memory; only a few bytes per candidate
+and lead are kept to keep the funnels consistent between tables.
+
+``load`` writes the tables with multi-row INSERTs through any driver;
+``copy_load`` uses binary COPY through asyncpg and is the one to use for
+runs of a million rows and more (scripts/seed_synthetic_data.py).
+
+Every seeded user can sign in with ``PASSWORD``.
+"""
+
+import random
+import uuid
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Type
+
+from sqlalchemy import Table, insert, text
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.models.ai_task_log import AITaskLog, AITaskStatus, AITaskTrigger
+from app.models.base import BaseModel
+from app.models.candidate import Candidate
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.candidate_document import CandidateDocument
+from app.models.candidate_screening import CandidateScreening
+from app.models.company import Company, CompanySize, CompanyStatus
+from app.models.contact import Contact
+from app.models.deal import Deal, DealStage, DealType
+from app.models.dsr_activity import DSRActivity, DSRActivityStatus
+from app.models.dsr_entry import DSREntry, DSRStatus
+from app.models.dsr_project import DSRProject, DSRProjectType
+from app.models.job_role import JobRole, JobRoleStatus
+from app.models.lead import Lead, LeadSource, LeadStatus
+from app.models.placement_mapping import PlacementMapping, PlacementStatus
+from app.models.training_attendance import TrainingAttendance
+from app.models.training_batch import TrainingBatch
+from app.models.training_batch_plan import TrainingBatchPlan
+from app.models.training_candidate_allocation import TrainingCandidateAllocation
+from app.models.user import User, UserRole
+
+
+PASSWORD = "password"
+# bcrypt hash of PASSWORD, so seeding does not pay for hashing per user
+PASSWORD_HASH = "$2b$12$BrnopgrADyTL1s7T3dPc7ecebiCo8ifHRPPQ3qofEgvCrQXpBQZ4W"
+
+FIRST_NAMES = [
+    "Aarav", "Aditi", "Akash", "Ananya", "Arjun", "Bhavna", "Deepak", "Divya", "Gaurav", "Ishita",
+    "Karthik", "Kavya", "Manoj", "Meera", "Nikhil", "Pooja", "Rahul", "Riya", "Sanjay", "Sneha",
+    "Suresh", "Swathi", "Vijay", "Yamini",
+]
+LAST_NAMES = [
+    "Iyer", "Kumar", "Nair", "Patel", "Rao", "Reddy", "Sharma", "Singh", "Menon", "Joshi",
+    "Das", "Gupta", "Pillai", "Verma",
+]
+# (city, district, state, pincode)
+LOCATIONS = [
+    ("Bengaluru", "Bengaluru Urban", "Karnataka", "560001"),
+    ("Mysuru", "Mysuru", "Karnataka", "570001"),
+    ("Chennai", "Chennai", "Tamil Nadu", "600001"),
+    ("Coimbatore", "Coimbatore", "Tamil Nadu", "641001"),
+    ("Hyderabad", "Hyderabad", "Telangana", "500001"),
+    ("Pune", "Pune", "Maharashtra", "411001"),
+    ("Mumbai", "Mumbai City", "Maharashtra", "400001"),
+    ("Kochi", "Ernakulam", "Kerala", "682001"),
+    ("New Delhi", "New Delhi", "Delhi", "110001"),
+    ("Kolkata", "Kolkata", "West Bengal", "700001"),
+]
+DEGREES = [
+    "B.Tech", "B.E", "B.Sc", "B.Com", "B.A", "B.B.A", "B.C.A",
+    "M.Tech", "M.Sc", "M.Com", "M.A", "M.B.A", "M.C.A", "Diploma",
+]
+SPECIALIZATIONS = [
+    "Computer Science", "Information Technology", "Electronics and Communication", "Mechanical Engineering",
+    "Commerce", "Accounting", "Finance", "Marketing", "English", "Economics", "Mathematics", "General",
+]
+COLLEGES = [
+    "Anna University", "Bangalore University", "Madras University", "Osmania University",
+    "Mumbai University", "Delhi University", "VIT University", "SRM University", "Other",
+]
+DISABILITY_TYPES = [
+    "Locomotor Disability",
+    "Hearing Impairment (Deaf and Hard of Hearing)",
+    "Blindness",
+    "Low Vision",
+    "Speech and Language Disability",
+]
+SKILLS = [
+    "MS Excel", "Data Entry", "Tally", "Customer Support", "Python", "Java", "SQL", "Communication",
+    "Typing", "Accounting", "Digital Marketing", "Testing",
+]
+INDUSTRIES = ["IT Services", "Banking", "Retail", "Healthcare", "Manufacturing", "BPO", "Logistics"]
+
+USER_ROLES = [
+    UserRole.SOURCING, UserRole.TRAINER, UserRole.COUNSELOR, UserRole.PLACEMENT,
+    UserRole.PROJECT_COORDINATOR, UserRole.DEVELOPER, UserRole.MANAGER,
+]
+SCREENING_STATUSES = ["Completed", "Completed", "Completed", "In Progress", "Rejected", "Pending", ""]
+COUNSELING_STATUSES = ["selected", "selected", "selected", "rejected", "pending"]
+BATCH_STATUSES = ["planned", "running", "running", "extended", "closed", "closed"]
+ALLOCATION_STATUSES = ["allocated", "in_training", "in_training", "completed", "moved_to_placement", "dropped_out"]
+ATTENDANCE_STATUSES = ["present"] * 8 + ["absent", "late"]
+PLACEMENT_STATUSES = [
+    PlacementStatus.MAPPED, PlacementStatus.MAPPED, PlacementStatus.SHORTLISTED,
+    PlacementStatus.INTERVIEW_L1, PlacementStatus.OFFER_MADE, PlacementStatus.JOINED, PlacementStatus.REJECTED,
+]
+DOCUMENT_TYPES = [
+    ("resume", "application/pdf"),
+    ("disability_certificate", "application/pdf"),
+    ("10th_certificate", "image/jpeg"),
+    ("photo", "image/jpeg"),
+]
+PERIODS = [(time(10, 0), time(11, 30)), (time(12, 0), time(13, 30)), (time(14, 30), time(16, 0))]
+# Leads that did not convert; converted leads are QUALIFIED
+LEAD_STATUSES = [LeadStatus.NEW, LeadStatus.NEW, LeadStatus.CONTACTED, LeadStatus.UNQUALIFIED, LeadStatus.LOST]
+DEAL_STAGES = [
+    DealStage.DISCOVERY, DealStage.QUALIFICATION, DealStage.PROPOSAL, DealStage.NEGOTIATION,
+    DealStage.CLOSED_WON, DealStage.CLOSED_WON, DealStage.CLOSED_LOST,
+]
+SERVICES = ["Inclusive Hiring Drive", "Sensitisation Workshop", "Accessibility Audit", "Campus Partnership"]
+# (task name, trigger, tools it plans)
+AI_TASKS = [
+    ("Process WhatsApp Enquiry", AITaskTrigger.WEBHOOK, ["search_contacts", "create_lead", "send_whatsapp_reply"]),
+    ("Summarise Candidate Profile", AITaskTrigger.MANUAL, ["get_candidate", "summarise_text"]),
+    ("Match Candidates to Job Role", AITaskTrigger.MANUAL, ["get_job_role", "search_candidates", "create_placement_mapping"]),
+    ("Daily Pipeline Digest", AITaskTrigger.SCHEDULE, ["get_pipeline_stats", "send_email"]),
+    ("Draft Follow-up Email", AITaskTrigger.API, ["get_deal", "draft_email"]),
+]
+AI_TASK_STATUSES = [AITaskStatus.COMPLETED] * 7 + [AITaskStatus.PARTIALLY_COMPLETED, AITaskStatus.FAILED, AITaskStatus.AWAITING_APPROVAL]
+
+Rows = Iterator[dict]
+
+
+@dataclass(frozen=True)
+class DatasetScale:
+    """How many rows of each kind to generate"""
+
+    candidates: int = 1_000
+    users: int = 25
+    batches: int = 20
+    training_days: int = 20
+    periods_per_day: int = 2
+    companies: int = 20
+    job_roles: int = 50
+    dsr_days: int = 30
+    leads: int = 200
+    ai_task_logs: int = 500
+
+    @classmethod
+    def for_candidates(cls, candidates: int) -> "DatasetScale":
+        """Scale the surrounding tables in proportion to the number of candidates"""
+        return cls(
+            candidates=candidates,
+            users=max(10, candidates // 200),
+            batches=max(5, candidates // 50),
+            companies=max(5, candidates // 100),
+            job_roles=max(10, candidates // 40),
+            leads=max(50, candidates // 10),
+            ai_task_logs=max(100, candidates // 4),
+        )
+
+
+class SyntheticDataset:
+    """Deterministic rows for one seed and scale"""
+
+    def __init__(self, scale: DatasetScale = DatasetScale(), seed: int = 0, today: Optional[date] = None):
+        self.scale = scale
+        self.seed = seed
+        self.today = today or date.today()
+        self._now = datetime.combine(self.today, time(18, 0))
+        self._funnel()
+
+    def _rng(self, name: str) -> random.Random:
+        return random.Random(f"{self.seed}:{name}")
+
+    @staticmethod
+    def _uuid(rng: random.Random) -> uuid.UUID:
+        return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+    def _funnel(self) -> None:
+        """How far each candidate got: screening, counseling and batch allocation"""
+        rng = self._rng("funnel")
+        count = self.scale.candidates
+        # 0 = none, otherwise an index + 1 into the status list
+        self._screening = bytearray(count + 1)
+        self._counseling = bytearray(count + 1)
+        self._allocation = bytearray(count + 1)
+        self._batch = array("I", bytes(4 * (count + 1)))
+        for candidate_id in range(1, count + 1):
+            if rng.random() >= 0.7:
+                continue
+            screening = rng.randrange(len(SCREENING_STATUSES))
+            self._screening[candidate_id] = screening + 1
+            if SCREENING_STATUSES[screening] != "Completed" or rng.random() >= 0.8:
+                continue
+            counseling = rng.randrange(len(COUNSELING_STATUSES))
+            self._counseling[candidate_id] = counseling + 1
+            if COUNSELING_STATUSES[counseling] == "selected" and rng.random() < 0.7:
+                self._allocation[candidate_id] = rng.randrange(len(ALLOCATION_STATUSES)) + 1
+                self._batch[candidate_id] = rng.randrange(1, self.scale.batches + 1)
+
+        # Deal id for each converted lead, 0 otherwise
+        self._deal = array("I", bytes(4 * (self.scale.leads + 1)))
+        deal_id = 0
+        for lead_id in range(1, self.scale.leads + 1):
+            if rng.random() < 0.25:
+                deal_id += 1
+                self._deal[lead_id] = deal_id
+
+    # ------------------------------------------------------------------
+    # Queries over the funnel (for benchmarks picking realistic inputs)
+    # ------------------------------------------------------------------
+
+    def allocated(self, status: Optional[str] = None) -> Iterator[Tuple[int, int, str]]:
+        """(candidate_id, batch_id, allocation status) for allocated candidates"""
+        for candidate_id in range(1, self.scale.candidates + 1):
+            code = self._allocation[candidate_id]
+            if code and (status is None or ALLOCATION_STATUSES[code - 1] == status):
+                yield candidate_id, self._batch[candidate_id], ALLOCATION_STATUSES[code - 1]
+
+    def batch_start(self, batch_id: int) -> date:
+        """Batches start every few days over the past year, the newest ending around today"""
+        return self.today - timedelta(days=self.scale.training_days + 3 * ((self.scale.batches - batch_id) % 120))
+
+    def tables(self) -> List[Tuple[Type[BaseModel], Callable[[], Rows]]]:
+        """(model, row generator) for every table, parents before children"""
+        return [
+            (User, self.users),
+            (Candidate, self.candidates),
+            (CandidateScreening, self.screenings),
+            (CandidateCounseling, self.counselings),
+            (CandidateDocument, self.documents),
+            (TrainingBatch, self.batches),
+            (TrainingBatchPlan, self.batch_plans),
+            (TrainingCandidateAllocation, self.allocations),
+            (TrainingAttendance, self.attendance),
+            (Company, self.companies),
+            (Contact, self.contacts),
+            (JobRole, self.job_roles),
+            (PlacementMapping, self.placement_mappings),
+            (DSRProject, self.dsr_projects),
+            (DSRActivity, self.dsr_activities),
+            (DSREntry, self.dsr_entries),
+            (Lead, self.leads),
+            (Deal, self.deals),
+            (AITaskLog, self.ai_task_logs),
+        ]
+
+    # ------------------------------------------------------------------
+    # Users and candidates
+    # ------------------------------------------------------------------
+
+    def _users_with_role(self, role: UserRole) -> List[int]:
+        users = [user_id for user_id in range(2, self.scale.users + 1) if self._role(user_id) == role]
+        return users or [1]
+
+    def _role(self, user_id: int) -> UserRole:
+        return UserRole.ADMIN if user_id == 1 else USER_ROLES[(user_id - 2) % len(USER_ROLES)]
+
+    def users(self) -> Rows:
+        rng = self._rng("users")
+        for user_id in range(1, self.scale.users + 1):
+            role = self._role(user_id)
+            yield {
+                "id": user_id,
+                "public_id": self._uuid(rng),
+                "email": f"user{user_id}@example.com",
+                "username": f"user{user_id}",
+                "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "hashed_password": PASSWORD_HASH,
+                "is_active": True,
+                "is_superuser": role == UserRole.ADMIN,
+                "is_verified": True,
+                "role": role,
+                "mobile": f"9{rng.randrange(10**8, 10**9)}",
+                "created_at": self._now - timedelta(days=400),
+            }
+
+    def candidates(self) -> Rows:
+        rng = self._rng("candidates")
+        for candidate_id in range(1, self.scale.candidates + 1):
+            city, district, state, pincode = rng.choice(LOCATIONS)
+            disabled = rng.random() < 0.8
+            experienced = rng.random() < 0.35
+            yield {
+                "id": candidate_id,
+                "public_id": self._uuid(rng),
+                "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                "gender": rng.choice(["male", "female", "female", "male", "other"]),
+                "email": f"candidate{candidate_id}@example.com",
+                "phone": f"9{candidate_id:09d}",
+                "whatsapp_number": f"9{candidate_id:09d}",
+                "dob": date(1985, 1, 1) + timedelta(days=rng.randrange(7300)),
+                "pincode": pincode,
+                "city": city,
+                "district": district,
+                "state": state,
+                "guardian_details": {
+                    "parent_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    "relationship": rng.choice(["Father", "Mother", "Guardian"]),
+                    "parent_phone": f"8{rng.randrange(10**8, 10**9)}",
+                },
+                "work_experience": {
+                    "is_experienced": experienced,
+                    "currently_employed": experienced and rng.random() < 0.4,
+                    "year_of_experience": f"{rng.randint(1, 8)} years" if experienced else None,
+                },
+                "education_details": {
+                    "degrees": [
+                        {
+                            "degree_name": rng.choice(DEGREES),
+                            "specialization": rng.choice(SPECIALIZATIONS),
+                            "college_name": rng.choice(COLLEGES),
+                            "year_of_passing": rng.randint(2012, 2025),
+                            "percentage": round(rng.uniform(55, 92), 2),
+                        }
+                        for _ in range(rng.choice([1, 1, 1, 2]))
+                    ]
+                },
+                "disability_details": {
+                    "is_disabled": disabled,
+                    "disability_type": rng.choice(DISABILITY_TYPES) if disabled else None,
+                    "disability_percentage": rng.randint(40, 90) if disabled else 0,
+                },
+                "other": {"registration_type": rng.choice(["Registered"] * 8 + ["Excel", "Public"])},
+                "created_at": self._now - timedelta(minutes=rng.randrange(365 * 24 * 60)),
+                "is_deleted": rng.random() < 0.02,
+            }
+
+    def screenings(self) -> Rows:
+        rng = self._rng("screenings")
+        sourcing = self._users_with_role(UserRole.SOURCING)
+        for candidate_id in range(1, self.scale.candidates + 1):
+            code = self._screening[candidate_id]
+            if not code:
+                continue
+            yield {
+                "candidate_id": candidate_id,
+                "status": SCREENING_STATUSES[code - 1],
+                "skills": {"technical_skills": rng.sample(SKILLS, 3), "soft_skills": ["Communication"]},
+                "others": {"willing_for_training": rng.random() < 0.9},
+                "screened_by_id": rng.choice(sourcing),
+                "created_at": self._now - timedelta(minutes=rng.randrange(300 * 24 * 60)),
+            }
+
+    def counselings(self) -> Rows:
+        rng = self._rng("counselings")
+        counselors = self._users_with_role(UserRole.COUNSELOR)
+        for candidate_id in range(1, self.scale.candidates + 1):
+            code = self._counseling[candidate_id]
+            if not code:
+                continue
+            yield {
+                "candidate_id": candidate_id,
+                "status": COUNSELING_STATUSES[code - 1],
+                "skills": [{"name": skill, "level": rng.choice(["Basic", "Intermediate"])} for skill in rng.sample(SKILLS, 2)],
+                "feedback": "Good communication, keen to learn.",
+                "counselor_id": rng.choice(counselors),
+                "counseling_date": self._now - timedelta(minutes=rng.randrange(250 * 24 * 60)),
+            }
+
+    def documents(self) -> Rows:
+        rng = self._rng("documents")
+        for candidate_id in range(1, self.scale.candidates + 1):
+            if not self._screening[candidate_id]:
+                continue
+            for document_type, mime_type in DOCUMENT_TYPES[: rng.randint(1, len(DOCUMENT_TYPES))]:
+                yield {
+                    "candidate_id": candidate_id,
+                    "document_type": document_type,
+                    "document_name": f"{document_type}.{mime_type.split('/')[1]}",
+                    "file_path": f"candidates/{candidate_id}/{document_type}",
+                    "file_size": rng.randrange(50_000, 2_000_000),
+                    "mime_type": mime_type,
+                    "is_active": True,
+                }
+
+    # ------------------------------------------------------------------
+    # Training
+    # ------------------------------------------------------------------
+
+    def batches(self) -> Rows:
+        rng = self._rng("batches")
+        trainers = self._users_with_role(UserRole.TRAINER)
+        for batch_id in range(1, self.scale.batches + 1):
+            start = self.batch_start(batch_id)
+            yield {
+                "id": batch_id,
+                "public_id": self._uuid(rng),
+                "batch_name": f"Batch {batch_id:04d}",
+                "disability_types": rng.sample(DISABILITY_TYPES, 2) + (["Women"] if rng.random() < 0.2 else []),
+                "start_date": start,
+                "approx_close_date": start + timedelta(days=self.scale.training_days),
+                "courses": [{"course_name": rng.choice(["Data Entry", "Customer Support", "Testing"]), "trainer": "Trainer"}],
+                "duration": {"weeks": self.scale.training_days // 5, "days": self.scale.training_days},
+                "status": rng.choice(BATCH_STATUSES),
+                "owner_id": rng.choice(trainers),
+            }
+
+    def _periods(self, batch_id: int) -> Iterator[Tuple[int, date, int]]:
+        """(period id, date, slot) for every timetable period of a batch"""
+        per_batch = self.scale.training_days * self.scale.periods_per_day
+        period_id = (batch_id - 1) * per_batch
+        start = self.batch_start(batch_id)
+        for day in range(self.scale.training_days):
+            for slot in range(self.scale.periods_per_day):
+                period_id += 1
+                yield period_id, start + timedelta(days=day), slot
+
+    def batch_plans(self) -> Rows:
+        rng = self._rng("batch_plans")
+        trainers = self._users_with_role(UserRole.TRAINER)
+        for batch_id in range(1, self.scale.batches + 1):
+            for period_id, day, slot in self._periods(batch_id):
+                start_time, end_time = PERIODS[slot % len(PERIODS)]
+                yield {
+                    "id": period_id,
+                    "public_id": self._uuid(rng),
+                    "batch_id": batch_id,
+                    "date": day,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "activity_type": "course",
+                    "activity_name": rng.choice(["Excel Basics", "Typing Practice", "Soft Skills", "Mock Calls"]),
+                    "trainer_user_id": rng.choice(trainers),
+                }
+
+    def allocations(self) -> Rows:
+        rng = self._rng("allocations")
+        for candidate_id, batch_id, status in self.allocated():
+            yield {
+                "public_id": self._uuid(rng),
+                "batch_id": batch_id,
+                "candidate_id": candidate_id,
+                "status": status,
+                "is_dropout": status == "dropped_out",
+                "dropout_remark": "Relocated" if status == "dropped_out" else None,
+            }
+
+    def attendance(self) -> Rows:
+        """One row per period up to today for every candidate who started training"""
+        rng = self._rng("attendance")
+        periods = {}
+        for candidate_id, batch_id, status in self.allocated():
+            if status == "allocated":
+                continue
+            if batch_id not in periods:
+                periods[batch_id] = [(period_id, day) for period_id, day, _ in self._periods(batch_id) if day <= self.today]
+            for period_id, day in periods[batch_id]:
+                yield {
+                    "batch_id": batch_id,
+                    "candidate_id": candidate_id,
+                    "date": day,
+                    "period_id": period_id,
+                    "status": rng.choice(ATTENDANCE_STATUSES),
+                }
+
+    # ------------------------------------------------------------------
+    # Placement
+    # ------------------------------------------------------------------
+
+    def companies(self) -> Rows:
+        rng = self._rng("companies")
+        for company_id in range(1, self.scale.companies + 1):
+            city, _, state, pincode = rng.choice(LOCATIONS)
+            yield {
+                "id": company_id,
+                "public_id": self._uuid(rng),
+                "name": f"Company {company_id:04d}",
+                "industry": rng.choice(INDUSTRIES),
+                "company_size": rng.choice(list(CompanySize)),
+                "website": f"https://company{company_id}.example.com",
+                "email": f"hr@company{company_id}.example.com",
+                "status": rng.choice([CompanyStatus.ACTIVE, CompanyStatus.CUSTOMER, CompanyStatus.PROSPECT]),
+                "address": {"city": city, "state": state, "pincode": pincode, "country": "India"},
+            }
+
+    def contacts(self) -> Rows:
+        """One primary contact per company, sharing its id"""
+        rng = self._rng("contacts")
+        for company_id in range(1, self.scale.companies + 1):
+            yield {
+                "id": company_id,
+                "public_id": self._uuid(rng),
+                "company_id": company_id,
+                "first_name": rng.choice(FIRST_NAMES),
+                "last_name": rng.choice(LAST_NAMES),
+                "email": f"contact{company_id}@company{company_id}.example.com",
+                "designation": "HR Manager",
+                "is_primary": True,
+                "is_decision_maker": True,
+            }
+
+    def job_roles(self) -> Rows:
+        rng = self._rng("job_roles")
+        placement = self._users_with_role(UserRole.PLACEMENT)
+        for job_role_id in range(1, self.scale.job_roles + 1):
+            company_id = rng.randrange(1, self.scale.companies + 1)
+            city, _, state, _ = rng.choice(LOCATIONS)
+            yield {
+                "id": job_role_id,
+                "public_id": self._uuid(rng),
+                "title": rng.choice(["Data Entry Operator", "Customer Support Executive", "QA Tester", "Accounts Assistant"]),
+                "description": "Entry-level role with on-the-job training.",
+                "status": rng.choice([JobRoleStatus.ACTIVE] * 4 + [JobRoleStatus.CLOSED]),
+                "is_visible": True,
+                "no_of_vacancies": rng.randint(1, 20),
+                "close_date": self.today + timedelta(days=rng.randint(-30, 90)),
+                "company_id": company_id,
+                "contact_id": company_id,
+                "created_by_id": rng.choice(placement),
+                "location": {"cities": [city], "state": state, "workplace_type": rng.choice(["Onsite", "Hybrid", "Remote"])},
+                "salary_range": {"min": 15000, "max": rng.choice([20000, 25000, 30000]), "currency": "INR"},
+                "experience": {"min": 0, "max": rng.choice([1, 2, 3])},
+                "requirements": {
+                    "skills": rng.sample(SKILLS, 3),
+                    "qualifications": rng.sample(DEGREES, 2) if rng.random() < 0.7 else ["Any Graduation"],
+                    "disability_preferred": rng.sample(DISABILITY_TYPES, 2),
+                },
+            }
+
+    def placement_mappings(self) -> Rows:
+        rng = self._rng("placement_mappings")
+        placement = self._users_with_role(UserRole.PLACEMENT)
+        for candidate_id in range(1, self.scale.candidates + 1):
+            code = self._counseling[candidate_id]
+            if not code or COUNSELING_STATUSES[code - 1] != "selected" or rng.random() >= 0.4:
+                continue
+            for job_role_id in rng.sample(range(1, self.scale.job_roles + 1), min(rng.randint(1, 3), self.scale.job_roles)):
+                yield {
+                    "candidate_id": candidate_id,
+                    "job_role_id": job_role_id,
+                    "mapped_by_id": rng.choice(placement),
+                    "match_score": round(rng.uniform(40, 95), 1),
+                    "mapped_at": self._now - timedelta(minutes=rng.randrange(120 * 24 * 60)),
+                    "status": rng.choice(PLACEMENT_STATUSES),
+                    "is_active": True,
+                    "source": "manual",
+                }
+
+    # ------------------------------------------------------------------
+    # DSR
+    # ------------------------------------------------------------------
+
+    def _dsr_project_count(self) -> int:
+        return max(3, self.scale.users // 4)
+
+    def dsr_projects(self) -> Rows:
+        rng = self._rng("dsr_projects")
+        for project_id in range(1, self._dsr_project_count() + 1):
+            owner = rng.randrange(1, self.scale.users + 1)
+            yield {
+                "id": project_id,
+                "public_id": self._uuid(rng),
+                "name": f"Project {project_id:03d}",
+                "is_active": True,
+                "project_type": DSRProjectType.STANDARD,
+                "owner_id": owner,
+                "created_by": 1,
+            }
+
+    def _dsr_activities(self) -> Iterator[Tuple[int, int, uuid.UUID, uuid.UUID, str]]:
+        """(activity id, project id, project public_id, activity public_id, activity name)"""
+        projects = {row["id"]: row["public_id"] for row in self.dsr_projects()}
+        rng = self._rng("dsr_activities")
+        activity_id = 0
+        for project_id, project_public_id in projects.items():
+            for name in ("Planning", "Development", "Review"):
+                activity_id += 1
+                yield activity_id, project_id, project_public_id, self._uuid(rng), name
+
+    def dsr_activities(self) -> Rows:
+        for activity_id, project_id, _, public_id, name in self._dsr_activities():
+            yield {
+                "id": activity_id,
+                "public_id": public_id,
+                "project_id": project_id,
+                "name": name,
+                "start_date": self.today - timedelta(days=self.scale.dsr_days),
+                "end_date": self.today + timedelta(days=30),
+                "estimated_hours": 80.0,
+                "status": DSRActivityStatus.IN_PROGRESS,
+                "is_active": True,
+            }
+
+    def dsr_entries(self) -> Rows:
+        """One entry per user per weekday over the last ``dsr_days`` days"""
+        rng = self._rng("dsr_entries")
+        activities = [
+            (str(project_public_id), f"Project {project_id:03d}", str(public_id), name)
+            for _, project_id, project_public_id, public_id, name in self._dsr_activities()
+        ]
+        for user_id in range(1, self.scale.users + 1):
+            for offset in range(self.scale.dsr_days, 0, -1):
+                report_date = self.today - timedelta(days=offset)
+                if report_date.weekday() >= 5:
+                    continue
+                items = []
+                start = 9 * 60
+                for project_public_id, project_name, activity_public_id, activity_name in rng.sample(activities, min(rng.randint(1, 3), len(activities))):
+                    minutes = rng.choice([60, 90, 120, 180])
+                    items.append({
+                        "project_public_id": project_public_id,
+                        "project_name": project_name,
+                        "activity_public_id": activity_public_id,
+                        "activity_name": activity_name,
+                        "activity_type_name": rng.choice(["Development", "Meeting", "Documentation"]),
+                        "description": f"{activity_name} work",
+                        "start_time": f"{start // 60:02d}:{start % 60:02d}",
+                        "end_time": f"{(start + minutes) // 60:02d}:{(start + minutes) % 60:02d}",
+                        "hours": minutes / 60,
+                    })
+                    start += minutes
+                status = rng.choice([DSRStatus.APPROVED] * 6 + [DSRStatus.SUBMITTED, DSRStatus.REJECTED])
+                yield {
+                    "public_id": self._uuid(rng),
+                    "user_id": user_id,
+                    "report_date": report_date,
+                    "status": status,
+                    "submitted_at": datetime.combine(report_date, time(18, 30)),
+                    "items": items,
+                    "reviewed_by": 1 if status != DSRStatus.SUBMITTED else None,
+                }
+
+
+    # ------------------------------------------------------------------
+    # CRM and AI
+    # ------------------------------------------------------------------
+
+    def _lead_company(self, lead_id: int) -> int:
+        return (lead_id - 1) % self.scale.companies + 1
+
+    def leads(self) -> Rows:
+        """
+        Leads spread over the companies. ``converted_to_deal_id`` is left
+        empty because deals reference leads too; ``link_converted_leads``
+        fills it in once both tables are loaded.
+        """
+        rng = self._rng("leads")
+        placement = self._users_with_role(UserRole.PLACEMENT)
+        for lead_id in range(1, self.scale.leads + 1):
+            company_id = self._lead_company(lead_id)
+            converted = bool(self._deal[lead_id])
+            created_at = self._now - timedelta(minutes=rng.randrange(365 * 24 * 60))
+            status = LeadStatus.QUALIFIED if converted else rng.choice(LEAD_STATUSES)
+            yield {
+                "id": lead_id,
+                "public_id": self._uuid(rng),
+                "company_id": company_id,
+                "contact_id": company_id,
+                "assigned_to": rng.choice(placement),
+                "title": f"{rng.choice(SERVICES)} - Company {company_id:04d}",
+                "lead_source": rng.choice(list(LeadSource)),
+                "lead_status": status,
+                "lead_score": rng.randint(60, 100) if converted else rng.randint(0, 70),
+                "estimated_value": Decimal(rng.randrange(50, 2_000) * 1_000),
+                "expected_close_date": created_at.date() + timedelta(days=rng.randint(30, 120)),
+                "conversion_date": created_at + timedelta(days=rng.randint(5, 60)) if converted else None,
+                "lost_reason": "Budget constraints" if status == LeadStatus.LOST else None,
+                "tags": rng.sample(["csr", "it", "bpo", "retail", "hot", "repeat"], 2),
+                "qualification_notes": {
+                    "budget": rng.choice(["Approved", "Pending", "Unknown"]),
+                    "authority": "HR Head",
+                    "need": rng.choice(SERVICES),
+                    "timeline": rng.choice(["This quarter", "Next quarter"]),
+                },
+                "utm_data": {"utm_source": rng.choice(["google", "linkedin", "newsletter"]), "utm_medium": "cpc"},
+                "created_at": created_at,
+            }
+
+    def deals(self) -> Rows:
+        """One deal per converted lead, with the lead's company"""
+        rng = self._rng("deals")
+        placement = self._users_with_role(UserRole.PLACEMENT)
+        for lead_id in range(1, self.scale.leads + 1):
+            deal_id = self._deal[lead_id]
+            if not deal_id:
+                continue
+            company_id = self._lead_company(lead_id)
+            stage = rng.choice(DEAL_STAGES)
+            closed = stage in (DealStage.CLOSED_WON, DealStage.CLOSED_LOST)
+            expected_close = self.today + timedelta(days=rng.randint(-90, 90))
+            quantity = rng.randint(5, 50)
+            unit_price = rng.choice([5_000, 10_000, 25_000])
+            yield {
+                "id": deal_id,
+                "public_id": self._uuid(rng),
+                "company_id": company_id,
+                "contact_id": company_id,
+                "lead_id": lead_id,
+                "assigned_to": rng.choice(placement),
+                "title": f"{rng.choice(SERVICES)} - Company {company_id:04d}",
+                "deal_stage": stage,
+                "deal_type": rng.choice(list(DealType)),
+                "win_probability": {DealStage.CLOSED_WON: 100, DealStage.CLOSED_LOST: 0}.get(stage, rng.choice([20, 40, 60, 80])),
+                "deal_value": Decimal(quantity * unit_price),
+                "payment_terms": rng.choice(["Net 30", "Net 45", "Advance"]),
+                "contract_duration_months": rng.choice([3, 6, 12]),
+                "expected_close_date": expected_close,
+                "actual_close_date": expected_close if closed else None,
+                "lost_reason": "Chose a competitor" if stage == DealStage.CLOSED_LOST else None,
+                "products_services": [{
+                    "name": rng.choice(SERVICES),
+                    "quantity": quantity,
+                    "unit_price": unit_price,
+                    "discount": 0,
+                    "total": quantity * unit_price,
+                }],
+                "next_action": None if closed else {
+                    "action": rng.choice(["Send proposal", "Schedule call", "Share candidate profiles"]),
+                    "due_date": (self.today + timedelta(days=rng.randint(1, 14))).isoformat(),
+                },
+                "created_at": self._now - timedelta(minutes=rng.randrange(180 * 24 * 60)),
+            }
+
+    def ai_task_logs(self) -> Rows:
+        """Task journals over the last 90 days, each with its plan and steps"""
+        rng = self._rng("ai_task_logs")
+        for _ in range(self.scale.ai_task_logs):
+            task_name, trigger, tools = rng.choice(AI_TASKS)
+            status = rng.choice(AI_TASK_STATUSES)
+            started_at = self._now - timedelta(seconds=rng.randrange(90 * 24 * 3600))
+            failed = {AITaskStatus.FAILED: len(tools), AITaskStatus.PARTIALLY_COMPLETED: 1}.get(status, 0)
+            ran = 1 if status == AITaskStatus.AWAITING_APPROVAL else len(tools)
+            steps = []
+            clock = started_at + timedelta(milliseconds=rng.randint(800, 4_000))
+            for number, tool in enumerate(tools[:ran], start=1):
+                took = rng.randint(50, 2_500)
+                ok = number <= ran - failed
+                steps.append({
+                    "step_number": number,
+                    "tool_name": tool,
+                    "parameters": {"query": f"{tool} input"},
+                    "status": "success" if ok else "failed",
+                    "result": {"records": rng.randint(0, 5)} if ok else None,
+                    "error": None if ok else "Upstream service timed out",
+                    "started_at": clock.isoformat(),
+                    "duration_ms": took,
+                })
+                clock += timedelta(milliseconds=took)
+            duration_ms = int((clock - started_at).total_seconds() * 1000)
+            tokens = rng.randint(600, 6_000)
+            yield {
+                "public_id": self._uuid(rng),
+                "task_name": task_name,
+                "trigger": trigger,
+                "status": status,
+                "triggered_by_user_id": rng.randrange(1, self.scale.users + 1) if trigger == AITaskTrigger.MANUAL else None,
+                "ai_provider": "gemini",
+                "ai_model": "gemini-1.5-flash",
+                "raw_input": {"message": f"{task_name} request", "source": trigger.value},
+                "plan": [{"tool_name": tool, "parameters": {"query": f"{tool} input"}} for tool in tools],
+                "plan_reasoning": f"Run {', '.join(tools)} in order.",
+                "steps": steps,
+                "tools_called": len(steps),
+                "tools_succeeded": len(steps) - failed,
+                "tools_failed": failed,
+                "records_affected": sum(step["result"]["records"] for step in steps if step["result"]),
+                "requires_approval": status == AITaskStatus.AWAITING_APPROVAL,
+                "summary": None if status == AITaskStatus.FAILED else f"{task_name}: {len(steps) - failed} steps done.",
+                "error_message": "Upstream service timed out" if status == AITaskStatus.FAILED else None,
+                "started_at": started_at,
+                "completed_at": clock if status != AITaskStatus.AWAITING_APPROVAL else None,
+                "duration_ms": duration_ms,
+                "llm_tokens_used": tokens,
+                "llm_cost_usd": round(tokens * 0.0000004, 6),
+                "created_at": started_at,
+            }
+
+
+async def load(
+    connection: AsyncConnection | AsyncSession,
+    dataset: SyntheticDataset,
+    chunk_size: int = 5_000,
+) -> Dict[str, int]:
+    """Insert every table with multi-row executemany batches; returns rows per table"""
+    counts = {}
+    for model, rows in dataset.tables():
+        count = 0
+        chunk = []
+        for row in rows():
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                await connection.execute(insert(model), chunk)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            await connection.execute(insert(model), chunk)
+            count += len(chunk)
+        counts[model.__tablename__] = count
+    await finish_load(connection, dataset)
+    return counts
+
+
+async def copy_load(
+    connection: AsyncConnection,
+    dataset: SyntheticDataset,
+    chunk_size: int = 50_000,
+) -> Dict[str, int]:
+    """
+    Write every table with binary COPY; returns rows per table. Needs the
+    asyncpg driver. Rows go through the same column defaults and type
+    conversions as ``load``, so both give identical tables.
+    """
+    driver = (await connection.get_raw_connection()).driver_connection
+    counts = {}
+    for model, rows in dataset.tables():
+        table = model.__table__
+        columns, record = None, None
+        count = 0
+        chunk = []
+        for row in rows():
+            if record is None:
+                columns, record = _copy_record(table, row, connection.dialect)
+            chunk.append(record(row))
+            if len(chunk) >= chunk_size:
+                await driver.copy_records_to_table(table.name, records=chunk, columns=columns)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            await driver.copy_records_to_table(table.name, records=chunk, columns=columns)
+            count += len(chunk)
+        counts[table.name] = count
+    await finish_load(connection, dataset)
+    return counts
+
+
+def _copy_record(table: Table, first_row: dict, dialect: Dialect) -> Tuple[List[str], Callable[[dict], tuple]]:
+    """
+    COPY column list for a table and a function turning a row into a record.
+    Columns missing from the rows take their Python-side default, as with
+    ``insert()``; the rest are left to the database.
+    """
+    fields = []
+    for column in table.columns:
+        default = column.default
+        if column.key not in first_row and (default is None or not (default.is_scalar or default.is_callable)):
+            continue
+        processor = column.type.dialect_impl(dialect).bind_processor(dialect)
+        fields.append((column.name, column.key, default, processor))
+
+    def record(row: dict) -> tuple:
+        values = []
+        for _, key, default, processor in fields:
+            if key in row:
+                value = row[key]
+            else:
+                value = default.arg if default.is_scalar else default.arg(None)
+            values.append(value if processor is None else processor(value))
+        return tuple(values)
+
+    return [name for name, _, _, _ in fields], record
+
+
+async def finish_load(connection: AsyncConnection | AsyncSession, dataset: SyntheticDataset) -> None:
+    """Steps after every table is written: sequences, then the lead -> deal links"""
+    await reset_sequences(connection, [model for model, _ in dataset.tables()])
+    await link_converted_leads(connection)
+
+
+async def reset_sequences(connection: AsyncConnection | AsyncSession, models: List[Type[BaseModel]]) -> None:
+    """Move each table's id sequence past the ids loaded explicitly"""
+    for model in models:
+        table = model.__tablename__
+        await connection.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        ))
+
+
+async def link_converted_leads(connection: AsyncConnection | AsyncSession) -> None:
+    """Point converted leads at their deal; leads and deals reference each other"""
+    await connection.execute(text(
+        "UPDATE leads SET converted_to_deal_id = deals.id FROM deals WHERE deals.lead_id = leads.id"
+    ))
+
+
+def row_counts(dataset: SyntheticDataset) -> Dict[str, int]:
+    """Rows per table, generating (but not keeping) every row"""
+    return {model.__tablename__: sum(1 for _ in rows()) for model, rows in dataset.tables()}
@@ -0,0 +1,84 @@
+"""
+Benchmark the candidate list views: ORM path vs flat projection.
+
+For each list view (all, unscreened, screened) fetches the same page through
+the ORM path (entities + eager loads + CandidateListResponse's validator) and
+through the flat column projection (CandidateListItem), serialises it the way
+the endpoint does, and reports per-page wall time, Python CPU time and peak
+allocated memory. Runs against the configured database; read-only.
+
+Usage (from the backend directory):
+    python scripts/benchmark_candidate_list.py
+    python scripts/benchmark_candidate_list.py --limit 100 --rounds 50
+"""
+
+import asyncio
+import sys
+import os
+import time
+import argparse
+import tracemalloc
+
+# Add parent directory to path to allow importing app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import AsyncSessionLocal
+from app.repositories.candidate_repository import CandidateRepository
+from app.schemas.candidate import CandidateListItem, CandidateListResponse
+
+
+VIEWS = ("get_multi", "get_unscreened", "get_screened")
+
+
+async def fetch_page(method: str, limit: int, flat: bool) -> int:
+    """Fetch and serialise one page in a fresh session; returns the row count"""
+    async with AsyncSessionLocal() as session:
+        repository = CandidateRepository(session)
+        items, _ = await getattr(repository, method)(limit=limit, flat=flat)
+        schema = CandidateListItem if flat else CandidateListResponse
+        page = [schema.model_validate(item).model_dump(mode="json") for item in items]
+    return len(page)
+
+
+async def measure(method: str, limit: int, flat: bool, rounds: int) -> dict:
+    rows = await fetch_page(method, limit, flat)  # Warm up connections and caches
+
+    wall = cpu = 0.0
+    for _ in range(rounds):
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        await fetch_page(method, limit, flat)
+        wall += time.perf_counter() - wall_start
+        cpu += time.process_time() - cpu_start
+
+    tracemalloc.start()
+    await fetch_page(method, limit, flat)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"rows": rows, "wall_ms": wall / rounds * 1000, "cpu_ms": cpu / rounds * 1000, "peak_kb": peak / 1024}
+
+
+async def main(limit: int, rounds: int) -> None:
+    print(f"{'view':<16} {'path':<6} {'rows':>5} {'wall ms':>9} {'cpu ms':>9} {'peak kB':>9}")
+    for method in VIEWS:
+        results = {}
+        for label, flat in (("orm", False), ("flat", True)):
+            result = results[label] = await measure(method, limit, flat, rounds)
+            print(
+                f"{method:<16} {label:<6} {result['rows']:>5} {result['wall_ms']:>9.2f} "
+                f"{result['cpu_ms']:>9.2f} {result['peak_kb']:>9.0f}"
+            )
+        orm, flat = results["orm"], results["flat"]
+        if orm["cpu_ms"] and orm["peak_kb"]:
+            print(
+                f"{'':<16} {'saved':<6} {'':>5} {orm['wall_ms'] - flat['wall_ms']:>9.2f} "
+                f"{(1 - flat['cpu_ms'] / orm['cpu_ms']) * 100:>8.0f}% {(1 - flat['peak_kb'] / orm['peak_kb']) * 100:>8.0f}%"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=50, help="Page size (default 50)")
+    parser.add_argument("--rounds", type=int, default=20, help="Pages fetched per path (default 20)")
+    args = parser.parse_args()
+    asyncio.run(main(args.limit, args.rounds))
@@ -0,0 +1,110 @@
+"""
+Micro-benchmark for response JSON encoding: stdlib path vs orjson.
+
+Builds the largest payloads the API serves from the configured database
+(read-only) and times turning each into response bytes:
+
+* candidate list page: CandidatePaginatedResponse, as FastAPI dumps a
+  response_model and then renders it;
+* analytics export: every candidates / dsr_entries row as ORM objects, as
+  /analytics/export/{table} encodes them;
+* DSR entries: DSREntryListResponse for the admin list.
+
+"stdlib" is jsonable_encoder (for untyped payloads) + starlette's
+JSONResponse; "orjson" is app.core.serialization.FastJSONResponse, the
+application's default response class. Each payload is checked to decode
+to the same JSON on both paths.
+
+Usage (from the backend directory):
+    python scripts/benchmark_json.py
+    python scripts/benchmark_json.py --limit 200 --rounds 200
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+# Add parent directory to path to allow importing app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.core.serialization import FastJSONResponse
+from app.models.candidate import Candidate
+from app.models.dsr_entry import DSREntry
+from app.repositories.candidate_repository import CandidateRepository
+from app.repositories.dsr_entry_repository import DSREntryRepository
+from app.schemas.candidate import CandidatePaginatedResponse
+from app.schemas.dsr_entry import DSREntryListResponse
+
+
+async def load_payloads(limit: int) -> dict:
+    """name -> (payload, is response_model) built from the database"""
+    async with AsyncSessionLocal() as db:
+        items, total = await CandidateRepository(db).get_multi(limit=limit, flat=True)
+        candidates = CandidatePaginatedResponse(items=items, total=total)
+
+        entries, total = await DSREntryRepository(db).get_all_entries(limit=limit)
+        dsr_entries = DSREntryListResponse(items=entries, total=total, skip=0, limit=limit)
+
+        exports = {}
+        for model in (Candidate, DSREntry):
+            result = await db.execute(select(model))
+            exports[f"export {model.__tablename__}"] = (result.scalars().all(), False)
+
+    return {
+        "candidate list page": (candidates, True),
+        **exports,
+        "dsr entries": (dsr_entries, True),
+    }
+
+
+def encoders(payload, is_model: bool) -> dict:
+    if is_model:
+        # FastAPI serialises a response_model with pydantic before rendering
+        adapter = TypeAdapter(type(payload))
+        return {
+            "stdlib": lambda: JSONResponse(adapter.dump_python(payload, mode="json")).body,
+            "orjson": lambda: FastJSONResponse(adapter.dump_python(payload, mode="json")).body,
+        }
+    return {
+        "stdlib": lambda: JSONResponse(jsonable_encoder(payload)).body,
+        "orjson": lambda: FastJSONResponse(payload).body,
+    }
+
+
+def measure(encode, rounds: int) -> float:
+    """Mean milliseconds per encode"""
+    encode()  # Warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        encode()
+    return (time.perf_counter() - start) / rounds * 1000
+
+
+async def main(limit: int, rounds: int) -> None:
+    payloads = await load_payloads(limit)
+    print(f"{'payload':<24} {'kB':>8} {'stdlib ms':>10} {'orjson ms':>10} {'speedup':>8}")
+    for name, (payload, is_model) in payloads.items():
+        funcs = encoders(payload, is_model)
+        body = funcs["orjson"]()
+        if json.loads(body) != json.loads(funcs["stdlib"]()):
+            print(f"{name:<24} output differs between encoders, skipped")
+            continue
+        stdlib, fast = (measure(funcs[label], rounds) for label in ("stdlib", "orjson"))
+        print(f"{name:<24} {len(body) / 1024:>8.1f} {stdlib:>10.3f} {fast:>10.3f} {stdlib / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--limit", type=int, default=100, help="Page size for list payloads (default 100)")
+    parser.add_argument("--rounds", type=int, default=50, help="Encodes per payload and encoder (default 50)")
+    args = parser.parse_args()
+    asyncio.run(main(args.limit, args.rounds))
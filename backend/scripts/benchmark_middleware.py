@@ -0,0 +1,148 @@
+"""
+Micro-benchmark for the HTTP middleware stack.
+
+Compares the per-request overhead of the pure-ASGI LoggingMiddleware +
+ErrorHandlerMiddleware against equivalent BaseHTTPMiddleware implementations
+(the previous design), by driving the ASGI app directly without a server.
+
+Usage (from the backend directory):
+    python scripts/benchmark_middleware.py --requests 20000
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+for key, value in {
+    "POSTGRES_SERVER": "localhost",
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "password",
+    "POSTGRES_DB": "benchmark",
+    "SECRET_KEY": "benchmark",
+}.items():
+    os.environ.setdefault(key, value)
+
+from loguru import logger
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.error_handler import ErrorHandlerMiddleware, error_response
+from app.middleware.logging import LoggingMiddleware
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware equivalent of LoggingMiddleware (previous design)"""
+
+    async def dispatch(self, request, call_next):
+        request_id = request.headers.get("X-Request-ID", f"{int(time.time() * 1000)}")
+        logger.bind(request_id=request_id, method=request.method, url=str(request.url)).info("Incoming request")
+        start_time = time.time()
+        response = await call_next(request)
+        process_time = time.time() - start_time
+        logger.bind(
+            request_id=request_id,
+            method=request.method,
+            url=str(request.url),
+            status_code=response.status_code,
+        ).info("Request completed")
+        response.headers["X-Request-ID"] = request_id
+        response.headers["X-Process-Time"] = f"{process_time:.3f}"
+        return response
+
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware equivalent of ErrorHandlerMiddleware (previous design)"""
+
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as e:
+            return error_response(e)
+
+
+def build_app(legacy: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id, "name": "benchmark"}
+
+    if legacy:
+        app.add_middleware(LegacyLoggingMiddleware)
+        app.add_middleware(LegacyErrorHandlerMiddleware)
+    else:
+        app.add_middleware(LoggingMiddleware)
+        app.add_middleware(ErrorHandlerMiddleware)
+    return app
+
+
+async def drive(app, requests: int) -> float:
+    """Issue requests straight into the ASGI callable; returns seconds elapsed"""
+    scope_template = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/items/42",
+        "raw_path": b"/items/42",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    never = asyncio.Event()
+
+    def make_receive():
+        sent = False
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # Behave like an idle client: no disconnect until the response is done
+            await never.wait()
+
+        return receive
+
+    async def send(message):
+        pass
+
+    # Warm up routing and pydantic caches
+    for _ in range(200):
+        await app(dict(scope_template), make_receive(), send)
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        await app(dict(scope_template), make_receive(), send)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    # Measure middleware cost, not log sink I/O
+    logger.remove()
+
+    results = {}
+    for label, legacy in (("BaseHTTPMiddleware", True), ("pure ASGI", False)):
+        elapsed = asyncio.run(drive(build_app(legacy), args.requests))
+        results[label] = elapsed / args.requests * 1_000_000
+        print(f"{label:<20} {results[label]:8.1f} µs/request")
+
+    saved = results["BaseHTTPMiddleware"] - results["pure ASGI"]
+    print(f"{'overhead reduction':<20} {saved:8.1f} µs/request "
+          f"({saved / results['BaseHTTPMiddleware'] * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
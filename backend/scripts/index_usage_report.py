@@ -0,0 +1,69 @@
+"""
+Report how the database's indexes are used.
+
+Lists every index with its scan count and size, marking unused indexes and
+indexes made redundant by another index's leading columns, then the tables
+read mostly through sequential scans. Read-only; run it against production
+(or a replica) after representative traffic.
+
+Usage (from the backend directory):
+    python scripts/index_usage_report.py
+    python scripts/index_usage_report.py --flagged-only
+"""
+
+import asyncio
+import sys
+import os
+import argparse
+
+# Add parent directory to path to allow importing app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import AsyncSessionLocal
+from app.services.index_usage_service import IndexUsageService
+
+
+def _size(size_bytes: int) -> str:
+    for unit in ("B", "kB", "MB", "GB"):
+        if size_bytes < 1024 or unit == "GB":
+            return f"{size_bytes:.0f} {unit}" if unit == "B" else f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024
+
+
+async def main(flagged_only: bool, min_rows: int) -> None:
+    async with AsyncSessionLocal() as session:
+        service = IndexUsageService(session)
+        indexes = await service.index_usage()
+        tables = await service.sequential_scans(min_rows)
+
+    print(f"{'table':<34} {'index':<56} {'scans':>12} {'size':>10}  notes")
+    for index in indexes:
+        notes = []
+        if index["unused"]:
+            notes.append("unused")
+        if index["covered_by"]:
+            notes.append(f"covered by {index['covered_by']}")
+        if flagged_only and not notes:
+            continue
+        print(
+            f"{index['table_name']:<34} {index['index_name']:<56} "
+            f"{index['scans']:>12} {_size(index['size_bytes']):>10}  {', '.join(notes)}"
+        )
+
+    print()
+    print(f"{'table':<34} {'seq scans':>12} {'rows read seq':>16} {'index scans':>12} {'live rows':>12}")
+    for table in tables:
+        if flagged_only and table["seq_scan"] <= table["idx_scan"]:
+            continue
+        print(
+            f"{table['table_name']:<34} {table['seq_scan']:>12} {table['seq_tup_read']:>16} "
+            f"{table['idx_scan']:>12} {table['live_rows']:>12}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--flagged-only", action="store_true", help="Only unused/redundant indexes and seq-scan-heavy tables")
+    parser.add_argument("--min-rows", type=int, default=1000, help="Ignore tables smaller than this (default 1000)")
+    args = parser.parse_args()
+    asyncio.run(main(args.flagged_only, args.min_rows))
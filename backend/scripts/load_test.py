@@ -0,0 +1,210 @@
+"""
+Load profile for the busiest API endpoints, driven with httpx.
+
+Signs in, then runs --users concurrent virtual users for --duration seconds.
+Each user picks endpoints by weight from PROFILE and pauses --think-time
+between calls. For each endpoint the report gives requests, errors,
+p50/p95/p99 latency and queries per request. Query counts come from the
+X-DB-Query-Count header, which the server only sends when started with
+QUERY_PROFILER_ENABLED=true.
+
+Run the server with rate limiting off, against a database seeded from
+app.utils.synthetic_data. Every seeded user signs in with its PASSWORD, so
+user1@example.com is the admin:
+
+    RATE_LIMIT_ENABLED=false QUERY_PROFILER_ENABLED=true uvicorn app.main:app --workers 4
+
+With --in-process the profile runs against app.main in this process through
+httpx's ASGI transport. That needs no server but gives a single worker on the
+configured database; set the same two variables.
+
+--fail-p95-ms exits non-zero when any endpoint's p95 is above the limit, so
+a deploy pipeline can gate on it.
+
+Usage (from the backend directory):
+    python scripts/load_test.py --base-url http://localhost:8000
+    python scripts/load_test.py --in-process --users 10 --duration 30
+    python scripts/load_test.py --users 50 --duration 120 --fail-p95-ms 500 --json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import statistics
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# Add parent directory to path to allow importing app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+
+API = "/api/v1"
+
+# (name, weight, path); {job_role} is filled from the job roles list
+PROFILE = [
+    ("candidates list", 20, "/candidates/?skip=0&limit=50"),
+    ("candidate stats", 8, "/candidates/stats"),
+    ("screened candidates", 10, "/candidates/screened?skip=0&limit=50&counseling_status=selected"),
+    ("candidate filter options", 5, "/candidates/filter-options"),
+    ("training batches", 8, "/training-batches/?skip=0&limit=50"),
+    ("training batch stats", 5, "/training-batches/stats"),
+    ("my dsr entries", 10, "/dsr/entries/me?skip=0&limit=20"),
+    ("my notifications", 15, "/notifications/my?limit=20"),
+    ("current user", 10, "/users/me"),
+    ("job role matches", 3, "/placement/mappings/match/{job_role}"),
+]
+
+
+class Results:
+    """Latencies, query counts and failures per endpoint"""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.queries: Dict[str, List[int]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.statuses: Dict[int, int] = defaultdict(int)
+
+    def record(self, name: str, seconds: float, response: Optional[httpx.Response]) -> None:
+        self.latencies[name].append(seconds)
+        if response is None:
+            self.errors[name] += 1
+            return
+        self.statuses[response.status_code] += 1
+        if response.status_code >= 400:
+            self.errors[name] += 1
+        count = response.headers.get("X-DB-Query-Count")
+        if count is not None:
+            self.queries[name].append(int(count))
+
+    def summary(self, elapsed: float) -> List[dict]:
+        rows = []
+        for name, latencies in sorted(self.latencies.items()):
+            ordered = sorted(latencies)
+            queries = self.queries.get(name)
+            rows.append({
+                "endpoint": name,
+                "requests": len(latencies),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(latencies) / elapsed, 2),
+                "p50_ms": round(_percentile(ordered, 50) * 1000, 1),
+                "p95_ms": round(_percentile(ordered, 95) * 1000, 1),
+                "p99_ms": round(_percentile(ordered, 99) * 1000, 1),
+                "queries_per_request": round(statistics.mean(queries), 1) if queries else None,
+            })
+        return rows
+
+
+def _percentile(ordered: List[float], percent: int) -> float:
+    if len(ordered) == 1:
+        return ordered[0]
+    return statistics.quantiles(ordered, n=100, method="inclusive")[percent - 1]
+
+
+def _client(args: argparse.Namespace) -> httpx.AsyncClient:
+    if args.in_process:
+        from app.main import app
+
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load-test", timeout=60)
+    limits = httpx.Limits(max_connections=args.users, max_keepalive_connections=args.users)
+    return httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits)
+
+
+async def _sign_in(client: httpx.AsyncClient, email: str, password: str) -> None:
+    response = await client.post(f"{API}/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+async def _paths(client: httpx.AsyncClient) -> List[tuple]:
+    """PROFILE with placeholders filled in; entries that cannot be filled are dropped"""
+    response = await client.get(f"{API}/placement/job-roles/", params={"limit": 20})
+    body = response.json() if response.status_code == 200 else []
+    items = body.get("items", []) if isinstance(body, dict) else body
+    job_roles = [item["public_id"] for item in items if item.get("public_id")]
+
+    paths = []
+    for name, weight, path in PROFILE:
+        if "{job_role}" in path:
+            if not job_roles:
+                print(f"skipping '{name}': no job roles", file=sys.stderr)
+                continue
+            paths.extend((name, weight / len(job_roles), path.format(job_role=job_role)) for job_role in job_roles)
+        else:
+            paths.append((name, weight, path))
+    return paths
+
+
+async def _virtual_user(client, paths, results: Results, deadline: float, think_time: float, rng: random.Random):
+    names, weights = [(name, path) for name, _, path in paths], [weight for _, weight, _ in paths]
+    while time.monotonic() < deadline:
+        name, path = rng.choices(names, weights)[0]
+        start = time.perf_counter()
+        try:
+            response = await client.get(API + path)
+        except httpx.HTTPError:
+            response = None
+        results.record(name, time.perf_counter() - start, response)
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+
+
+def _report(rows: List[dict], results: Results, elapsed: float) -> None:
+    total = sum(row["requests"] for row in rows)
+    print(f"{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s); status codes {dict(results.statuses)}")
+    print(f"{'endpoint':<28} {'reqs':>6} {'errs':>5} {'rps':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8}")
+    for row in rows:
+        queries = "-" if row["queries_per_request"] is None else f"{row['queries_per_request']:.1f}"
+        print(
+            f"{row['endpoint']:<28} {row['requests']:>6} {row['errors']:>5} {row['rps']:>7.1f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {queries:>8}"
+        )
+    if results.statuses.get(429):
+        print("429 responses: start the server with RATE_LIMIT_ENABLED=false", file=sys.stderr)
+    if not results.queries:
+        print("No X-DB-Query-Count headers: start the server with QUERY_PROFILER_ENABLED=true", file=sys.stderr)
+
+
+async def main(args: argparse.Namespace) -> int:
+    async with _client(args) as client:
+        await _sign_in(client, args.email, args.password)
+        paths = await _paths(client)
+        results = Results()
+        deadline = time.monotonic() + args.duration
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            _virtual_user(client, paths, results, deadline, args.think_time, random.Random(args.seed + user))
+            for user in range(args.users)
+        ))
+        elapsed = time.perf_counter() - start
+
+    rows = results.summary(elapsed)
+    if args.json:
+        print(json.dumps({"elapsed_seconds": round(elapsed, 2), "endpoints": rows}))
+    else:
+        _report(rows, results, elapsed)
+
+    slow = [row for row in rows if args.fail_p95_ms and row["p95_ms"] > args.fail_p95_ms]
+    for row in slow:
+        print(f"{row['endpoint']}: p95 {row['p95_ms']}ms over {args.fail_p95_ms}ms", file=sys.stderr)
+    return 1 if slow else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Server to load (default http://localhost:8000)")
+    parser.add_argument("--in-process", action="store_true", help="Serve app.main in this process instead")
+    parser.add_argument("--email", default="user1@example.com", help="User to sign in as")
+    parser.add_argument("--password", default="password", help="Password for --email")
+    parser.add_argument("--users", type=int, default=20, help="Concurrent virtual users (default 20)")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to run (default 60)")
+    parser.add_argument("--think-time", type=float, default=0.1, help="Mean pause between a user's requests in seconds (default 0.1)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for endpoint choice")
+    parser.add_argument("--fail-p95-ms", type=float, default=0, help="Exit non-zero if any endpoint's p95 is above this")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    sys.exit(asyncio.run(main(parser.parse_args())))
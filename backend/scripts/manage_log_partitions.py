@@ -0,0 +1,40 @@
+"""
+Roll log table partitions forward and enforce retention.
+
+Creates the upcoming monthly partitions of activity_logs, crm_activity_logs and
+ai_task_logs, then archives (LOG_ARCHIVE_DIR) and drops partitions older than
+their retention window. Safe to run from cron on several hosts at once.
+
+Usage (from the backend directory):
+    python scripts/manage_log_partitions.py              # rollover + retention
+    python scripts/manage_log_partitions.py --rollover-only
+"""
+
+import asyncio
+import sys
+import os
+import argparse
+
+# Add parent directory to path to allow importing app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import AsyncSessionLocal
+from app.services.log_partition_service import LogPartitionService
+
+
+async def main(rollover_only: bool) -> None:
+    async with AsyncSessionLocal() as session:
+        service = LogPartitionService(session)
+        created = await service.ensure_partitions()
+        print(f"Created partitions: {', '.join(created) or 'none'}")
+        if rollover_only:
+            return
+        for dropped in await service.enforce_retention():
+            print(f"Dropped {dropped['partition']} (archive: {dropped['archive'] or 'none'})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rollover-only", action="store_true", help="Only create upcoming partitions")
+    args = parser.parse_args()
+    asyncio.run(main(args.rollover_only))
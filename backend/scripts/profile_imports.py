@@ -0,0 +1,139 @@
+"""
+Report where start-up import time goes, using ``python -X importtime``.
+
+Imports a module (default: app.main, what every API worker loads) in a fresh
+interpreter and summarises CPython's import-time trace: the total, the
+slowest modules by cumulative and by self time, and self time per top-level
+package. With several runs the fastest is reported, which is the least noisy.
+
+--check exits non-zero when the total exceeds --budget or when a module that
+is meant to load on first use (DEFERRED_MODULES) is imported at start-up;
+tests/core/test_import_time.py runs it that way.
+
+Usage (from the backend directory):
+    python scripts/profile_imports.py
+    python scripts/profile_imports.py --runs 3 --top 30
+    python scripts/profile_imports.py --check --budget 10
+    python scripts/profile_imports.py --json
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Loaded on first use rather than at start-up: spreadsheet/PDF/HTTP libraries
+# used by a handful of endpoints, the LLM providers and the AI tool modules.
+DEFERRED_MODULES = [
+    "openpyxl",
+    "PyPDF2",
+    "httpx",
+    "app.ai.mcp.tools",
+    "app.ai.providers.gemini",
+    "app.ai.providers.openai",
+    "app.ai.providers.anthropic",
+    "app.ai.providers.groq",
+    "app.ai.providers.mistral",
+]
+
+# "import time:       self [us] |  cumulative | imported package"
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+# name -> (self seconds, cumulative seconds)
+Timings = Dict[str, Tuple[float, float]]
+
+
+def parse_importtime(trace: str) -> Timings:
+    """Timings per module from ``-X importtime`` stderr"""
+    timings = {}
+    for line in trace.splitlines():
+        match = _LINE.match(line)
+        if match:
+            own, cumulative, _, name = match.groups()
+            timings[name] = (int(own) / 1e6, int(cumulative) / 1e6)
+    return timings
+
+
+def measure(module: str) -> Timings:
+    """Import ``module`` in a fresh interpreter and return its import timings"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def fastest(module: str, runs: int) -> Timings:
+    return min((measure(module) for _ in range(runs)), key=lambda timings: timings[module][1])
+
+
+def by_package(timings: Timings) -> List[Tuple[str, float]]:
+    totals = defaultdict(float)
+    for name, (own, _) in timings.items():
+        totals[name.split(".")[0]] += own
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def report(module: str, timings: Timings, top: int) -> None:
+    total = timings[module][1]
+    print(f"import {module}: {total:.3f}s, {len(timings)} modules")
+
+    print(f"\nslowest by cumulative time\n{'module':<60} {'cumul s':>8} {'self s':>8}")
+    ranked = sorted(timings.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (own, cumulative) in ranked[1 : top + 1]:
+        print(f"{name:<60} {cumulative:>8.3f} {own:>8.3f}")
+
+    print(f"\nslowest by self time\n{'module':<60} {'self s':>8}")
+    for name, (own, _) in sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:top]:
+        print(f"{name:<60} {own:>8.3f}")
+
+    print(f"\nself time by top-level package\n{'package':<60} {'self s':>8} {'share':>7}")
+    for package, own in by_package(timings)[:top]:
+        print(f"{package:<60} {own:>8.3f} {own / total:>7.1%}")
+
+
+def main(module: str, runs: int, top: int, budget: float, check: bool, as_json: bool) -> int:
+    timings = fastest(module, runs)
+    total = timings[module][1]
+    deferred = [name for name in DEFERRED_MODULES if name in timings]
+
+    if as_json:
+        print(json.dumps({
+            "module": module,
+            "total_seconds": total,
+            "deferred_imported": deferred,
+            "modules": {name: {"self": own, "cumulative": cumulative} for name, (own, cumulative) in timings.items()},
+        }))
+    else:
+        report(module, timings, top)
+
+    if not check:
+        return 0
+    failures = [f"{name} is imported at start-up; it should load on first use" for name in deferred]
+    if budget and total > budget:
+        failures.append(f"import {module} took {total:.2f}s, over the {budget:.2f}s budget")
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--module", default="app.main", help="Module to import (default app.main)")
+    parser.add_argument("--runs", type=int, default=1, help="Imports to time; the fastest is reported (default 1)")
+    parser.add_argument("--top", type=int, default=20, help="Rows per table (default 20)")
+    parser.add_argument("--budget", type=float, default=0, help="With --check, fail above this many seconds")
+    parser.add_argument("--check", action="store_true", help="Fail on a budget overrun or an eager deferred import")
+    parser.add_argument("--json", action="store_true", help="Print the timings as JSON")
+    args = parser.parse_args()
+    sys.exit(main(args.module, args.runs, args.top, args.budget, args.check, args.json))
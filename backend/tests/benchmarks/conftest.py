@@ -0,0 +1,127 @@
+"""
+Fixtures for the hot-path benchmarks.
+
+Needs a real Postgres (TEST_POSTGRES_URL=postgresql+asyncpg://...) and
+pytest-benchmark. One schema is created per session and loaded with
+app.utils.synthetic_data. BENCHMARK_CANDIDATES sets the number of
+candidates (default 2000) and BENCHMARK_SEED sets the seed (default 48). The
+other tables scale with the candidates. Every table is created with its
+indexes but without foreign keys, then ANALYZEd.
+
+``measure`` times a call with pytest-benchmark, in a fresh session that is
+rolled back afterwards, and counts the SQL statements it sends through
+app.core.query_profiler. The session ends with a p50 / p95 / queries-per-call
+table. To catch latency regressions, save a baseline and compare against it:
+
+    pytest tests/benchmarks --benchmark-autosave
+    pytest tests/benchmarks --benchmark-compare --benchmark-compare-fail=median:25%
+"""
+
+import asyncio
+import os
+import statistics
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core import query_profiler
+from app.core.database import Base
+from app.utils.synthetic_data import DatasetScale, SyntheticDataset, copy_load
+from tests.postgres import POSTGRES_URL, create_schema, drop_schema, schema_engine
+
+
+CANDIDATES = int(os.getenv("BENCHMARK_CANDIDATES", "2000"))
+SEED = int(os.getenv("BENCHMARK_SEED", "48"))
+
+# (name, p50 ms, p95 ms, queries per call) for the summary table
+RESULTS: List[tuple] = []
+
+
+@dataclass
+class Seeded:
+    engine: AsyncEngine
+    dataset: SyntheticDataset
+    counts: dict
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Event loop shared by the benchmarks; pytest-benchmark calls are synchronous"""
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    # With a loop factory the runner never installs its loop as the current
+    # one, so closing it leaves pytest-asyncio's loop alone
+    with asyncio.Runner(loop_factory=asyncio.new_event_loop) as runner:
+        yield runner
+
+
+async def _seed(engine: AsyncEngine, dataset: SyntheticDataset) -> dict:
+    async with engine.begin() as connection:
+        counts = await copy_load(connection, dataset)
+    async with engine.begin() as connection:
+        await connection.execute(text("ANALYZE"))
+    return counts
+
+
+@pytest.fixture(scope="session")
+def seeded(runner):
+    name = f"benchmark_{uuid.uuid4().hex[:8]}"
+    runner.run(create_schema(name, Base.metadata.tables.values()))
+    engine = schema_engine(name)
+    try:
+        dataset = SyntheticDataset(DatasetScale.for_candidates(CANDIDATES), seed=SEED)
+        counts = runner.run(_seed(engine, dataset))
+        query_profiler.install(engine)
+        yield Seeded(engine, dataset, counts)
+    finally:
+        runner.run(engine.dispose())
+        runner.run(drop_schema(name))
+
+
+@pytest.fixture
+def measure(request, benchmark, runner, seeded):
+    """
+    ``measure(call, rounds=...)`` benchmarks ``await call(db)`` and returns
+    (last result, statements per call).
+    """
+
+    def run(call: Callable[[AsyncSession], Awaitable[Any]], rounds: int = 20) -> tuple:
+        outcome = {}
+
+        async def once():
+            stats = query_profiler.start_request()
+            async with AsyncSession(seeded.engine) as db:
+                outcome["result"] = await call(db)
+                await db.rollback()
+            outcome["queries"] = stats.statement_count
+
+        benchmark.pedantic(lambda: runner.run(once()), rounds=rounds, iterations=1, warmup_rounds=1)
+
+        benchmark.extra_info["queries_per_call"] = outcome["queries"]
+        data = benchmark.stats.stats.data if benchmark.stats else None
+        if data:
+            p50, p95 = _percentile(data, 50), _percentile(data, 95)
+            benchmark.extra_info.update(p50_ms=round(p50 * 1000, 2), p95_ms=round(p95 * 1000, 2))
+            RESULTS.append((request.node.name, p50 * 1000, p95 * 1000, outcome["queries"]))
+        return outcome["result"], outcome["queries"]
+
+    return run
+
+
+def _percentile(data: List[float], percent: int) -> float:
+    if len(data) == 1:
+        return data[0]
+    return statistics.quantiles(data, n=100, method="inclusive")[percent - 1]
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    if not RESULTS:
+        return
+    terminalreporter.section("hot path latency")
+    terminalreporter.write_line(f"{'benchmark':<48} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+    for name, p50, p95, queries in RESULTS:
+        terminalreporter.write_line(f"{name:<48} {p50:>9.2f} {p95:>9.2f} {queries:>8}")
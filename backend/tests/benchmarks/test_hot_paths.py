@@ -0,0 +1,88 @@
+"""
+Benchmarks for the repository and service calls behind the busiest pages.
+
+Each benchmark also pins the number of SQL statements per call, so an N+1
+regression fails here even when the dataset is too small to show it in the
+timings. Raise a budget deliberately, in the same change that needs it.
+"""
+
+import math
+
+import pytest
+
+from app.repositories.candidate_repository import CandidateRepository
+from app.repositories.training_batch_repository import TrainingBatchRepository
+from app.schemas.training_attendance import TrainingAttendanceCreate
+from app.services.placement_mapping_service import PlacementMappingService
+from app.services.training_extension_service import TrainingExtensionService
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+def test_candidate_stats(measure):
+    async def call(db):
+        return await CandidateRepository(db).get_stats()
+
+    stats, queries = measure(call)
+    assert stats["total"] > 0
+    assert queries <= 19
+
+
+def test_screened_candidates_page(measure):
+    async def call(db):
+        return await CandidateRepository(db).get_screened(
+            limit=50, screening_status="Completed", counseling_status="selected", flat=True
+        )
+
+    (items, total), queries = measure(call)
+    assert total > 0 and len(items) == min(50, total)
+    assert queries <= 3
+
+
+def test_training_batch_stats(measure):
+    async def call(db):
+        return await TrainingBatchRepository(db).get_stats()
+
+    stats, queries = measure(call)
+    assert stats["total"] > 0
+    assert queries <= 2
+
+
+def test_matches_for_job_role(measure, seeded):
+    job_role = next(seeded.dataset.job_roles())
+
+    async def call(db):
+        return await PlacementMappingService(db).get_matches_for_job_role(job_role["public_id"])
+
+    matches, queries = measure(call, rounds=10)
+    assert matches
+    # Eager loads of the placement-ready candidates run per 500 ids
+    assert queries <= 24 + 3 * math.ceil(len(matches) / 500)
+
+
+def test_bulk_attendance_update(measure, seeded):
+    batches = {}
+    for candidate_id, batch_id, _ in seeded.dataset.allocated(status="in_training"):
+        batches.setdefault(batch_id, []).append(candidate_id)
+    batch_id, candidate_ids = max(batches.items(), key=lambda item: len(item[1]))
+    period = next(row for row in seeded.dataset.batch_plans() if row["batch_id"] == batch_id)
+    attendance = [
+        TrainingAttendanceCreate(
+            batch_id=batch_id,
+            candidate_id=candidate_id,
+            date=period["date"],
+            period_id=period["id"],
+            status="absent",
+        )
+        for candidate_id in candidate_ids
+    ]
+
+    async def call(db):
+        return await TrainingExtensionService(db).update_bulk_attendance(attendance)
+
+    records, queries = measure(call, rounds=10)
+    assert len(records) == len(attendance)
+    # Per record: holiday check, allocation check, existing lookup, update;
+    # then the re-fetch with its eager loads
+    assert queries <= 4 * len(attendance) + 5
@@ -12,7 +12,7 @@ from typing import AsyncGenerator
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from app.main import app
-from app.core.database import get_db, Base
+from app.core.database import get_db, get_read_db, Base
 from app.core.config import settings
 
 
@@ -60,6 +60,8 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    # Read-only endpoints must not reach a real primary or replica either
+    app.dependency_overrides[get_read_db] = override_get_db
     
     async with AsyncClient(app=app, base_url="http://test") as test_client:
         yield test_client
@@ -0,0 +1,156 @@
+"""
+Tests for connection pool sizing, PgBouncer mode and pool-wait instrumentation.
+
+The PgBouncer-mode round trip needs a real Postgres: set TEST_POSTGRES_URL
+(postgresql+asyncpg://...) to run it.
+"""
+
+import os
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import database
+from app.core.config import settings
+from app.core.database import InstrumentedQueuePool, pool_limits
+
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def pool_settings(monkeypatch):
+    for name, value in {
+        "WORKERS": 4,
+        "DB_CONNECTION_BUDGET": 80,
+        "DB_POOL_PROCESSES": None,
+        "DB_POOL_SIZE": None,
+        "DB_MAX_OVERFLOW": None,
+        "NOTIFICATION_PUSH_LISTEN": True,
+        "SCHEDULER_ENABLED": True,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    return monkeypatch
+
+
+def test_budget_is_split_across_workers_and_job_worker(pool_settings):
+    # (80 - 4 API workers x 2 dedicated) / (4 API workers + 1 job worker) = 14 each
+    assert pool_limits() == (7, 7)
+
+    pool_settings.setattr(settings, "DB_CONNECTION_BUDGET", 25)
+    assert pool_limits() == (2, 1)
+
+
+def test_dedicated_connections_count_only_when_enabled(pool_settings):
+    pool_settings.setattr(settings, "NOTIFICATION_PUSH_LISTEN", False)
+    pool_settings.setattr(settings, "SCHEDULER_ENABLED", False)
+    assert pool_limits() == (8, 8)
+
+
+def test_budget_never_sizes_a_pool_to_zero(pool_settings):
+    pool_settings.setattr(settings, "DB_CONNECTION_BUDGET", 2)
+    assert pool_limits() == (1, 0)
+
+
+def test_explicit_process_count_and_sizes_win(pool_settings):
+    pool_settings.setattr(settings, "DB_POOL_PROCESSES", 2)
+    assert pool_limits() == (18, 18)
+
+    pool_settings.setattr(settings, "DB_POOL_SIZE", 5)
+    pool_settings.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    assert pool_limits() == (5, 0)
+
+
+def test_pgbouncer_mode_disables_statement_caches(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+    args = database._connect_args()
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    names = {args["prepared_statement_name_func"]() for _ in range(3)}
+    assert len(names) == 3
+
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", False)
+    monkeypatch.setattr(settings, "DB_STATEMENT_CACHE_SIZE", 250)
+    assert database._connect_args() == {"prepared_statement_cache_size": 250}
+
+
+def test_session_level_connections_bypass_pgbouncer(monkeypatch):
+    monkeypatch.setattr(settings, "DATABASE_URL", "postgresql+asyncpg://app:pw@pgbouncer:6432/app")
+    monkeypatch.setattr(settings, "DATABASE_DIRECT_URL", None)
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", False)
+    assert database.direct_dsn() == "postgresql://app:pw@pgbouncer:6432/app"
+
+    # LISTEN and advisory locks must not go through a transaction pooler
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+    assert database.direct_dsn() is None
+
+    monkeypatch.setattr(settings, "DATABASE_DIRECT_URL", "postgresql+asyncpg://app:pw@db:5432/app")
+    assert database.direct_dsn() == "postgresql://app:pw@db:5432/app"
+
+
+@pytest.mark.anyio
+async def test_session_level_features_stay_off_without_a_direct_url(monkeypatch):
+    from app.jobs.scheduler import scheduler
+    from app.services.notification_hub import NotificationHub
+
+    monkeypatch.setattr(settings, "DATABASE_DIRECT_URL", None)
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+    hub = NotificationHub(channel="test", queue_size=10)
+    await hub.start()
+    await scheduler.start()
+
+    assert hub._task is None
+    assert not scheduler.running
+
+
+def _timeouts() -> float:
+    return REGISTRY.get_sample_value("db_pool_checkout_timeouts_total") or 0
+
+
+@pytest.mark.anyio
+async def test_starved_pool_counts_timeouts_and_records_wait(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SLOW_CHECKOUT_SECONDS", 0.05)
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    wait_count = REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_count") or 0
+    timeouts = _timeouts()
+    try:
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                async with engine.connect():
+                    pass
+    finally:
+        await engine.dispose()
+
+    assert _timeouts() == timeouts + 1
+    assert REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_count") >= wait_count + 2
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+@pytest.mark.anyio
+async def test_pgbouncer_mode_round_trips(monkeypatch):
+    monkeypatch.setattr(settings, "DB_PGBOUNCER_MODE", True)
+    engine = create_async_engine(POSTGRES_URL, connect_args=database._connect_args())
+    try:
+        async with engine.connect() as connection:
+            for value in range(5):
+                result = await connection.execute(text("SELECT CAST(:value AS int) + 1"), {"value": value})
+                assert result.scalar() == value + 1
+            cached = await connection.execute(text("SELECT count(*) FROM pg_prepared_statements"))
+            # Nothing is kept prepared on the server connection between statements
+            assert cached.scalar() <= 1
+    finally:
+        await engine.dispose()
@@ -0,0 +1,62 @@
+"""
+Start-up import budget for app.main, and the on-demand loading that keeps it.
+
+The budget check imports app.main in a fresh interpreter through
+scripts/profile_imports.py. The module count is deterministic and is the
+strict check; the time budget sits just above what a developer machine
+measures (~5s) and IMPORT_TIME_BUDGET_SECONDS overrides it on slower ones.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from app.ai.brain.exceptions import LLMProviderError
+from app.ai.mcp.registry import ToolRegistry
+from app.ai.providers import load_provider_class
+from app.ai.providers.base import LLMProvider
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BUDGET_SECONDS = float(os.getenv("IMPORT_TIME_BUDGET_SECONDS", "6"))
+# 1114 modules when the budget was set
+MODULE_BUDGET = 1130
+
+
+def test_app_import_stays_within_budget():
+    result = subprocess.run(
+        [sys.executable, os.path.join("scripts", "profile_imports.py"), "--json", "--runs", "2"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    profile = json.loads(result.stdout)
+
+    assert profile["deferred_imported"] == []
+    assert len(profile["modules"]) <= MODULE_BUDGET
+    assert profile["total_seconds"] < BUDGET_SECONDS
+
+
+def test_providers_load_by_name():
+    provider_class = load_provider_class("groq")
+    assert issubclass(provider_class, LLMProvider)
+    assert provider_class.__module__ == "app.ai.providers.groq"
+
+    with pytest.raises(LLMProviderError):
+        load_provider_class("unknown")
+
+
+def test_registry_discovers_tools_on_first_lookup(monkeypatch):
+    registry = ToolRegistry()
+    imported = []
+    # The package's ``registry`` attribute is the instance, so go by module
+    monkeypatch.setattr(sys.modules[ToolRegistry.__module__], "import_module", imported.append)
+
+    assert imported == []
+    registry.all()
+    registry.count()
+    assert imported == ["app.ai.mcp.tools"]
@@ -0,0 +1,68 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from app.ai.providers.base import LLMProvider, LLMResponse
+from app.ai.providers.instrumented import InstrumentedProvider
+from app.core import metrics
+
+
+class _StubProvider(LLMProvider):
+    provider_name = "stub"
+    model_name = "stub-1"
+
+    async def complete(self, system_prompt, user_message, temperature=0.2, max_tokens=4096):
+        return LLMResponse(content="{}", raw_response={"usage": {"total_tokens": 42}})
+
+    async def stream_complete(self, system_prompt, user_message, temperature=0.2, max_tokens=4096):
+        yield "x"
+
+
+def _sample(name, labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.mark.anyio
+async def test_instrumented_provider_records_latency_and_tokens():
+    """Provider calls are counted and token usage is read from raw usage blocks"""
+    before = _sample("ai_provider_tokens_total", {"provider": "stub", "model": "stub-1"})
+    response = await InstrumentedProvider(_StubProvider()).complete("sys", "user")
+
+    assert response.tokens_used == 42
+    assert _sample("ai_provider_tokens_total", {"provider": "stub", "model": "stub-1"}) == before + 42
+    assert _sample(
+        "ai_provider_requests_total", {"provider": "stub", "operation": "complete", "outcome": "success"}
+    ) >= 1
+
+
+@pytest.mark.anyio
+async def test_tracked_task_reports_queue_depth():
+    """The in-progress gauge rises when a task is scheduled and falls once it runs"""
+    async def job():
+        return "done"
+
+    labels = {"task": "unit_test_job"}
+    wrapped = metrics.tracked_task("unit_test_job", job)
+    assert _sample("background_tasks_in_progress", labels) == 1
+    assert await wrapped() == "done"
+    assert _sample("background_tasks_in_progress", labels) == 0
+
+
+@pytest.mark.anyio
+async def test_metrics_endpoint_requires_the_scrape_token(monkeypatch):
+    """/metrics answers only the configured bearer token, and nothing while none is set"""
+    from httpx import ASGITransport, AsyncClient
+
+    from app.core.config import settings
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        monkeypatch.setattr(settings, "METRICS_SCRAPE_TOKEN", "")
+        assert (await client.get("/metrics", headers={"Authorization": "Bearer "})).status_code == 401
+
+        monkeypatch.setattr(settings, "METRICS_SCRAPE_TOKEN", "scrape-secret")
+        assert (await client.get("/metrics")).status_code == 401
+        assert (await client.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 401
+
+        response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert response.status_code == 200
+        assert b"http_requests" in response.content
@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.core import query_profiler
+
+
+def test_normalize_statement_collapses_literals_and_in_lists():
+    """Statements differing only in arguments share one shape"""
+    a = query_profiler.normalize_statement(
+        "SELECT * FROM candidates WHERE id IN ($1::INTEGER, $2::INTEGER) AND name = 'x'"
+    )
+    b = query_profiler.normalize_statement(
+        "SELECT *  FROM candidates WHERE id IN ($1::INTEGER) AND name = 'other'"
+    )
+    assert a == b == "SELECT * FROM candidates WHERE id IN (?) AND name = ?"
+
+
+def test_engine_events_count_statements_and_flag_repeats():
+    """Listeners record statements, rows and repeated shapes for the active request"""
+    engine = create_engine("sqlite://")
+    query_profiler.install(engine)
+    query_profiler.install(engine)  # idempotent
+
+    stats = query_profiler.start_request()
+    with engine.connect() as conn:
+        for i in range(4):
+            conn.execute(text("SELECT :value"), {"value": i}).all()
+
+    assert stats.statement_count == 4
+    assert stats.db_time > 0
+    assert stats.repeated_shapes(threshold=3) == [("SELECT ?", 4)]
+    assert stats.repeated_shapes(threshold=4) == []
+
+
+def test_slow_endpoints_aggregate():
+    """Finished requests fold into a sortable per-endpoint aggregate"""
+    query_profiler.reset_endpoint_stats()
+    stats = query_profiler.RequestQueryStats(statement_count=12, db_time=0.05)
+    query_profiler.record_endpoint("GET /a", 0.2, stats, n_plus_one=True)
+    query_profiler.record_endpoint("GET /b", 0.5, query_profiler.RequestQueryStats(), n_plus_one=False)
+
+    rows = query_profiler.slow_endpoints()
+    assert [row["endpoint"] for row in rows] == ["GET /b", "GET /a"]
+    assert rows[1]["n_plus_one_requests"] == 1
+    assert rows[1]["max_statements"] == 12
+    query_profiler.reset_endpoint_stats()
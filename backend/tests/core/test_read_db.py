@@ -0,0 +1,173 @@
+"""
+Tests for read-only sessions and read-replica routing (get_read_db).
+
+The routing tests need a real Postgres: set TEST_POSTGRES_URL
+(postgresql+asyncpg://...) to run them. The database stands in for both the
+primary and a healthy replica; an unreachable port stands in for a replica
+that is down.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import database
+from app.core.config import settings
+from app.core.database import ReplicaHealth
+
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+UNREACHABLE_URL = "postgresql+asyncpg://postgres:x@127.0.0.1:1/none"
+
+needs_postgres = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+
+@pytest.fixture(scope="module")
+def anyio_backend():
+    return "asyncio"
+
+
+def _fake_lag(monkeypatch, health: ReplicaHealth, lags: list):
+    calls = []
+
+    async def lag(bind):
+        calls.append(bind)
+        return lags[min(len(calls), len(lags)) - 1]
+
+    monkeypatch.setattr(health, "_lag", lag)
+    return calls
+
+
+@pytest.mark.anyio
+async def test_replica_within_max_lag_is_usable(monkeypatch):
+    monkeypatch.setattr(settings, "READ_REPLICA_MAX_LAG_SECONDS", 30.0)
+    health = ReplicaHealth()
+    _fake_lag(monkeypatch, health, [2.5])
+    assert await health.is_usable(object()) is True
+
+
+@pytest.mark.anyio
+async def test_lagging_replica_is_not_usable_until_it_catches_up(monkeypatch):
+    monkeypatch.setattr(settings, "READ_REPLICA_MAX_LAG_SECONDS", 30.0)
+    monkeypatch.setattr(settings, "READ_REPLICA_CHECK_INTERVAL_SECONDS", 0.0)
+    health = ReplicaHealth()
+    _fake_lag(monkeypatch, health, [120.0, 0.0])
+    assert await health.is_usable(object()) is False
+    assert await health.is_usable(object()) is True
+
+
+@pytest.mark.anyio
+async def test_lag_is_checked_once_per_interval(monkeypatch):
+    monkeypatch.setattr(settings, "READ_REPLICA_CHECK_INTERVAL_SECONDS", 60.0)
+    health = ReplicaHealth()
+    calls = _fake_lag(monkeypatch, health, [0.0])
+    for _ in range(5):
+        assert await health.is_usable(object()) is True
+    assert len(calls) == 1
+
+    health.mark_down("test")
+    assert await health.is_usable(object()) is False
+    assert len(calls) == 1
+
+
+@pytest.mark.anyio
+async def test_unreachable_replica_is_not_usable():
+    bind = create_async_engine(UNREACHABLE_URL)
+    try:
+        assert await ReplicaHealth().is_usable(bind) is False
+    finally:
+        await bind.dispose()
+
+
+@pytest.fixture
+async def engines(monkeypatch):
+    """Point the module's primary (and, per test, replica) at the test database"""
+    primary = create_async_engine(POSTGRES_URL)
+    monkeypatch.setattr(database, "AsyncSessionLocal", database._session_factory(primary))
+    monkeypatch.setattr(database, "replica_health", ReplicaHealth())
+    created = [primary]
+
+    def use_replica(url: str):
+        replica = create_async_engine(url)
+        created.append(replica)
+        monkeypatch.setattr(database, "read_engine", replica)
+        monkeypatch.setattr(database, "ReadSessionLocal", database._session_factory(replica))
+        return replica
+
+    monkeypatch.setattr(database, "read_engine", None)
+    monkeypatch.setattr(database, "ReadSessionLocal", None)
+    yield primary, use_replica
+    for engine in created:
+        await engine.dispose()
+
+
+async def _read_session_bind():
+    dependency = database.get_read_db()
+    session = await dependency.__anext__()
+    try:
+        read_only = (await session.execute(text("SHOW transaction_read_only"))).scalar()
+        return session.bind, read_only
+    finally:
+        await dependency.aclose()
+
+
+@needs_postgres
+@pytest.mark.anyio
+async def test_read_session_is_read_only_and_never_commits(engines):
+    primary, _ = engines
+    dependency = database.get_read_db()
+    session = await dependency.__anext__()
+    try:
+        assert session.bind is primary
+        assert (await session.execute(text("SHOW transaction_read_only"))).scalar() == "on"
+        with pytest.raises(DBAPIError, match="read-only transaction"):
+            await session.execute(text("CREATE TEMPORARY TABLE read_db_probe (id int)"))
+    finally:
+        await dependency.aclose()
+
+
+@needs_postgres
+@pytest.mark.anyio
+async def test_healthy_replica_serves_reads(engines):
+    _, use_replica = engines
+    replica = use_replica(POSTGRES_URL)
+    bind, read_only = await _read_session_bind()
+    assert bind is replica
+    assert read_only == "on"
+
+
+@needs_postgres
+@pytest.mark.anyio
+async def test_unreachable_replica_falls_back_to_primary(engines):
+    primary, use_replica = engines
+    use_replica(UNREACHABLE_URL)
+    bind, read_only = await _read_session_bind()
+    assert bind is primary
+    assert read_only == "on"
+    assert database.replica_health.usable is False
+
+
+def _dependency_calls(dependant):
+    for dependency in dependant.dependencies:
+        yield dependency.call
+        yield from _dependency_calls(dependency)
+
+
+def test_read_routes_authenticate_on_the_read_session():
+    """A route on get_read_db holds one connection: auth must not open a get_db session too"""
+    from fastapi.routing import APIRoute
+
+    from app.main import app
+
+    read_routes = 0
+    for route in app.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        calls = set(_dependency_calls(route.dependant))
+        if database.get_read_db in calls:
+            read_routes += 1
+            assert database.get_db not in calls, route.path
+    assert read_routes
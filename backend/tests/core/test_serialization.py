@@ -0,0 +1,96 @@
+"""Tests for the orjson response encoder and SSE framing"""
+
+import enum
+import json
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+from pydantic import BaseModel, Field
+
+from app.core.serialization import FastJSONResponse, dumps
+from app.models.candidate import Candidate
+from app.utils.sse import KEEPALIVE, format_data, format_event
+
+
+class Colour(str, enum.Enum):
+    RED = "red"
+
+
+class AsyncpgStyleUUID(uuid.UUID):
+    """orjson only encodes exact uuid.UUID instances natively"""
+
+
+class Item(BaseModel):
+    item_id: int = Field(alias="itemId")
+    price: Decimal
+    tags: set = set()
+    note: Optional[str] = None
+
+    model_config = {"populate_by_name": True}
+
+
+PAYLOAD = {
+    "uuid": uuid.UUID("6e7f20eb-223e-4ef2-9a35-76c7bd51c4f0"),
+    "uuid_subclass": AsyncpgStyleUUID("9ad9b896-6b70-4528-bd40-ad0853f13545"),
+    "naive": datetime(2026, 1, 5, 9, 30),
+    "aware": datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc),
+    "day": date(2026, 1, 5),
+    "integral": Decimal("12"),
+    "fraction": Decimal("12.50"),
+    "enum": Colour.RED,
+    "tuple": (1, 2),
+    "model": Item(item_id=1, price=Decimal("9.99")),
+    "text": "नमस्ते ⚠️",
+}
+
+
+def test_dumps_matches_jsonable_encoder():
+    expected = json.loads(json.dumps(jsonable_encoder(PAYLOAD)))
+    assert json.loads(dumps(PAYLOAD)) == expected
+
+
+def test_dumps_encodes_orm_instances_without_sqlalchemy_state():
+    candidate = Candidate(id=3, name="Asha", public_id=uuid.UUID(int=3))
+    encoded = json.loads(dumps([candidate]))
+    assert encoded == json.loads(json.dumps(jsonable_encoder([candidate])))
+    assert encoded[0]["name"] == "Asha"
+    assert not any(key.startswith("_sa") for key in encoded[0])
+
+
+def test_dumps_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        dumps({"value": object()})
+
+
+@pytest.mark.anyio
+async def test_default_response_class_renders_with_orjson():
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/item", response_model=Item)
+    async def item():
+        return Item(item_id=7, price=Decimal("1.5"), note="ok")
+
+    @app.get("/raw")
+    async def raw():
+        return FastJSONResponse(PAYLOAD)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        item_response = await client.get("/item")
+        raw_response = await client.get("/raw")
+
+    assert item_response.headers["content-type"] == "application/json"
+    assert item_response.json() == {"itemId": 7, "price": "1.5", "tags": [], "note": "ok"}
+    assert raw_response.json()["uuid_subclass"] == "9ad9b896-6b70-4528-bd40-ad0853f13545"
+    assert raw_response.json()["fraction"] == 12.5
+
+
+def test_sse_frames_are_bytes():
+    assert format_event("read", {"unread_delta": -1}) == b'event: read\ndata: {"unread_delta":-1}\n\n'
+    assert format_data({"token": "नमस्ते"}) == 'data: {"token":"नमस्ते"}\n\n'.encode()
+    assert KEEPALIVE == b": keepalive\n\n"
@@ -0,0 +1,70 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import AsyncClient
+
+from app.middleware.error_handler import ErrorHandlerMiddleware
+from app.middleware.logging import LoggingMiddleware
+
+
+def _build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ok")
+    async def ok():
+        return {"ok": True}
+
+    @app.get("/value-error")
+    async def value_error():
+        raise ValueError("bad input")
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    app.add_middleware(LoggingMiddleware)
+    app.add_middleware(ErrorHandlerMiddleware)
+    return app
+
+
+@pytest.fixture
+async def asgi_client():
+    async with AsyncClient(app=_build_app(), base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.anyio
+async def test_request_id_and_timing_headers(asgi_client):
+    """Request IDs are echoed back and a process time header is added"""
+    response = await asgi_client.get("/ok", headers={"X-Request-ID": "abc-123"})
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == "abc-123"
+    assert float(response.headers["X-Process-Time"]) >= 0
+
+
+@pytest.mark.anyio
+async def test_error_mapping(asgi_client):
+    """Unhandled exceptions map to the standardized error payloads"""
+    response = await asgi_client.get("/value-error")
+    assert response.status_code == 400
+    assert response.json() == {"error": "Bad Request", "message": "bad input"}
+
+    response = await asgi_client.get("/boom")
+    assert response.status_code == 500
+    assert response.json()["error"] == "Internal Server Error"
+
+
+@pytest.mark.anyio
+async def test_streaming_responses_pass_through(asgi_client):
+    """Streamed bodies are forwarded chunk by chunk with headers intact"""
+    response = await asgi_client.get("/stream")
+    assert response.status_code == 200
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
+    assert "X-Request-ID" in response.headers
@@ -0,0 +1,50 @@
+"""
+Scratch schemas for the tests that need a real Postgres.
+
+TEST_POSTGRES_URL (postgresql+asyncpg://...) points at the server; the tests
+using these helpers skip without it. Each caller creates its own schema and
+drops it afterwards. Tables are created with their indexes but without
+foreign keys, so they can be seeded independently.
+"""
+
+import os
+from typing import Iterable
+
+from sqlalchemy import Enum, Table, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def schema_engine(schema: str) -> AsyncEngine:
+    """Engine whose connections resolve unqualified names in ``schema``"""
+    return create_async_engine(POSTGRES_URL, connect_args={"server_settings": {"search_path": schema}})
+
+
+async def create_schema(name: str, tables: Iterable[Table]) -> None:
+    admin = create_async_engine(POSTGRES_URL)
+    async with admin.begin() as connection:
+        await connection.execute(text(f'CREATE SCHEMA "{name}"'))
+    await admin.dispose()
+
+    engine = schema_engine(name)
+    try:
+        async with engine.begin() as connection:
+            for table in tables:
+                for column in table.columns:
+                    if isinstance(column.type, Enum) and column.type.native_enum:
+                        await connection.run_sync(column.type.create, checkfirst=True)
+                await connection.execute(CreateTable(table, include_foreign_key_constraints=[]))
+                for index in table.indexes:
+                    await connection.execute(CreateIndex(index))
+    finally:
+        await engine.dispose()
+
+
+async def drop_schema(name: str) -> None:
+    admin = create_async_engine(POSTGRES_URL)
+    async with admin.begin() as connection:
+        await connection.execute(text(f'DROP SCHEMA "{name}" CASCADE'))
+    await admin.dispose()
@@ -0,0 +1,53 @@
+"""
+Seeded Postgres schema for the repository tests.
+
+A module defines a module-scoped ``seed_rows`` fixture returning
+``{model: rows}``; ``seeded`` creates a schema with those models' tables
+(an empty list still creates the table), inserts the rows, runs ANALYZE and
+yields the schema name. ``session`` is an AsyncSession on that schema.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.postgres import create_schema, drop_schema, schema_engine
+
+
+async def _seed(name: str, seed_rows: dict) -> None:
+    await create_schema(name, [model.__table__ for model in seed_rows])
+    engine = schema_engine(name)
+    try:
+        async with engine.begin() as connection:
+            for model, rows in seed_rows.items():
+                # One executemany per set of keys, so a row that leaves a
+                # column out gets its default instead of NULL
+                for keys in dict.fromkeys(tuple(row) for row in rows):
+                    await connection.execute(insert(model), [row for row in rows if tuple(row) == keys])
+        async with engine.connect() as connection:
+            await connection.execute(text("ANALYZE"))
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def seeded(request, seed_rows):
+    # Set up and torn down on loops of its own: pytest-asyncio binds a
+    # module-scoped async fixture from a conftest to the first module's loop
+    name = f"{request.module.__name__.rsplit('.', 1)[-1]}_{uuid.uuid4().hex[:8]}"
+    try:
+        asyncio.run(_seed(name, seed_rows))
+        yield name
+    finally:
+        asyncio.run(drop_schema(name))
+
+
+@pytest.fixture
+async def session(seeded):
+    engine = schema_engine(seeded)
+    async with AsyncSession(engine) as db:
+        yield db
+    await engine.dispose()
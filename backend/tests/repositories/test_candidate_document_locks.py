@@ -0,0 +1,43 @@
+"""
+CandidateDocumentRepository.lock_file must serialise transactions on the same
+stored file, so a delete cannot remove an object an upload is reusing.
+
+Needs a real Postgres: set TEST_POSTGRES_URL (postgresql+asyncpg://...) to run.
+"""
+
+import asyncio
+import os
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.repositories.candidate_document_repository import CandidateDocumentRepository
+
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+PATH = "uploads/objects/ab/cd/abcd.pdf"
+
+
+@pytest.mark.asyncio
+async def test_lock_is_held_until_the_transaction_ends():
+    engine = create_async_engine(POSTGRES_URL)
+    try:
+        async with AsyncSession(engine) as deleting, AsyncSession(engine) as uploading:
+            await CandidateDocumentRepository(deleting).lock_file(PATH)
+
+            waiting = asyncio.create_task(CandidateDocumentRepository(uploading).lock_file(PATH))
+            await asyncio.sleep(0.2)
+            assert not waiting.done()
+
+            # Other files are not affected
+            async with AsyncSession(engine) as other:
+                await asyncio.wait_for(CandidateDocumentRepository(other).lock_file(PATH + ".png"), 5)
+
+            await deleting.commit()
+            await asyncio.wait_for(waiting, 5)
+            await uploading.rollback()
+    finally:
+        await engine.dispose()
@@ -0,0 +1,130 @@
+"""
+CandidateRepository.get_facets must count candidates per filter value the way
+the list filters select them.
+
+Needs a real Postgres: set TEST_POSTGRES_URL (postgresql+asyncpg://...) to run.
+Seeds candidates, screenings and counselings from app.utils.synthetic_data and
+compares the facet counts with the same counts taken in Python over the rows.
+"""
+
+from collections import Counter
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate import Candidate
+from app.models.candidate_assignment import CandidateAssignment
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.candidate_document import CandidateDocument
+from app.models.candidate_screening import CandidateScreening
+from app.models.user import User
+from app.repositories.candidate_repository import CandidateRepository, filter_options
+from app.utils.synthetic_data import DatasetScale, SyntheticDataset
+from tests.postgres import POSTGRES_URL
+
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+
+@pytest.fixture(scope="module")
+def seed_rows() -> dict:
+    dataset = SyntheticDataset(DatasetScale.for_candidates(600), seed=50, today=date(2026, 3, 2))
+    candidates = list(dataset.candidates())
+    # Shapes the API has also written: no registration type, odd casing, a
+    # non-array degrees value and an empty city
+    candidates[0]["other"] = {}
+    candidates[1]["other"] = {"registration_type": " excel "}
+    candidates[2]["education_details"] = {"degrees": "B.Sc"}
+    candidates[3]["city"] = ""
+    screenings = list(dataset.screenings())
+    screenings[0]["status"] = ""
+    screenings[1]["others"] = {"reason": "Not interested"}
+    return {
+        Candidate: candidates,
+        CandidateScreening: screenings,
+        CandidateCounseling: list(dataset.counselings()),
+        # Empty, but the list query joins them
+        CandidateAssignment: [],
+        CandidateDocument: [],
+        User: [],
+    }
+
+
+def _expected(rows: dict, keep=lambda candidate: True) -> dict:
+    """Facet counts over the non-deleted candidates ``keep`` accepts"""
+    screenings = {row["candidate_id"]: row for row in rows[CandidateScreening]}
+    counselings = {row["candidate_id"]: row for row in rows[CandidateCounseling]}
+    candidates = [row for row in rows[Candidate] if not row["is_deleted"] and keep(row)]
+
+    def screening_status(candidate):
+        screening = screenings.get(candidate["id"])
+        if screening is None:
+            return "Pending"
+        return screening["status"] or "In Progress"
+
+    def degrees(candidate):
+        value = candidate["education_details"]["degrees"]
+        return value if isinstance(value, list) else []
+
+    def registration_type(candidate):
+        value = (candidate["other"].get("registration_type") or "").strip().capitalize()
+        return value or "Registered"
+
+    return {
+        "disability_types": Counter(c["disability_details"]["disability_type"] for c in candidates if c["disability_details"]["disability_type"]),
+        "education_levels": Counter(name for c in candidates for name in {d["degree_name"] for d in degrees(c)}),
+        "years_of_passing": Counter(str(year) for c in candidates for year in {d["year_of_passing"] for d in degrees(c)}),
+        "cities": Counter(c["city"] for c in candidates if c["city"]),
+        "registration_types": Counter(registration_type(c) for c in candidates),
+        "screening_statuses": Counter(screening_status(c) for c in candidates),
+        "screening_reasons": Counter(
+            screenings[c["id"]]["others"]["reason"]
+            for c in candidates
+            if c["id"] in screenings and screenings[c["id"]]["others"].get("reason")
+        ),
+        "counseling_statuses": Counter(counselings[c["id"]]["status"] for c in candidates if c["id"] in counselings),
+    }
+
+
+async def _facets(db: AsyncSession, **filters) -> tuple:
+    repository = CandidateRepository(db)
+    facets = await (repository.get_filter_facets(**filters) if filters else repository.get_facets())
+    _, total = await repository.get_multi(limit=1, flat=True, **filters)
+    return facets, total
+
+
+@pytest.mark.asyncio
+async def test_facets_count_every_non_deleted_candidate(seed_rows, session):
+    facets, total = await _facets(session)
+
+    for name, expected in _expected(seed_rows).items():
+        assert dict(facets[name]) == expected, name
+    assert sum(count for _, count in facets["screening_statuses"]) == total
+    # Most common first
+    counts = [count for _, count in facets["cities"]]
+    assert counts == sorted(counts, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_facets_follow_the_list_filters(seed_rows, session):
+    city = seed_rows[Candidate][10]["city"]
+    screened = {row["candidate_id"] for row in seed_rows[CandidateScreening] if row["status"] == "Completed"}
+    facets, total = await _facets(session, cities=[city], screening_status="Completed")
+
+    expected = _expected(seed_rows, lambda candidate: candidate["city"] == city and candidate["id"] in screened)
+    for name, counts in expected.items():
+        assert dict(facets[name]) == counts, name
+    assert facets["cities"] == [(city, total)]
+
+
+@pytest.mark.asyncio
+async def test_filter_options_keep_their_shape(session):
+    facets, _ = await _facets(session)
+    options = filter_options(facets)
+
+    assert {"Pending", "In Progress", "Completed"} <= set(options["screening_statuses"])
+    assert {"Registered", "Excel"} <= set(options["registration_types"])
+    assert options["years_of_passing"] == sorted(options["years_of_passing"], reverse=True)
+    assert all(isinstance(value, int) for value in options["disability_percentages"])
+    assert options["screening_reasons"] == ["Not interested"]
@@ -0,0 +1,208 @@
+"""
+The flat candidate list projection must render what the ORM path renders.
+
+Needs a real Postgres: set TEST_POSTGRES_URL (postgresql+asyncpg://...) to run.
+Seeds candidates covering the JSON shapes the list validator special-cases
+(missing/empty/null keys, string vs list assigned_to, no screening or
+counseling row) and compares CandidateListItem rows from the projection with
+CandidateListResponse built from the ORM objects.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate import Candidate
+from app.models.candidate_assignment import CandidateAssignment
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.candidate_document import CandidateDocument
+from app.models.candidate_screening import CandidateScreening
+from app.models.user import User, UserRole
+from app.repositories.candidate_repository import CandidateRepository
+from app.schemas.candidate import CandidateListItem, CandidateListResponse
+from app.utils.fieldsets import FieldSelection
+from tests.postgres import POSTGRES_URL
+
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+NOW = datetime(2026, 6, 1)
+
+DISABILITY = [
+    None,
+    {},
+    {"is_disabled": True, "disability_type": "Locomotor", "disability_percentage": 40},
+    {"is_disabled": False, "disability_percentage": "55.5"},
+]
+EXPERIENCE = [
+    None,
+    {"is_experienced": True, "year_of_experience": "3", "currently_employed": True},
+    {"is_experienced": False},
+]
+EDUCATION = [
+    None,
+    {"degrees": []},
+    {"degrees": [{"degree_name": "B.Com", "year_of_passing": 2020, "specialization": "Finance"}, {"degree_name": "M.Com"}]},
+    {"degrees": [{"degree_name": "BA"}]},
+]
+OTHER = [None, {}, {"registration_type": "Registered"}, {"registration_type": "Excel", "status_of_beneficiary": "x"}]
+SCREENING_STATUS = ["Completed", "In Progress", "", None, "Rejected", "On Hold"]
+SCREENING_OTHERS = [
+    None,
+    {},
+    {"source_of_info": "Newspaper", "family_annual_income": 120000, "reason": "Relocated"},
+    {"reason": None},
+]
+SCREENING_SKILLS = [None, [], {"languages": ["Hindi"]}]
+COUNSELING_OTHERS = [
+    None,
+    {},
+    {"suitable_job_roles": ["Cashier"], "assigned_to": "Retail", "remarks": "Good"},
+    {"assigned_to": ["Retail", "BPO"]},
+    {"assigned_to": [], "suitable_job_roles": None},
+    {"assigned_to": ""},
+]
+DOCUMENTS = [[], ["resume"], ["resume", "pan_card", "10th_certificate"]]
+
+
+@pytest.fixture(scope="module")
+def seed_rows() -> dict:
+    users = [
+        {
+            "id": user_id,
+            "email": f"user{user_id}@example.com",
+            "username": f"user{user_id}",
+            "full_name": ["Asha Rao", "", None][user_id % 3],
+            "hashed_password": "x",
+            "role": UserRole.SOURCING,
+        }
+        for user_id in range(1, 7)
+    ]
+    candidates, screenings, counselings, assignments, documents = [], [], [], [], []
+    for i in range(1, 121):
+        candidates.append({
+            "id": i,
+            "name": f"Candidate {i}",
+            "gender": ["Male", "Female", "Other"][i % 3],
+            "email": f"candidate{i}@example.com",
+            "phone": f"90000{i:05d}",
+            "pincode": "560001",
+            "city": ["Bengaluru", "Pune"][i % 2],
+            "district": "Urban",
+            "state": "KA",
+            "disability_details": DISABILITY[i % len(DISABILITY)],
+            "work_experience": EXPERIENCE[i % len(EXPERIENCE)],
+            "education_details": EDUCATION[i % len(EDUCATION)],
+            "other": OTHER[i % len(OTHER)],
+            "created_at": NOW - timedelta(hours=i),
+        })
+        if i % 5:
+            screenings.append({
+                "candidate_id": i,
+                "status": SCREENING_STATUS[i % len(SCREENING_STATUS)],
+                "consent_status": ["Accepted", None][i % 2],
+                "family_details": [{"relation": "Mother"}] if i % 4 else None,
+                "others": SCREENING_OTHERS[i % len(SCREENING_OTHERS)],
+                "skills": SCREENING_SKILLS[i % len(SCREENING_SKILLS)],
+                "screened_by_id": (i % 7) or None,
+            })
+        if i % 3:
+            counselings.append({
+                "candidate_id": i,
+                "status": ["pending", "selected", "rejected"][i % 3],
+                "counselor_id": (i % 7) or None,
+                "counselor_name": ["Walk-in counselor", None][i % 2],
+                "counseling_date": NOW - timedelta(days=i),
+                "feedback": "Motivated" if i % 2 else None,
+                "skills": [{"name": "Excel"}] if i % 2 else None,
+                "questions": [] if i % 4 else None,
+                "workexperience": [{"company": "Acme"}] if i % 6 == 1 else None,
+                "others": COUNSELING_OTHERS[i % len(COUNSELING_OTHERS)],
+            })
+        if i % 4 == 1:
+            assignments.append({"candidate_id": i, "user_id": (i % 6) + 1, "assigned_by_id": 1})
+        for position, document_type in enumerate(DOCUMENTS[i % len(DOCUMENTS)]):
+            documents.append({
+                "candidate_id": i,
+                "document_type": document_type,
+                "document_name": f"{document_type}.pdf",
+                "file_path": f"/uploads/{i}/{document_type}.pdf",
+                "is_active": position != 1 or i % 2 == 0,
+            })
+    return {
+        User: users,
+        Candidate: candidates,
+        CandidateScreening: screenings,
+        CandidateCounseling: counselings,
+        CandidateAssignment: assignments,
+        CandidateDocument: documents,
+    }
+
+
+async def _assert_same_page(db: AsyncSession, method: str, **kwargs) -> int:
+    repository = CandidateRepository(db)
+    orm_items, orm_total = await getattr(repository, method)(**kwargs)
+    expected = [CandidateListResponse.model_validate(item).model_dump(mode="json") for item in orm_items]
+    db.expunge_all()
+
+    rows, total = await getattr(repository, method)(flat=True, **kwargs)
+    actual = [CandidateListItem.model_validate(row).model_dump(mode="json") for row in rows]
+
+    assert total == orm_total
+    assert [item["id"] for item in actual] == [item["id"] for item in expected]
+    for got, want in zip(actual, expected):
+        # The ORM path has no defined document order; the projection uses upload order
+        want["documents_uploaded"].sort()
+        got["documents_uploaded"].sort()
+        assert got == want, got["id"]
+    return len(actual)
+
+
+@pytest.mark.asyncio
+async def test_all_candidates_page_matches_orm_path(session):
+    assert await _assert_same_page(session, "get_multi", limit=200) == 120
+    assert await _assert_same_page(session, "get_multi", skip=10, limit=25, sort_by="name", sort_order="asc") == 25
+
+
+@pytest.mark.asyncio
+async def test_filtered_candidates_page_matches_orm_path(session):
+    assert await _assert_same_page(session, "get_multi", limit=200, assigned_to_id=2)
+    assert await _assert_same_page(session, "get_multi", limit=200, screening_status="In Progress")
+    assert await _assert_same_page(session, "get_multi", limit=200, is_experienced=True, search="Candidate 1")
+
+
+@pytest.mark.asyncio
+async def test_unscreened_page_matches_orm_path(session):
+    assert await _assert_same_page(session, "get_unscreened", limit=200) == 24
+
+
+@pytest.mark.asyncio
+async def test_screened_page_matches_orm_path(session):
+    assert await _assert_same_page(session, "get_screened", limit=200)
+    assert await _assert_same_page(session, "get_screened", limit=200, counseling_status="not_counseled")
+    assert await _assert_same_page(session, "get_screened", limit=200, document_status="pending")
+
+
+@pytest.mark.asyncio
+async def test_sparse_fields_skip_unneeded_user_joins(session):
+    repository = CandidateRepository(session)
+    full, _ = await repository.get_multi(limit=200, flat=True)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    try:
+        fields = FieldSelection.parse(CandidateListItem, ["name", "counselor_name"])
+        rows, _ = await repository.get_multi(limit=200, flat=True, fields=fields)
+    finally:
+        event.remove(bind, "before_cursor_execute", record)
+
+    assert rows == [{key: row[key] for key in rows[0]} for row in full]
+    listing = statements[-1]
+    assert "counselor" in listing
+    assert "screener" not in listing and "assignee" not in listing
@@ -0,0 +1,176 @@
+"""
+Key repository queries must be answered from their indexes.
+
+Needs a real Postgres: set TEST_POSTGRES_URL (postgresql+asyncpg://...) to run.
+Each run creates its own schema, seeds a few thousand rows per table, runs
+ANALYZE and checks the plan of the statement the repository method actually
+sends. Foreign keys are left out so tables can be seeded independently.
+"""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.dsr_entry import DSREntry, DSRStatus
+from app.models.notification import Notification
+from app.models.placement_mapping import PlacementMapping
+from app.models.training_attendance import TrainingAttendance
+from app.repositories.candidate_counseling_repository import CandidateCounselingRepository
+from app.repositories.dsr_entry_repository import DSREntryRepository
+from app.repositories.notification_repository import NotificationRepository
+from app.repositories.placement_mapping_repository import PlacementMappingRepository
+from app.repositories.training_attendance_repository import TrainingAttendanceRepository
+from tests.postgres import POSTGRES_URL
+
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+START = date(2026, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def seed_rows() -> dict:
+    rng = random.Random(40)
+    now = datetime(2026, 6, 1)
+    return {
+        Notification: [
+            {
+                "user_id": user_id,
+                "title": "DSR Approved",
+                "message": "Your DSR has been approved.",
+                "type": "dsr_approved",
+                "is_read": rng.random() > 0.1,
+                "created_at": now - timedelta(minutes=rng.randrange(200_000)),
+            }
+            for user_id in range(1, 401)
+            for _ in range(50)
+        ],
+        DSREntry: [
+            {
+                "user_id": user_id,
+                "report_date": START + timedelta(days=day),
+                "status": DSRStatus.APPROVED,
+                "items": [],
+            }
+            for user_id in range(1, 201)
+            for day in range(100)
+        ],
+        TrainingAttendance: [
+            {
+                "batch_id": batch_id,
+                "candidate_id": batch_id * 100 + candidate,
+                "date": START + timedelta(days=day),
+                "status": "present" if rng.random() > 0.2 else "absent",
+            }
+            for batch_id in range(1, 21)
+            for candidate in range(30)
+            for day in range(40)
+        ],
+        PlacementMapping: [
+            {
+                "candidate_id": candidate_id,
+                "job_role_id": job_role_id,
+                "is_active": rng.random() < 0.05,
+                "mapped_at": now,
+            }
+            for candidate_id in range(1, 2001)
+            for job_role_id in rng.sample(range(1, 301), 10)
+        ],
+        CandidateCounseling: [
+            {
+                "candidate_id": candidate_id,
+                "status": rng.choice(["pending", "selected", "rejected"]),
+                "counselor_id": rng.randrange(1, 201),
+                "counseling_date": now - timedelta(hours=candidate_id),
+            }
+            for candidate_id in range(1, 20_001)
+        ],
+    }
+
+
+class _Captured(Exception):
+    pass
+
+
+async def _indexes_used(db: AsyncSession, call) -> set:
+    """Index names in the plan of the first statement ``call`` sends"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+        # Stop before it runs: only the plan matters, and relationship loads
+        # would need tables this schema does not have
+        raise _Captured()
+
+    sync_engine = db.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    except _Captured:
+        pass
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", capture)
+    await db.rollback()
+
+    statement, parameters = statements[0]
+    connection = await db.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    plan = result.scalar_one()[0]["Plan"]
+
+    used, nodes = set(), [plan]
+    while nodes:
+        node = nodes.pop()
+        if "Index Name" in node:
+            used.add(node["Index Name"])
+        nodes.extend(node.get("Plans", []))
+    return used
+
+
+@pytest.mark.asyncio
+async def test_notification_feed_queries_use_user_indexes(session):
+    repository = NotificationRepository(session)
+    assert "ix_notifications_user_created" in await _indexes_used(
+        session, lambda: repository.get_user_notifications(17)
+    )
+    assert "ix_notifications_user_unread" in await _indexes_used(
+        session, lambda: repository.get_user_notifications(17, unread_only=True)
+    )
+    assert "ix_notifications_user_unread" in await _indexes_used(
+        session, lambda: repository.get_unread_count(17)
+    )
+
+
+@pytest.mark.asyncio
+async def test_dsr_entry_lookup_by_user_and_date_uses_composite_index(session):
+    repository = DSREntryRepository(session)
+    assert "ix_dsr_entries_user_report_date" in await _indexes_used(
+        session, lambda: repository.get_by_user_and_date(42, START + timedelta(days=30))
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_register_for_a_day_uses_batch_date_index(session):
+    repository = TrainingAttendanceRepository(session)
+    assert "ix_training_attendance_batch_date" in await _indexes_used(
+        session, lambda: repository.get_by_batch_and_date(7, START + timedelta(days=12))
+    )
+
+
+@pytest.mark.asyncio
+async def test_active_mappings_for_candidate_use_partial_index(session):
+    repository = PlacementMappingRepository(session)
+    assert "ix_placement_mappings_candidate_active" in await _indexes_used(
+        session, lambda: repository.get_by_candidate_active(123)
+    )
+
+
+@pytest.mark.asyncio
+async def test_counseling_by_counselor_uses_counselor_date_index(session):
+    repository = CandidateCounselingRepository(session)
+    assert "ix_candidate_counseling_counselor_date" in await _indexes_used(
+        session, lambda: repository.get_by_counselor(9)
+    )
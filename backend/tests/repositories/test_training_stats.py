@@ -0,0 +1,155 @@
+"""
+TrainingBatchRepository.get_stats must bucket candidates like the original
+query-per-bucket implementation.
+
+Needs a real Postgres: set TEST_POSTGRES_URL (postgresql+asyncpg://...) to run.
+Seeds random batches, allocations and counseling outcomes and compares the
+repository's counts with a plain-Python version of the previous algorithm:
+in training (active batch, not dropped out) > moved to placement >
+completed > dropped out, each candidate counted in the first bucket they
+qualify for.
+"""
+
+import random
+
+import pytest
+from sqlalchemy import text
+
+from app.models.candidate import Candidate
+from app.models.candidate_counseling import CandidateCounseling
+from app.models.training_batch import TrainingBatch
+from app.models.training_candidate_allocation import TrainingCandidateAllocation
+from app.repositories.training_batch_repository import TrainingBatchRepository
+from tests.postgres import POSTGRES_URL
+
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+
+BATCH_STATUSES = ["planned", "running", "extended", "closed", "cancelled"]
+ALLOCATION_STATUSES = ["allocated", "in_training", "completed", "moved_to_placement", "dropped_out"]
+DISABILITY_TYPES = [None, [], ["Women"], ["Locomotor", "Women"], ["Hearing"]]
+OTHER = [None, {}, {"registration_type": "Registered"}, {"registration_type": "Excel"}]
+
+
+@pytest.fixture(scope="module")
+def seed_rows() -> dict:
+    rng = random.Random(44)
+    batches = [
+        {
+            "id": batch_id,
+            "batch_name": f"Batch {batch_id}",
+            "status": rng.choice(BATCH_STATUSES),
+            "disability_types": rng.choice(DISABILITY_TYPES),
+            "is_deleted": rng.random() < 0.1,
+        }
+        for batch_id in range(1, 41)
+    ]
+    candidates = [
+        {
+            "id": candidate_id,
+            "name": f"Candidate {candidate_id}",
+            "gender": "Female",
+            "email": f"candidate{candidate_id}@example.com",
+            "phone": f"90000{candidate_id:05d}",
+            "pincode": "560001",
+            "city": "Pune",
+            "district": "Pune",
+            "state": "MH",
+            "other": rng.choice(OTHER),
+            "is_deleted": rng.random() < 0.05,
+        }
+        for candidate_id in range(1, 601)
+    ]
+    for candidate in candidates:
+        # Left out rather than None, which the JSON type would store as JSON null
+        if candidate["other"] is None:
+            del candidate["other"]
+    counselings = [
+        {"candidate_id": candidate["id"], "status": rng.choice(["Selected", "selected", "pending", "rejected"])}
+        for candidate in candidates
+        if rng.random() < 0.8
+    ]
+    allocations = [
+        {
+            "batch_id": rng.randrange(1, 41),
+            "candidate_id": candidate["id"],
+            "status": rng.choice(ALLOCATION_STATUSES),
+            "is_dropout": rng.random() < 0.2,
+            "is_deleted": rng.random() < 0.1,
+        }
+        for candidate in candidates
+        for _ in range(rng.choice([0, 0, 1, 1, 2, 3]))
+    ]
+    return {
+        TrainingBatch: batches,
+        Candidate: candidates,
+        CandidateCounseling: counselings,
+        TrainingCandidateAllocation: allocations,
+    }
+
+
+def _expected_stats(rows: dict) -> dict:
+    """The previous TrainingBatchService.get_stats, over the seeded rows"""
+    batches = [batch for batch in rows[TrainingBatch] if not batch["is_deleted"]]
+    candidates = {candidate["id"]: candidate for candidate in rows[Candidate]}
+
+    def registered(candidate_id):
+        other = candidates[candidate_id].get("other")
+        return other is None or other.get("registration_type") == "Registered"
+
+    total_selected = sum(
+        1
+        for counseling in rows[CandidateCounseling]
+        if counseling["status"].lower() == "selected"
+        and not candidates[counseling["candidate_id"]]["is_deleted"]
+        and registered(counseling["candidate_id"])
+    )
+    allocations = [
+        allocation
+        for allocation in rows[TrainingCandidateAllocation]
+        if not allocation["is_deleted"] and registered(allocation["candidate_id"])
+    ]
+    active = {batch["id"] for batch in batches if batch["status"] in ("planned", "running", "extended")}
+
+    def ids(predicate, excluded):
+        return {a["candidate_id"] for a in allocations if predicate(a)} - excluded
+
+    in_training = ids(lambda a: a["batch_id"] in active and not a["is_dropout"], set())
+    moved = ids(lambda a: a["status"] == "moved_to_placement", in_training)
+    completed = ids(lambda a: a["status"] == "completed", in_training | moved)
+    dropped = ids(lambda a: a["is_dropout"], in_training | moved | completed)
+
+    return {
+        "total": len(batches),
+        "planned": sum(1 for b in batches if b["status"] == "planned"),
+        "running": sum(1 for b in batches if b["status"] == "running"),
+        "completed": sum(1 for b in batches if b["status"] == "closed"),
+        "total_selected": total_selected,
+        "in_training": len(in_training),
+        "moved_to_placement": len(moved),
+        "completed_candidates": len(completed),
+        "completed_training": len(moved | completed),
+        "dropped_out": len(dropped),
+        "ready_for_training": max(0, total_selected - len(in_training | moved | completed | dropped)),
+        "women": sum(1 for b in batches if b["disability_types"] and "Women" in b["disability_types"]),
+    }
+
+
+@pytest.mark.asyncio
+async def test_stats_match_query_per_bucket_version(seed_rows, session):
+    stats = await TrainingBatchRepository(session).get_stats()
+
+    expected = _expected_stats(seed_rows)
+    assert stats == expected
+    # Every bucket is populated, so the comparison covers each priority rule
+    assert all(expected[name] for name in ("in_training", "moved_to_placement", "completed_candidates", "dropped_out"))
+
+
+@pytest.mark.asyncio
+async def test_stats_on_empty_tables(seed_rows, session):
+    for model in seed_rows:
+        await session.execute(text(f"DELETE FROM {model.__tablename__}"))
+    stats = await TrainingBatchRepository(session).get_stats()
+    await session.rollback()
+
+    assert set(stats.values()) == {0}
@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from datetime import datetime, timezone
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.core import database
+from app.models.activity_log import ActivityLog, ActionType
+from app.services.activity_log_pipeline import ActivityLogPipeline
+from app.utils.activity_tracker import get_changes
+
+
+def _row(i: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "user_id": None,
+        "action_type": ActionType.UPDATE,
+        "endpoint": f"/api/v1/items/{i}",
+        "method": "PUT",
+        "resource_type": "item",
+        "resource_id": i,
+        "changes": {"before": {"n": i}, "after": {"n": i + 1}},
+        "ip_address": "127.0.0.1",
+        "user_agent": "pytest",
+        "status_code": 200,
+        "created_at": now,
+        "updated_at": now,
+        "is_deleted": False,
+    }
+
+
+@pytest.fixture
+async def log_sessions(monkeypatch, tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(ActivityLog.__table__.create)
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(database, "AsyncSessionLocal", sessions)
+    yield sessions
+    await engine.dispose()
+
+
+async def _count(sessions) -> int:
+    async with sessions() as db:
+        return (await db.execute(select(func.count()).select_from(ActivityLog))).scalar_one()
+
+
+@pytest.mark.anyio
+async def test_rows_are_batched_and_flushed_on_stop(log_sessions, tmp_path):
+    """Queued rows are written by the background writer and drained on shutdown"""
+    pipeline = ActivityLogPipeline(100, 50, 5.0, str(tmp_path / "spool.jsonl"))
+    await pipeline.start()
+    for i in range(7):
+        await pipeline.submit(None, _row(i))
+    await pipeline.stop()
+
+    assert await _count(log_sessions) == 7
+    assert not (tmp_path / "spool.jsonl").exists()
+
+
+@pytest.mark.anyio
+async def test_stop_keeps_the_batch_the_writer_holds(log_sessions, tmp_path, monkeypatch):
+    """Rows already taken off the queue, or being written, are not lost on shutdown"""
+    pipeline = ActivityLogPipeline(100, 50, 5.0, str(tmp_path / "spool.jsonl"))
+    await pipeline.start()
+    for i in range(7):
+        await pipeline.submit(None, _row(i))
+    # The writer now holds all 7 rows while it waits out the flush interval
+    await asyncio.sleep(0.05)
+    await pipeline.stop()
+    assert await _count(log_sessions) == 7
+
+    write = pipeline._write
+
+    async def slow_write(rows):
+        await asyncio.sleep(0.1)
+        await write(rows)
+
+    monkeypatch.setattr(pipeline, "_write", slow_write)
+    pipeline.flush_interval = 0.01
+    await pipeline.start()
+    for i in range(5):
+        await pipeline.submit(None, _row(i))
+    # Stop while the first batch is being written
+    await asyncio.sleep(0.05)
+    await pipeline.stop()
+
+    assert await _count(log_sessions) == 12
+    assert not (tmp_path / "spool.jsonl").exists()
+
+
+@pytest.mark.anyio
+async def test_rows_are_written_through_the_session_when_not_running(log_sessions, tmp_path):
+    """Without the background writer a row goes through create_log"""
+    pipeline = ActivityLogPipeline(100, 50, 5.0, str(tmp_path / "spool.jsonl"))
+    async with log_sessions() as db:
+        await pipeline.submit(db, _row(1))
+
+    assert await _count(log_sessions) == 1
+
+
+@pytest.mark.anyio
+async def test_failed_flush_spools_and_replays(log_sessions, tmp_path, monkeypatch):
+    """Rows survive a database failure via the spool file and replay on start"""
+    spool = tmp_path / "spool.jsonl"
+    pipeline = ActivityLogPipeline(100, 50, 0.01, str(spool))
+
+    async def broken_write(rows):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(pipeline, "_write", broken_write)
+    await pipeline.start()
+    for i in range(3):
+        await pipeline.submit(None, _row(i))
+    await pipeline.stop()
+    assert len(spool.read_text().splitlines()) == 3
+
+    monkeypatch.undo()
+    monkeypatch.setattr(database, "AsyncSessionLocal", log_sessions)
+    pipeline = ActivityLogPipeline(100, 50, 0.01, str(spool))
+    await pipeline.start()
+    await pipeline.stop()
+
+    assert await _count(log_sessions) == 3
+    assert not spool.exists()
+
+
+def test_get_changes_only_reports_changed_fields():
+    """Diffs contain changed, non-sensitive fields only"""
+    changes = get_changes(
+        {"name": "a", "city": "x", "password": "old"},
+        {"name": "b", "city": "x", "password": "new"},
+    )
+    assert changes == {"before": {"name": "a"}, "after": {"name": "b"}}
+
+    same = {"name": "a"}
+    assert get_changes(same, same) is None
@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from starlette.requests import Request
+
+from app.models.candidate import Candidate
+from app.repositories import candidate_repository
+from app.repositories.candidate_repository import CandidateRepository
+from app.services import candidate_facet_index
+from app.services.candidate_facet_index import CandidateFacetIndex, FacetSnapshot
+
+
+FACETS = {
+    **{name: [] for name in candidate_repository.FACETS},
+    "cities": [("Chennai", 3), ("Pune", 1)],
+    "screening_statuses": [("Completed", 2)],
+}
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    """Counts aggregate runs instead of querying Postgres"""
+    calls = []
+
+    async def get_facets(self, conditions=None):
+        calls.append(conditions)
+        return FACETS
+
+    monkeypatch.setattr(CandidateRepository, "get_facets", get_facets)
+    return calls
+
+
+@pytest.fixture
+async def sessions(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'facets.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Candidate.__table__.create)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def index(monkeypatch):
+    index = CandidateFacetIndex(ttl_seconds=300)
+    monkeypatch.setattr(candidate_facet_index, "candidate_facets", index)
+    return index
+
+
+def _candidate(name: str) -> Candidate:
+    return Candidate(
+        name=name, gender="Female", email=f"{name}@example.com", phone="9000000000",
+        pincode="600001", city="Chennai", district="Chennai", state="Tamil Nadu",
+    )
+
+
+def _request(**headers) -> Request:
+    raw = [(key.replace("_", "-").encode(), value.encode()) for key, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+@pytest.mark.anyio
+async def test_snapshot_is_reused_until_a_commit_changes_candidates(builds, sessions, index):
+    async with sessions() as db:
+        first = await index.get(db)
+        assert await index.get(db) is first
+        assert len(builds) == 1
+
+        # A rolled back write and an unrelated commit keep the snapshot
+        db.add(_candidate("rolled"))
+        await db.flush()
+        await db.rollback()
+        await db.commit()
+        assert await index.get(db) is first
+
+        db.add(_candidate("asha"))
+        await db.commit()
+        second = await index.get(db)
+        assert second is not first and len(builds) == 2
+
+        # Bulk statements count too
+        await db.execute(update(Candidate).values(city="Pune"))
+        await db.commit()
+        await index.get(db)
+        assert len(builds) == 3
+
+
+@pytest.mark.anyio
+async def test_snapshot_expires_after_ttl(builds, sessions, index):
+    index.ttl_seconds = 0
+    async with sessions() as db:
+        await index.get(db)
+        await index.get(db)
+    assert len(builds) == 2
+
+
+def test_response_revalidates_with_etag():
+    snapshot = FacetSnapshot.build(FACETS)
+
+    response = snapshot.response(_request())
+    assert response.status_code == 200
+    assert response.headers["etag"] == snapshot.etag
+    assert b'"cities":["Chennai","Pune"]' in response.body
+
+    assert snapshot.response(_request(if_none_match=snapshot.etag)).status_code == 304
+    assert snapshot.response(_request(if_none_match='"stale"')).status_code == 200
@@ -0,0 +1,130 @@
+"""Tests for the email outbox dispatcher helpers and the SMTP connection pool"""
+
+from datetime import datetime, timezone
+
+import aiosmtplib
+import pytest
+
+from app.core.config import settings
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox_service import (
+    PermanentDeliveryError,
+    build_message,
+    is_permanent,
+    retry_delay,
+)
+from app.services.smtp_pool import SMTPConnectionPool, SMTPTransport
+
+
+TRANSPORT = SMTPTransport(
+    host="smtp.example.com",
+    port=587,
+    username="mailer",
+    password="secret",
+    from_email="no-reply@example.com",
+    from_name="Example",
+)
+
+
+class FakeSMTP:
+    def __init__(self):
+        self.is_connected = True
+        self.sent = []
+
+    async def send_message(self, message):
+        self.sent.append(message)
+        return {}, "OK"
+
+    async def noop(self):
+        pass
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+def _pool(opened: list, **kwargs) -> SMTPConnectionPool:
+    async def connect(transport, timeout):
+        client = FakeSMTP()
+        opened.append(client)
+        return client
+
+    options = {"max_connections": 2, "idle_seconds": 60, "max_messages": 100, "timeout": 5}
+    options.update(kwargs)
+    return SMTPConnectionPool(connect=connect, **options)
+
+
+@pytest.mark.anyio
+async def test_pool_reuses_connection_across_messages():
+    opened = []
+    pool = _pool(opened)
+    for number in range(5):
+        async with pool.connection(TRANSPORT) as client:
+            await client.send_message(number)
+
+    assert len(opened) == 1
+    assert opened[0].sent == [0, 1, 2, 3, 4]
+    await pool.close_all()
+    assert not opened[0].is_connected
+
+
+@pytest.mark.anyio
+async def test_pool_recycles_after_max_messages_and_on_error():
+    opened = []
+    pool = _pool(opened, max_messages=2)
+    for number in range(4):
+        async with pool.connection(TRANSPORT) as client:
+            await client.send_message(number)
+    assert len(opened) == 2
+
+    with pytest.raises(aiosmtplib.SMTPServerDisconnected):
+        async with pool.connection(TRANSPORT):
+            raise aiosmtplib.SMTPServerDisconnected("gone")
+    async with pool.connection(TRANSPORT) as client:
+        await client.send_message("after error")
+    assert len(opened) == 4
+
+
+def test_retry_delay_backs_off_exponentially(monkeypatch):
+    monkeypatch.setattr(settings, "EMAIL_RETRY_BASE_SECONDS", 30)
+    monkeypatch.setattr(settings, "EMAIL_RETRY_MAX_SECONDS", 600)
+
+    assert 24 <= retry_delay(1) <= 36
+    assert 96 <= retry_delay(3) <= 144
+    assert 480 <= retry_delay(10) <= 720
+
+
+def test_permanent_errors_are_not_retried():
+    assert is_permanent(PermanentDeliveryError("no config"))
+    assert is_permanent(aiosmtplib.SMTPDataError(550, "mailbox unavailable"))
+    assert not is_permanent(aiosmtplib.SMTPDataError(451, "try again later"))
+    assert not is_permanent(aiosmtplib.SMTPAuthenticationError(535, "bad credentials"))
+    assert not is_permanent(aiosmtplib.SMTPServerDisconnected("gone"))
+
+
+def test_build_message_attaches_files(tmp_path):
+    report = tmp_path / "report.bin"
+    report.write_bytes(b"xlsx-bytes")
+    message = EmailOutbox(
+        id=7,
+        to_email="hr@company.com",
+        cc=["lead@company.com"],
+        subject="Report",
+        html_body="<p>Hello</p>",
+        attachments=[{"filename": "report.xlsx", "path": str(report), "spooled": True}],
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+    mime = build_message(TRANSPORT, message)
+    assert mime["From"] == "Example <no-reply@example.com>"
+    assert mime["Cc"] == "lead@company.com"
+    assert mime["Message-ID"].startswith("<outbox-7.")
+    parts = mime.get_payload()
+    assert parts[1].get_filename() == "report.xlsx"
+    assert parts[1].get_payload(decode=True) == b"xlsx-bytes"
+
+    report.unlink()
+    with pytest.raises(PermanentDeliveryError):
+        build_message(TRANSPORT, message)
@@ -0,0 +1,81 @@
+"""Tests for the streaming, content-addressed file store"""
+
+import hashlib
+import os
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException
+from starlette.datastructures import UploadFile
+
+from app.services.file_storage_service import FileStorageService
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(FileStorageService, "OBJECT_STORE_DIR", tmp_path / "objects")
+    monkeypatch.setattr(FileStorageService, "TEMP_UPLOAD_DIR", tmp_path / "objects" / "tmp")
+    monkeypatch.setattr(FileStorageService, "UPLOAD_CHUNK_SIZE", 1024)
+    return tmp_path / "objects"
+
+
+def _upload(content: bytes, filename: str = "certificate.pdf") -> UploadFile:
+    return UploadFile(file=BytesIO(content), filename=filename)
+
+
+async def _save(upload: UploadFile) -> dict:
+    return await FileStorageService.save_file(
+        upload, candidate_public_id="0" * 32, document_type="disability_certificate"
+    )
+
+
+@pytest.mark.anyio
+async def test_save_file_streams_and_hashes(store):
+    content = b"%PDF" + b"x" * 5000
+    info = await _save(_upload(content))
+
+    sha = hashlib.sha256(content).hexdigest()
+    assert info["content_sha256"] == sha
+    assert info["file_size"] == len(content)
+    assert info["file_path"] == str(store / sha[:2] / sha[2:4] / f"{sha}.pdf")
+    with open(info["file_path"], "rb") as stored:
+        assert stored.read() == content
+    assert not any((store / "tmp").iterdir())
+
+
+@pytest.mark.anyio
+async def test_identical_uploads_share_one_object(store):
+    first = await _save(_upload(b"same bytes", "a.pdf"))
+    second = await _save(_upload(b"same bytes", "b.pdf"))
+
+    assert first["file_path"] == second["file_path"]
+    assert first["file_name"] != second["file_name"]
+    assert len([p for p in store.rglob("*.pdf")]) == 1
+
+
+@pytest.mark.anyio
+async def test_size_limit_enforced_while_streaming(store, monkeypatch):
+    monkeypatch.setattr(FileStorageService, "MAX_FILE_SIZE", 2048)
+
+    with pytest.raises(HTTPException) as exc:
+        await _save(_upload(b"x" * 4096))
+
+    assert exc.value.status_code == 400
+    assert not list(store.rglob("*.pdf"))
+    assert not any((store / "tmp").iterdir())
+
+
+@pytest.mark.anyio
+async def test_before_store_runs_before_the_object_is_stored(store):
+    seen = []
+
+    async def before_store(object_path: str):
+        seen.append((object_path, os.path.exists(object_path)))
+
+    info = await FileStorageService.save_file(
+        _upload(b"locked bytes"), candidate_public_id="0" * 32,
+        document_type="disability_certificate", before_store=before_store,
+    )
+
+    assert seen == [(info["file_path"], False)]
+    assert os.path.exists(info["file_path"])
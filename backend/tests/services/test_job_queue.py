@@ -0,0 +1,167 @@
+"""Tests for the background job queue: enqueueing, claiming, retries and shutdown"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.jobs import registry, worker as worker_module
+from app.jobs.registry import JobContext, PermanentJobError, job_handler
+from app.jobs.worker import JobWorker, parse_queues
+from app.models.job import Job, JobStatus
+from app.services.job_service import JobService, retry_delay
+
+
+calls = []
+
+
+@job_handler("test_report", queue="tests", max_attempts=2)
+async def build_report(ctx: JobContext, rows: int) -> dict:
+    await ctx.progress(50, "Halfway")
+    calls.append(("report", rows))
+    return {"rows": rows}
+
+
+@job_handler("test_flaky", queue="tests", max_attempts=2)
+async def flaky(ctx: JobContext) -> None:
+    raise RuntimeError("upstream unavailable")
+
+
+@job_handler("test_invalid", queue="tests", max_attempts=5)
+async def invalid(ctx: JobContext) -> None:
+    raise PermanentJobError("record is gone")
+
+
+@job_handler("test_slow", queue="tests")
+async def slow(ctx: JobContext) -> None:
+    await asyncio.sleep(30)
+
+
+@pytest.fixture
+async def sessions(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync: Job.__table__.create(sync))
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    monkeypatch.setattr(worker_module, "AsyncSessionLocal", factory)
+    monkeypatch.setattr(registry, "AsyncSessionLocal", factory)
+    calls.clear()
+    yield factory
+    await engine.dispose()
+
+
+def _worker(**kwargs) -> JobWorker:
+    options = dict(
+        queues={"tests": 2},
+        poll_interval=0.05,
+        heartbeat_seconds=60,
+        stale_after_seconds=120,
+        shutdown_grace_seconds=5,
+    )
+    options.update(kwargs)
+    return JobWorker(**options)
+
+
+async def _enqueue(sessions, handler, payload=None, **kwargs) -> Job:
+    async with sessions() as db:
+        job = await JobService(db).enqueue(handler, payload, **kwargs)
+        await db.commit()
+    return job
+
+
+async def _load(sessions, job: Job) -> Job:
+    async with sessions() as db:
+        return await db.get(Job, job.id)
+
+
+@pytest.mark.anyio
+async def test_jobs_are_claimed_by_priority_and_record_progress_and_result(sessions):
+    low = await _enqueue(sessions, build_report, {"rows": 1})
+    high = await _enqueue(sessions, build_report, {"rows": 2}, priority=5)
+    later = await _enqueue(sessions, build_report, {"rows": 3}, delay_seconds=3600)
+
+    worker = _worker()
+    claimed = await worker._claim("tests", 5)
+    assert [job.id for job in claimed] == [high.id, low.id]
+    assert await worker._claim("tests", 5) == []
+
+    for job in claimed:
+        await worker._execute(job)
+
+    assert calls == [("report", 2), ("report", 1)]
+    done = await _load(sessions, high)
+    assert done.status == JobStatus.SUCCEEDED
+    assert done.progress == 100
+    assert done.result == {"rows": 2}
+    assert (await _load(sessions, later)).status == JobStatus.QUEUED
+
+
+@pytest.mark.anyio
+async def test_failures_retry_with_backoff_then_fail(sessions, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_SECONDS", 30)
+    job = await _enqueue(sessions, flaky)
+    worker = _worker()
+
+    [claimed] = await worker._claim("tests", 1)
+    await worker._execute(claimed)
+    retried = await _load(sessions, job)
+    assert retried.status == JobStatus.QUEUED
+    assert retried.last_error == "RuntimeError: upstream unavailable"
+    assert retried.run_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc) + timedelta(seconds=20)
+
+    async with sessions() as db:
+        retried.run_at = datetime.now(timezone.utc)
+        await db.merge(retried)
+        await db.commit()
+    [claimed] = await worker._claim("tests", 1)
+    await worker._execute(claimed)
+    failed = await _load(sessions, job)
+    assert failed.status == JobStatus.FAILED
+    assert failed.attempts == 2
+
+
+@pytest.mark.anyio
+async def test_permanent_errors_are_not_retried(sessions):
+    job = await _enqueue(sessions, invalid)
+    worker = _worker()
+    [claimed] = await worker._claim("tests", 1)
+    await worker._execute(claimed)
+
+    failed = await _load(sessions, job)
+    assert failed.status == JobStatus.FAILED
+    assert failed.attempts == 1
+
+
+@pytest.mark.anyio
+async def test_shutdown_requeues_jobs_that_outlive_the_grace_period(sessions):
+    job = await _enqueue(sessions, slow)
+    worker = _worker(shutdown_grace_seconds=0.1)
+    await worker.start()
+    for _ in range(100):
+        if worker._jobs:
+            break
+        await asyncio.sleep(0.02)
+    assert worker._jobs
+
+    await worker.stop()
+    released = await _load(sessions, job)
+    assert released.status == JobStatus.QUEUED
+    assert released.attempts == 0
+
+
+def test_parse_queues_uses_configured_slots():
+    defaults = {"default": 4, "exports": 2}
+    assert parse_queues(None, defaults) == defaults
+    assert parse_queues("exports=3, default", defaults) == {"exports": 3, "default": 4}
+    assert parse_queues("reports", defaults) == {"reports": 1}
+
+
+def test_retry_delay_backs_off_exponentially(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RETRY_BASE_SECONDS", 30)
+    monkeypatch.setattr(settings, "JOB_RETRY_MAX_SECONDS", 600)
+
+    assert 24 <= retry_delay(1) <= 36
+    assert 96 <= retry_delay(3) <= 144
+    assert 480 <= retry_delay(10) <= 720
@@ -0,0 +1,49 @@
+"""Tests for log partition naming and retention helpers"""
+
+from datetime import datetime, timedelta, timezone
+
+from app.core.config import Settings, settings
+from app.services.log_partition_service import (
+    add_months,
+    is_partition_table,
+    month_start,
+    partition_month,
+    partition_name,
+    retention_floor,
+)
+
+
+def test_month_start_uses_utc():
+    ist = timezone(timedelta(hours=5, minutes=30))
+    # 1 Nov 02:00 IST is still October in UTC
+    assert month_start(datetime(2026, 11, 1, 2, 0, tzinfo=ist)) == datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def test_add_months_crosses_year_boundaries():
+    start = datetime(2026, 11, 1, tzinfo=timezone.utc)
+    assert add_months(start, 2) == datetime(2027, 1, 1, tzinfo=timezone.utc)
+    assert add_months(start, -11) == datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+
+def test_partition_names_round_trip():
+    month = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    name = partition_name("ai_task_logs", month)
+
+    assert name == "ai_task_logs_p2026_03"
+    assert partition_month(name) == month
+    assert is_partition_table(name)
+    assert is_partition_table("crm_activity_logs_default")
+    assert partition_month("crm_activity_logs_default") is None
+    assert not is_partition_table("activity_logs")
+    assert not is_partition_table("notifications_p2026_03")
+
+
+def test_retention_floor(monkeypatch):
+    now = datetime(2026, 10, 19, tzinfo=timezone.utc)
+    monkeypatch.setattr(settings, "AI_LOG_RETENTION_DAYS", 90)
+    monkeypatch.setattr(settings, "CRM_ACTIVITY_LOG_RETENTION_DAYS", 0)
+
+    assert retention_floor("ai_task_logs", now) == now - timedelta(days=90)
+    assert retention_floor("crm_activity_logs", now) is None
+    # The audit trail is kept unless an operator opts in
+    assert Settings.model_fields["ACTIVITY_LOG_RETENTION_DAYS"].default == 0
@@ -0,0 +1,77 @@
+"""Tests for in-process notification fan-out"""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.services.notification_hub import RESYNC, NotificationHub
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'hub.db'}")
+    async with AsyncSession(engine) as db:
+        yield db
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_events_are_delivered_only_after_commit(session):
+    hub = NotificationHub(channel="test", queue_size=10)
+    async with hub.subscribe(1) as mine, hub.subscribe(2) as other:
+        await session.execute(text("SELECT 1"))
+        await hub.publish(session, 1, {"event": "notification", "unread_delta": 1})
+        assert mine.empty()
+
+        await session.commit()
+        assert mine.get_nowait() == {"event": "notification", "unread_delta": 1}
+        assert other.empty()
+
+
+@pytest.mark.anyio
+async def test_rolled_back_events_are_discarded(session):
+    hub = NotificationHub(channel="test", queue_size=10)
+    async with hub.subscribe(1) as queue:
+        await session.execute(text("SELECT 1"))
+        await hub.publish(session, 1, {"event": "read_all", "unread_delta": -3})
+        await session.rollback()
+        await session.execute(text("SELECT 1"))
+        await session.commit()
+        assert queue.empty()
+
+
+@pytest.mark.anyio
+async def test_slow_subscriber_is_told_to_resync():
+    hub = NotificationHub(channel="test", queue_size=2)
+    async with hub.subscribe(1) as queue:
+        for number in range(3):
+            hub.dispatch_local(1, {"event": "notification", "n": number})
+        assert queue.qsize() == 1
+        assert queue.get_nowait() == RESYNC
+    assert hub._subscribers == {}
+
+
+@pytest.mark.anyio
+async def test_publish_many_delivers_each_users_events_after_commit(session):
+    hub = NotificationHub(channel="test", queue_size=10)
+    async with hub.subscribe(1) as first, hub.subscribe(2) as second:
+        await session.execute(text("SELECT 1"))
+        await hub.publish_many(session, [(1, {"n": 1}), (2, {"n": 2}), (1, {"n": 3})])
+        assert first.empty()
+
+        await session.commit()
+        assert [first.get_nowait(), first.get_nowait()] == [{"n": 1}, {"n": 3}]
+        assert second.get_nowait() == {"n": 2}
+
+
+def test_batched_events_are_packed_into_notify_sized_messages():
+    hub = NotificationHub(channel="test", queue_size=10)
+    events = [(user_id, {"event": "notification", "message": "x" * 200}) for user_id in range(100)]
+    messages = NotificationHub._pack(events)
+
+    assert 1 < len(messages) < len(events)
+    assert all(len(message.encode()) < 7900 for message in messages)
+    async_queues = {user_id: hub.add_subscriber(user_id) for user_id in range(100)}
+    for message in messages:
+        hub._on_notify(None, 0, "test", message)
+    assert all(queue.qsize() == 1 for queue in async_queues.values())
@@ -0,0 +1,69 @@
+"""Tests for batched notification creation"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from app.models.notification import Notification
+from app.services import notification_service as notification_module
+from app.services.notification_hub import NotificationHub
+from app.services.notification_service import NotificationService
+
+
+@compiles(UUID, "sqlite")
+def _uuid_on_sqlite(type_, compiler, **kw):
+    # notifications.public_id is a Postgres UUID column
+    return "CHAR(32)"
+
+
+@pytest.fixture
+async def session(tmp_path, monkeypatch):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'notifications.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Notification.__table__.create)
+    hub = NotificationHub(channel="test", queue_size=10)
+    monkeypatch.setattr(notification_module, "notification_hub", hub)
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        db.info["hub"] = hub
+        yield db
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_notify_users_writes_one_row_per_recipient_with_rendered_text(session):
+    hub = session.info["hub"]
+    async with hub.subscribe(2) as queue:
+        created = await NotificationService(session).notify_users(
+            [3, 1, 2, 1], "dsr_rejected",
+            {"report_date": "2026-10-19", "reason": "Missing hours", "dsr_public_id": "abc"},
+        )
+        await session.commit()
+
+        assert [notification.user_id for notification in created] == [3, 1, 2]
+        assert all(notification.public_id is not None for notification in created)
+        assert created[0].message == "Your DSR for 2026-10-19 was rejected: Missing hours"
+        assert created[0].link == "/dashboard/dsr?id=abc"
+        count = await session.scalar(select(func.count()).select_from(Notification))
+        assert count == 3
+
+        event = queue.get_nowait()
+        assert event["unread_delta"] == 1
+        assert event["notification"]["public_id"] == str(created[2].public_id)
+        assert queue.empty()
+
+
+@pytest.mark.anyio
+async def test_single_notifications_keep_their_text(session):
+    service = NotificationService(session)
+    await service.notify_permission_rejected(5, "2026-10-18", "Too late")
+    notification = await service.create_notification(5, "Hello", "World", "custom")
+    await session.commit()
+
+    rows = (await session.execute(select(Notification).order_by(Notification.id))).scalars().all()
+    assert [(row.title, row.message, row.type) for row in rows] == [
+        ("DSR Permission Rejected", "Your request for 2026-10-18 was rejected: Too late", "permission_rejected"),
+        ("Hello", "World", "custom"),
+    ]
+    assert notification.id == rows[1].id
@@ -0,0 +1,30 @@
+"""Tests for bundling placement email attachments under the size limit"""
+
+import zipfile
+
+from app.services.placement_email_service import _zip_files, split_bundles
+
+
+def test_split_bundles_keeps_order_within_budget():
+    assert split_bundles([4, 4, 4, 4], budget=10) == [[0, 1], [2, 3]]
+    assert split_bundles([3, 8, 1, 1, 9], budget=10) == [[0], [1, 2, 3], [4]]
+    assert split_bundles([], budget=10) == []
+
+
+def test_split_bundles_gives_oversized_item_its_own_bundle():
+    assert split_bundles([2, 15, 2], budget=10) == [[0], [1], [2]]
+
+
+def test_zip_files_deduplicates_names(tmp_path):
+    first = tmp_path / "a.pdf"
+    second = tmp_path / "b.pdf"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+    archive = tmp_path / "out" / "bundle.zip"
+
+    size = _zip_files([("Asha/resume.pdf", str(first)), ("Asha/resume.pdf", str(second))], archive)
+
+    assert size == archive.stat().st_size
+    with zipfile.ZipFile(archive) as bundle:
+        assert bundle.namelist() == ["Asha/resume.pdf", "Asha/resume (1).pdf"]
+        assert bundle.read("Asha/resume (1).pdf") == b"second"
@@ -0,0 +1,77 @@
+"""Tests for firing cron schedules into the job queue"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.jobs.registry import JobContext, job_handler
+from app.jobs.scheduler import Schedule, Scheduler
+from app.models.job import Job
+from app.models.scheduled_run import ScheduledRun
+from app.utils.cron import CronExpression
+
+
+@job_handler("test_nightly", queue="tests")
+async def nightly(ctx: JobContext, day: str) -> None:
+    pass
+
+
+@pytest.fixture
+async def session(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'scheduler.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync: Job.__table__.create(sync))
+        await conn.run_sync(lambda sync: ScheduledRun.__table__.create(sync))
+    async with AsyncSession(engine, expire_on_commit=False) as db:
+        yield db
+    await engine.dispose()
+
+
+def _scheduler(grace_seconds=3600) -> Scheduler:
+    schedule = Schedule(
+        name="nightly",
+        cron=CronExpression("15 0 * * *"),
+        handler=nightly,
+        payload=lambda slot: {"day": slot.date().isoformat()},
+    )
+    return Scheduler([schedule], tz="Asia/Kolkata", misfire_grace_seconds=grace_seconds)
+
+
+@pytest.mark.anyio
+async def test_each_slot_fires_once(session):
+    scheduler = _scheduler()
+    # 00:20 in Kolkata is 18:50 UTC the day before
+    now = datetime(2026, 10, 18, 18, 50, tzinfo=timezone.utc)
+
+    [run] = await scheduler.fire_due(session, now)
+    await session.commit()
+    assert run.scheduled_for.replace(tzinfo=timezone.utc) == datetime(2026, 10, 18, 18, 45, tzinfo=timezone.utc)
+    assert run.job.name == "test_nightly"
+    assert run.job.payload == {"day": "2026-10-19"}
+
+    # A second tick, or a second leader, finds the slot taken
+    assert await scheduler.fire_due(session, now) == []
+    await session.commit()
+    jobs = (await session.execute(select(Job))).scalars().all()
+    assert len(jobs) == 1
+
+
+@pytest.mark.anyio
+async def test_slots_older_than_the_grace_period_are_skipped(session):
+    scheduler = _scheduler(grace_seconds=600)
+    assert await scheduler.fire_due(session, datetime(2026, 10, 18, 19, 30, tzinfo=timezone.utc)) == []
+
+
+@pytest.mark.anyio
+async def test_describe_reports_next_run_and_history(session):
+    scheduler = _scheduler()
+    await scheduler.fire_due(session, datetime(2026, 10, 18, 18, 50, tzinfo=timezone.utc))
+    await session.commit()
+
+    [described] = await scheduler.describe(session)
+    assert described["name"] == "nightly"
+    assert described["next_run_at"].hour == 0 and described["next_run_at"].minute == 15
+    assert len(described["recent_runs"]) == 1
+    assert described["recent_runs"][0]["status"] == "queued"
@@ -0,0 +1,47 @@
+"""Tests for cron expression parsing and slot calculation"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.utils.cron import CronExpression
+
+
+def test_parses_lists_ranges_and_steps():
+    cron = CronExpression("*/15 9-17 * * 1-5")
+    assert cron.minutes == {0, 15, 30, 45}
+    assert cron.hours == set(range(9, 18))
+    assert cron.weekdays == {0, 1, 2, 3, 4}  # Monday-Friday
+
+
+def test_sunday_is_zero_or_seven():
+    assert CronExpression("0 0 * * 0").weekdays == {6}
+    assert CronExpression("0 0 * * 7").weekdays == {6}
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "0 0 32 * *", "*/0 * * * *", "5-1 * * * *"])
+def test_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronExpression(expression)
+
+
+def test_next_after_skips_to_the_following_matching_day():
+    cron = CronExpression("0 18 * * 1-6")
+    # Saturday 2026-10-17 18:00 has passed; Sunday is skipped
+    assert cron.next_after(datetime(2026, 10, 17, 18, 0)) == datetime(2026, 10, 19, 18, 0)
+    assert cron.next_after(datetime(2026, 10, 19, 9, 30)) == datetime(2026, 10, 19, 18, 0)
+    assert CronExpression("0 0 1 1 *").next_after(datetime(2026, 10, 19)) == datetime(2027, 1, 1)
+
+
+def test_day_of_month_or_weekday_when_both_restricted():
+    cron = CronExpression("0 0 1 * 1")
+    assert cron.matches(datetime(2026, 10, 1))   # 1st of the month (a Thursday)
+    assert cron.matches(datetime(2026, 10, 5))   # a Monday
+    assert not cron.matches(datetime(2026, 10, 6))
+
+
+def test_latest_before_respects_the_window():
+    cron = CronExpression("30 2 * * *")
+    now = datetime(2026, 10, 19, 3, 10, 42)
+    assert cron.latest_before(now, timedelta(hours=1)) == datetime(2026, 10, 19, 2, 30)
+    assert cron.latest_before(now, timedelta(minutes=30)) is None
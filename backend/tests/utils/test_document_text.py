@@ -0,0 +1,51 @@
+"""Tests for PDF/DOCX text extraction"""
+
+import io
+import zipfile
+
+import pytest
+import PyPDF2
+
+from app.utils.document_text import DOCX, PDF, TEXT, detect_kind, extract_text
+
+
+def _docx(*paragraphs: str) -> bytes:
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    xml = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", xml)
+    return buffer.getvalue()
+
+
+def _pdf(pages: int) -> bytes:
+    writer = PyPDF2.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def test_detect_kind():
+    assert detect_kind(_pdf(1)) == PDF
+    assert detect_kind(_docx("x")) == DOCX
+    assert detect_kind("Résumé".encode()) == TEXT
+    with pytest.raises(ValueError):
+        detect_kind(b"\xff\xd8\xff\xe0 jpeg bytes \xff")
+
+
+def test_docx_paragraphs():
+    result = extract_text(_docx("Jane Doe", "Python, SQL"), max_pages=10)
+    assert result["kind"] == DOCX
+    assert result["text"] == "Jane Doe\nPython, SQL"
+
+
+def test_pdf_page_limit():
+    result = extract_text(_pdf(5), max_pages=2)
+    assert result["kind"] == PDF
+    assert result["page_count"] == 5
+    assert result["truncated"] is True
@@ -0,0 +1,149 @@
+"""Tests for ?fields= / ?view= sparse fieldsets on list endpoints"""
+
+import json
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from httpx import AsyncClient
+from pydantic import BaseModel, model_validator
+from sqlalchemy import select
+
+from app.models.dsr_entry import DSREntry
+from app.schemas.dsr_entry import DSREntryResponse
+from app.utils.fieldsets import FieldSelection, field_selection
+
+
+class Owner(BaseModel):
+    id: int
+    name: str
+    email: str
+
+    model_config = {"from_attributes": True}
+
+
+class Row(BaseModel):
+    id: int
+    public_id: str
+    title: str
+    notes: Optional[str] = None
+    owner: Optional[Owner] = None
+    reviewers: List[Owner] = []
+
+    model_config = {"from_attributes": True}
+
+
+VIEWS = {"compact": ["title", "owner.name"]}
+
+ROWS = [
+    SimpleNamespace(
+        id=1,
+        public_id="a",
+        title="First",
+        notes="long text",
+        owner=SimpleNamespace(id=7, name="Asha", email="asha@example.com"),
+        reviewers=[SimpleNamespace(id=8, name="Ravi", email="ravi@example.com")],
+    ),
+]
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    row_fields = field_selection(Row, VIEWS)
+
+    @app.get("/rows")
+    async def rows(selection: Optional[FieldSelection] = Depends(row_fields)):
+        if selection:
+            return selection.page(ROWS, total=len(ROWS))
+        return {"items": [Row.model_validate(row) for row in ROWS], "total": len(ROWS)}
+
+    return AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.anyio
+async def test_without_parameters_the_full_item_is_returned(client):
+    async with client:
+        response = await client.get("/rows")
+    item = response.json()["items"][0]
+    assert item["notes"] == "long text"
+    assert item["owner"]["email"] == "asha@example.com"
+
+
+@pytest.mark.anyio
+async def test_view_returns_only_its_fields_plus_ids(client):
+    async with client:
+        response = await client.get("/rows", params={"view": "compact"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [{"id": 1, "public_id": "a", "title": "First", "owner": {"name": "Asha"}}],
+        "total": 1,
+    }
+
+
+@pytest.mark.anyio
+async def test_fields_extend_a_view(client):
+    async with client:
+        response = await client.get("/rows", params={"view": "compact", "fields": "notes,reviewers.name"})
+    item = response.json()["items"][0]
+    assert item["notes"] == "long text"
+    assert item["reviewers"] == [{"name": "Ravi"}]
+
+
+@pytest.mark.anyio
+async def test_unknown_field_or_view_is_rejected(client):
+    async with client:
+        unknown_field = await client.get("/rows", params={"fields": "title,secret"})
+        unknown_nested = await client.get("/rows", params={"fields": "owner.password"})
+        unknown_view = await client.get("/rows", params={"view": "huge"})
+    assert unknown_field.status_code == 400
+    assert "secret" in unknown_field.json()["detail"]
+    assert unknown_nested.status_code == 400
+    assert unknown_view.status_code == 400
+
+
+def test_whole_nested_object_wins_over_dotted_names():
+    selection = FieldSelection.parse(Row, ["owner.name", "owner"])
+    assert selection.fields["owner"] is None
+    body = json.loads(selection.items(ROWS).body)
+    assert body[0]["owner"] == {"id": 7, "name": "Asha", "email": "asha@example.com"}
+
+
+def test_unselected_attributes_are_never_read():
+    class Guarded(SimpleNamespace):
+        def __getattribute__(self, name):
+            if name == "notes":
+                raise AssertionError("notes was read")
+            return super().__getattribute__(name)
+
+    selection = FieldSelection.parse(Row, ["title"])
+    body = json.loads(selection.items([Guarded(id=2, public_id="b", title="Second")]).body)
+    assert body == [{"id": 2, "public_id": "b", "title": "Second"}]
+
+
+def test_load_options_keep_selected_columns_and_raise_on_other_relationships():
+    selection = FieldSelection.parse(DSREntryResponse, ["report_date", "status", "user.full_name"])
+    load, *raises = selection.load_options(DSREntry)
+
+    sql = str(select(DSREntry).options(load))
+    columns = {column.strip().split(".")[-1] for column in sql.split("FROM")[0][len("SELECT"):].split(",")}
+    # user_id rides along so the selected user relationship can still load
+    assert columns == {"id", "public_id", "report_date", "status", "user_id"}
+    assert {option.path[1].key for option in raises} == {"permission_granter", "reviewer"}
+
+
+def test_schemas_with_model_validators_are_refused():
+    class Derived(Row):
+        @model_validator(mode="after")
+        def fill(self):
+            return self
+
+    with pytest.raises(TypeError):
+        field_selection(Derived)
+
+
+def test_parse_rejects_with_http_400():
+    with pytest.raises(HTTPException) as error:
+        FieldSelection.parse(Row, ["nope"])
+    assert error.value.status_code == 400
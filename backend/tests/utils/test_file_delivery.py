@@ -0,0 +1,74 @@
+"""Tests for conditional, ranged and offloaded document delivery"""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.utils import file_delivery
+from app.utils.file_delivery import deliver_file
+
+
+@pytest.fixture
+def stored_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(file_delivery, "UPLOAD_ROOT", tmp_path / "uploads")
+    path = tmp_path / "uploads" / "objects" / "ab" / "cd" / "abcd.pdf"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"0123456789" * 10)
+    return path
+
+
+@pytest.fixture
+def client(stored_file):
+    app = FastAPI()
+
+    @app.get("/doc")
+    async def doc(request: Request):
+        return await deliver_file(
+            request, Path(stored_file), filename="resume.pdf", media_type="application/pdf"
+        )
+
+    return AsyncClient(app=app, base_url="http://test")
+
+
+@pytest.mark.anyio
+async def test_full_download_then_304(client):
+    async with client:
+        first = await client.get("/doc")
+        assert first.status_code == 200
+        assert first.content == b"0123456789" * 10
+        assert first.headers["accept-ranges"] == "bytes"
+
+        by_etag = await client.get("/doc", headers={"If-None-Match": first.headers["etag"]})
+        by_date = await client.get("/doc", headers={"If-Modified-Since": first.headers["last-modified"]})
+
+    assert by_etag.status_code == 304 and by_etag.content == b""
+    assert by_date.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_range_request(client):
+    async with client:
+        partial = await client.get("/doc", headers={"Range": "bytes=10-19"})
+        suffix = await client.get("/doc", headers={"Range": "bytes=-5"})
+        invalid = await client.get("/doc", headers={"Range": "bytes=500-"})
+
+    assert partial.status_code == 206
+    assert partial.content == b"0123456789"
+    assert partial.headers["content-range"] == "bytes 10-19/100"
+    assert suffix.content == b"56789"
+    assert invalid.status_code == 416
+
+
+@pytest.mark.anyio
+async def test_x_accel_mode_hands_off_to_nginx(client, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_DELIVERY_MODE", "x-accel")
+    async with client:
+        response = await client.get("/doc")
+
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == "/_protected/uploads/objects/ab/cd/abcd.pdf"
+    assert response.headers["content-disposition"] == 'attachment; filename="resume.pdf"'
@@ -0,0 +1,78 @@
+"""Determinism and referential consistency of the synthetic dataset"""
+
+from datetime import date
+
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from app.models.ai_task_log import AITaskLog
+from app.models.lead import Lead, LeadStatus
+from app.utils.synthetic_data import DatasetScale, SyntheticDataset, _copy_record, row_counts
+
+
+TODAY = date(2026, 3, 2)
+
+
+def _dataset(seed: int = 1, candidates: int = 400) -> SyntheticDataset:
+    return SyntheticDataset(DatasetScale.for_candidates(candidates), seed=seed, today=TODAY)
+
+
+def test_same_seed_gives_same_rows():
+    first, second, other = _dataset(), _dataset(), _dataset(seed=2)
+
+    for (model, rows), (_, again), (_, different) in zip(first.tables(), second.tables(), other.tables()):
+        assert list(rows()) == list(again()), model.__tablename__
+    assert list(first.candidates()) != list(other.candidates())
+
+
+def test_counts_scale_with_candidates():
+    small, large = row_counts(_dataset(candidates=400)), row_counts(_dataset(candidates=4_000))
+
+    assert small["candidates"] == 400 and large["candidates"] == 4_000
+    assert all(small[table] > 0 for table in small)
+    assert large["training_attendance"] > 5 * small["training_attendance"]
+    assert large["leads"] == 4_000 // 10
+
+
+def test_children_reference_generated_parents():
+    dataset = _dataset()
+    candidates = {row["id"] for row in dataset.candidates()}
+    periods = {row["id"]: row["batch_id"] for row in dataset.batch_plans()}
+    leads = {row["id"]: row for row in dataset.leads()}
+
+    assert {row["candidate_id"] for row in dataset.screenings()} <= candidates
+    for row in dataset.attendance():
+        assert periods[row["period_id"]] == row["batch_id"]
+
+    deals = list(dataset.deals())
+    assert deals
+    assert [row["id"] for row in deals] == list(range(1, len(deals) + 1))
+    for deal in deals:
+        lead = leads[deal["lead_id"]]
+        assert lead["lead_status"] == LeadStatus.QUALIFIED
+        assert lead["company_id"] == deal["company_id"]
+    assert "converted_to_deal_id" not in next(iter(leads.values()))
+
+
+def test_ai_task_log_counters_match_steps():
+    for row in _dataset().ai_task_logs():
+        failed = [step for step in row["steps"] if step["status"] == "failed"]
+        assert row["tools_called"] == len(row["steps"])
+        assert row["tools_failed"] == len(failed)
+        assert row["tools_succeeded"] == len(row["steps"]) - len(failed)
+
+
+def test_copy_records_apply_defaults_and_conversions():
+    dialect = asyncpg_dialect()
+    row = next(_dataset().leads())
+    columns, record = _copy_record(Lead.__table__, row, dialect)
+    values = dict(zip(columns, record(row)))
+
+    # Python-side defaults are filled in; server defaults are left to the database
+    assert values["is_deleted"] is False and values["currency"] == "INR"
+    assert "updated_at" not in values and "converted_to_deal_id" not in values
+    assert values["lead_source"] == row["lead_source"].value
+    assert isinstance(values["tags"], str)
+
+    task = next(_dataset().ai_task_logs())
+    columns, record = _copy_record(AITaskLog.__table__, task, dialect)
+    assert "public_id" in columns and "id" not in columns
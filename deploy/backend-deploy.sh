@@ -48,6 +48,8 @@ cd /var/www/winvinaya-crm/backend
 echo "🛑 Stopping existing PM2 process..."
 pm2 stop $APP_NAME || true
 pm2 delete $APP_NAME || true
+pm2 stop "$APP_NAME-worker" || true
+pm2 delete "$APP_NAME-worker" || true
 
 # Create virtual environment if missing
 if [ ! -d "venv-$ENV" ]; then
@@ -89,13 +91,23 @@ pm2 start venv-$ENV/bin/uvicorn \
     --port "$PORT" \
     --env-file "$ENV_FILE"
 
+# Background job worker (exports, registration emails)
+echo "▶️ Starting job worker with PM2..."
+ENV_FILE="$ENV_FILE" pm2 start venv-$ENV/bin/python \
+    --name "$APP_NAME-worker" \
+    --interpreter none \
+    --kill-timeout 45000 \
+    -- -m app.jobs.worker
+
 # Persist PM2 processes
 pm2 save
 
 echo "================================"
 echo "✅ Backend deployed successfully!"
 echo "Process: $APP_NAME"
+echo "Worker:  $APP_NAME-worker"
 echo "Port:    $PORT"
 echo "================================"
 
 pm2 status "$APP_NAME"
+pm2 status "$APP_NAME-worker"
@@ -1,11 +1,14 @@
 import { useEffect, useRef } from 'react';
 import { useAppDispatch, useAppSelector } from '../store/hooks';
-import { addNotification, setLastCandidateId, fetchNotifications } from '../store/slices/notificationSlice';
+import { addNotification, setLastCandidateId, fetchNotifications, applyStreamEvent } from '../store/slices/notificationSlice';
 import candidateService from '../services/candidateService';
+import notificationService from '../services/notificationService';
+import authService from '../services/authService';
 
 /**
  * Hook to watch for notifications:
- * 1. Persistent backend notifications (Approval/Rejection/Permissions)
+ * 1. Persistent backend notifications (Approval/Rejection/Permissions), pushed over SSE
+ *    (polled when EventSource is unavailable)
  * 2. New candidate registrations (client-side polling)
  */
 export const useNotificationWatcher = () => {
@@ -101,19 +104,51 @@ export const useNotificationWatcher = () => {
 			}
 		};
 
+		// Personal notifications: the stream sends an unread snapshot, then deltas.
+		// The list is fetched once on (re)connect and whenever the server asks to resync.
+		let stream: EventSource | null = null;
+		let reconnectTimeout: ReturnType<typeof setTimeout> | undefined;
+		let notifIntervalId: ReturnType<typeof setInterval> | undefined;
+
+		const openStream = () => {
+			const token = authService.getAccessToken();
+			if (!user || !token) return;
+			stream = notificationService.openStream(token, (streamEvent) => {
+				dispatch(applyStreamEvent(streamEvent));
+				if (streamEvent.event === 'snapshot' || streamEvent.event === 'resync') {
+					checkBackendNotifications();
+				}
+			});
+			stream.onerror = () => {
+				// EventSource retries by itself unless the server refused the stream (e.g. expired token)
+				if (stream?.readyState === EventSource.CLOSED) {
+					stream = null;
+					reconnectTimeout = setTimeout(openStream, 30000);
+				}
+			};
+		};
+
+		let initialNotifTimeout: ReturnType<typeof setTimeout> | undefined;
+		if (typeof EventSource !== 'undefined') {
+			openStream();
+		} else {
+			initialNotifTimeout = setTimeout(checkBackendNotifications, 1000);
+			notifIntervalId = setInterval(checkBackendNotifications, 30000); // 30s for personal notifs
+		}
+
 		// Initial checks
 		const initialCandidateTimeout = setTimeout(checkForNewCandidates, 2000);
-		const initialNotifTimeout = setTimeout(checkBackendNotifications, 1000);
 
 		// Intervals
 		const candidateIntervalId = setInterval(checkForNewCandidates, 60000); // 60s for candidates
-		const notifIntervalId = setInterval(checkBackendNotifications, 30000); // 30s for personal notifs
 
 		return () => {
 			clearTimeout(initialCandidateTimeout);
 			clearTimeout(initialNotifTimeout);
+			clearTimeout(reconnectTimeout);
 			clearInterval(candidateIntervalId);
 			clearInterval(notifIntervalId);
+			stream?.close();
 		};
 	}, [dispatch, user]);
 };
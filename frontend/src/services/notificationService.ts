@@ -15,6 +15,15 @@ export interface NotificationListResponse {
 	unread_count: number;
 }
 
+export type NotificationStreamEvent =
+	| { event: 'snapshot'; unread_count: number }
+	| { event: 'notification'; unread_delta: number; notification: BackendNotification }
+	| { event: 'read'; unread_delta: number; public_id: string }
+	| { event: 'read_all'; unread_delta: number }
+	| { event: 'resync' };
+
+const STREAM_EVENTS = ['snapshot', 'notification', 'read', 'read_all', 'resync'];
+
 const notificationService = {
 	getMyNotifications: async (unreadOnly = false, limit = 50): Promise<NotificationListResponse> => {
 		const response = await api.get<NotificationListResponse>('/notifications/my', {
@@ -31,6 +40,17 @@ const notificationService = {
 	markAllAsRead: async (): Promise<{ status: string; marked_count: number }> => {
 		const response = await api.put<{ status: string; marked_count: number }>('/notifications/read-all');
 		return response.data;
+	},
+
+	// Server-sent events with unread-count deltas; EventSource cannot send headers, so the token goes in the query
+	openStream: (token: string, onEvent: (event: NotificationStreamEvent) => void): EventSource => {
+		const source = new EventSource(`${api.defaults.baseURL}/notifications/stream?token=${encodeURIComponent(token)}`);
+		STREAM_EVENTS.forEach((name) => {
+			source.addEventListener(name, (message) => {
+				onEvent(JSON.parse((message as MessageEvent).data));
+			});
+		});
+		return source;
 	}
 };
 
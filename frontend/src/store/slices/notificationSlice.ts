@@ -1,5 +1,5 @@
 import { createSlice, createAsyncThunk, type PayloadAction } from '@reduxjs/toolkit';
-import notificationService from '../../services/notificationService';
+import notificationService, { type BackendNotification, type NotificationStreamEvent } from '../../services/notificationService';
 import { formatDistanceToNow } from 'date-fns';
 
 export interface Notification {
@@ -28,6 +28,16 @@ const initialState: NotificationState = {
 	error: null,
 };
 
+const toNotification = (item: BackendNotification): Notification => ({
+	id: item.public_id,
+	title: item.title,
+	message: item.message,
+	timestamp: formatDistanceToNow(new Date(item.created_at), { addSuffix: true }),
+	read: item.is_read,
+	link: item.link,
+	type: item.type as any
+});
+
 // Async Thunks
 export const fetchNotifications = createAsyncThunk(
 	'notifications/fetchNotifications',
@@ -87,6 +97,40 @@ const notificationSlice = createSlice({
 			state.notifications = [];
 			state.unreadCount = 0;
 		},
+		// Pushed by /notifications/stream; guards keep deltas from being applied twice
+		applyStreamEvent: (state, action: PayloadAction<NotificationStreamEvent>) => {
+			const streamEvent = action.payload;
+			switch (streamEvent.event) {
+				case 'snapshot':
+					state.unreadCount = streamEvent.unread_count;
+					break;
+				case 'notification':
+					if (!state.notifications.some(n => n.id === streamEvent.notification.public_id)) {
+						state.notifications.unshift(toNotification(streamEvent.notification));
+						state.unreadCount += streamEvent.unread_delta;
+						if (state.notifications.length > 50) {
+							state.notifications.pop();
+						}
+					}
+					break;
+				case 'read': {
+					const notification = state.notifications.find(n => n.id === streamEvent.public_id);
+					if (!notification) {
+						state.unreadCount = Math.max(0, state.unreadCount + streamEvent.unread_delta);
+					} else if (!notification.read) {
+						notification.read = true;
+						state.unreadCount = Math.max(0, state.unreadCount - 1);
+					}
+					break;
+				}
+				case 'read_all':
+					state.notifications.forEach(n => {
+						n.read = true;
+					});
+					state.unreadCount = 0;
+					break;
+			}
+		},
 	},
 	extraReducers: (builder) => {
 		builder
@@ -97,15 +141,7 @@ const notificationSlice = createSlice({
 			.addCase(fetchNotifications.fulfilled, (state, action) => {
 				state.loading = false;
 				state.unreadCount = action.payload.unread_count;
-				state.notifications = action.payload.items.map(item => ({
-					id: item.public_id,
-					title: item.title,
-					message: item.message,
-					timestamp: formatDistanceToNow(new Date(item.created_at), { addSuffix: true }),
-					read: item.is_read,
-					link: item.link,
-					type: item.type as any
-				}));
+				state.notifications = action.payload.items.map(toNotification);
 			})
 			.addCase(fetchNotifications.rejected, (state, action) => {
 				state.loading = false;
@@ -129,5 +165,5 @@ const notificationSlice = createSlice({
 	}
 });
 
-export const { addNotification, setLastCandidateId, clearAllNotifications } = notificationSlice.actions;
+export const { addNotification, setLastCandidateId, clearAllNotifications, applyStreamEvent } = notificationSlice.actions;
 export default notificationSlice.reducer;